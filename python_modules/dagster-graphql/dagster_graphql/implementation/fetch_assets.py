@@ -26,10 +26,8 @@
 )
 from dagster._core.definitions.data_time import CachingDataTimeResolver
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionsSubset,
-)
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     CachingDynamicPartitionsLoader,
     DefaultPartitionsSubset,
     PartitionsDefinition,
@@ -184,25 +182,36 @@ def get_asset_nodes_by_asset_key(
 
     depended_by_loader = CrossRepoAssetDependedByLoader(context=graphene_info.context)
 
+    external_asset_nodes_by_asset_key: Dict[
+        AssetKey, Tuple[CodeLocation, ExternalRepository, ExternalAssetNode]
+    ] = {}
+    for repo_loc, repo, external_asset_node in asset_node_iter(graphene_info):
+        preexisting = external_asset_nodes_by_asset_key.get(external_asset_node.asset_key)
+        if preexisting is None or preexisting[2].is_source:
+            external_asset_nodes_by_asset_key[external_asset_node.asset_key] = (
+                repo_loc,
+                repo,
+                external_asset_node,
+            )
+
     stale_status_loader = StaleStatusLoader(
         instance=graphene_info.context.instance,
         asset_graph=lambda: ExternalAssetGraph.from_workspace(graphene_info.context),
+        asset_keys=list(external_asset_nodes_by_asset_key.keys()),
     )
 
     dynamic_partitions_loader = CachingDynamicPartitionsLoader(graphene_info.context.instance)
 
     asset_nodes_by_asset_key: Dict[AssetKey, GrapheneAssetNode] = {}
-    for repo_loc, repo, external_asset_node in asset_node_iter(graphene_info):
-        preexisting_node = asset_nodes_by_asset_key.get(external_asset_node.asset_key)
-        if preexisting_node is None or preexisting_node.external_asset_node.is_source:
-            asset_nodes_by_asset_key[external_asset_node.asset_key] = GrapheneAssetNode(
-                repo_loc,
-                repo,
-                external_asset_node,
-                depended_by_loader=depended_by_loader,
-                stale_status_loader=stale_status_loader,
-                dynamic_partitions_loader=dynamic_partitions_loader,
-            )
+    for asset_key, (repo_loc, repo, asset_node) in external_asset_nodes_by_asset_key.items():
+        asset_nodes_by_asset_key[asset_key] = GrapheneAssetNode(
+            repo_loc,
+            repo,
+            asset_node,
+            depended_by_loader=depended_by_loader,
+            stale_status_loader=stale_status_loader,
+            dynamic_partitions_loader=dynamic_partitions_loader,
+        )
 
     return asset_nodes_by_asset_key
 
@@ -467,14 +476,16 @@ def build_partition_statuses(
                 )
             )
         return GrapheneTimePartitions(ranges=graphene_ranges)
-    elif isinstance(materialized_partitions_subset, MultiPartitionsSubset):
+    elif isinstance(materialized_partitions_subset.partitions_def, MultiPartitionsDefinition):
         return get_2d_run_length_encoded_partitions(
             dynamic_partitions_store,
             materialized_partitions_subset,
             failed_partitions_subset,
             in_progress_partitions_subset,
         )
-    elif isinstance(materialized_partitions_subset, DefaultPartitionsSubset):
+    elif isinstance(
+        materialized_partitions_subset, (DefaultPartitionsSubset, BitmapPartitionsSubset)
+    ):
         materialized_keys = materialized_partitions_subset.get_partition_keys()
         failed_keys = failed_partitions_subset.get_partition_keys()
         in_progress_keys = in_progress_partitions_subset.get_partition_keys()
@@ -320,6 +320,14 @@ def stale_status_loader(self) -> StaleStatusLoader:
         )
         return loader
 
+    def get_instance_queryer(self, graphene_info: ResolveInfo) -> CachingInstanceQueryer:
+        """Returns the queryer of this node's stale status loader, so that the record caches are
+        shared with the other asset nodes built for the same request.
+        """
+        if self._stale_status_loader is not None:
+            return self._stale_status_loader.instance_queryer
+        return CachingInstanceQueryer(instance=graphene_info.context.instance)
+
     def get_external_job(self) -> ExternalJob:
         if self._external_job is None:
             check.invariant(
@@ -455,11 +463,8 @@ def resolve_assetMaterializationUsedData(
         asset_graph = ExternalAssetGraph.from_external_repository(self._external_repository)
         asset_key = self._external_asset_node.asset_key
 
-        # in the future, we can share this same CachingInstanceQueryer across all
-        # GrapheneMaterializationEvent which share an external repository for improved performance
-        instance_queryer = CachingInstanceQueryer(instance=graphene_info.context.instance)
         data_time_resolver = CachingDataTimeResolver(
-            instance_queryer=instance_queryer, asset_graph=asset_graph
+            instance_queryer=self.get_instance_queryer(graphene_info), asset_graph=asset_graph
         )
         event_records = instance.get_event_records(
             EventRecordsFilter(
@@ -687,12 +692,8 @@ def resolve_freshnessInfo(
             asset_graph = ExternalAssetGraph.from_external_repository(self._external_repository)
             return get_freshness_info(
                 asset_key=self._external_asset_node.asset_key,
-                # in the future, we can share this same CachingInstanceQueryer across all
-                # GrapheneAssetNodes which share an external repository for improved performance
                 data_time_resolver=CachingDataTimeResolver(
-                    instance_queryer=CachingInstanceQueryer(
-                        instance=graphene_info.context.instance
-                    ),
+                    instance_queryer=self.get_instance_queryer(graphene_info),
                     asset_graph=asset_graph,
                 ),
             )
@@ -244,6 +244,7 @@ def __init__(
         self._stale_status_loader = StaleStatusLoader(
             instance=instance,
             asset_graph=lambda: ExternalAssetGraph.from_external_repository(repository),
+            asset_keys=[node.asset_key for node in repository.get_external_asset_nodes()],
         )
         self._dynamic_partitions_loader = CachingDynamicPartitionsLoader(instance)
         super().__init__(name=repository.name)
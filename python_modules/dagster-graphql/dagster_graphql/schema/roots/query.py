@@ -822,6 +822,7 @@ def load_asset_graph() -> ExternalAssetGraph:
         stale_status_loader = StaleStatusLoader(
             instance=graphene_info.context.instance,
             asset_graph=load_asset_graph,
+            asset_keys=[node.assetKey for node in results],
         )
 
         return [
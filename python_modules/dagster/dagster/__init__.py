@@ -489,6 +489,10 @@
     mem_io_manager as mem_io_manager,
 )
 from dagster._core.storage.memoizable_io_manager import MemoizableIOManager as MemoizableIOManager
+from dagster._core.storage.mmap_io_manager import (
+    MemoryMappedIOManager as MemoryMappedIOManager,
+    make_memory_mapped_io_manager_cleanup_sensor as make_memory_mapped_io_manager_cleanup_sensor,
+)
 from dagster._core.storage.root_input_manager import (
     RootInputManager as RootInputManager,
     RootInputManagerDefinition as RootInputManagerDefinition,
@@ -1,16 +1,232 @@
-from typing import TYPE_CHECKING, Optional, Sequence
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Tuple
 
 import dagster._check as check
 from dagster._core.definitions.events import AssetKey
-from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.host_representation.external_data import ExternalJobSubsetResult
-from dagster._core.host_representation.origin import ExternalJobOrigin
+from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalJobRef,
+    ExternalJobSubsetResult,
+)
+from dagster._core.host_representation.origin import ExternalJobOrigin, ExternalRepositoryOrigin
+from dagster._core.host_representation.snapshot_cache import SnapshotCache
+from dagster._core.snap.job_snapshot import create_job_snapshot_id
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
     from dagster._grpc.client import DagsterGrpcClient
 
+JOB_DATA_CACHE_MAX_BYTES_ENV_VAR = "DAGSTER_JOB_SNAPSHOT_CACHE_MAX_BYTES"
+DEFAULT_JOB_DATA_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+ExternalJobDataCacheKey = Tuple[str, str, str]
+
+
+class ExternalJobDataCache:
+    """Least-recently-used cache of the ExternalJobData fetched from code servers, bounded by the
+    total size of the serialized data.
+
+    Entries are keyed by the job's snapshot id, so data fetched before a code location is reloaded
+    is reused afterwards for the jobs that didn't change.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[ExternalJobDataCacheKey, Tuple[ExternalJobData, int]]" = (
+            OrderedDict()
+        )
+        self._total_bytes = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: ExternalJobDataCacheKey) -> Optional[ExternalJobData]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: ExternalJobDataCacheKey, job_data: ExternalJobData, num_bytes: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+
+            # data larger than the whole cache is returned to the caller but not kept
+            if num_bytes > self._max_bytes:
+                return
+
+            self._entries[key] = (job_data, num_bytes)
+            self._total_bytes += num_bytes
+            while self._total_bytes > self._max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_job_data_cache = ExternalJobDataCache(
+    int(os.getenv(JOB_DATA_CACHE_MAX_BYTES_ENV_VAR, str(DEFAULT_JOB_DATA_CACHE_MAX_BYTES)))
+)
+
+
+def sync_get_external_job_data_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: ExternalRepositoryOrigin,
+    job_ref: ExternalJobRef,
+    snapshot_cache: Optional[SnapshotCache] = None,
+) -> ExternalJobData:
+    """Fetches the full data of a job that was loaded with deferred snapshots, or returns it from
+    the process-wide cache or the on-disk snapshot cache if it was fetched before.
+    """
+    from dagster._grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+    check.inst_param(job_ref, "job_ref", ExternalJobRef)
+    check.opt_inst_param(snapshot_cache, "snapshot_cache", SnapshotCache)
+
+    job_data = _get_cached_job_data(repository_origin, job_ref, snapshot_cache)
+    if job_data is not None:
+        return job_data
+
+    reply = api_client.external_job(repository_origin, job_ref.name)
+    if reply.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_value(reply.serialized_error, SerializableErrorInfo)
+        )
+
+    return _set_cached_job_data(
+        repository_origin, job_ref, reply.serialized_job_data, snapshot_cache
+    )
+
+
+def sync_get_external_job_datas_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: ExternalRepositoryOrigin,
+    job_refs: Sequence[ExternalJobRef],
+    snapshot_cache: Optional[SnapshotCache] = None,
+) -> Mapping[str, ExternalJobData]:
+    """Fetches the full data of several jobs that were loaded with deferred snapshots in one
+    streaming call, instead of one call per job. The data of jobs that were fetched before is
+    returned from the process-wide cache or the on-disk snapshot cache. Returns the data of each
+    job by job name.
+    """
+    from dagster._api.snapshot_repository import _is_unimplemented_error
+    from dagster._grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+    check.sequence_param(job_refs, "job_refs", of_type=ExternalJobRef)
+    check.opt_inst_param(snapshot_cache, "snapshot_cache", SnapshotCache)
+
+    job_datas: Dict[str, ExternalJobData] = {}
+    refs_to_fetch: Dict[str, ExternalJobRef] = {}
+    for job_ref in job_refs:
+        job_data = _get_cached_job_data(repository_origin, job_ref, snapshot_cache)
+        if job_data is None:
+            refs_to_fetch[job_ref.name] = job_ref
+        else:
+            job_datas[job_ref.name] = job_data
+
+    if not refs_to_fetch:
+        return job_datas
+
+    try:
+        chunks = []
+        for event in api_client.streaming_external_jobs(repository_origin, list(refs_to_fetch)):
+            if event["serialized_error"]:
+                raise DagsterUserCodeProcessError.from_error_info(
+                    deserialize_value(event["serialized_error"], SerializableErrorInfo)
+                )
+
+            chunks.append(event["serialized_job_data_chunk"])
+            if not event["is_last_chunk"]:
+                continue
+
+            serialized_job_data = "".join(chunks)
+            chunks = []
+
+            job_ref = refs_to_fetch[event["job_name"]]
+            job_datas[job_ref.name] = _set_cached_job_data(
+                repository_origin, job_ref, serialized_job_data, snapshot_cache
+            )
+    except DagsterUserCodeUnreachableError as e:
+        # Back-compat for older gRPC servers that can only fetch one job at a time
+        if not _is_unimplemented_error(e):
+            raise
+        for job_name, job_ref in refs_to_fetch.items():
+            if job_name not in job_datas:
+                job_datas[job_name] = sync_get_external_job_data_grpc(
+                    api_client, repository_origin, job_ref, snapshot_cache
+                )
+
+    return job_datas
+
+
+def _get_job_data_cache_key(
+    repository_origin: ExternalRepositoryOrigin, job_name: str, snapshot_id: str
+) -> ExternalJobDataCacheKey:
+    return (repository_origin.get_id(), job_name, snapshot_id)
+
+
+def _get_cached_job_data(
+    repository_origin: ExternalRepositoryOrigin,
+    job_ref: ExternalJobRef,
+    snapshot_cache: Optional[SnapshotCache],
+) -> Optional[ExternalJobData]:
+    key = _get_job_data_cache_key(repository_origin, job_ref.name, job_ref.snapshot_id)
+    job_data = _job_data_cache.get(key)
+    if job_data is not None or not snapshot_cache:
+        return job_data
+
+    # data that isn't held in memory by this process may be on disk, stored by another process
+    serialized_job_data = snapshot_cache.get_serialized_job_data(*key)
+    if serialized_job_data is None:
+        return None
+
+    job_data = deserialize_value(serialized_job_data, ExternalJobData)
+    _job_data_cache.set(key, job_data, len(serialized_job_data))
+    return job_data
+
+
+def _set_cached_job_data(
+    repository_origin: ExternalRepositoryOrigin,
+    job_ref: ExternalJobRef,
+    serialized_job_data: str,
+    snapshot_cache: Optional[SnapshotCache],
+) -> ExternalJobData:
+    job_data = deserialize_value(serialized_job_data, ExternalJobData)
+
+    # The server serves the data of the job as it is currently loaded, which may no longer match
+    # the ref if the code changed since the repository was loaded. Key the data by the snapshot it
+    # actually holds, so that it is never returned for a ref of another snapshot.
+    key = _get_job_data_cache_key(
+        repository_origin, job_ref.name, create_job_snapshot_id(job_data.job_snapshot)
+    )
+    _job_data_cache.set(key, job_data, len(serialized_job_data))
+    if snapshot_cache:
+        snapshot_cache.set_serialized_job_data(*key, serialized_job_data)
+    return job_data
+
 
 def sync_get_external_job_subset_grpc(
     api_client: "DagsterGrpcClient",
@@ -1,48 +1,304 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import grpc
 
 import dagster._check as check
-from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import (
+    ExternalAssetNode,
+    ExternalJobData,
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
+    external_repository_data_from_components,
 )
+from dagster._core.host_representation.snapshot_cache import SnapshotCache
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
     from dagster._core.host_representation import CodeLocation
+    from dagster._core.host_representation.origin import ExternalRepositoryOrigin
     from dagster._grpc.client import DagsterGrpcClient
 
+ExternalRepositoryComponent = Union[ExternalJobData, ExternalAssetNode, ExternalRepositoryData]
+
+
+class _ComponentCacheEntry(NamedTuple):
+    components: Mapping[str, ExternalRepositoryComponent]
+    server_id: Optional[str]
+    defer_snapshots: bool
+
+
+class ExternalRepositoryComponentCache:
+    """Holds the parts of the ExternalRepositoryData last fetched for each repository, keyed by the
+    hash of their serialized content, so that fetching the repository again only transfers and
+    deserializes the parts that changed since. The id of the code server that served them is kept
+    with them, so that loading a repository with a fixed snapshot from the same server again
+    doesn't call the server.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries_by_repository: Dict[Tuple[str, str], _ComponentCacheEntry] = {}
+
+    def get_components(
+        self, location_name: str, repository_name: str
+    ) -> Mapping[str, ExternalRepositoryComponent]:
+        with self._lock:
+            entry = self._entries_by_repository.get((location_name, repository_name))
+            return entry.components if entry else {}
+
+    def get_served_components(
+        self, location_name: str, repository_name: str, server_id: str, defer_snapshots: bool
+    ) -> Optional[Mapping[str, ExternalRepositoryComponent]]:
+        with self._lock:
+            entry = self._entries_by_repository.get((location_name, repository_name))
+            if (
+                not entry
+                or entry.server_id != server_id
+                or entry.defer_snapshots != defer_snapshots
+            ):
+                return None
+            return entry.components
+
+    def set_components(
+        self,
+        location_name: str,
+        repository_name: str,
+        components: Mapping[str, ExternalRepositoryComponent],
+        server_id: Optional[str] = None,
+        defer_snapshots: bool = False,
+    ) -> None:
+        with self._lock:
+            self._entries_by_repository[(location_name, repository_name)] = _ComponentCacheEntry(
+                components, server_id, defer_snapshots
+            )
+
+
+_component_cache = ExternalRepositoryComponentCache()
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    defer_snapshots: bool = False,
+    snapshot_cache: Optional[SnapshotCache] = None,
+    server_id: Optional[str] = None,
+    fixed_snapshot_repository_names: Optional[Sequence[str]] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
+    """Fetches the data of each repository in the code location.
+
+    The server reports the repositories whose snapshots don't change for as long as it runs in
+    fixed_snapshot_repository_names. If one of them was already loaded from the server with the
+    given id, by this process or by another process sharing the snapshot cache, its data is built
+    from the cached parts without calling the server.
+    """
     from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    check.opt_inst_param(snapshot_cache, "snapshot_cache", SnapshotCache)
+    check.opt_str_param(server_id, "server_id")
+    fixed_snapshot_repository_names = check.opt_sequence_param(
+        fixed_snapshot_repository_names, "fixed_snapshot_repository_names", of_type=str
+    )
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
+        external_repository_origin = ExternalRepositoryOrigin(
+            code_location.origin,
+            repository_name,
+        )
+        try:
+            repo_datas[repository_name] = _get_external_repository_data_from_components(
+                api_client,
+                external_repository_origin,
+                defer_snapshots,
+                snapshot_cache,
+                server_id if repository_name in fixed_snapshot_repository_names else None,
+            )
+        except DagsterUserCodeUnreachableError as e:
+            # Back-compat for older gRPC servers that can't stream repository components
+            if not _is_unimplemented_error(e):
+                raise
+            repo_datas[repository_name] = _get_external_repository_data(
+                api_client, external_repository_origin, defer_snapshots
+            )
+    return repo_datas
+
+
+def _get_external_repository_data_from_components(
+    api_client: "DagsterGrpcClient",
+    external_repository_origin: "ExternalRepositoryOrigin",
+    defer_snapshots: bool,
+    snapshot_cache: Optional[SnapshotCache],
+    server_id: Optional[str] = None,
+    use_cached_component_hashes: bool = True,
+) -> ExternalRepositoryData:
+    location_name = external_repository_origin.code_location_origin.location_name
+    repository_name = external_repository_origin.repository_name
+
+    if server_id is not None and use_cached_component_hashes:
+        served_components = _get_served_components(
+            external_repository_origin, defer_snapshots, snapshot_cache, server_id
+        )
+        if served_components is not None:
+            return external_repository_data_from_components(list(served_components.values()))
+
+    cached_components = _component_cache.get_components(location_name, repository_name)
+
+    # parts that aren't held in memory by this process may be on disk, stored by another process
+    known_component_hashes = set(cached_components.keys())
+    if snapshot_cache and use_cached_component_hashes:
+        known_component_hashes.update(
+            snapshot_cache.get_component_hashes(external_repository_origin.get_id())
+        )
+
+    components: Dict[str, ExternalRepositoryComponent] = {}
+    chunks: List[str] = []
+    for event in api_client.streaming_external_repository_components(
+        external_repository_origin,
+        known_component_hashes=list(known_component_hashes),
+        defer_snapshots=defer_snapshots,
+    ):
+        chunks.append(event["serialized_component_chunk"])
+        if not event["is_last_chunk"]:
+            continue
+
+        component_hash = event["component_hash"]
+        serialized_component = "".join(chunks)
+        chunks = []
+
+        # components that are unchanged since a cached snapshot are sent without content
+        if not serialized_component and component_hash in cached_components:
+            component = cached_components[component_hash]
+        else:
+            if serialized_component:
+                if snapshot_cache:
+                    snapshot_cache.set_serialized_component(component_hash, serialized_component)
+            else:
+                serialized_component = check.not_none(snapshot_cache).get_serialized_component(
+                    component_hash
                 )
+                if serialized_component is None:
+                    # the part was evicted from disk since it was listed, so fetch every part
+                    # that isn't held in memory
+                    return _get_external_repository_data_from_components(
+                        api_client,
+                        external_repository_origin,
+                        defer_snapshots,
+                        snapshot_cache,
+                        server_id,
+                        use_cached_component_hashes=False,
+                    )
+
+            component = deserialize_value(
+                serialized_component,
+                (
+                    ExternalJobData,
+                    ExternalAssetNode,
+                    ExternalRepositoryData,
+                    ExternalRepositoryErrorData,
+                ),
             )
+
+        if isinstance(component, ExternalRepositoryErrorData):
+            raise DagsterUserCodeProcessError.from_error_info(component.error)
+
+        components[component_hash] = component
+
+    _component_cache.set_components(
+        location_name, repository_name, components, server_id, defer_snapshots
+    )
+    if snapshot_cache:
+        snapshot_cache.set_component_hashes(
+            external_repository_origin.get_id(), list(components.keys()), server_id, defer_snapshots
         )
+    return external_repository_data_from_components(list(components.values()))
+
+
+def _get_served_components(
+    external_repository_origin: "ExternalRepositoryOrigin",
+    defer_snapshots: bool,
+    snapshot_cache: Optional[SnapshotCache],
+    server_id: str,
+) -> Optional[Mapping[str, ExternalRepositoryComponent]]:
+    """Returns the parts of the snapshot that the code server with the given id serves for the
+    repository if they were fetched before, from memory or from disk, or None if they have to be
+    fetched from the server.
+    """
+    location_name = external_repository_origin.code_location_origin.location_name
+    repository_name = external_repository_origin.repository_name
 
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
+    served_components = _component_cache.get_served_components(
+        location_name, repository_name, server_id, defer_snapshots
+    )
+    if served_components is not None or not snapshot_cache:
+        return served_components
+
+    component_hashes = snapshot_cache.get_served_component_hashes(
+        external_repository_origin.get_id(), server_id, defer_snapshots
+    )
+    if component_hashes is None:
+        return None
+
+    cached_components = _component_cache.get_components(location_name, repository_name)
+    components: Dict[str, ExternalRepositoryComponent] = {}
+    for component_hash in component_hashes:
+        if component_hash in cached_components:
+            components[component_hash] = cached_components[component_hash]
+            continue
+
+        serialized_component = snapshot_cache.get_serialized_component(component_hash)
+        if serialized_component is None:
+            # the part was evicted from disk since it was listed
+            return None
+        components[component_hash] = deserialize_value(
+            serialized_component, (ExternalJobData, ExternalAssetNode, ExternalRepositoryData)
         )
 
-        if isinstance(result, ExternalRepositoryErrorData):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
+    _component_cache.set_components(
+        location_name, repository_name, components, server_id, defer_snapshots
+    )
+    return components
 
-        repo_datas[repository_name] = result
-    return repo_datas
+
+def _get_external_repository_data(
+    api_client: "DagsterGrpcClient",
+    external_repository_origin: "ExternalRepositoryOrigin",
+    defer_snapshots: bool,
+) -> ExternalRepositoryData:
+    external_repository_chunks = list(
+        api_client.streaming_external_repository(
+            external_repository_origin=external_repository_origin,
+            defer_snapshots=defer_snapshots,
+        )
+    )
+
+    result = deserialize_value(
+        "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        ),
+        (ExternalRepositoryData, ExternalRepositoryErrorData),
+    )
+
+    if isinstance(result, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    return result
+
+
+def _is_unimplemented_error(error: DagsterUserCodeUnreachableError) -> bool:
+    cause = error.__cause__
+    if not isinstance(cause, grpc.RpcError):
+        return False
+    return cause.code() == grpc.StatusCode.UNIMPLEMENTED  # type: ignore  # (bad stubs)
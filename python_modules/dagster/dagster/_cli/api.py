@@ -18,7 +18,7 @@
 from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.errors import DagsterExecutionInterruptedError
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import create_step_execution_plan, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -409,10 +409,13 @@ def _execute_step_command_body(
             if not success:
                 return
 
+        execution_plan_snapshot = (
+            instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id)
+            if dagster_run.execution_plan_snapshot_id
+            else None
+        )
         if dagster_run.has_repository_load_data:
-            repository_load_data = instance.get_execution_plan_snapshot(
-                check.not_none(dagster_run.execution_plan_snapshot_id)
-            ).repository_load_data
+            repository_load_data = check.not_none(execution_plan_snapshot).repository_load_data
         else:
             repository_load_data = None
 
@@ -424,11 +427,12 @@ def _execute_step_command_body(
             )
         )
 
-        execution_plan = create_execution_plan(
+        execution_plan = create_step_execution_plan(
             recon_job,
-            run_config=dagster_run.run_config,
+            dagster_run,
             step_keys_to_execute=args.step_keys_to_execute,
             known_state=args.known_state,
+            execution_plan_snapshot=execution_plan_snapshot,
             repository_load_data=repository_load_data,
         )
 
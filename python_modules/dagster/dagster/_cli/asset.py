@@ -13,6 +13,7 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.origin import JobPythonOrigin
 from dagster._core.selector.subset_selector import parse_asset_selection
+from dagster._core.storage.partition_status_cache import rebuild_asset_status_cache_value
 from dagster._core.telemetry import telemetry_wrapper
 from dagster._utils.hosted_user_process import (
     recon_job_from_origin,
@@ -215,3 +216,39 @@ def asset_wipe_cache_command(key, **cli_args):
             click.echo("Cleared the partitions status cache")
         else:
             click.echo("Exiting without wiping the partitions status cache")
+
+
+@asset_cli.command(name="rebuild-partitions-status-cache")
+@python_origin_target_argument
+@click.option("--select", help="Asset selection to target", required=False)
+def asset_rebuild_cache_command(**kwargs):
+    """Recomputes the asset partitions status cache from the event log, for the selected assets (or
+    all assets) in the given repository. Use this to repair the cache if it has drifted from the
+    event log.
+    """
+    repository_origin = get_repository_python_origin_from_kwargs(kwargs)
+    recon_repo = recon_repository_from_origin(repository_origin)
+    repo_def = recon_repo.get_definition()
+
+    select = kwargs.get("select")
+    if select is not None:
+        asset_keys = parse_asset_selection(
+            assets_defs=list(repo_def.assets_defs_by_key.values()),
+            source_assets=list(repo_def.source_assets_by_key.values()),
+            asset_selection=select.split(","),
+        )
+    else:
+        asset_keys = repo_def.asset_graph.non_source_asset_keys
+
+    with DagsterInstance.get() as instance:
+        if instance.can_cache_asset_status_data() is False:
+            raise click.UsageError(
+                "Error, the instance does not support caching asset status. Rebuilding the cache is"
+                " not supported."
+            )
+
+        for asset_key in sorted(asset_keys):
+            rebuild_asset_status_cache_value(
+                instance, asset_key, repo_def.asset_graph.get_partitions_def(asset_key)
+            )
+        click.echo(f"Rebuilt the partitions status cache for {len(asset_keys)} assets")
@@ -1,5 +1,5 @@
 import functools
-from collections import deque
+from collections import defaultdict
 from heapq import heapify, heappop, heappush
 from typing import (
     TYPE_CHECKING,
@@ -31,7 +31,7 @@
 from .events import AssetKey, AssetKeyPartitionKey
 from .freshness_policy import FreshnessPolicy
 from .partition import PartitionsDefinition, PartitionsSubset
-from .partition_mapping import PartitionMapping, infer_partition_mapping
+from .partition_mapping import IdentityPartitionMapping, PartitionMapping, infer_partition_mapping
 from .source_asset import SourceAsset
 from .time_window_partitions import TimeWindowPartitionsDefinition
 
@@ -79,9 +79,26 @@ def source_asset_keys(self) -> AbstractSet[AssetKey]:
     @property
     def root_asset_keys(self) -> AbstractSet[AssetKey]:
         """Non-source asset keys that have no non-source parents."""
-        from .asset_selection import AssetSelection
+        return self._get_root_asset_keys()
 
-        return AssetSelection.keys(*self.non_source_asset_keys).roots().resolve(self)
+    @cached_method
+    def _get_root_asset_keys(self) -> AbstractSet[AssetKey]:
+        return {
+            asset_key
+            for asset_key in self.non_source_asset_keys
+            if not self.has_non_source_parents(asset_key)
+        }
+
+    @property
+    def index(self) -> "AssetGraphIndex":
+        """Precomputed structure for answering upstream and downstream queries, built on first
+        access.
+        """
+        return self._get_index()
+
+    @cached_method
+    def _get_index(self) -> "AssetGraphIndex":
+        return AssetGraphIndex(self._asset_dep_graph["upstream"])
 
     @property
     def freshness_policies_by_key(self) -> Mapping[AssetKey, Optional[FreshnessPolicy]]:
@@ -158,6 +175,12 @@ def get_partitions_def(self, asset_key: AssetKey) -> Optional[PartitionsDefiniti
 
     def get_partition_mapping(
         self, asset_key: AssetKey, in_asset_key: AssetKey
+    ) -> PartitionMapping:
+        return self._get_partition_mapping(asset_key=asset_key, in_asset_key=in_asset_key)
+
+    @cached_method
+    def _get_partition_mapping(
+        self, *, asset_key: AssetKey, in_asset_key: AssetKey
     ) -> PartitionMapping:
         partition_mappings = self._partition_mappings_by_key.get(asset_key) or {}
         return infer_partition_mapping(
@@ -166,11 +189,36 @@ def get_partition_mapping(
             self.get_partitions_def(in_asset_key),
         )
 
+    @cached_method
+    def _has_identity_partition_mapping(
+        self, *, asset_key: AssetKey, in_asset_key: AssetKey
+    ) -> bool:
+        """Whether each partition of the asset depends on exactly the partition with the same key in
+        the upstream asset, so single keys can be mapped across the edge without building subsets.
+        """
+        from .time_window_partition_mapping import TimeWindowPartitionMapping
+
+        if not self.is_partitioned(asset_key) or not self.have_same_partitioning(
+            asset_key, in_asset_key
+        ):
+            return False
+
+        partition_mapping = self.get_partition_mapping(asset_key, in_asset_key)
+        return isinstance(partition_mapping, IdentityPartitionMapping) or (
+            isinstance(partition_mapping, TimeWindowPartitionMapping)
+            and partition_mapping.start_offset == 0
+            and partition_mapping.end_offset == 0
+        )
+
     def is_partitioned(self, asset_key: AssetKey) -> bool:
         return self.get_partitions_def(asset_key) is not None
 
     def have_same_partitioning(self, asset_key1: AssetKey, asset_key2: AssetKey) -> bool:
         """Returns whether the given assets have the same partitions definition."""
+        return self._have_same_partitioning(asset_key1=asset_key1, asset_key2=asset_key2)
+
+    @cached_method
+    def _have_same_partitioning(self, *, asset_key1: AssetKey, asset_key2: AssetKey) -> bool:
         return self.get_partitions_def(asset_key1) == self.get_partitions_def(asset_key2)
 
     def have_same_or_no_partitioning(self, asset_keys: Iterable[AssetKey]) -> bool:
@@ -254,15 +302,54 @@ def get_child_partition_keys_of_parent(
                 f" '{parent_asset_key}' is not partitioned."
             )
 
-        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-        child_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
+        if self._has_identity_partition_mapping(
+            asset_key=child_asset_key, in_asset_key=parent_asset_key
+        ):
+            return [parent_partition_key]
+
+        child_partitions_subset = self.get_child_partitions_subset(
+            dynamic_partitions_store,
+            parent_asset_key,
             parent_partitions_def.empty_subset().with_partition_keys([parent_partition_key]),
-            downstream_partitions_def=child_partitions_def,
-            dynamic_partitions_store=dynamic_partitions_store,
+            child_asset_key,
         )
 
         return list(child_partitions_subset.get_partition_keys())
 
+    def get_child_partitions_subset(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        parent_asset_key: AssetKey,
+        parent_partitions_subset: Optional[PartitionsSubset],
+        child_asset_key: AssetKey,
+    ) -> PartitionsSubset:
+        """Maps a subset of the partitions of an asset to the partitions of one of its partitioned
+        children that depend on them, in a single call to the partition mapping between the two.
+
+        Args:
+            parent_partitions_subset (Optional[PartitionsSubset]): The partitions of the parent
+                asset, or None if the parent asset is not partitioned, in which case every
+                partition of the child depends on it.
+        """
+        child_partitions_def = self.get_partitions_def(child_asset_key)
+        if child_partitions_def is None:
+            raise DagsterInvalidInvocationError(
+                f"Asset key {child_asset_key} is not partitioned. Cannot get partition keys."
+            )
+
+        if parent_partitions_subset is None:
+            return child_partitions_def.subset_with_all_partitions(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+
+        return self.get_partition_mapping(
+            child_asset_key, parent_asset_key
+        ).get_downstream_partitions_for_partitions(
+            parent_partitions_subset,
+            downstream_partitions_def=child_partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
+
     def get_parents_partitions(
         self,
         dynamic_partitions_store: DynamicPartitionsStore,
@@ -310,25 +397,51 @@ def get_parent_partition_keys_for_child(
         """
         partition_key = check.opt_str_param(partition_key, "partition_key")
 
+        if partition_key is not None and self._has_identity_partition_mapping(
+            asset_key=child_asset_key, in_asset_key=parent_asset_key
+        ):
+            return [partition_key]
+
         child_partitions_def = self.get_partitions_def(child_asset_key)
-        parent_partitions_def = self.get_partitions_def(parent_asset_key)
+        parent_partition_key_subset = self.get_parent_partitions_subset(
+            dynamic_partitions_store,
+            child_asset_key,
+            cast(PartitionsDefinition, child_partitions_def)
+            .empty_subset()
+            .with_partition_keys([partition_key])
+            if partition_key
+            else None,
+            parent_asset_key,
+        )
+        return list(parent_partition_key_subset.get_partition_keys())
 
+    def get_parent_partitions_subset(
+        self,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+        child_asset_key: AssetKey,
+        child_partitions_subset: Optional[PartitionsSubset],
+        parent_asset_key: AssetKey,
+    ) -> PartitionsSubset:
+        """Maps a subset of the partitions of an asset to the partitions of one of its partitioned
+        parents that they depend on, in a single call to the partition mapping between the two.
+
+        Args:
+            child_partitions_subset (Optional[PartitionsSubset]): The partitions of the child
+                asset, or None if the child asset is not partitioned.
+        """
+        parent_partitions_def = self.get_partitions_def(parent_asset_key)
         if parent_partitions_def is None:
             raise DagsterInvalidInvocationError(
                 f"Asset key {parent_asset_key} is not partitioned. Cannot get partition keys."
             )
 
-        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-        parent_partition_key_subset = partition_mapping.get_upstream_partitions_for_partitions(
-            cast(PartitionsDefinition, child_partitions_def)
-            .empty_subset()
-            .with_partition_keys([partition_key])
-            if partition_key
-            else None,
+        return self.get_partition_mapping(
+            child_asset_key, parent_asset_key
+        ).get_upstream_partitions_for_partitions(
+            child_partitions_subset,
             upstream_partitions_def=parent_partitions_def,
             dynamic_partitions_store=dynamic_partitions_store,
         )
-        return list(parent_partition_key_subset.get_partition_keys())
 
     def is_source(self, asset_key: AssetKey) -> bool:
         return asset_key in self.source_asset_keys or asset_key not in self.all_asset_keys
@@ -348,25 +461,15 @@ def get_non_source_roots(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
         """
         if not self.has_non_source_parents(asset_key):
             return {asset_key}
-        return {
-            key
-            for key in self.upstream_key_iterator(asset_key)
-            if not self.is_source(key) and not self.has_non_source_parents(key)
-        }
+        return self.index.get_ancestors([asset_key]) & self.root_asset_keys
 
     def upstream_key_iterator(self, asset_key: AssetKey) -> Iterator[AssetKey]:
         """Iterates through all asset keys which are upstream of the given key."""
-        visited: Set[AssetKey] = set()
-        queue = deque([asset_key])
-        while queue:
-            current_key = queue.popleft()
-            if self.is_source(current_key):
-                continue
-            for parent_key in self.get_parents(current_key):
-                if parent_key not in visited:
-                    yield parent_key
-                    queue.append(parent_key)
-                    visited.add(parent_key)
+        if self.is_source(asset_key):
+            return
+        yield from self.index.get_ancestors([asset_key])
+        if self.has_self_dependency(asset_key):
+            yield asset_key
 
     def get_required_multi_asset_keys(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
         """For a given asset_key, return the set of asset keys that must be materialized at the same time.
@@ -382,11 +485,8 @@ def get_required_multi_asset_keys(self, asset_key: AssetKey) -> AbstractSet[Asse
     def get_code_version(self, asset_key: AssetKey) -> Optional[str]:
         return self._code_versions_by_key.get(asset_key)
 
-    @cached_method
     def toposort_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
-        return [
-            {key for key in level} for level in toposort.toposort(self._asset_dep_graph["upstream"])
-        ]
+        return self.index.toposorted_levels
 
     def get_auto_materialize_policy(self, asset_key: AssetKey) -> Optional[AutoMaterializePolicy]:
         return self.auto_materialize_policies_by_key.get(asset_key)
@@ -395,18 +495,19 @@ def get_auto_materialize_policy(self, asset_key: AssetKey) -> Optional[AutoMater
     def get_downstream_freshness_policies(
         self, *, asset_key: AssetKey
     ) -> AbstractSet[FreshnessPolicy]:
-        downstream_policies = set().union(
-            *(
-                self.get_downstream_freshness_policies(asset_key=child_key)
-                for child_key in self.get_children(asset_key)
-                if child_key != asset_key
-            )
-        )
-        current_policy = self.freshness_policies_by_key.get(asset_key)
-        if self.get_partitions_def(asset_key) is None and current_policy is not None:
-            downstream_policies.add(current_policy)
+        policy_keys = self._get_unpartitioned_freshness_policy_keys()
+        return {
+            self.freshness_policies_by_key[key]
+            for key in (self.index.get_descendants([asset_key]) | {asset_key}) & policy_keys
+        }
 
-        return downstream_policies
+    @cached_method
+    def _get_unpartitioned_freshness_policy_keys(self) -> AbstractSet[AssetKey]:
+        return {
+            asset_key
+            for asset_key, freshness_policy in self.freshness_policies_by_key.items()
+            if freshness_policy is not None and self.get_partitions_def(asset_key) is None
+        }
 
     def has_self_dependency(self, asset_key: AssetKey) -> bool:
         return asset_key in self.get_parents(asset_key)
@@ -432,7 +533,10 @@ def bfs_filter_subsets(
             len(initial_subset.asset_keys) == 1, "Multiple initial assets not yet supported"
         )
         initial_asset_key = next(iter(initial_subset.asset_keys))
-        queue = deque([initial_asset_key])
+        # visiting assets in topological order means every parent's partitions have been added to
+        # an asset's subset before the asset is visited
+        index = self.index
+        queue = [(index.get_position(initial_asset_key), initial_asset_key)]
 
         queued_subsets_by_asset_key: Dict[AssetKey, Optional[PartitionsSubset]] = {
             initial_asset_key: initial_subset.get_partitions_subset(initial_asset_key)
@@ -442,7 +546,7 @@ def bfs_filter_subsets(
         result = AssetGraphSubset(self)
 
         while len(queue) > 0:
-            asset_key = queue.popleft()
+            _, asset_key = heappop(queue)
             partitions_subset = queued_subsets_by_asset_key.get(asset_key)
 
             if condition_fn(asset_key, partitions_subset):
@@ -455,34 +559,19 @@ def bfs_filter_subsets(
                 )
 
                 for child in self.get_children(asset_key):
-                    partition_mapping = self.get_partition_mapping(child, asset_key)
-                    child_partitions_def = self.get_partitions_def(child)
-
-                    if child_partitions_def:
-                        if partitions_subset is None:
-                            child_partitions_subset = (
-                                child_partitions_def.subset_with_all_partitions()
-                            )
-                            queued_subsets_by_asset_key[child] = child_partitions_subset
-                        else:
-                            child_partitions_subset = (
-                                partition_mapping.get_downstream_partitions_for_partitions(
-                                    partitions_subset,
-                                    downstream_partitions_def=child_partitions_def,
-                                    dynamic_partitions_store=dynamic_partitions_store,
-                                )
-                            )
-                            prior_child_partitions_subset = queued_subsets_by_asset_key.get(child)
-                            queued_subsets_by_asset_key[child] = (
-                                child_partitions_subset
-                                if not prior_child_partitions_subset
-                                else child_partitions_subset | prior_child_partitions_subset
-                            )
-                    else:
-                        child_partitions_subset = None
+                    if self.is_partitioned(child):
+                        child_partitions_subset = self.get_child_partitions_subset(
+                            dynamic_partitions_store, asset_key, partitions_subset, child
+                        )
+                        prior_child_partitions_subset = queued_subsets_by_asset_key.get(child)
+                        queued_subsets_by_asset_key[child] = (
+                            child_partitions_subset
+                            if not prior_child_partitions_subset
+                            else child_partitions_subset | prior_child_partitions_subset
+                        )
 
                     if child not in all_assets:
-                        queue.append(child)
+                        heappush(queue, (index.get_position(child), child))
                         all_assets.add(child)
 
         return result
@@ -513,22 +602,73 @@ def bfs_filter_asset_partitions(
 
         result: Set[AssetKeyPartitionKey] = set()
 
-        while len(queue) > 0:
-            candidates_unit = queue.dequeue()
-
-            if condition_fn(candidates_unit, result):
-                result.update(candidates_unit)
+        def _enqueue(asset_partition: AssetKeyPartitionKey) -> None:
+            if asset_partition not in all_nodes:
+                queue.enqueue(asset_partition)
+                all_nodes.add(asset_partition)
 
-                for candidate in candidates_unit:
-                    for child in self.get_children_partitions(
-                        dynamic_partitions_store, candidate.asset_key, candidate.partition_key
-                    ):
-                        if child not in all_nodes:
-                            queue.enqueue(child)
-                            all_nodes.add(child)
+        while len(queue) > 0:
+            # children are in later toposort levels than their parents, so the children of all the
+            # asset partitions that pass in a level are mapped at once, one call per edge, after
+            # the level is done. Self-dependent assets order their partitions within a level, so
+            # their own next partitions are enqueued right away.
+            level = queue.peek_level()
+            partition_keys_by_asset_key: Dict[AssetKey, Set[Optional[str]]] = defaultdict(set)
+            while len(queue) > 0 and queue.peek_level() == level:
+                candidates_unit = queue.dequeue()
+
+                if condition_fn(candidates_unit, result):
+                    result.update(candidates_unit)
+
+                    for candidate in candidates_unit:
+                        partition_keys_by_asset_key[candidate.asset_key].add(
+                            candidate.partition_key
+                        )
+                        if self.has_self_dependency(candidate.asset_key):
+                            for partition_key in self.get_child_partition_keys_of_parent(
+                                dynamic_partitions_store,
+                                candidate.partition_key,
+                                candidate.asset_key,
+                                candidate.asset_key,
+                            ):
+                                _enqueue(AssetKeyPartitionKey(candidate.asset_key, partition_key))
+
+            for asset_key, partition_keys in partition_keys_by_asset_key.items():
+                for child in self._get_children_partitions_of_partition_keys(
+                    dynamic_partitions_store, asset_key, partition_keys
+                ):
+                    _enqueue(child)
 
         return result
 
+    def _get_children_partitions_of_partition_keys(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        asset_key: AssetKey,
+        partition_keys: AbstractSet[Optional[str]],
+    ) -> Iterable[AssetKeyPartitionKey]:
+        """Returns every partition of the given asset's children, other than the asset itself, that
+        depends on any of the given partitions of the asset.
+        """
+        partitions_def = self.get_partitions_def(asset_key)
+        partitions_subset = (
+            partitions_def.empty_subset().with_partition_keys(
+                cast(AbstractSet[str], partition_keys)
+            )
+            if partitions_def is not None
+            else None
+        )
+        for child_asset_key in self.get_children(asset_key):
+            if child_asset_key == asset_key:
+                continue
+            if self.is_partitioned(child_asset_key):
+                for child_partition_key in self.get_child_partitions_subset(
+                    dynamic_partitions_store, asset_key, partitions_subset, child_asset_key
+                ).get_partition_keys():
+                    yield AssetKeyPartitionKey(child_asset_key, child_partition_key)
+            else:
+                yield AssetKeyPartitionKey(child_asset_key)
+
     def split_asset_keys_by_repository(
         self, asset_keys: AbstractSet[AssetKey]
     ) -> Sequence[AbstractSet[AssetKey]]:
@@ -581,6 +721,211 @@ def source_assets(self) -> Sequence[SourceAsset]:
         return self._source_assets
 
 
+class AssetGraphIndex:
+    """Integer-indexed copy of the dependencies between the assets in an AssetGraph, for answering
+    upstream and downstream queries without walking the graph's dictionaries each time.
+
+    Assets are numbered in topological order, so every asset's id is greater than the ids of all of
+    its ancestors. Sets of ancestors and descendants are stored as bitsets, i.e. Python ints where
+    bit i is set if the asset with id i is in the set, and are computed for the whole graph in a
+    single pass the first time they are needed. Self-dependencies are ignored.
+    """
+
+    def __init__(self, upstream: Mapping[AssetKey, AbstractSet[AssetKey]]):
+        # hashing AssetKeys is relatively slow, so each key is looked up once and the rest of the
+        # construction works on integers
+        unsorted_id_by_key: Dict[AssetKey, int] = {key: i for i, key in enumerate(upstream)}
+        unsorted_parent_ids: List[List[int]] = [[] for _ in unsorted_id_by_key]
+        for key_id, (key, parent_keys) in enumerate(upstream.items()):
+            for parent_key in parent_keys:
+                parent_id = unsorted_id_by_key.get(parent_key)
+                if parent_id is None:
+                    parent_id = len(unsorted_id_by_key)
+                    unsorted_id_by_key[parent_key] = parent_id
+                    unsorted_parent_ids.append([])
+                if parent_id != key_id:
+                    unsorted_parent_ids[key_id].append(parent_id)
+        unsorted_keys = list(unsorted_id_by_key)
+
+        unsorted_child_ids: List[List[int]] = [[] for _ in unsorted_keys]
+        for key_id, parent_ids in enumerate(unsorted_parent_ids):
+            for parent_id in parent_ids:
+                unsorted_child_ids[parent_id].append(key_id)
+
+        # an asset's level is one more than the highest level of its parents, which matches the
+        # levels returned by toposort.toposort, but takes a single pass over the graph
+        num_unvisited_parents = [len(parent_ids) for parent_ids in unsorted_parent_ids]
+        level_by_unsorted_id = [0] * len(unsorted_keys)
+        visit_order = [key_id for key_id, count in enumerate(num_unvisited_parents) if count == 0]
+        for key_id in visit_order:
+            child_level = level_by_unsorted_id[key_id] + 1
+            for child_id in unsorted_child_ids[key_id]:
+                if level_by_unsorted_id[child_id] < child_level:
+                    level_by_unsorted_id[child_id] = child_level
+                num_unvisited_parents[child_id] -= 1
+                if num_unvisited_parents[child_id] == 0:
+                    visit_order.append(child_id)
+
+        if len(visit_order) < len(unsorted_keys):
+            raise toposort.CircularDependencyError(
+                {
+                    unsorted_keys[key_id]: {
+                        unsorted_keys[parent_id] for parent_id in unsorted_parent_ids[key_id]
+                    }
+                    for key_id, count in enumerate(num_unvisited_parents)
+                    if count > 0
+                }
+            )
+
+        sorted_unsorted_ids = sorted(visit_order, key=level_by_unsorted_id.__getitem__)
+        id_by_unsorted_id = [0] * len(unsorted_keys)
+        for key_id, unsorted_id in enumerate(sorted_unsorted_ids):
+            id_by_unsorted_id[unsorted_id] = key_id
+
+        self._keys: List[AssetKey] = [
+            unsorted_keys[unsorted_id] for unsorted_id in sorted_unsorted_ids
+        ]
+        self._id_by_key: Dict[AssetKey, int] = {key: i for i, key in enumerate(self._keys)}
+        self._level_by_id = [
+            level_by_unsorted_id[unsorted_id] for unsorted_id in sorted_unsorted_ids
+        ]
+        self._parent_ids = [
+            tuple(id_by_unsorted_id[parent_id] for parent_id in unsorted_parent_ids[unsorted_id])
+            for unsorted_id in sorted_unsorted_ids
+        ]
+        self._child_ids = [
+            tuple(id_by_unsorted_id[child_id] for child_id in unsorted_child_ids[unsorted_id])
+            for unsorted_id in sorted_unsorted_ids
+        ]
+
+        levels: List[Set[AssetKey]] = [
+            set() for _ in range(self._level_by_id[-1] + 1 if self._keys else 0)
+        ]
+        for key, level in zip(self._keys, self._level_by_id):
+            levels[level].add(key)
+        self._levels = levels
+
+        self._ancestor_bits: Optional[List[int]] = None
+        self._descendant_bits: Optional[List[int]] = None
+
+    @property
+    def toposorted_levels(self) -> Sequence[AbstractSet[AssetKey]]:
+        return self._levels
+
+    def get_level(self, asset_key: AssetKey) -> int:
+        """Returns the index of the toposorted level that contains the given asset."""
+        return self._level_by_id[self._id_by_key[asset_key]]
+
+    def get_position(self, asset_key: AssetKey) -> int:
+        """Returns the position of the given asset in a topological ordering of all the assets."""
+        return self._id_by_key[asset_key]
+
+    def get_ancestors(
+        self, asset_keys: Iterable[AssetKey], depth: Optional[int] = None
+    ) -> AbstractSet[AssetKey]:
+        """Returns the assets upstream of any of the given assets, limited to the given number of
+        hops if a depth is provided.
+        """
+        if depth is not None:
+            return self._bfs(asset_keys, self._parent_ids, depth)
+        return self._keys_from_bits(self._union_bits(asset_keys, self._get_ancestor_bits()))
+
+    def get_descendants(
+        self, asset_keys: Iterable[AssetKey], depth: Optional[int] = None
+    ) -> AbstractSet[AssetKey]:
+        """Returns the assets downstream of any of the given assets, limited to the given number of
+        hops if a depth is provided.
+        """
+        if depth is not None:
+            return self._bfs(asset_keys, self._child_ids, depth)
+        return self._keys_from_bits(self._union_bits(asset_keys, self._get_descendant_bits()))
+
+    def get_roots(self, within_selection: AbstractSet[AssetKey]) -> AbstractSet[AssetKey]:
+        """Returns the assets in the selection that have no ancestors in the selection."""
+        return self._filter_unconnected(within_selection, self._get_ancestor_bits())
+
+    def get_sinks(self, within_selection: AbstractSet[AssetKey]) -> AbstractSet[AssetKey]:
+        """Returns the assets in the selection that have no descendants in the selection."""
+        return self._filter_unconnected(within_selection, self._get_descendant_bits())
+
+    def _get_ancestor_bits(self) -> List[int]:
+        if self._ancestor_bits is None:
+            ancestor_bits = [0] * len(self._keys)
+            # parents always have lower ids, so their ancestors are computed first
+            for key_id, parent_ids in enumerate(self._parent_ids):
+                bits = 0
+                for parent_id in parent_ids:
+                    bits |= ancestor_bits[parent_id] | (1 << parent_id)
+                ancestor_bits[key_id] = bits
+            self._ancestor_bits = ancestor_bits
+        return self._ancestor_bits
+
+    def _get_descendant_bits(self) -> List[int]:
+        if self._descendant_bits is None:
+            descendant_bits = [0] * len(self._keys)
+            for key_id in reversed(range(len(self._keys))):
+                bits = 0
+                for child_id in self._child_ids[key_id]:
+                    bits |= descendant_bits[child_id] | (1 << child_id)
+                descendant_bits[key_id] = bits
+            self._descendant_bits = descendant_bits
+        return self._descendant_bits
+
+    def _union_bits(self, asset_keys: Iterable[AssetKey], bits_by_id: Sequence[int]) -> int:
+        bits = 0
+        for asset_key in asset_keys:
+            key_id = self._id_by_key.get(asset_key)
+            if key_id is not None:
+                bits |= bits_by_id[key_id]
+        return bits
+
+    def _keys_from_bits(self, bits: int) -> Set[AssetKey]:
+        # scanning the binary string is much faster than testing each bit of a large int
+        binary = format(bits, "b")[::-1]
+        keys = set()
+        key_id = binary.find("1")
+        while key_id != -1:
+            keys.add(self._keys[key_id])
+            key_id = binary.find("1", key_id + 1)
+        return keys
+
+    def _filter_unconnected(
+        self, within_selection: AbstractSet[AssetKey], bits_by_id: Sequence[int]
+    ) -> AbstractSet[AssetKey]:
+        selection_bits = 0
+        for asset_key in within_selection:
+            key_id = self._id_by_key.get(asset_key)
+            if key_id is not None:
+                selection_bits |= 1 << key_id
+
+        return {
+            asset_key
+            for asset_key in within_selection
+            if asset_key not in self._id_by_key
+            or not bits_by_id[self._id_by_key[asset_key]] & selection_bits
+        }
+
+    def _bfs(
+        self,
+        asset_keys: Iterable[AssetKey],
+        adjacent_ids: Sequence[Sequence[int]],
+        depth: int,
+    ) -> AbstractSet[AssetKey]:
+        frontier = [self._id_by_key[key] for key in asset_keys if key in self._id_by_key]
+        visited: Set[int] = set()
+        for _ in range(depth):
+            next_frontier = []
+            for key_id in frontier:
+                for adjacent_id in adjacent_ids[key_id]:
+                    if adjacent_id not in visited:
+                        visited.add(adjacent_id)
+                        next_frontier.append(adjacent_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return {self._keys[key_id] for key_id in visited}
+
+
 class ToposortedPriorityQueue:
     """Queue that returns parents before their children."""
 
@@ -610,12 +955,7 @@ def __lt__(self, other: object) -> bool:
 
     def __init__(self, asset_graph: AssetGraph, items: Iterable[AssetKeyPartitionKey]):
         self._asset_graph = asset_graph
-        toposorted_asset_keys = asset_graph.toposort_asset_keys()
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(toposorted_asset_keys)
-            for asset_key in asset_keys
-        }
+        self._index = asset_graph.index
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
@@ -625,6 +965,10 @@ def enqueue(self, asset_partition: AssetKeyPartitionKey) -> None:
     def dequeue(self) -> Iterable[AssetKeyPartitionKey]:
         return heappop(self._heap).multi_asset_partition
 
+    def peek_level(self) -> int:
+        """Returns the toposort level of the next item that will be dequeued."""
+        return self._heap[0].level
+
     def _queue_item(
         self, asset_partition: AssetKeyPartitionKey
     ) -> "ToposortedPriorityQueue.QueueItem":
@@ -634,7 +978,7 @@ def _queue_item(
             asset_key
         }
         level = max(
-            self._toposort_level_by_asset_key[required_asset_key]
+            self._index.get_level(required_asset_key)
             for required_asset_key in required_multi_asset_keys
         )
         if self._asset_graph.has_self_dependency(asset_key):
@@ -2,12 +2,15 @@
 import itertools
 import json
 from collections import defaultdict
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -35,6 +38,7 @@
 )
 from dagster._utils.backcompat import deprecation_warning
 from dagster._utils.schedules import cron_string_iterator
+from dagster._utils.timing import format_duration, time_execution_scope
 
 from .asset_selection import AssetGraph, AssetSelection
 from .decorators.sensor_decorator import sensor
@@ -47,6 +51,11 @@
     from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
+# Assets whose evaluation is deferred until a future time are still re-evaluated at least this
+# often, so that changes that don't produce any events (e.g. a changed FreshnessPolicy, or a
+# canceled run) are eventually picked up.
+MAX_EVALUATION_DEFERRAL = datetime.timedelta(minutes=10)
+
 
 def get_implicit_auto_materialize_policy(
     asset_graph: AssetGraph, asset_key: AssetKey
@@ -133,11 +142,16 @@ class AssetReconciliationCursor(NamedTuple):
     materialized_or_requested_root_partitions_by_asset_key: Every key is a partitioned root
         asset. Every value is the set of that asset's partitoins that have been requested by
         this sensor or have been materialized (even if not by this sensor).
+    next_evaluation_timestamps_by_key: Every key is an asset whose time-dependent conditions
+        (freshness policies, or new time window partitions for root assets) were evaluated on a
+        previous tick. Every value is the timestamp before which the asset does not need to be
+        evaluated again, unless it or one of its ancestors is updated in the meantime.
     """
 
     latest_storage_id: Optional[int]
     materialized_or_requested_root_asset_keys: AbstractSet[AssetKey]
     materialized_or_requested_root_partitions_by_asset_key: Mapping[AssetKey, PartitionsSubset]
+    next_evaluation_timestamps_by_key: Mapping[AssetKey, float]
 
     def was_previously_materialized_or_requested(self, asset_key: AssetKey) -> bool:
         return asset_key in self.materialized_or_requested_root_asset_keys
@@ -186,6 +200,7 @@ def with_updates(
         run_requests: Sequence[RunRequest],
         newly_materialized_root_asset_keys: AbstractSet[AssetKey],
         newly_materialized_root_partitions_by_asset_key: Mapping[AssetKey, AbstractSet[str]],
+        next_evaluation_timestamps_by_key: Mapping[AssetKey, float],
         asset_graph: AssetGraph,
     ) -> "AssetReconciliationCursor":
         """Returns a cursor that represents this cursor plus the updates that have happened within the
@@ -243,6 +258,7 @@ def with_updates(
             latest_storage_id=latest_storage_id or self.latest_storage_id,
             materialized_or_requested_root_asset_keys=result_materialized_or_requested_root_asset_keys,
             materialized_or_requested_root_partitions_by_asset_key=result_materialized_or_requested_root_partitions_by_asset_key,
+            next_evaluation_timestamps_by_key=next_evaluation_timestamps_by_key,
         )
 
     @classmethod
@@ -251,6 +267,7 @@ def empty(cls) -> "AssetReconciliationCursor":
             latest_storage_id=None,
             materialized_or_requested_root_partitions_by_asset_key={},
             materialized_or_requested_root_asset_keys=set(),
+            next_evaluation_timestamps_by_key={},
         )
 
     @classmethod
@@ -259,7 +276,11 @@ def from_serialized(cls, cursor: str, asset_graph: AssetGraph) -> "AssetReconcil
             latest_storage_id,
             serialized_materialized_or_requested_root_asset_keys,
             serialized_materialized_or_requested_root_partitions_by_asset_key,
+            *rest,
         ) = json.loads(cursor)
+        # cursors serialized before next evaluation timestamps were tracked have no fourth element,
+        # so every asset is evaluated on the first tick that reads them
+        serialized_next_evaluation_timestamps_by_key = rest[0] if rest else {}
         materialized_or_requested_root_partitions_by_asset_key = {}
         for (
             key_str,
@@ -283,6 +304,13 @@ def from_serialized(cls, cursor: str, asset_graph: AssetGraph) -> "AssetReconcil
                 materialized_or_requested_root_partitions_by_asset_key[
                     key
                 ] = partitions_def.empty_subset()
+
+        next_evaluation_timestamps_by_key = {}
+        for key_str, timestamp in serialized_next_evaluation_timestamps_by_key.items():
+            key = AssetKey.from_user_string(key_str)
+            if key in asset_graph.all_asset_keys:
+                next_evaluation_timestamps_by_key[key] = timestamp
+
         return cls(
             latest_storage_id=latest_storage_id,
             materialized_or_requested_root_asset_keys={
@@ -290,6 +318,7 @@ def from_serialized(cls, cursor: str, asset_graph: AssetGraph) -> "AssetReconcil
                 for key_str in serialized_materialized_or_requested_root_asset_keys
             },
             materialized_or_requested_root_partitions_by_asset_key=materialized_or_requested_root_partitions_by_asset_key,
+            next_evaluation_timestamps_by_key=next_evaluation_timestamps_by_key,
         )
 
     def serialize(self) -> str:
@@ -302,11 +331,48 @@ def serialize(self) -> str:
                 self.latest_storage_id,
                 [key.to_user_string() for key in self.materialized_or_requested_root_asset_keys],
                 serializable_materialized_or_requested_root_partitions_by_asset_key,
+                {
+                    key.to_user_string(): timestamp
+                    for key, timestamp in self.next_evaluation_timestamps_by_key.items()
+                },
             )
         )
         return serialized
 
 
+class AssetReconciliationProfile:
+    """Records how long each step of a reconciliation tick took, and how many assets were involved,
+    so that slow ticks can be attributed to a step.
+    """
+
+    def __init__(self):
+        self.seconds_by_step: Dict[str, float] = {}
+        self.asset_counts: Dict[str, int] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        with time_execution_scope() as timer_result:
+            yield
+        self.seconds_by_step[name] = self.seconds_by_step.get(name, 0.0) + timer_result.seconds
+
+    def record_asset_count(self, name: str, count: int) -> None:
+        self.asset_counts[name] = count
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.seconds_by_step.values())
+
+    def report(self) -> str:
+        lines: List[str] = [
+            f"Asset reconciliation tick took {format_duration(self.total_seconds * 1000)}:"
+        ]
+        for name, seconds in self.seconds_by_step.items():
+            lines.append(f"  {name}: {format_duration(seconds * 1000)}")
+        for name, count in self.asset_counts.items():
+            lines.append(f"  {name}: {count}")
+        return "\n".join(lines)
+
+
 def get_active_backfill_target_asset_graph_subset(
     instance: "DagsterInstance", asset_graph: AssetGraph
 ) -> AssetGraphSubset:
@@ -336,6 +402,85 @@ def get_active_backfill_target_asset_graph_subset(
     return result
 
 
+def find_updated_asset_keys(
+    instance_queryer: "CachingInstanceQueryer",
+    latest_storage_id: Optional[int],
+    asset_keys: AbstractSet[AssetKey],
+    asset_graph: AssetGraph,
+) -> AbstractSet[AssetKey]:
+    """Finds the assets in the given set that have been materialized, or for observable source
+    assets observed, since latest_storage_id.
+
+    Materializations are read from the latest materialization records of the prefetched asset
+    records, and observations with a single query, so this does not issue a query per asset. If
+    latest_storage_id is None, every asset is considered updated.
+    """
+    if latest_storage_id is None:
+        return asset_keys
+
+    updated_asset_keys: Set[AssetKey] = set()
+    for asset_key in asset_keys:
+        if asset_graph.is_source(asset_key):
+            if asset_graph.is_observable(asset_key) and asset_key in (
+                instance_queryer.get_observed_asset_keys(after_cursor=latest_storage_id)
+            ):
+                updated_asset_keys.add(asset_key)
+        elif instance_queryer.get_latest_materialization_record(
+            asset_key, after_cursor=latest_storage_id
+        ):
+            updated_asset_keys.add(asset_key)
+
+    return updated_asset_keys
+
+
+def get_asset_keys_to_evaluate(
+    asset_graph: AssetGraph,
+    cursor: AssetReconciliationCursor,
+    updated_asset_keys: AbstractSet[AssetKey],
+    time_dependent_asset_keys: AbstractSet[AssetKey],
+    current_time: datetime.datetime,
+) -> AbstractSet[AssetKey]:
+    """Returns the assets whose time-dependent conditions need to be evaluated on this tick.
+
+    These are the updated assets, the time-dependent assets that have not been evaluated before or
+    whose next evaluation time has passed, and everything downstream of them. Assets that must be
+    materialized alongside one of these are included as well, since materializing them changes
+    what their own children can expect.
+    """
+    current_timestamp = current_time.timestamp()
+    to_visit = list(updated_asset_keys)
+    for asset_key in time_dependent_asset_keys:
+        next_evaluation_timestamp = cursor.next_evaluation_timestamps_by_key.get(asset_key)
+        if next_evaluation_timestamp is None or next_evaluation_timestamp <= current_timestamp:
+            to_visit.append(asset_key)
+
+    asset_keys_to_evaluate: Set[AssetKey] = set()
+    while to_visit:
+        asset_key = to_visit.pop()
+        if asset_key in asset_keys_to_evaluate:
+            continue
+        asset_keys_to_evaluate.add(asset_key)
+        to_visit.extend(asset_graph.get_children(asset_key))
+        to_visit.extend(asset_graph.get_required_multi_asset_keys(asset_key))
+
+    return asset_keys_to_evaluate
+
+
+def get_next_partition_boundary(
+    partitions_def: TimeWindowPartitionsDefinition, current_time: datetime.datetime
+) -> datetime.datetime:
+    """Returns the first time after current_time at which the set of partitions of the given
+    partitions definition can change.
+    """
+    return next(
+        cron_string_iterator(
+            start_timestamp=current_time.timestamp(),
+            cron_string=partitions_def.cron_schedule,
+            execution_timezone=partitions_def.timezone,
+        )
+    )
+
+
 def find_parent_materialized_asset_partitions(
     instance_queryer: "CachingInstanceQueryer",
     latest_storage_id: Optional[int],
@@ -407,13 +552,8 @@ def find_parent_materialized_asset_partitions(
                 else:
                     # we are mapping from the partitions of the parent asset to the partitions of
                     # the child asset
-                    partition_mapping = asset_graph.get_partition_mapping(child, asset_key)
-                    child_partitions_subset = (
-                        partition_mapping.get_downstream_partitions_for_partitions(
-                            partitions_subset,
-                            downstream_partitions_def=child_partitions_def,
-                            dynamic_partitions_store=instance_queryer,
-                        )
+                    child_partitions_subset = asset_graph.get_child_partitions_subset(
+                        instance_queryer, asset_key, partitions_subset, child
                     )
                     for child_partition in child_partitions_subset.get_partition_keys():
                         # we need to see if the child is planned for the same run, but this is
@@ -508,12 +648,39 @@ def determine_asset_partitions_to_reconcile(
     target_asset_keys_and_parents: AbstractSet[AssetKey],
     asset_graph: AssetGraph,
     current_time: datetime.datetime,
+    updated_asset_keys: Optional[AbstractSet[AssetKey]] = None,
+    asset_keys_to_evaluate: Optional[AbstractSet[AssetKey]] = None,
 ) -> Tuple[
     AbstractSet[AssetKeyPartitionKey],
     AbstractSet[AssetKey],
     Mapping[AssetKey, AbstractSet[str]],
     Optional[int],
+    Mapping[AssetKey, float],
 ]:
+    """Returns:
+    - Asset (partition)s to reconcile.
+    - Non-partitioned root assets that are now materialized (see
+        find_never_materialized_or_requested_root_asset_partitions).
+    - Root asset partitions that are now materialized.
+    - The latest observed storage_id across all relevant assets.
+    - For time window partitioned root assets that were evaluated and have all their missing
+        partitions requested, the timestamp before which they don't need to be evaluated again.
+
+    If updated_asset_keys is provided, only those assets are checked for new materializations. If
+    asset_keys_to_evaluate is provided, time window partitioned root assets outside of it are
+    skipped, as they can only gain new partitions at their next partition boundary.
+    """
+    root_asset_keys = target_asset_keys & asset_graph.root_asset_keys
+    if asset_keys_to_evaluate is not None:
+        root_asset_keys = {
+            asset_key
+            for asset_key in root_asset_keys
+            if asset_key in asset_keys_to_evaluate
+            or not isinstance(
+                asset_graph.get_partitions_def(asset_key), TimeWindowPartitionsDefinition
+            )
+        }
+
     (
         never_materialized_or_requested_roots,
         newly_materialized_root_asset_keys,
@@ -521,7 +688,7 @@ def determine_asset_partitions_to_reconcile(
     ) = find_never_materialized_or_requested_root_asset_partitions(
         instance_queryer=instance_queryer,
         cursor=cursor,
-        target_asset_keys=target_asset_keys,
+        target_asset_keys=root_asset_keys,
         asset_graph=asset_graph,
         current_time=current_time,
     )
@@ -562,7 +729,11 @@ def can_reconcile_candidate(candidate: AssetKeyPartitionKey) -> bool:
         instance_queryer=instance_queryer,
         latest_storage_id=cursor.latest_storage_id,
         target_asset_keys=target_asset_keys,
-        target_asset_keys_and_parents=target_asset_keys_and_parents,
+        target_asset_keys_and_parents=(
+            target_asset_keys_and_parents & updated_asset_keys
+            if updated_asset_keys is not None
+            else target_asset_keys_and_parents
+        ),
         asset_graph=asset_graph,
         can_reconcile_fn=can_reconcile_candidate,
     )
@@ -653,11 +824,28 @@ def should_reconcile(
         set(itertools.chain(never_materialized_or_requested_roots, stale_candidates)),
     )
 
+    # a time window partitioned root asset with no missing partitions left to request won't have
+    # any new ones until its next partition boundary
+    unrequested_root_asset_keys = {
+        asset_partition.asset_key
+        for asset_partition in never_materialized_or_requested_roots
+        if asset_partition not in to_reconcile
+    }
+    next_evaluation_timestamps_by_key: Dict[AssetKey, float] = {}
+    for asset_key in root_asset_keys - unrequested_root_asset_keys:
+        partitions_def = asset_graph.get_partitions_def(asset_key)
+        if isinstance(partitions_def, TimeWindowPartitionsDefinition):
+            next_evaluation_timestamps_by_key[asset_key] = min(
+                get_next_partition_boundary(partitions_def, current_time),
+                current_time + MAX_EVALUATION_DEFERRAL,
+            ).timestamp()
+
     return (
         to_reconcile,
         newly_materialized_root_asset_keys,
         newly_materialized_root_partitions_by_asset_key,
         latest_storage_id,
+        next_evaluation_timestamps_by_key,
     )
 
 
@@ -728,27 +916,61 @@ def determine_asset_partitions_to_reconcile_for_freshness(
     target_asset_keys: AbstractSet[AssetKey],
     target_asset_keys_and_parents: AbstractSet[AssetKey],
     current_time: datetime.datetime,
-) -> AbstractSet[AssetKeyPartitionKey]:
+    asset_keys_to_evaluate: Optional[AbstractSet[AssetKey]] = None,
+) -> Tuple[AbstractSet[AssetKeyPartitionKey], Mapping[AssetKey, float]]:
     """Returns a set of AssetKeyPartitionKeys to materialize in order to abide by the given
     FreshnessPolicies, as well as a set of AssetKeyPartitionKeys which will be materialized at
     some point within the plan window.
 
     Attempts to minimize the total number of asset executions.
+
+    If asset_keys_to_evaluate is provided, assets outside of it are skipped: nothing upstream of
+    them has changed and their execution periods have not started, so they would not be
+    materialized on this tick. For the evaluated assets that are not materialized, also returns the
+    timestamp before which they don't need to be evaluated again.
     """
     from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 
+    def is_relevant(key: AssetKey) -> bool:
+        return (
+            key in target_asset_keys_and_parents
+            and key in asset_graph.non_source_asset_keys
+            and bool(asset_graph.get_downstream_freshness_policies(asset_key=key))
+        )
+
     # now we have a full set of constraints, we can find solutions for them as we move down
     to_materialize: Set[AssetKeyPartitionKey] = set()
     waiting_to_materialize: Set[AssetKey] = set()
     expected_data_time_by_key: Dict[AssetKey, Optional[datetime.datetime]] = {}
+    next_evaluation_timestamps_by_key: Dict[AssetKey, float] = {}
+
+    def get_expected_data_time(key: AssetKey) -> Optional[datetime.datetime]:
+        if (
+            key not in expected_data_time_by_key
+            and asset_keys_to_evaluate is not None
+            and key not in asset_keys_to_evaluate
+            and is_relevant(key)
+        ):
+            # a skipped asset won't be updated on this tick
+            expected_data_time_by_key[key] = data_time_resolver.get_current_data_time(
+                key, current_time
+            )
+        return expected_data_time_by_key.get(key)
+
+    keys_to_evaluate = {
+        key
+        for key in target_asset_keys_and_parents
+        if is_relevant(key) and (asset_keys_to_evaluate is None or key in asset_keys_to_evaluate)
+    }
+    # the data times of the evaluated assets share most of their upstream records, so they're
+    # computed together
+    current_data_time_by_key = data_time_resolver.get_current_data_time_by_key(
+        keys_to_evaluate, current_time
+    )
 
     for level in asset_graph.toposort_asset_keys():
         for key in level:
-            if (
-                key not in target_asset_keys_and_parents
-                or key not in asset_graph.non_source_asset_keys
-                or not asset_graph.get_downstream_freshness_policies(asset_key=key)
-            ):
+            if key not in keys_to_evaluate:
                 continue
 
             parents = asset_graph.get_parents(key)
@@ -771,14 +993,14 @@ def determine_asset_partitions_to_reconcile_for_freshness(
                     continue
 
             # figure out the current contents of this asset with respect to its constraints
-            current_data_time = data_time_resolver.get_current_data_time(key, current_time)
+            current_data_time = current_data_time_by_key[key]
 
             # figure out the expected data time of this asset if it were to be executed on this tick
             expected_data_time = min(
                 (
-                    cast(datetime.datetime, expected_data_time_by_key[k])
-                    for k in parents
-                    if k in expected_data_time_by_key and expected_data_time_by_key[k] is not None
+                    parent_expected_data_time
+                    for parent_expected_data_time in map(get_expected_data_time, parents)
+                    if parent_expected_data_time is not None
                 ),
                 default=current_time,
             )
@@ -830,8 +1052,19 @@ def determine_asset_partitions_to_reconcile_for_freshness(
                 # if downstream assets consume this, they should expect data time equal to the
                 # current time for this asset, as it's not going to be updated
                 expected_data_time_by_key[key] = current_data_time
+                # until its execution period starts, this asset can only be materialized if
+                # something upstream of it changes
+                next_evaluation_time = current_time + MAX_EVALUATION_DEFERRAL
+                if execution_period is not None:
+                    next_evaluation_time = min(next_evaluation_time, execution_period.start)
+                next_evaluation_timestamps_by_key[key] = next_evaluation_time.timestamp()
+
+    # assets selected to be updated as a required neighbor of another asset are evaluated again on
+    # the next tick
+    for asset_partition in to_materialize:
+        next_evaluation_timestamps_by_key.pop(asset_partition.asset_key, None)
 
-    return to_materialize
+    return to_materialize, next_evaluation_timestamps_by_key
 
 
 def reconcile(
@@ -840,9 +1073,18 @@ def reconcile(
     instance: "DagsterInstance",
     cursor: AssetReconciliationCursor,
     run_tags: Optional[Mapping[str, str]],
+    profile: Optional[AssetReconciliationProfile] = None,
 ):
+    """Determines the runs to request on this tick.
+
+    Only the assets that may have changed since the previous tick are evaluated: the assets that
+    have been materialized or observed since the cursor, the assets whose next evaluation time
+    (tracked in the cursor) has passed, and everything downstream of those. If a profile is
+    provided, the time spent in each step is recorded on it.
+    """
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
+    profile = profile or AssetReconciliationProfile()
     current_time = pendulum.now("UTC")
 
     instance_queryer = CachingInstanceQueryer(instance=instance)
@@ -854,15 +1096,64 @@ def reconcile(
     }
     target_asset_keys_and_parents = target_asset_keys | target_parent_asset_keys
 
-    # fetch some data in advance to batch some queries
-    target_asset_keys_and_parents_list = list(target_asset_keys_and_parents)
-    instance_queryer.prefetch_asset_records(target_asset_keys_and_parents_list)
-    instance_queryer.prefetch_asset_partition_counts(
-        target_asset_keys_and_parents_list, after_cursor=cursor.latest_storage_id
-    )
+    with profile.step("prefetch asset records"):
+        # fetch some data in advance to batch some queries
+        instance_queryer.prefetch_asset_records(list(target_asset_keys_and_parents))
+
+    with profile.step("find assets to evaluate"):
+        updated_asset_keys = find_updated_asset_keys(
+            instance_queryer=instance_queryer,
+            latest_storage_id=cursor.latest_storage_id,
+            asset_keys=target_asset_keys_and_parents,
+            asset_graph=asset_graph,
+        )
+        # the assets whose evaluation depends on the passage of time, and not only on new events
+        freshness_asset_keys = {
+            asset_key
+            for asset_key in target_asset_keys_and_parents & asset_graph.non_source_asset_keys
+            if asset_graph.get_downstream_freshness_policies(asset_key=asset_key)
+        }
+        time_window_partitioned_root_asset_keys = {
+            asset_key
+            for asset_key in target_asset_keys & asset_graph.root_asset_keys
+            if isinstance(asset_graph.get_partitions_def(asset_key), TimeWindowPartitionsDefinition)
+        }
+        asset_keys_to_evaluate = get_asset_keys_to_evaluate(
+            asset_graph=asset_graph,
+            cursor=cursor,
+            updated_asset_keys=updated_asset_keys,
+            time_dependent_asset_keys=freshness_asset_keys
+            | time_window_partitioned_root_asset_keys,
+            current_time=current_time,
+        )
+
+    with profile.step("prefetch partition counts"):
+        # partition counts are only read for partitioned assets, and mostly for the ones that are
+        # evaluated on this tick and their parents. any others are fetched on demand
+        partitioned_asset_keys_to_prefetch = [
+            asset_key
+            for asset_key in target_asset_keys_and_parents
+            if asset_graph.is_partitioned(asset_key)
+            and (
+                asset_key in asset_keys_to_evaluate
+                or asset_key in asset_graph.root_asset_keys
+                or not asset_keys_to_evaluate.isdisjoint(asset_graph.get_children(asset_key))
+            )
+        ]
+        if partitioned_asset_keys_to_prefetch:
+            instance_queryer.prefetch_asset_partition_counts(
+                partitioned_asset_keys_to_prefetch, after_cursor=cursor.latest_storage_id
+            )
+
+    profile.record_asset_count("target assets", len(target_asset_keys))
+    profile.record_asset_count("updated assets", len(updated_asset_keys))
+    profile.record_asset_count("assets to evaluate", len(asset_keys_to_evaluate))
 
-    asset_partitions_to_reconcile_for_freshness = (
-        determine_asset_partitions_to_reconcile_for_freshness(
+    with profile.step("freshness"):
+        (
+            asset_partitions_to_reconcile_for_freshness,
+            next_evaluation_timestamps_by_key_for_freshness,
+        ) = determine_asset_partitions_to_reconcile_for_freshness(
             data_time_resolver=CachingDataTimeResolver(
                 instance_queryer=instance_queryer, asset_graph=asset_graph
             ),
@@ -870,28 +1161,49 @@ def reconcile(
             target_asset_keys=target_asset_keys,
             target_asset_keys_and_parents=target_asset_keys_and_parents,
             current_time=current_time,
+            asset_keys_to_evaluate=asset_keys_to_evaluate,
         )
-    )
 
-    (
-        asset_partitions_to_reconcile,
-        newly_materialized_root_asset_keys,
-        newly_materialized_root_partitions_by_asset_key,
-        latest_storage_id,
-    ) = determine_asset_partitions_to_reconcile(
-        instance_queryer=instance_queryer,
-        asset_graph=asset_graph,
-        cursor=cursor,
-        target_asset_keys=target_asset_keys,
-        target_asset_keys_and_parents=target_asset_keys_and_parents,
-        current_time=current_time,
-    )
+    with profile.step("reconciliation"):
+        (
+            asset_partitions_to_reconcile,
+            newly_materialized_root_asset_keys,
+            newly_materialized_root_partitions_by_asset_key,
+            latest_storage_id,
+            next_evaluation_timestamps_by_key_for_roots,
+        ) = determine_asset_partitions_to_reconcile(
+            instance_queryer=instance_queryer,
+            asset_graph=asset_graph,
+            cursor=cursor,
+            target_asset_keys=target_asset_keys,
+            target_asset_keys_and_parents=target_asset_keys_and_parents,
+            current_time=current_time,
+            updated_asset_keys=updated_asset_keys,
+            asset_keys_to_evaluate=asset_keys_to_evaluate,
+        )
 
-    run_requests = build_run_requests(
-        asset_partitions_to_reconcile | asset_partitions_to_reconcile_for_freshness,
-        asset_graph,
-        run_tags,
-    )
+    with profile.step("build run requests"):
+        run_requests = build_run_requests(
+            asset_partitions_to_reconcile | asset_partitions_to_reconcile_for_freshness,
+            asset_graph,
+            run_tags,
+        )
+
+    # assets that weren't evaluated keep their previous next evaluation time. an evaluated asset
+    # gets one only if every evaluation that applies to it has deferred it
+    next_evaluation_timestamps_by_key = {
+        asset_key: timestamp
+        for asset_key, timestamp in cursor.next_evaluation_timestamps_by_key.items()
+        if asset_key not in asset_keys_to_evaluate
+    }
+    for asset_key in asset_keys_to_evaluate:
+        timestamps = []
+        if asset_key in freshness_asset_keys:
+            timestamps.append(next_evaluation_timestamps_by_key_for_freshness.get(asset_key))
+        if asset_key in time_window_partitioned_root_asset_keys:
+            timestamps.append(next_evaluation_timestamps_by_key_for_roots.get(asset_key))
+        if timestamps and None not in timestamps:
+            next_evaluation_timestamps_by_key[asset_key] = min(cast(List[float], timestamps))
 
     return run_requests, cursor.with_updates(
         latest_storage_id=latest_storage_id,
@@ -899,6 +1211,7 @@ def reconcile(
         asset_graph=asset_graph,
         newly_materialized_root_asset_keys=newly_materialized_root_asset_keys,
         newly_materialized_root_partitions_by_asset_key=newly_materialized_root_partitions_by_asset_key,
+        next_evaluation_timestamps_by_key=next_evaluation_timestamps_by_key,
     )
 
 
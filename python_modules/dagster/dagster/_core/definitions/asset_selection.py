@@ -8,12 +8,7 @@
 import dagster._check as check
 from dagster._annotations import deprecated, public
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import parse_clause
 from dagster._utils.backcompat import deprecation_warning
 
 from .asset_graph import AssetGraph
@@ -309,7 +304,7 @@ def __init__(self, child: AssetSelection):
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        return asset_graph.index.get_sinks(selection)
 
 
 class RequiredNeighborsAssetSelection(AssetSelection):
@@ -330,7 +325,7 @@ def __init__(self, child: AssetSelection):
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        return asset_graph.index.get_roots(selection)
 
 
 class DownstreamAssetSelection(AssetSelection):
@@ -347,22 +342,12 @@ def __init__(
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
-            selection if not self.include_self else set(),
+        all_downstream = set(selection) | asset_graph.index.get_descendants(
+            selection, depth=self.depth
         )
+        if not self.include_self:
+            all_downstream -= selection
+        return all_downstream
 
 
 class GroupsAssetSelection(AssetSelection):
@@ -423,21 +408,7 @@ def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         if len(selection) == 0:
             return selection
 
-        all_upstream = operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="upstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-                set(),
-            ),
-            selection if not self.include_self else set(),
-        )
+        all_upstream = set(selection) | asset_graph.index.get_ancestors(selection, depth=self.depth)
+        if not self.include_self:
+            all_upstream -= selection
         return {key for key in all_upstream if key not in asset_graph.source_asset_keys}
@@ -1,5 +1,5 @@
 import datetime
-from typing import AbstractSet, Dict, Mapping, Optional, Sequence, Tuple, cast
+from typing import AbstractSet, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple, cast
 
 import pendulum
 
@@ -479,6 +479,56 @@ def get_current_data_time(
 
         return min(cast(AbstractSet[datetime.datetime], data_times), default=None)
 
+    def get_current_data_time_by_key(
+        self, asset_keys: Iterable[AssetKey], current_time: datetime.datetime
+    ) -> Mapping[AssetKey, Optional[datetime.datetime]]:
+        """Returns the current data time of each of the given assets.
+
+        The latest materializations of the assets and of all their ancestors are fetched in a
+        single query, and the data times are computed from the roots of the graph down. Each asset
+        then finds the data times of the parent materializations it consumed already computed,
+        unless a parent has been materialized again since.
+        """
+        asset_keys = set(asset_keys)
+        keys = self._get_non_source_ancestors_for_data_time(asset_keys)
+        self._instance_queryer.prefetch_asset_records(list(keys))
+
+        data_time_by_key: Dict[AssetKey, Optional[datetime.datetime]] = {}
+        for key in sorted(keys, key=self._asset_graph.index.get_position):
+            data_time = self.get_current_data_time(key, current_time=current_time)
+            if key in asset_keys:
+                data_time_by_key[key] = data_time
+        return data_time_by_key
+
+    def _get_non_source_ancestors_for_data_time(
+        self, asset_keys: AbstractSet[AssetKey]
+    ) -> AbstractSet[AssetKey]:
+        """Returns the given assets and the ancestors whose materializations their data times can
+        depend on. Data times are not traced through time-partitioned assets, so their ancestors
+        are not included.
+        """
+        all_asset_keys = self._asset_graph.all_asset_keys
+        source_asset_keys = self._asset_graph.source_asset_keys
+        keys: Set[AssetKey] = set()
+        to_visit = [
+            key for key in asset_keys if key in all_asset_keys and key not in source_asset_keys
+        ]
+        while to_visit:
+            key = to_visit.pop()
+            if key in keys:
+                continue
+            keys.add(key)
+            if isinstance(
+                self._asset_graph.get_partitions_def(key), TimeWindowPartitionsDefinition
+            ):
+                continue
+            to_visit.extend(
+                parent_key
+                for parent_key in self._asset_graph.get_parents(key)
+                if parent_key in all_asset_keys and parent_key not in source_asset_keys
+            )
+        return keys
+
     def get_current_minutes_late(
         self,
         asset_key: AssetKey,
@@ -494,3 +544,27 @@ def get_current_minutes_late(
             data_time=self.get_current_data_time(asset_key, current_time=evaluation_time),
             evaluation_time=evaluation_time,
         )
+
+    def get_current_minutes_late_by_key(
+        self,
+        asset_keys: Iterable[AssetKey],
+        evaluation_time: datetime.datetime,
+    ) -> Mapping[AssetKey, Optional[float]]:
+        """Returns how late each of the given assets is with respect to its FreshnessPolicy, with
+        the data times of all the assets computed together.
+        """
+        asset_keys = set(asset_keys)
+        freshness_policies_by_key = self._asset_graph.freshness_policies_by_key
+        for asset_key in asset_keys:
+            if freshness_policies_by_key.get(asset_key) is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot calculate minutes late for asset without a FreshnessPolicy"
+                )
+
+        data_time_by_key = self.get_current_data_time_by_key(asset_keys, evaluation_time)
+        return {
+            asset_key: check.not_none(freshness_policies_by_key[asset_key]).minutes_overdue(
+                data_time=data_time_by_key[asset_key], evaluation_time=evaluation_time
+            )
+            for asset_key in asset_keys
+        }
@@ -6,13 +6,16 @@
 from hashlib import sha256
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -28,6 +31,8 @@
     from dagster._core.definitions.events import AssetKey
     from dagster._core.events.log import EventLogEntry
     from dagster._core.instance import DagsterInstance
+    from dagster._core.storage.event_log import EventLogRecord
+    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
 class UnknownValue:
@@ -254,16 +259,28 @@ class CachingStaleStatusResolver:
     """Used to resolve data version information. Avoids redundant database
     calls that would otherwise occur. Intended for use within the scope of a
     single "request" (e.g. GQL request, RunRequest resolution).
+
+    The latest materializations of the assets being resolved and of their ancestors are fetched
+    together, the first time any of them is needed. If the keys that will be requested are known up
+    front, passing them as `asset_keys` lets all of them be fetched in a single batch. Statuses are
+    computed from the roots of the graph down, so that long chains of assets don't recurse through
+    every ancestor.
     """
 
     _instance: "DagsterInstance"
     _asset_graph: Optional["AssetGraph"]
     _asset_graph_load_fn: Optional[Callable[[], "AssetGraph"]]
+    _instance_queryer: Optional["CachingInstanceQueryer"]
+    _requested_asset_keys: AbstractSet["AssetKey"]
+    _prefetched_asset_keys: Set["AssetKey"]
+    _resolved_asset_keys: Set["AssetKey"]
 
     def __init__(
         self,
         instance: "DagsterInstance",
         asset_graph: Union["AssetGraph", Callable[[], "AssetGraph"]],
+        instance_queryer: Optional["CachingInstanceQueryer"] = None,
+        asset_keys: Optional[Iterable["AssetKey"]] = None,
     ):
         from dagster._core.definitions.asset_graph import AssetGraph
 
@@ -274,19 +291,70 @@ def __init__(
         else:
             self._asset_graph = None
             self._asset_graph_load_fn = asset_graph
+        self._instance_queryer = instance_queryer
+        self._requested_asset_keys = set(asset_keys) if asset_keys is not None else set()
+        self._prefetched_asset_keys = set()
+        self._resolved_asset_keys = set()
 
     def get_status(self, key: AssetKey) -> StaleStatus:
+        self._resolve_ancestors(key)
         return self._get_status(key=key)
 
     def get_stale_causes(self, key: AssetKey) -> Sequence[StaleCause]:
+        self._resolve_ancestors(key)
         return self._get_stale_causes(key=key)
 
     def get_stale_root_causes(self, key: AssetKey) -> Sequence[StaleCause]:
+        self._resolve_ancestors(key)
         return self._get_stale_root_causes(key=key)
 
     def get_current_data_version(self, key: AssetKey) -> DataVersion:
         return self._get_current_data_version(key=key)
 
+    @property
+    def instance_queryer(self) -> "CachingInstanceQueryer":
+        """The queryer that the resolver's event records are fetched through, which can be shared
+        with other resolvers in the same request.
+        """
+        if self._instance_queryer is None:
+            from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+            self._instance_queryer = CachingInstanceQueryer(self._instance)
+        return self._instance_queryer
+
+    def _prefetch(self, key: AssetKey) -> None:
+        if key in self._prefetched_asset_keys:
+            return
+
+        keys = {key, *self._requested_asset_keys}
+        keys |= self.asset_graph.index.get_ancestors(keys)
+        # source assets are observed rather than materialized, so they aren't covered by the batch
+        keys_to_fetch = [
+            asset_key
+            for asset_key in keys - self._prefetched_asset_keys
+            if not self.asset_graph.is_source(asset_key)
+        ]
+        if keys_to_fetch:
+            self.instance_queryer.prefetch_asset_records(keys_to_fetch)
+        self._prefetched_asset_keys |= keys
+
+    def _resolve_ancestors(self, key: AssetKey) -> None:
+        if key in self._resolved_asset_keys:
+            return
+
+        self._prefetch(key)
+        index = self.asset_graph.index
+        ancestors = index.get_ancestors([key]) - self._resolved_asset_keys
+        # resolving parents before their children means each status only looks one level up for
+        # the statuses it depends on. Sources are resolved when a child needs them, since that can
+        # require querying for their observations
+        for ancestor in sorted(ancestors, key=index.get_position):
+            if not self.asset_graph.is_source(ancestor):
+                self._is_partitioned_or_downstream(key=ancestor)
+                self._get_status(key=ancestor)
+        self._resolved_asset_keys |= ancestors
+        self._resolved_asset_keys.add(key)
+
     @cached_method
     def _get_status(self, key: AssetKey) -> StaleStatus:
         current_version = self._get_current_data_version(key=key)
@@ -413,11 +481,14 @@ def _get_stale_root_causes(self, key: AssetKey) -> Sequence[StaleCause]:
 
     # The leaves of the cause tree for an asset are the root causes of its staleness.
     def _gather_leaves(self, cause: StaleCause, level: int = 0) -> Iterator[Tuple[int, StaleCause]]:
-        if cause.children is None:
-            yield (level, cause)
-        else:
-            for child in cause.children:
-                yield from self._gather_leaves(child, level=level + 1)
+        # the tree is as deep as the longest chain of stale assets, so it's walked without recursion
+        stack = [(level, cause)]
+        while stack:
+            level, cause = stack.pop()
+            if cause.children is None:
+                yield (level, cause)
+            else:
+                stack.extend((level + 1, child) for child in reversed(cause.children))
 
     @property
     def asset_graph(self) -> "AssetGraph":
@@ -428,21 +499,25 @@ def asset_graph(self) -> "AssetGraph":
     @cached_method
     def _get_current_data_version(self, *, key: AssetKey) -> DataVersion:
         is_source = self.asset_graph.is_source(key)
-        event = self._instance.get_latest_data_version_record(
-            key,
-            is_source,
+        self._prefetch(key)
+        record: Optional["EventLogRecord"] = (
+            self.instance_queryer.get_observation_record(asset_key=key, before_cursor=None)
+            if is_source
+            else self.instance_queryer.get_latest_materialization_record(key)
         )
-        if event is None and is_source:
+        if record is None and is_source:
             return DEFAULT_DATA_VERSION
-        elif event is None:
+        elif record is None:
             return NULL_DATA_VERSION
         else:
-            data_version = extract_data_version_from_entry(event.event_log_entry)
+            data_version = extract_data_version_from_entry(record.event_log_entry)
             return data_version or DEFAULT_DATA_VERSION
 
     @cached_method
     def _get_latest_materialization_event(self, *, key: AssetKey) -> Optional[EventLogEntry]:
-        return self._instance.get_latest_materialization_event(key)
+        self._prefetch(key)
+        record = self.instance_queryer.get_latest_materialization_record(key)
+        return record.event_log_entry if record else None
 
     @cached_method
     def _is_current_data_version_user_provided(self, *, key: AssetKey) -> bool:
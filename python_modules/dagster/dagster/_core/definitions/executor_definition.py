@@ -331,12 +331,19 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    worker_pool_cfg = (
+        check.opt_dict_elem(config, "worker_pool") if "worker_pool" in config else None
+    )
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=check.opt_int_elem(worker_pool_cfg or {}, "max_steps_per_worker"),
+        max_worker_memory_mb=check.opt_int_elem(worker_pool_cfg or {}, "max_worker_memory_mb"),
     )
 
 
@@ -389,6 +396,32 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Int,
+                    is_required=False,
+                    description=(
+                        "The number of steps that a worker process executes before it is replaced"
+                        " with a new one. By default, workers are not replaced."
+                    ),
+                ),
+                "max_worker_memory_mb": Field(
+                    Int,
+                    is_required=False,
+                    description=(
+                        "Replace a worker process after a step once its peak memory usage exceeds"
+                        " this many megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of up to `max_concurrent` long-lived worker processes,"
+                " which each load the job once, instead of starting a new process for each step."
+                " Resources are still initialized for each step."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -258,18 +258,22 @@ def _wrapped_fn(context: SensorEvaluationContext):
                 context.cursor
             ).minutes_late_by_key
 
-            minutes_late_by_key: Dict[AssetKey, Optional[float]] = {}
+            # get the current minutes_overdue values of all the monitored assets at once
+            minutes_late_by_key: Dict[AssetKey, Optional[float]] = dict(
+                data_time_resolver.get_current_minutes_late_by_key(
+                    [
+                        asset_key
+                        for asset_key in monitored_keys
+                        if asset_graph.freshness_policies_by_key.get(asset_key) is not None
+                    ],
+                    evaluation_time=evaluation_time,
+                )
+            )
             for asset_key in monitored_keys:
                 freshness_policy = asset_graph.freshness_policies_by_key.get(asset_key)
                 if freshness_policy is None:
                     continue
 
-                # get the current minutes_overdue value for this asset
-                minutes_late_by_key[asset_key] = data_time_resolver.get_current_minutes_late(
-                    evaluation_time=evaluation_time,
-                    asset_key=asset_key,
-                )
-
                 resource_args_populated = validate_and_get_resource_dict(
                     context.resources, name, resource_arg_names
                 )
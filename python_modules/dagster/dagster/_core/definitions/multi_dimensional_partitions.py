@@ -1,5 +1,6 @@
 import hashlib
 import itertools
+import json
 from datetime import datetime
 from functools import reduce
 from typing import (
@@ -29,13 +30,17 @@
     MULTIDIMENSIONAL_PARTITION_PREFIX,
     get_multidimensional_partition_tag,
 )
+from dagster._utils.cached_method import cached_method
 
 from .partition import (
+    BitmapPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
+    PartitionKeyIndex,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
+    get_observed_partition_key_index,
 )
 from .time_window_partitions import TimeWindow, TimeWindowPartitionsDefinition
 
@@ -99,6 +104,102 @@ def keys_by_dimension(self) -> Mapping[str, str]:
         return {dim_key.dimension_name: dim_key.partition_key for dim_key in self.dimension_keys}
 
 
+class MultiPartitionKeyIndex(PartitionKeyIndex[MultiPartitionKey]):
+    """Maps the partition keys of a multi-partitions definition whose dimensions all have partition key
+    indexes to their positions in the cross-product of the dimensions, without building every key.
+    """
+
+    def __init__(
+        self,
+        dimension_names: Sequence[str],
+        dimension_indexes: Sequence[PartitionKeyIndex[str]],
+    ):
+        self._dimension_names = dimension_names
+        self._dimension_indexes = dimension_indexes
+
+        # The keys of the cross-product are ordered by the first dimension, then by the second
+        # dimension, so each position of a dimension spans the product of the sizes of the
+        # dimensions after it.
+        self._strides: List[int] = []
+        num_partitions = 1
+        for dimension_index in reversed(dimension_indexes):
+            self._strides.insert(0, num_partitions)
+            num_partitions *= dimension_index.num_partitions
+        self._num_partitions = num_partitions
+
+    @property
+    def num_partitions(self) -> int:
+        return self._num_partitions
+
+    def get_fingerprint(self, num_partitions: int) -> Optional[str]:
+        # Adding a key to a dimension shifts the positions of the cross-product, so positions can
+        # only be compared with those of the same dimensions
+        if num_partitions != self._num_partitions:
+            return None
+
+        dimension_fingerprints = []
+        for dimension_name, dimension_index in zip(self._dimension_names, self._dimension_indexes):
+            dimension_fingerprint = dimension_index.get_fingerprint(dimension_index.num_partitions)
+            if dimension_fingerprint is None:
+                return None
+            dimension_fingerprints.append([dimension_name, dimension_fingerprint])
+        return hashlib.sha1(json.dumps(dimension_fingerprints).encode("utf-8")).hexdigest()
+
+    def _get_dimension_keys(self, partition_key: str) -> Optional[Sequence[str]]:
+        if isinstance(partition_key, MultiPartitionKey):
+            if [
+                dim_key.dimension_name for dim_key in partition_key.dimension_keys
+            ] != self._dimension_names:
+                return None
+            return [dim_key.partition_key for dim_key in partition_key.dimension_keys]
+
+        dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        return dimension_keys if len(dimension_keys) == len(self._dimension_names) else None
+
+    def get_index(self, partition_key: str) -> Optional[int]:
+        dimension_keys = self._get_dimension_keys(partition_key)
+        if dimension_keys is None:
+            return None
+
+        index = 0
+        for dimension_key, dimension_index, stride in zip(
+            dimension_keys, self._dimension_indexes, self._strides
+        ):
+            dimension_position = dimension_index.get_index(dimension_key)
+            if dimension_position is None:
+                return None
+            index += dimension_position * stride
+        return index
+
+    def get_partition_key(self, index: int) -> MultiPartitionKey:
+        keys_by_dimension = {}
+        for dimension_name, dimension_index, stride in zip(
+            self._dimension_names, self._dimension_indexes, self._strides
+        ):
+            dimension_position, index = divmod(index, stride)
+            keys_by_dimension[dimension_name] = dimension_index.get_partition_key(
+                dimension_position
+            )
+        return MultiPartitionKey(keys_by_dimension)
+
+    def normalize_unindexed_key(self, partition_key: str) -> Optional[MultiPartitionKey]:
+        # like MultiPartitionsSubset, drop keys that are not multi-partition keys
+        if isinstance(partition_key, MultiPartitionKey):
+            return partition_key
+        if MULTIPARTITION_KEY_DELIMITER not in partition_key:
+            return None
+
+        dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        check.invariant(
+            len(dimension_keys) == len(self._dimension_names),
+            (
+                f"Expected {len(self._dimension_names)} partition keys in partition key string"
+                f" {partition_key}, but got {len(dimension_keys)}"
+            ),
+        )
+        return MultiPartitionKey(dict(zip(self._dimension_names, dimension_keys)))
+
+
 class PartitionDimensionDefinition(
     NamedTuple(
         "_PartitionDimensionDefinition",
@@ -214,8 +315,39 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        if self.get_partition_key_index() is not None:
+            return BitmapPartitionsSubset
         return MultiPartitionsSubset
 
+    @cached_method
+    def get_partition_key_index(self) -> Optional[PartitionKeyIndex[MultiPartitionKey]]:
+        dimension_indexes = [
+            dim_def.partitions_def.get_partition_key_index() for dim_def in self._partitions_defs
+        ]
+        if all(
+            dimension_index is not None and dimension_index.has_definition_order
+            for dimension_index in dimension_indexes
+        ):
+            return MultiPartitionKeyIndex(
+                self.partition_dimension_names,
+                cast(Sequence[PartitionKeyIndex[str]], dimension_indexes),
+            )
+
+        # the keys of time window and dynamic dimensions change after definition time
+        return get_observed_partition_key_index(self, self._normalize_partition_key)
+
+    def _normalize_partition_key(self, partition_key: str) -> Optional[MultiPartitionKey]:
+        # like MultiPartitionsSubset, drop keys that are not multi-partition keys, and key the rest
+        # by the dimensions of this definition
+        if (
+            isinstance(partition_key, MultiPartitionKey)
+            and list(partition_key.keys_by_dimension) == self.partition_dimension_names
+        ):
+            return partition_key
+        if MULTIPARTITION_KEY_DELIMITER not in partition_key:
+            return None
+        return self.get_partition_key_from_str(partition_key)
+
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
     ) -> str:
@@ -1,6 +1,10 @@
+import base64
 import copy
 import hashlib
 import json
+import re
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from datetime import (
     datetime,
@@ -8,15 +12,20 @@
 )
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Callable,
+    Dict,
     Generic,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -44,6 +53,7 @@
 from dagster._utils.cached_method import cached_method
 
 from ..errors import (
+    DagsterDefinitionChangedDeserializationError,
     DagsterInvalidDefinitionError,
     DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
@@ -140,8 +150,16 @@ class PartitionsDefinition(ABC, Generic[T_str]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset[T_str]"]:
+        if self.get_partition_key_index() is not None:
+            return BitmapPartitionsSubset[T_str]
         return DefaultPartitionsSubset[T_str]
 
+    def get_partition_key_index(self) -> Optional["PartitionKeyIndex[T_str]"]:
+        """Returns an index that maps partition keys to positions, if the keys can be indexed. Subsets
+        of definitions with an index are represented as bitmaps over the positions of their keys.
+        """
+        return None
+
     @abstractmethod
     @public
     def get_partition_keys(
@@ -317,6 +335,13 @@ def get_partition_keys(
     ) -> Sequence[str]:
         return self._partition_keys
 
+    @cached_method
+    def get_partition_key_index(self) -> Optional["PartitionKeyIndex[str]"]:
+        # Partition keys that are defined more than once can't be mapped to a single position
+        if len(set(self._partition_keys)) != len(self._partition_keys):
+            return None
+        return PartitionKeyIndex(self._partition_keys)
+
     def __hash__(self):
         return hash(self.__repr__())
 
@@ -352,6 +377,10 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._instance.get_dynamic_partitions(partitions_def_name)
 
 
+def _normalize_dynamic_partition_key(partition_key: str) -> Optional[str]:
+    return partition_key
+
+
 class DynamicPartitionsDefinition(
     PartitionsDefinition,
     NamedTuple(
@@ -481,6 +510,11 @@ def get_partition_keys(
                 partitions_def_name=self._validated_name()
             )
 
+    @cached_method
+    def get_partition_key_index(self) -> Optional["PartitionKeyIndex[str]"]:
+        # the keys are only known to the instance, so positions are assigned as keys are seen
+        return get_observed_partition_key_index(self, _normalize_dynamic_partition_key)
+
     def has_partition_key(
         self,
         partition_key: str,
@@ -853,6 +887,20 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
             return self
         return self.with_partition_keys(other.get_partition_keys())
 
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key in other
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self.partitions_def.empty_subset()
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key not in other
+        )
+
     @abstractmethod
     def serialize(self) -> str:
         ...
@@ -894,6 +942,28 @@ def empty_subset(cls, partitions_def: PartitionsDefinition[T_str]) -> "Partition
         ...
 
 
+def _get_partition_key_ranges(
+    partition_keys: Iterable[str], subset: Union[AbstractSet[str], PartitionsSubset]
+) -> Sequence[PartitionKeyRange]:
+    cur_range_start = None
+    cur_range_end = None
+    result = []
+    for partition_key in partition_keys:
+        if partition_key in subset:
+            if cur_range_start is None:
+                cur_range_start = partition_key
+            cur_range_end = partition_key
+        else:
+            if cur_range_start is not None and cur_range_end is not None:
+                result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+            cur_range_start = cur_range_end = None
+
+    if cur_range_start is not None and cur_range_end is not None:
+        result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+    return result
+
+
 class DefaultPartitionsSubset(PartitionsSubset[T_str]):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -931,23 +1001,7 @@ def get_partition_key_ranges(
         partition_keys = self._partitions_def.get_partition_keys(
             current_time, dynamic_partitions_store=dynamic_partitions_store
         )
-        cur_range_start = None
-        cur_range_end = None
-        result = []
-        for partition_key in partition_keys:
-            if partition_key in self._subset:
-                if cur_range_start is None:
-                    cur_range_start = partition_key
-                cur_range_end = partition_key
-            else:
-                if cur_range_start is not None and cur_range_end is not None:
-                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-                cur_range_start = cur_range_end = None
-
-        if cur_range_start is not None and cur_range_end is not None:
-            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-
-        return result
+        return _get_partition_key_ranges(partition_keys, self._subset)
 
     def with_partition_keys(
         self, partition_keys: Iterable[str]
@@ -1001,6 +1055,8 @@ def partitions_def(self) -> PartitionsDefinition[T_str]:
         return self._partitions_def
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return (
             isinstance(other, DefaultPartitionsSubset)
             and self._partitions_def == other._partitions_def  # noqa: SLF001
@@ -1021,3 +1077,463 @@ def __repr__(self) -> str:
     @classmethod
     def empty_subset(cls, partitions_def: PartitionsDefinition[T_str]) -> "PartitionsSubset[T_str]":
         return cls(partitions_def=partitions_def)
+
+
+class PartitionKeyIndex(Generic[T_str]):
+    """Maps the partition keys of a partitions definition whose keys are fixed at definition time to
+    their positions in the definition.
+    """
+
+    # Whether the positions follow the order of the keys in the definition, and are therefore the
+    # same in every process that loads the definition
+    has_definition_order = True
+
+    def __init__(self, partition_keys: Sequence[T_str]):
+        self._partition_keys = partition_keys
+        self._index_by_key = {partition_key: i for i, partition_key in enumerate(partition_keys)}
+        self._fingerprints: Dict[int, str] = {}
+
+    @property
+    def num_partitions(self) -> int:
+        return len(self._partition_keys)
+
+    def get_index(self, partition_key: str) -> Optional[int]:
+        return self._index_by_key.get(partition_key)
+
+    def index_partition_key(self, partition_key: str) -> Optional[int]:
+        """Returns the position at which a subset records a partition key, or None if the key is not
+        in the index.
+        """
+        return self.get_index(partition_key)
+
+    def get_partition_key(self, index: int) -> T_str:
+        return self._partition_keys[index]
+
+    def get_fingerprint(self, num_partitions: int) -> Optional[str]:
+        """Returns a hash of the keys at the first num_partitions positions, which only matches the
+        hash of another index if those positions hold the same keys in both, or None if the
+        positions can't be compared across indexes.
+        """
+        if num_partitions not in self._fingerprints:
+            self._fingerprints[num_partitions] = hashlib.sha1(
+                json.dumps(list(self._partition_keys[:num_partitions])).encode("utf-8")
+            ).hexdigest()
+        return self._fingerprints[num_partitions]
+
+    def normalize_unindexed_key(self, partition_key: str) -> Optional[T_str]:
+        """Returns the key to keep in a subset for a partition key that is not in the index, or None
+        if the key should be dropped from the subset.
+        """
+        return cast(T_str, partition_key)
+
+
+class ObservedPartitionKeyIndex(PartitionKeyIndex[T_str]):
+    """Maps the partition keys of a partitions definition whose keys are not fixed at definition time,
+    e.g. dynamic partitions, to positions assigned in the order the keys are first added to a subset
+    in this process.
+
+    The positions are only meaningful within the process, so subsets of these definitions are
+    serialized as partition keys.
+    """
+
+    has_definition_order = False
+
+    def __init__(self, normalize_key: Callable[[str], Optional[T_str]]):
+        super().__init__([])
+        self._normalize_key = normalize_key
+        self._lock = threading.Lock()
+
+    def index_partition_key(self, partition_key: str) -> Optional[int]:
+        index = self.get_index(partition_key)
+        if index is not None:
+            return index
+
+        normalized_key = self._normalize_key(partition_key)
+        if normalized_key is None:
+            return None
+
+        with self._lock:
+            index = self._index_by_key.get(normalized_key)
+            if index is None:
+                index = len(self._partition_keys)
+                cast(List[T_str], self._partition_keys).append(normalized_key)
+                self._index_by_key[normalized_key] = index
+            return index
+
+    def get_fingerprint(self, num_partitions: int) -> Optional[str]:
+        return None
+
+    def normalize_unindexed_key(self, partition_key: str) -> Optional[T_str]:
+        # every key that isn't dropped is indexed
+        return None
+
+
+_observed_partition_key_indexes: Dict[PartitionsDefinition, ObservedPartitionKeyIndex] = {}
+_observed_partition_key_indexes_lock = threading.Lock()
+
+
+def get_observed_partition_key_index(
+    partitions_def: PartitionsDefinition[T_str],
+    normalize_key: Callable[[str], Optional[T_str]],
+) -> ObservedPartitionKeyIndex[T_str]:
+    """Returns the index shared by every equal instance of a partitions definition in this process,
+    so that subsets of definitions loaded separately can still be combined bitwise.
+    """
+    with _observed_partition_key_indexes_lock:
+        if partitions_def not in _observed_partition_key_indexes:
+            _observed_partition_key_indexes[partitions_def] = ObservedPartitionKeyIndex(
+                normalize_key
+            )
+        return _observed_partition_key_indexes[partitions_def]
+
+
+_RUNS_OF_SET_BITS = re.compile("1+")
+
+# Below this many positions, setting one bit at a time is faster than building the binary string
+_MAX_POSITIONS_TO_SET_BITWISE = 32
+
+
+def _bitmap_from_indices(indices: Sequence[int]) -> int:
+    if len(indices) <= _MAX_POSITIONS_TO_SET_BITWISE:
+        bitmap = 0
+        for index in indices:
+            bitmap |= 1 << index
+        return bitmap
+
+    # build the binary representation of the bitmap, least significant bit first, and parse it at once
+    bits = bytearray(b"0") * (max(indices) + 1)
+    for index in indices:
+        bits[index] = ord("1")
+    bits.reverse()
+    return int(bits, 2)
+
+
+def _bitmap_from_ranges(ranges: Sequence[Sequence[int]]) -> int:
+    if not ranges:
+        return 0
+
+    bits = bytearray(b"0") * (max(end for _, end in ranges) + 1)
+    for start, end in ranges:
+        bits[start : end + 1] = b"1" * (end - start + 1)
+    bits.reverse()
+    return int(bits, 2)
+
+
+def _compress_partition_keys(partition_keys: Sequence[str]) -> str:
+    return base64.b64encode(zlib.compress(json.dumps(partition_keys).encode("utf-8"))).decode(
+        "ascii"
+    )
+
+
+def _decompress_partition_keys(compressed: str) -> Sequence[str]:
+    return json.loads(zlib.decompress(base64.b64decode(compressed)).decode("utf-8"))
+
+
+class BitmapPartitionsSubset(PartitionsSubset[T_str]):
+    """A subset of a partitions definition whose partition keys can be indexed, represented as a
+    bitmap over the positions of the keys in the index.
+
+    Unions, intersections and differences of subsets of the same partitions definition are bitwise
+    operations on the bitmaps. Partition keys that are not in the index, e.g. keys that have since
+    been removed from a static definition, are kept alongside the bitmap.
+
+    Subsets are serialized as runs of consecutive positions, along with a fingerprint of the keys
+    at those positions, and deserialized positionally as long as the definition still has the same
+    keys at those positions, e.g. after keys were appended to it. Keys that are not recorded by
+    position, including all the keys of definitions whose positions are only meaningful within the
+    process, are serialized as a compressed list of keys.
+    """
+
+    # Version 1 is the serialization format of DefaultPartitionsSubset, which can still be
+    # deserialized into a BitmapPartitionsSubset.
+    SERIALIZATION_VERSION = 2
+
+    def __init__(
+        self,
+        partitions_def: PartitionsDefinition[T_str],
+        bitmap: int = 0,
+        unindexed_keys: Optional[AbstractSet[T_str]] = None,
+    ):
+        partition_key_index = partitions_def.get_partition_key_index()
+        if partition_key_index is None:
+            check.failed(
+                f"Partitions definition {partitions_def} does not have a partition key index."
+            )
+        self._partitions_def = partitions_def
+        self._partition_key_index = cast(PartitionKeyIndex[T_str], partition_key_index)
+        self._bitmap = check.int_param(bitmap, "bitmap")
+        self._unindexed_keys = frozenset(unindexed_keys or [])
+        # the binary representation of the bitmap, with the bit for position i at index i
+        self._bits: Optional[str] = None
+
+    def _get_bits(self) -> str:
+        if self._bits is None:
+            self._bits = format(self._bitmap, "b")[::-1] if self._bitmap else ""
+        return self._bits
+
+    def _get_indices(self) -> Iterator[int]:
+        bits = self._get_bits()
+        index = bits.find("1")
+        while index != -1:
+            yield index
+            index = bits.find("1", index + 1)
+
+    def _get_index_ranges(self) -> Sequence[Tuple[int, int]]:
+        return [
+            (match.start(), match.end() - 1)
+            for match in _RUNS_OF_SET_BITS.finditer(self._get_bits())
+        ]
+
+    def _with_bitmap(
+        self, bitmap: int, unindexed_keys: AbstractSet[T_str]
+    ) -> "BitmapPartitionsSubset[T_str]":
+        return BitmapPartitionsSubset(self._partitions_def, bitmap, unindexed_keys)
+
+    def _has_same_index(self, other: object) -> bool:
+        if not isinstance(other, BitmapPartitionsSubset):
+            return False
+        if other._partition_key_index is self._partition_key_index:  # noqa: SLF001
+            return True
+        # the positions of equal definitions only match if they follow the definition's order
+        return (
+            self._partition_key_index.has_definition_order
+            and other._partition_key_index.has_definition_order  # noqa: SLF001
+            and other._partitions_def == self._partitions_def  # noqa: SLF001
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[T_str]:
+        if not self._partition_key_index.has_definition_order:
+            all_partitions = self._with_bitmap(0, set()).with_partition_keys(
+                self._partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                )
+            )
+            return (all_partitions - self).get_partition_keys()
+
+        all_partitions_bitmap = (1 << self._partition_key_index.num_partitions) - 1
+        not_in_subset = self._with_bitmap(all_partitions_bitmap & ~self._bitmap, set())
+        return {
+            self._partition_key_index.get_partition_key(index)
+            for index in not_in_subset._get_indices()  # noqa: SLF001
+        }
+
+    def _get_indexed_partition_keys(self) -> Iterator[T_str]:
+        get_partition_key = self._partition_key_index.get_partition_key
+        return (get_partition_key(index) for index in self._get_indices())
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[T_str]:
+        return set(self._get_indexed_partition_keys()) | self._unindexed_keys
+
+    def get_partition_key_ranges(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        if not self._partition_key_index.has_definition_order:
+            return _get_partition_key_ranges(
+                self._partitions_def.get_partition_keys(
+                    current_time, dynamic_partitions_store=dynamic_partitions_store
+                ),
+                self,
+            )
+
+        get_partition_key = self._partition_key_index.get_partition_key
+        return [
+            PartitionKeyRange(get_partition_key(start), get_partition_key(end))
+            for start, end in self._get_index_ranges()
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset[T_str]":
+        indices = []
+        unindexed_keys = set()
+        for partition_key in partition_keys:
+            index = self._partition_key_index.index_partition_key(partition_key)
+            if index is not None:
+                indices.append(index)
+                continue
+
+            unindexed_key = self._partition_key_index.normalize_unindexed_key(partition_key)
+            if unindexed_key is not None:
+                unindexed_keys.add(unindexed_key)
+
+        return self._with_bitmap(
+            self._bitmap | _bitmap_from_indices(indices), self._unindexed_keys | unindexed_keys
+        )
+
+    def with_partition_key_range(
+        self,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset[T_str]":
+        if not self._partition_key_index.has_definition_order:
+            return super().with_partition_key_range(partition_key_range, dynamic_partitions_store)
+
+        start = self._partition_key_index.get_index(partition_key_range.start)
+        end = self._partition_key_index.get_index(partition_key_range.end)
+        if start is None or end is None:
+            return super().with_partition_key_range(partition_key_range, dynamic_partitions_store)
+
+        range_bitmap = ((1 << (end - start + 1)) - 1) << start if end >= start else 0
+        return self._with_bitmap(self._bitmap | range_bitmap, self._unindexed_keys)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset[T_str]:
+        if not self._has_same_index(other):
+            return super().__or__(other)
+        other = cast(BitmapPartitionsSubset[T_str], other)
+        return self._with_bitmap(
+            self._bitmap | other._bitmap,  # noqa: SLF001
+            self._unindexed_keys | other._unindexed_keys,  # noqa: SLF001
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset[T_str]:
+        if not self._has_same_index(other):
+            return super().__and__(other)
+        other = cast(BitmapPartitionsSubset[T_str], other)
+        return self._with_bitmap(
+            self._bitmap & other._bitmap,  # noqa: SLF001
+            self._unindexed_keys & other._unindexed_keys,  # noqa: SLF001
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset[T_str]:
+        if not self._has_same_index(other):
+            return super().__sub__(other)
+        other = cast(BitmapPartitionsSubset[T_str], other)
+        return self._with_bitmap(
+            self._bitmap & ~other._bitmap,  # noqa: SLF001
+            self._unindexed_keys - other._unindexed_keys,  # noqa: SLF001
+        )
+
+    def serialize(self) -> str:
+        data: Dict[str, Any] = {"version": self.SERIALIZATION_VERSION}
+        if self._partition_key_index.has_definition_order:
+            # Serialize the number of partitions in the definition and a fingerprint of its keys, so
+            # that the positions are only read back against a definition that has the same keys at
+            # those positions.
+            num_partitions = self._partition_key_index.num_partitions
+            data["num_partitions"] = num_partitions
+            data["fingerprint"] = self._partition_key_index.get_fingerprint(num_partitions)
+            data["ranges"] = self._get_index_ranges()
+            partition_keys = sorted(self._unindexed_keys)
+        else:
+            partition_keys = sorted(self.get_partition_keys())
+
+        data["keys"] = _compress_partition_keys(partition_keys)
+        return json.dumps(data)
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition[T_str], serialized: str
+    ) -> "PartitionsSubset[T_str]":
+        data = json.loads(serialized)
+        empty_subset = cls(partitions_def)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return empty_subset.with_partition_keys(data)
+
+        version = data.get("version")
+        if version == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return empty_subset.with_partition_keys(data.get("subset"))
+        if version != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {version}, but only"
+                f" versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        if not cls._has_same_positions(partitions_def, data):
+            raise DagsterDefinitionChangedDeserializationError(
+                "Attempted to deserialize a partition subset of a partitions definition whose keys"
+                " have since been removed, renamed or reordered."
+            )
+        return cls(partitions_def, _bitmap_from_ranges(data.get("ranges", []))).with_partition_keys(
+            _decompress_partition_keys(data["keys"])
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition[T_str],
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        if data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return data.get("subset") is not None
+
+        return data.get("version") == cls.SERIALIZATION_VERSION and cls._has_same_positions(
+            partitions_def, data
+        )
+
+    @staticmethod
+    def _has_same_positions(partitions_def: PartitionsDefinition, data: Mapping[str, Any]) -> bool:
+        # subsets serialized without positions can be deserialized against any set of keys
+        if "ranges" not in data:
+            return True
+
+        partition_key_index = partitions_def.get_partition_key_index()
+        num_partitions = data.get("num_partitions")
+        return (
+            partition_key_index is not None
+            and partition_key_index.has_definition_order
+            and isinstance(num_partitions, int)
+            and num_partitions <= partition_key_index.num_partitions
+            and data.get("fingerprint") == partition_key_index.get_fingerprint(num_partitions)
+        )
+
+    @property
+    def partitions_def(self) -> PartitionsDefinition[T_str]:
+        return self._partitions_def
+
+    def __eq__(self, other: object) -> bool:
+        if self._has_same_index(other):
+            other = cast(BitmapPartitionsSubset[T_str], other)
+            return (
+                self._bitmap == other._bitmap  # noqa: SLF001
+                and self._unindexed_keys == other._unindexed_keys  # noqa: SLF001
+                and self._partitions_def == other._partitions_def  # noqa: SLF001
+            )
+        return (
+            isinstance(other, (BitmapPartitionsSubset, DefaultPartitionsSubset))
+            and self._partitions_def == other.partitions_def
+            and set(self.get_partition_keys()) == set(other.get_partition_keys())
+        )
+
+    def __len__(self) -> int:
+        return bin(self._bitmap).count("1") + len(self._unindexed_keys)
+
+    def __contains__(self, value) -> bool:
+        index = self._partition_key_index.get_index(value)
+        if index is None:
+            return value in self._unindexed_keys
+
+        bits = self._get_bits()
+        return index < len(bits) and bits[index] == "1"
+
+    def __repr__(self) -> str:
+        if not self._partition_key_index.has_definition_order:
+            return (
+                f"BitmapPartitionsSubset(partition_keys={set(self.get_partition_keys())},"
+                f" partitions_def={self._partitions_def})"
+            )
+        return (
+            f"BitmapPartitionsSubset(ranges={self.get_partition_key_ranges()},"
+            f" unindexed_keys={set(self._unindexed_keys)}, partitions_def={self._partitions_def})"
+        )
+
+    @classmethod
+    def empty_subset(cls, partitions_def: PartitionsDefinition[T_str]) -> "PartitionsSubset[T_str]":
+        return cls(partitions_def=partitions_def)
@@ -190,6 +190,37 @@ def get_downstream_partitions_for_partition_range(
     ) -> PartitionKeyRange:
         return upstream_partition_key_range
 
+    def get_upstream_partitions_for_partitions(
+        self,
+        downstream_partitions_subset: Optional[PartitionsSubset],
+        upstream_partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> PartitionsSubset:
+        if downstream_partitions_subset is None:
+            check.failed("downstream asset is not partitioned")
+
+        # when both assets share a partitions definition, the subset maps to itself without
+        # going through its key ranges
+        if downstream_partitions_subset.partitions_def == upstream_partitions_def:
+            return downstream_partitions_subset
+
+        return super().get_upstream_partitions_for_partitions(
+            downstream_partitions_subset, upstream_partitions_def, dynamic_partitions_store
+        )
+
+    def get_downstream_partitions_for_partitions(
+        self,
+        upstream_partitions_subset: PartitionsSubset,
+        downstream_partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> PartitionsSubset:
+        if upstream_partitions_subset.partitions_def == downstream_partitions_def:
+            return upstream_partitions_subset
+
+        return super().get_downstream_partitions_for_partitions(
+            upstream_partitions_subset, downstream_partitions_def, dynamic_partitions_store
+        )
+
 
 @whitelist_for_serdes
 class AllPartitionMapping(PartitionMapping, NamedTuple("_AllPartitionMapping", [])):
@@ -455,17 +486,28 @@ def _get_matching_multipartition_keys_for_single_dim_subset(
         partition_dimension_name: str,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
-        matching_keys = []
-        for key in multipartitions_def.get_partition_keys(
-            current_time=None, dynamic_partitions_store=dynamic_partitions_store
-        ):
-            key = cast(MultiPartitionKey, key)  # noqa: PLW2901
-            if (
-                key.keys_by_dimension[partition_dimension_name]
-                in partitions_subset.get_partition_keys()
-            ):
-                matching_keys.append(key)
-        return matching_keys
+        # builds the matching keys from the cross-product of the subset's keys with the keys of the
+        # other dimensions, rather than checking every key of the multipartitions definition
+        subset_keys = set(partitions_subset.get_partition_keys())
+        partition_key_sequences = [
+            [
+                key
+                for key in dimension.partitions_def.get_partition_keys(
+                    current_time=None, dynamic_partitions_store=dynamic_partitions_store
+                )
+                if dimension.name != partition_dimension_name or key in subset_keys
+            ]
+            for dimension in multipartitions_def.partitions_defs
+        ]
+        return [
+            MultiPartitionKey(
+                {
+                    dimension.name: key
+                    for dimension, key in zip(multipartitions_def.partitions_defs, key_tuple)
+                }
+            )
+            for key_tuple in itertools.product(*partition_key_sequences)
+        ]
 
     def _get_single_dim_keys_from_multipartitioned_subset(
         self,
@@ -127,6 +127,13 @@ def load_all_definitions(self):
         # force load of all lazy constructed code artifacts
         self._repository_data.load_all_definitions()
 
+    @property
+    def has_fixed_definitions(self) -> bool:
+        """bool: Whether the definitions in the repository are fixed once loaded. Custom
+        RepositoryData may return different definitions each time they are asked for them.
+        """
+        return isinstance(self._repository_data, CachingRepositoryData)
+
     @public
     @property
     def job_names(self) -> Sequence[str]:
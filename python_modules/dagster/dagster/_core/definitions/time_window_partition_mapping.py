@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import NamedTuple, Optional, cast
+from typing import List, NamedTuple, Optional, cast
 
 import dagster._check as check
 from dagster._annotations import PublicAttr
@@ -134,8 +134,10 @@ def get_downstream_partitions_for_partitions(
             upstream_partitions_subset.partitions_def,
             downstream_partitions_def,
             upstream_partitions_subset,
-            -self.start_offset,
+            # a downstream partition depends on the upstream partitions from start_offset to
+            # end_offset away, so the upstream partitions map back over the reversed range
             -self.end_offset,
+            -self.start_offset,
         )
 
     def _map_partitions(
@@ -170,9 +172,55 @@ def _map_partitions(
         if to_partitions_def == from_partitions_def and start_offset == 0 and end_offset == 0:
             return from_partitions_subset
 
-        time_windows = []
+        # when mapping between partitions of the same definition, the offsets can be applied to
+        # window indices instead of by stepping through the windows one at a time
+        fixed_period_time_windows = (
+            to_partitions_def._get_fixed_period_time_windows()  # noqa: SLF001
+            if to_partitions_def == from_partitions_def
+            else None
+        )
+        last_partition_window = (
+            to_partitions_def.get_last_partition_window()
+            if fixed_period_time_windows is not None
+            else None
+        )
+        last_window_index = (
+            fixed_period_time_windows.get_index_of_window_containing(
+                last_partition_window.start.timestamp()
+            )
+            if fixed_period_time_windows is not None and last_partition_window is not None
+            else None
+        )
+
+        time_windows: List[TimeWindow] = []
         for from_partition_time_window in from_partitions_subset.included_time_windows:
             from_start_dt, from_end_dt = from_partition_time_window
+
+            if fixed_period_time_windows is not None and last_window_index is not None:
+                window_start_index = (
+                    fixed_period_time_windows.get_index_of_window_containing(
+                        from_start_dt.timestamp()
+                    )
+                    + start_offset
+                )
+                window_end_index = (
+                    fixed_period_time_windows.get_index_of_window_containing(
+                        from_end_dt.timestamp()
+                    )
+                    + end_offset
+                )
+                # offsets past the first or last partition are clamped to it. Windows that are
+                # shifted entirely out of range are mapped below
+                if window_start_index <= last_window_index and window_end_index >= 1:
+                    _append_time_window(
+                        time_windows,
+                        fixed_period_time_windows.get_window_start(max(window_start_index, 0)),
+                        fixed_period_time_windows.get_window_start(
+                            min(window_end_index, last_window_index + 1)
+                        ),
+                    )
+                    continue
+
             offsetted_start_dt = _offsetted_datetime(
                 from_partitions_def, from_start_dt, start_offset
             )
@@ -205,18 +253,29 @@ def _map_partitions(
                     else cast(TimeWindow, to_partitions_def.get_last_partition_window()).end
                 )
 
-                time_windows.append(TimeWindow(window_start, window_end))
+                _append_time_window(time_windows, window_start, window_end)
 
         return TimeWindowPartitionsSubset(
             to_partitions_def,
             num_partitions=sum(
-                len(to_partitions_def.get_partition_keys_in_time_window(time_window))
+                to_partitions_def.get_num_partitions_in_time_window(time_window)
                 for time_window in time_windows
             ),
             included_time_windows=time_windows,
         )
 
 
+def _append_time_window(
+    time_windows: List[TimeWindow], window_start: datetime, window_end: datetime
+) -> None:
+    # the windows of the mapped subset are sorted, but with offsets or a coarser partitions
+    # definition, consecutive ones can overlap or touch
+    if time_windows and time_windows[-1].start <= window_start <= time_windows[-1].end:
+        time_windows[-1] = TimeWindow(time_windows[-1].start, max(time_windows[-1].end, window_end))
+    else:
+        time_windows.append(TimeWindow(window_start, window_end))
+
+
 def _offsetted_datetime(
     partitions_def: TimeWindowPartitionsDefinition, dt: datetime, offset: int
 ) -> Optional[datetime]:
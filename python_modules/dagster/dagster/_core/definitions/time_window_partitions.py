@@ -1,14 +1,17 @@
 import functools
 import hashlib
 import json
+import math
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import (
     AbstractSet,
     Any,
     Callable,
+    Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -18,6 +21,7 @@
     Type,
     Union,
     cast,
+    overload,
 )
 
 import pendulum
@@ -59,6 +63,276 @@ class TimeWindow(NamedTuple):
     end: PublicAttr[datetime]
 
 
+# bounds the memory used by the window starts cached by each FixedPeriodTimeWindows
+_MAX_CACHED_WINDOW_STARTS = 10000
+
+
+class FixedPeriodTimeWindows:
+    """Computes the time windows of an hourly, daily, weekly, or monthly cron schedule from their
+    index, without iterating over the schedule. Index 0 is the first window of the partitions
+    definition, and negative indices are windows before it.
+
+    Only used in timezones whose DST transitions shift clocks by whole hours. Hourly windows are a
+    fixed number of seconds apart. Daily, weekly, and monthly windows start at the same wall clock
+    time on dates that are a fixed number of days or months apart. As in `cron_string_iterator`, if
+    that time doesn't exist on a date due to a DST transition, the window starts at the beginning of
+    the hour that does exist.
+    """
+
+    def __init__(
+        self,
+        schedule_type: ScheduleType,
+        first_window_start: datetime,
+        timezone: str,
+        hour: int,
+        minute: int,
+    ):
+        self._schedule_type = schedule_type
+        self._timezone = timezone
+        self._tz = pendulum.timezone(timezone)
+        self._first_window_start = first_window_start
+        self._first_window_timestamp = first_window_start.timestamp()
+        self._first_date = first_window_start.date()
+        self._hour = hour
+        self._minute = minute
+        # the same windows are looked up repeatedly when mapping partitions, and instances are
+        # shared through the cache of _get_fixed_period_time_windows
+        self._window_starts: Dict[int, datetime] = {}
+
+    def _get_start_on_date(self, year: int, month: int, day: int) -> datetime:
+        start = pendulum.datetime(year, month, day, self._hour, self._minute, tz=self._tz)
+        if start.hour != self._hour:
+            # the time doesn't exist on this date, so it was shifted forward by the DST transition
+            start = start.replace(minute=0)
+        return start
+
+    def get_window_start(self, index: int) -> datetime:
+        window_start = self._window_starts.get(index)
+        if window_start is None:
+            window_start = self._get_window_start(index)
+            if len(self._window_starts) >= _MAX_CACHED_WINDOW_STARTS:
+                self._window_starts.clear()
+            self._window_starts[index] = window_start
+        return window_start
+
+    def _get_window_start(self, index: int) -> datetime:
+        if self._schedule_type == ScheduleType.HOURLY:
+            return self._first_window_start.add(hours=index)
+        elif self._schedule_type == ScheduleType.MONTHLY:
+            month_index = self._first_date.year * 12 + self._first_date.month - 1 + index
+            return self._get_start_on_date(
+                month_index // 12, month_index % 12 + 1, self._first_date.day
+            )
+        else:
+            days = index if self._schedule_type == ScheduleType.DAILY else index * 7
+            date = self._first_date + timedelta(days=days)
+            return self._get_start_on_date(date.year, date.month, date.day)
+
+    def get_time_window(self, index: int) -> TimeWindow:
+        return TimeWindow(self.get_window_start(index), self.get_window_start(index + 1))
+
+    def get_index_of_window_containing(self, timestamp: float) -> int:
+        """Returns the index of the window that starts at or before the given timestamp and ends
+        after it.
+        """
+        if self._schedule_type == ScheduleType.HOURLY:
+            index = math.floor((timestamp - self._first_window_timestamp) / 3600)
+        else:
+            date = pendulum.from_timestamp(timestamp, tz=self._timezone).date()
+            if self._schedule_type == ScheduleType.MONTHLY:
+                index = (date.year - self._first_date.year) * 12 + (
+                    date.month - self._first_date.month
+                )
+            elif self._schedule_type == ScheduleType.WEEKLY:
+                index = (date - self._first_date).days // 7
+            else:
+                index = (date - self._first_date).days
+
+        # the estimate above can be off by one if the time is before the start of the window on its
+        # date, or due to floating point error
+        while self.get_window_start(index).timestamp() > timestamp:
+            index -= 1
+        while self.get_window_start(index + 1).timestamp() <= timestamp:
+            index += 1
+        return index
+
+    def get_index_of_first_window_starting_at_or_after(self, timestamp: float) -> int:
+        index = self.get_index_of_window_containing(timestamp)
+        return index if self.get_window_start(index).timestamp() == timestamp else index + 1
+
+
+@functools.lru_cache(maxsize=100)
+def _has_whole_hour_utc_offset_changes(timezone: str, start_year: int, end_year: int) -> bool:
+    """Whether the UTC offsets of the timezone between the given years differ from each other by
+    whole hours, i.e. whether its DST transitions shift its clocks by whole hours. The offsets are
+    sampled twice a month, since DST lasts for months.
+    """
+    tz = pendulum.timezone(timezone)
+    offsets = {
+        cast(timedelta, tz.utcoffset(datetime(year, month, day))).total_seconds()
+        for year in range(start_year, end_year + 1)
+        for month in range(1, 13)
+        for day in (1, 15)
+    }
+    first_offset = next(iter(offsets))
+    return all((offset - first_offset) % 3600 == 0 for offset in offsets)
+
+
+@functools.lru_cache(maxsize=100)
+def _get_fixed_period_time_windows(
+    start_timestamp: float,
+    timezone: str,
+    cron_schedule: str,
+    schedule_type: Optional[ScheduleType],
+    end_year: int,
+) -> Optional[FixedPeriodTimeWindows]:
+    """Returns the fixed-period windows of the schedule, if the arithmetic reproduces its ticks
+    between the start and the end of end_year. The end year is part of the cache key, so that the
+    UTC offsets of the timezone are checked again once the year changes.
+    """
+    if schedule_type is None:
+        return None
+    minute, hour, day = cron_schedule.split(" ")[:3]
+    if schedule_type == ScheduleType.MONTHLY and int(day) > 28:
+        # months without the scheduled day are skipped, so the windows aren't a fixed period apart
+        return None
+    if not _has_whole_hour_utc_offset_changes(
+        timezone,
+        pendulum.from_timestamp(start_timestamp).year,
+        end_year,
+    ):
+        # The schedule's ticks around a DST transition that isn't a whole hour, e.g. in
+        # Australia/Lord_Howe, depend on where the iteration started, and can't be reproduced by
+        # the arithmetic.
+        return None
+
+    ticks = cron_string_iterator(
+        start_timestamp=start_timestamp, cron_string=cron_schedule, execution_timezone=timezone
+    )
+    first_tick = next(ticks)
+    while first_tick.timestamp() < start_timestamp:
+        first_tick = next(ticks)
+
+    fixed_period_time_windows = FixedPeriodTimeWindows(
+        schedule_type,
+        cast(datetime, first_tick),
+        timezone,
+        hour=0 if schedule_type == ScheduleType.HOURLY else int(hour),
+        minute=int(minute),
+    )
+    # Guard against schedules that the arithmetic doesn't reproduce by comparing it to the first
+    # ticks of the schedule, and fall back to iterating over the schedule if they don't match.
+    if fixed_period_time_windows.get_window_start(
+        0
+    ) != first_tick or fixed_period_time_windows.get_window_start(1) != next(ticks):
+        return None
+    return fixed_period_time_windows
+
+
+class TimeWindowPartitionKeys(Sequence[str]):
+    """The partition keys of a contiguous range of windows of a TimeWindowPartitionsDefinition with a
+    fixed-period schedule. Supports `len`, indexing, slicing, and membership checks without
+    formatting every key.
+    """
+
+    def __init__(
+        self,
+        partitions_def: "TimeWindowPartitionsDefinition",
+        fixed_period_time_windows: FixedPeriodTimeWindows,
+        start_index: int,
+        end_index: int,
+    ):
+        self._partitions_def = partitions_def
+        self._fixed_period_time_windows = fixed_period_time_windows
+        self._start_index = start_index
+        self._end_index = max(start_index, end_index)
+
+    def __len__(self) -> int:
+        return self._end_index - self._start_index
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, Sequence[str]]:
+        indices = range(self._start_index, self._end_index)
+        if isinstance(index, slice):
+            sliced_indices = indices[index]
+            if sliced_indices.step != 1:
+                return [self._get_partition_key(i) for i in sliced_indices]
+            return TimeWindowPartitionKeys(
+                self._partitions_def,
+                self._fixed_period_time_windows,
+                sliced_indices.start,
+                sliced_indices.stop,
+            )
+        return self._get_partition_key(indices[index])
+
+    def _get_partition_key(self, index: int) -> str:
+        return self._fixed_period_time_windows.get_window_start(index).strftime(
+            self._partitions_def.fmt
+        )
+
+    def _get_index(self, partition_key: object) -> Optional[int]:
+        if not isinstance(partition_key, str):
+            return None
+        try:
+            partition_key_dt = pendulum.instance(
+                datetime.strptime(partition_key, self._partitions_def.fmt),
+                tz=self._partitions_def.timezone,
+            )
+        except ValueError:
+            return None
+
+        index = self._fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+            partition_key_dt.timestamp()
+        )
+        if (
+            index < self._start_index
+            or index >= self._end_index
+            or self._get_partition_key(index) != partition_key
+        ):
+            return None
+        return index
+
+    def __contains__(self, partition_key: object) -> bool:
+        return self._get_index(partition_key) is not None
+
+    def index(self, partition_key: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        index = self._get_index(partition_key)
+        if index is None:
+            raise ValueError(f"{partition_key} is not in the partition keys")
+        offset = index - self._start_index
+        if offset not in range(len(self))[start:stop]:
+            raise ValueError(f"{partition_key} is not in the partition keys")
+        return offset
+
+    def count(self, partition_key: Any) -> int:
+        return 1 if partition_key in self else 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._start_index, self._end_index):
+            yield self._get_partition_key(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TimeWindowPartitionKeys):
+            return (
+                self._partitions_def == other._partitions_def  # noqa: SLF001
+                and self._start_index == other._start_index  # noqa: SLF001
+                and self._end_index == other._end_index  # noqa: SLF001
+            ) or list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TimeWindowPartitionKeys({list(self)})"
+
+
 class TimeWindowPartitionsDefinition(
     PartitionsDefinition,
     NamedTuple(
@@ -155,6 +429,41 @@ def get_current_timestamp(self, current_time: Optional[datetime] = None) -> floa
             else pendulum.now(self.timezone)
         ).timestamp()
 
+    def _get_fixed_period_time_windows(self) -> Optional[FixedPeriodTimeWindows]:
+        """Returns None if the windows of the cron schedule aren't a fixed period apart, in which
+        case they're found by iterating over the schedule.
+        """
+        return _get_fixed_period_time_windows(
+            self.start.timestamp(),
+            self.timezone,
+            self.cron_schedule,
+            self.schedule_type,
+            # the windows are used up to the current time, so check the offsets through next year
+            pendulum.now("UTC").year + 1,
+        )
+
+    def _get_num_partitions_with_fixed_period(
+        self, fixed_period_time_windows: FixedPeriodTimeWindows, current_timestamp: float
+    ) -> int:
+        num_completed_windows = max(
+            0, fixed_period_time_windows.get_index_of_window_containing(current_timestamp)
+        )
+        return max(0, num_completed_windows + self.end_offset)
+
+    def get_partition_keys_sequence(self, current_time: Optional[datetime] = None) -> Sequence[str]:
+        """Returns the same partition keys as `get_partition_keys`. For fixed-period schedules, the
+        keys are computed lazily, so the sequence can be sliced, indexed, and checked for membership
+        without formatting every key.
+        """
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is None:
+            return self.get_partition_keys(current_time)
+
+        num_partitions = self._get_num_partitions_with_fixed_period(
+            fixed_period_time_windows, self.get_current_timestamp(current_time=current_time)
+        )
+        return TimeWindowPartitionKeys(self, fixed_period_time_windows, 0, num_partitions)
+
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
@@ -165,6 +474,12 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            return self._get_num_partitions_with_fixed_period(
+                fixed_period_time_windows, current_timestamp
+            )
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -192,6 +507,9 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
+        if self._get_fixed_period_time_windows() is not None:
+            return list(self.get_partition_keys_sequence(current_time)[start_idx:end_idx])
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -224,6 +542,9 @@ def get_partition_keys(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
+        if self._get_fixed_period_time_windows() is not None:
+            return list(self.get_partition_keys_sequence(current_time))
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -310,6 +631,13 @@ def _time_window_for_partition_key(self, *, partition_key: str) -> TimeWindow:
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            return fixed_period_time_windows.get_time_window(
+                fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                    partition_key_dt.timestamp()
+                )
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt)))
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
@@ -323,25 +651,38 @@ def time_windows_for_partition_keys(
             return []
 
         sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
-            )
-        )
         partition_key_time_windows: List[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if next_window.start.strftime(self.fmt) == partition_key:
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        pendulum.instance(
-                            datetime.strptime(partition_key, self.fmt), tz=self.timezone
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            for partition_key in sorted_pks:
+                partition_key_time_windows.append(
+                    fixed_period_time_windows.get_time_window(
+                        fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                            pendulum.instance(
+                                datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                            ).timestamp()
                         )
                     )
                 )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+        else:
+            cur_windows_iterator = iter(
+                self._iterate_time_windows(
+                    pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
+                )
+            )
+            for partition_key in sorted_pks:
+                next_window = next(cur_windows_iterator)
+                if next_window.start.strftime(self.fmt) == partition_key:
+                    partition_key_time_windows.append(next_window)
+                else:
+                    cur_windows_iterator = iter(
+                        self._iterate_time_windows(
+                            pendulum.instance(
+                                datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                            )
+                        )
+                    )
+                    partition_key_time_windows.append(next(cur_windows_iterator))
 
         start_time_window = self.get_first_partition_window()
         end_time_window = self.get_last_partition_window()
@@ -365,6 +706,13 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         )
         # the datetime format might not include granular components, so we need to recover them
         # we make the assumption that the parsed partition key is <= the start datetime
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            return fixed_period_time_windows.get_window_start(
+                fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                    partition_key_dt.timestamp()
+                )
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt))).start
 
     def get_next_partition_key(
@@ -377,9 +725,18 @@ def get_next_partition_key(
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
-        windows_iter = iter(self._iterate_time_windows(partition_key_dt))
-        next(windows_iter)
-        start_time = next(windows_iter).start
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            start_time = fixed_period_time_windows.get_window_start(
+                fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                    partition_key_dt.timestamp()
+                )
+                + 1
+            )
+        else:
+            windows_iter = iter(self._iterate_time_windows(partition_key_dt))
+            next(windows_iter)
+            start_time = next(windows_iter).start
         if start_time >= last_partition_window.end:
             return None
         else:
@@ -392,16 +749,32 @@ def get_next_partition_window(
         if last_partition_window is None:
             return None
 
-        windows_iter = iter(self._iterate_time_windows(end_dt))
-        next_window = next(windows_iter)
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            next_window = fixed_period_time_windows.get_time_window(
+                fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                    pendulum.instance(end_dt, tz=self.timezone).timestamp()
+                )
+            )
+        else:
+            next_window = next(iter(self._iterate_time_windows(end_dt)))
         if next_window.start >= last_partition_window.end:
             return None
         else:
             return next_window
 
     def get_prev_partition_window(self, start_dt: datetime) -> Optional[TimeWindow]:
-        windows_iter = iter(self._reverse_iterate_time_windows(start_dt))
-        prev_window = next(windows_iter)
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            # the previous window ends at the start of the window containing start_dt
+            prev_window = fixed_period_time_windows.get_time_window(
+                fixed_period_time_windows.get_index_of_window_containing(
+                    pendulum.instance(start_dt, tz=self.timezone).timestamp()
+                )
+                - 1
+            )
+        else:
+            prev_window = next(iter(self._reverse_iterate_time_windows(start_dt)))
         first_partition_window = self.get_first_partition_window()
         if first_partition_window is None or prev_window.start < first_partition_window.start:
             return None
@@ -412,6 +785,23 @@ def get_prev_partition_window(self, start_dt: datetime) -> Optional[TimeWindow]:
     def _get_first_partition_window(self, *, current_time: datetime) -> Optional[TimeWindow]:
         current_timestamp = current_time.timestamp()
 
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            num_partitions = self._get_num_partitions_with_fixed_period(
+                fixed_period_time_windows, current_timestamp
+            )
+            if self.end_offset > 0:
+                # matches the iteration below, which counts the offset from the first window that
+                # starts at or after the current time
+                num_partitions = min(
+                    num_partitions,
+                    fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                        current_timestamp
+                    )
+                    + self.end_offset,
+                )
+            return fixed_period_time_windows.get_time_window(0) if num_partitions > 0 else None
+
         time_window = next(iter(self._iterate_time_windows(self.start)))
 
         if self.end_offset == 0:
@@ -457,6 +847,13 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
         if self.get_first_partition_window(current_time) is None:
             return None
 
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            num_partitions = self._get_num_partitions_with_fixed_period(
+                fixed_period_time_windows, current_time.timestamp()
+            )
+            return fixed_period_time_windows.get_time_window(num_partitions - 1)
+
         current_time = (
             pendulum.instance(current_time, tz=self.timezone)
             if current_time
@@ -510,7 +907,35 @@ def get_last_partition_key(
     def end_time_for_partition_key(self, partition_key: str) -> datetime:
         return self.time_window_for_partition_key(partition_key).end
 
+    def _get_partition_keys_sequence_in_time_window(
+        self, time_window: TimeWindow
+    ) -> Optional[TimeWindowPartitionKeys]:
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is None:
+            return None
+
+        start_index, end_index = (
+            fixed_period_time_windows.get_index_of_first_window_starting_at_or_after(
+                pendulum.instance(dt, tz=self.timezone).timestamp()
+            )
+            for dt in time_window
+        )
+        return TimeWindowPartitionKeys(self, fixed_period_time_windows, start_index, end_index)
+
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        """Returns the number of partitions whose windows start within the given time window,
+        without listing their keys if the schedule has a fixed period.
+        """
+        partition_keys = self._get_partition_keys_sequence_in_time_window(time_window)
+        if partition_keys is not None:
+            return len(partition_keys)
+        return len(self.get_partition_keys_in_time_window(time_window))
+
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        partition_keys = self._get_partition_keys_sequence_in_time_window(time_window)
+        if partition_keys is not None:
+            return list(partition_keys)
+
         result: List[str] = []
         for partition_time_window in self._iterate_time_windows(time_window.start):
             if partition_time_window.start < time_window.end:
@@ -691,6 +1116,14 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        fixed_period_time_windows = self._get_fixed_period_time_windows()
+        if fixed_period_time_windows is not None:
+            index = fixed_period_time_windows.get_index_of_window_containing(timestamp)
+            window_start = fixed_period_time_windows.get_window_start(index)
+            if end_closed and window_start.timestamp() == timestamp:
+                window_start = fixed_period_time_windows.get_window_start(index - 1)
+            return window_start.strftime(self.fmt)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -1521,7 +1954,7 @@ def tuples_to_time_windows(tuples):
             # backwards compatibility
             time_windows = tuples_to_time_windows(loaded)
             num_partitions = sum(
-                len(partitions_def.get_partition_keys_in_time_window(time_window))
+                partitions_def.get_num_partitions_in_time_window(time_window)
                 for time_window in time_windows
             )
         elif isinstance(loaded, dict) and (
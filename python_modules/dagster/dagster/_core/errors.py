@@ -577,6 +577,23 @@ def __init__(self, run_id):
         )
 
 
+class DagsterEventLogWriteError(DagsterError):
+    """Raised when events that were queued to be written to the event log in the background could
+    not be written.
+    """
+
+
+class DagsterEventBatchPartiallyStoredError(DagsterError):
+    """Raised by an event log storage that can't store a batch of events atomically, when storing
+    the batch failed after some of its leading events were stored. Those events must not be stored
+    again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.num_stored = check.int_param(kwargs.pop("num_stored"), "num_stored")
+        super(DagsterEventBatchPartiallyStoredError, self).__init__(*args, **kwargs)
+
+
 class ScheduleExecutionError(DagsterUserCodeExecutionError):
     """Errors raised in a user process during the execution of schedule."""
 
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import Callable, Mapping, NamedTuple, Optional, Sequence, Union
 
 from typing_extensions import TypeAlias
@@ -6,10 +7,10 @@
 import dagster._check as check
 from dagster._annotations import PublicAttr
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
-from dagster._core.errors import DagsterInvalidInvocationError
+from dagster._core.errors import DagsterInvalidInvocationError, DagsterInvariantViolationError
 from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import deserialize_value, serialize_as_base_class, whitelist_for_serdes
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
 
@@ -59,11 +60,177 @@ def partition_key(self) -> Optional[str]:
 
         return None
 
+    @property
+    def event_type(self) -> Optional[DagsterEventType]:
+        return self.event_log_entry.dagster_event_type
+
     @property
     def asset_materialization(self) -> Optional[AssetMaterialization]:
         return self.event_log_entry.asset_materialization
 
 
+class EventRecordsProjection(Enum):
+    """Which columns of the event log an event records query loads for each record.
+
+    FULL: The event payload is loaded and deserialized into an EventLogEntry for every record.
+    LAZY: The event payload is loaded alongside the indexed columns, but is only deserialized the
+        first time the record's EventLogEntry is accessed.
+    INDEXED_COLUMNS: Only the indexed columns (storage id, run id, timestamp, event type, asset key
+        and partition) are loaded. The event payload is not available on the returned records.
+    """
+
+    FULL = "FULL"
+    LAZY = "LAZY"
+    INDEXED_COLUMNS = "INDEXED_COLUMNS"
+
+
+@serialize_as_base_class
+class LazyEventLogRecord(EventLogRecord):
+    """An event record returned by event record queries with a LAZY or INDEXED_COLUMNS projection.
+
+    The run id, timestamp, event type, asset key and partition key of the record are read from the
+    indexed columns of the event log row, so accessing them doesn't deserialize the event payload.
+    Rows stored before the asset key and partition columns were indexed have them unset, so the
+    asset key and partition key fall back to the EventLogEntry when their column is empty and the
+    payload was loaded. The timestamp column only has microsecond precision, so `timestamp` may
+    differ from the timestamp of the EventLogEntry by less than a microsecond.
+
+    The EventLogEntry is deserialized from the raw event payload on first access, and cached on the
+    record. Records loaded with the INDEXED_COLUMNS projection do not have an event payload, and
+    raise when their EventLogEntry is accessed.
+
+    Records are serialized as, and deserialized to, an EventLogRecord, decoding the EventLogEntry if
+    it hasn't been already.
+
+    Users should not instantiate this class directly.
+    """
+
+    _event_json: Optional[str]
+    _event_log_entry: Optional[EventLogEntry]
+    _run_id: str
+    _timestamp: float
+    _event_type_value: Optional[str]
+    _asset_key: Optional[AssetKey]
+    _partition_key: Optional[str]
+
+    def __new__(
+        cls,
+        storage_id: int,
+        event_json: Optional[str],
+        run_id: str,
+        timestamp: float,
+        event_type_value: Optional[str],
+        asset_key: Optional[AssetKey],
+        partition_key: Optional[str],
+    ):
+        record = super(LazyEventLogRecord, cls).__new__(
+            cls, storage_id=storage_id, event_log_entry=None  # type: ignore
+        )
+        # tuple subclasses can't declare non-empty __slots__, so the columns live on the __dict__
+        record.__dict__.update(
+            _event_json=event_json,
+            _event_log_entry=None,
+            _run_id=run_id,
+            _timestamp=timestamp,
+            _event_type_value=event_type_value,
+            _asset_key=asset_key,
+            _partition_key=partition_key,
+        )
+        return record
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:  # type: ignore
+        if self._event_log_entry is None:
+            if self._event_json is None:
+                raise DagsterInvariantViolationError(
+                    f"The event payload for record {self.storage_id} was not loaded. Query with "
+                    "the FULL or LAZY projection to access the EventLogEntry of the record."
+                )
+            self._event_log_entry = deserialize_value(self._event_json, EventLogEntry)
+            # drop the raw payload once decoded, so that we don't hold onto both
+            self._event_json = None
+        return self._event_log_entry
+
+    @property
+    def has_event_log_entry(self) -> bool:
+        return self._event_log_entry is not None or self._event_json is not None
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @property
+    def event_type(self) -> Optional[DagsterEventType]:
+        return DagsterEventType(self._event_type_value) if self._event_type_value else None
+
+    @property
+    def asset_key(self) -> Optional[AssetKey]:
+        if self._asset_key is None and self.has_event_log_entry:
+            return super().asset_key
+        return self._asset_key
+
+    @property
+    def partition_key(self) -> Optional[str]:
+        if self._partition_key is None and self.has_event_log_entry:
+            return super().partition_key
+        return self._partition_key
+
+    # the underlying tuple does not hold the EventLogEntry, so make tuple operations go through
+    # the lazily decoded value instead
+
+    def __iter__(self):
+        return iter((self.storage_id, self.event_log_entry))
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EventLogRecord):
+            return False
+        if isinstance(other, LazyEventLogRecord) and not (
+            self.has_event_log_entry and other.has_event_log_entry
+        ):
+            return self.storage_id == other.storage_id and self.run_id == other.run_id
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((self.storage_id, self.run_id))
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyEventLogRecord(storage_id={self.storage_id!r}, run_id={self.run_id!r},"
+            f" event_type={self._event_type_value!r})"
+        )
+
+    def __reduce__(self):
+        return (
+            LazyEventLogRecord,
+            (
+                self.storage_id,
+                self._event_json,
+                self._run_id,
+                self._timestamp,
+                self._event_type_value,
+                self._asset_key,
+                self._partition_key,
+            ),
+            {"_event_log_entry": self._event_log_entry},
+        )
+
+    def _asdict(self):
+        return {"storage_id": self.storage_id, "event_log_entry": self.event_log_entry}
+
+    def _replace(self, **kwargs) -> EventLogRecord:  # type: ignore
+        return EventLogRecord(**{**self._asdict(), **kwargs})
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
@@ -1,6 +1,7 @@
 import sys
 from contextlib import contextmanager
 from typing import (
+    TYPE_CHECKING,
     AbstractSet,
     Any,
     Callable,
@@ -47,6 +48,9 @@
 )
 from .job_execution_result import JobExecutionResult
 
+if TYPE_CHECKING:
+    from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+
 ## Brief guide to the execution APIs
 # | function name               | operates over      | sync  | supports    | creates new DagsterRun  |
 # |                             |                    |       | reexecution | in instance             |
@@ -693,6 +697,44 @@ def _get_execution_plan_from_run(
     )
 
 
+def create_step_execution_plan(
+    job: IJob,
+    dagster_run: DagsterRun,
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: Optional[KnownExecutionState],
+    execution_plan_snapshot: Optional["ExecutionPlanSnapshot"],
+    run_config: Optional[Mapping[str, object]] = None,
+    repository_load_data: Optional[RepositoryLoadData] = None,
+) -> ExecutionPlan:
+    """Creates the plan that a step worker uses to execute some of the steps of a run.
+
+    When the run's execution plan snapshot can be used to reconstruct the plan, the steps are
+    rehydrated from the snapshot and the known state, rather than building the whole plan from
+    the job definition and run config again in every step worker.
+    """
+    check.opt_nullable_sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    if (
+        execution_plan_snapshot is not None
+        and execution_plan_snapshot.can_reconstruct_plan
+        and job.solids_to_execute == dagster_run.solids_to_execute
+        and job.asset_selection == dagster_run.asset_selection
+    ):
+        return ExecutionPlan.rebuild_from_snapshot(
+            dagster_run.job_name,
+            execution_plan_snapshot,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+        )
+
+    return create_execution_plan(
+        job,
+        run_config=run_config if run_config is not None else dagster_run.run_config,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+
 def create_execution_plan(
     job: Union[IJob, JobDefinition],
     run_config: Optional[Mapping[str, object]] = None,
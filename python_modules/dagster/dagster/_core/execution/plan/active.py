@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -80,7 +84,21 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Rather than re-checking every pending step on each _update, track for each pending step
+        # the number of its upstream steps that have yet to succeed or be skipped, and which
+        # pending steps wait on each step. When a step finishes only its downstream steps are
+        # revisited, and those that are no longer waiting on anything move to _pending_ready.
+        self._num_pending_deps: Dict[str, int] = {}
+        self._pending_downstream: Dict[str, Set[str]] = defaultdict(set)
+        self._pending_ready: Set[str] = set()
+        # steps are moved out of _pending_ready in the order they were added to _pending
+        self._pending_order: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+        # upstream deps of each executable step, used to re-queue steps that are retried
+        self._step_deps: Dict[str, Set[str]] = {}
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -94,8 +112,9 @@ def __init__(
         # track which upstream deps caused a step to skip
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap ordered
+        # by the sort key of each step, then by the order in which the steps became executable.
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -115,6 +134,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -133,7 +155,10 @@ def __exit__(
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in self._executable]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str=f"\nSteps still in flight: {self._in_flight}"
@@ -171,71 +196,97 @@ def __exit__(
                     " performing step execution.".format(step_list=self._unknown_state)
                 )
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = next(self._counter)
+
+        num_pending_deps = 0
+        has_failed_dep = False
+        for dep in deps:
+            if dep in self._success or dep in self._skipped:
+                continue
+            if dep in self._failed or dep in self._abandoned:
+                has_failed_dep = True
+            num_pending_deps += 1
+            self._pending_downstream[dep].add(step_key)
+
+        self._num_pending_deps[step_key] = num_pending_deps
+        if num_pending_deps == 0 or has_failed_dep:
+            self._pending_ready.add(step_key)
+
+    def _update_downstream(self, step_key: str) -> None:
+        """Called when a step reaches a terminal state to update the steps that depend on it."""
+        succeeded_or_skipped = step_key in self._success or step_key in self._skipped
+        for downstream_key in self._pending_downstream.pop(step_key, ()):
+            if downstream_key not in self._pending:
+                continue
+
+            if succeeded_or_skipped:
+                self._num_pending_deps[downstream_key] -= 1
+                if self._num_pending_deps[downstream_key] == 0:
+                    self._pending_ready.add(downstream_key)
+            else:
+                self._pending_ready.add(downstream_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._counter), step_key),
+        )
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
-
-            # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
-                step = self.get_step_by_key(step_key)
-
-                # The base case is downstream step won't skip
-                should_skip = False
+        for step_key in sorted(self._pending_ready, key=self._pending_order.__getitem__):
+            requirements = self._pending.pop(step_key)
+            del self._num_pending_deps[step_key]
+            del self._pending_order[step_key]
 
-                # If there is at least one of the step's inputs, none of whose upstream steps has
-                # yielded an output, we should skip that step.
-                for step_input in step.step_inputs:
-                    missing_source_handles = [
-                        source_handle
-                        for source_handle in step_input.get_step_output_handle_dependencies()
-                        if source_handle.step_key in requirements
-                        and source_handle not in self._step_outputs
-                    ]
-                    if missing_source_handles:
-                        if len(missing_source_handles) == len(
-                            step_input.get_step_output_handle_dependencies()
-                        ):
-                            should_skip = True
-                            self._skipped_deps[step_key] = [
-                                f"{h.step_key}.{h.output_name}" for h in missing_source_handles
-                            ]
-                            break
-
-                if should_skip:
-                    new_steps_to_skip.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
+            # If any upstream deps failed - this is not executable
+            if any(dep in self._failed or dep in self._abandoned for dep in requirements):
+                self._pending_abandon.append(step_key)
+                continue
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            # Otherwise all the upstream steps of the step are complete or skipped
+            step = self.get_step_by_key(step_key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+            # The base case is downstream step won't skip
+            should_skip = False
+
+            # If there is at least one of the step's inputs, none of whose upstream steps has
+            # yielded an output, we should skip that step.
+            for step_input in step.step_inputs:
+                missing_source_handles = [
+                    source_handle
+                    for source_handle in step_input.get_step_output_handle_dependencies()
+                    if source_handle.step_key in requirements
+                    and source_handle not in self._step_outputs
+                ]
+                if missing_source_handles:
+                    if len(missing_source_handles) == len(
+                        step_input.get_step_output_handle_dependencies()
+                    ):
+                        should_skip = True
+                        self._skipped_deps[step_key] = [
+                            f"{h.step_key}.{h.output_name}" for h in missing_source_handles
+                        ]
+                        break
+
+            if should_skip:
+                self._pending_skip.append(step_key)
+            else:
+                self._push_executable(step_key)
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+        self._pending_ready.clear()
 
         ready_to_retry = []
         tick_time = time.time()
@@ -244,7 +295,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self) -> None:
@@ -284,11 +335,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         tag_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -298,8 +344,9 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        blocked: List[Tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -309,17 +356,23 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if tag_concurrency_limits_counter:
                 if tag_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
                 tag_concurrency_limits_counter.update_counters_with_launched_item(step)
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -328,13 +381,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs
             self._skip_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -343,11 +395,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -399,20 +451,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._update_downstream(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._update_downstream(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._update_downstream(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._update_downstream(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -432,7 +488,7 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
@@ -441,6 +497,8 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
         self._retry_state.mark_attempt(step_key)
 
         self._mark_complete(step_key)
+        if step_key in self._abandoned:
+            self._update_downstream(step_key)
 
     def _mark_complete(self, step_key: str) -> None:
         check.invariant(
@@ -754,47 +754,7 @@ def build_subset_plan(
             step_output_versions, "step_output_versions", key_type=StepOutputHandle, value_type=str
         )
 
-        step_handles_to_validate_set: Set[StepHandleUnion] = {
-            StepHandle.parse_from_key(key) for key in step_keys_to_execute
-        }
-        step_handles_to_execute: List[StepHandleUnion] = []
-        bad_keys = []
-
-        for handle in step_handles_to_validate_set:
-            if handle not in self.step_dict:
-                # Ok if the entire dynamic step is selected to execute.
-                # https://github.com/dagster-io/dagster/issues/8000
-                # Note: the assumption here is when the entire dynamic step is selected,
-                # the step_keys_to_execute will include both unresolved step (i.e. [?])
-                # and all the resolved steps (i.e. [0], ... [n]). Given that at this point
-                # we no longer track the parent known state (we don't know what "n" was),
-                # solely from the resolved handles, we can't tell if an entire dynamic
-                # node is being selected, so the best bet here is to check both unresolved
-                # and resolved handles exist. Examples:
-                # * `generate_subtasks, subtask[?], subtask[0], subtask[1], subtask[2]` will pass
-                # * `generate_subtasks, subtask[0], subtask[1], subtask[2]` will result in 3 bad
-                #   keys `subtask[0], subtask[1], subtask[2]`
-                if isinstance(handle, ResolvedFromDynamicStepHandle):
-                    unresolved_handle = handle.unresolved_form
-                    if (
-                        unresolved_handle in self.step_dict
-                        and unresolved_handle in step_handles_to_validate_set
-                    ):
-                        continue
-
-                bad_keys.append(handle.to_key())
-
-            # Add the handle to the ready-to-execute list once it's validated
-            step_handles_to_execute.append(handle)
-
-        if bad_keys:
-            raise DagsterExecutionStepNotFoundError(
-                (
-                    f"Can not build subset plan from unknown step{'s' if len(bad_keys)> 1 else ''}:"
-                    f" {', '.join(bad_keys)}"
-                ),
-                step_keys=bad_keys,
-            )
+        step_handles_to_execute = _get_step_handles_to_execute(self.step_dict, step_keys_to_execute)
 
         executable_map, resolvable_map = _compute_step_maps(
             self.step_dict,
@@ -832,6 +792,37 @@ def build_subset_plan(
             repository_load_data=self.repository_load_data,
         )
 
+    def build_step_plan(
+        self, step_keys_to_execute: Sequence[str], known_state: KnownExecutionState
+    ) -> "ExecutionPlan":
+        """Returns a plan that executes some of the steps of this plan with the given known state,
+        sharing the steps of this plan rather than building them again from the job definition and
+        run config. Steps resolved from dynamic outputs can only be selected if they were resolved
+        when this plan was built.
+        """
+        check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.inst_param(known_state, "known_state", KnownExecutionState)
+
+        step_handles_to_execute = _get_step_handles_to_execute(self.step_dict, step_keys_to_execute)
+        executable_map, resolvable_map = _compute_step_maps(
+            self.step_dict,
+            self.step_dict_by_key,
+            step_handles_to_execute,
+            known_state,
+        )
+
+        return ExecutionPlan(
+            self.step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            known_state,
+            self.artifacts_persisted,
+            step_dict_by_key=self.step_dict_by_key,
+            executor_name=self.executor_name,
+            repository_load_data=self.repository_load_data,
+        )
+
     def get_version_for_step_output_handle(
         self, step_output_handle: StepOutputHandle
     ) -> Optional[str]:
@@ -1050,7 +1041,21 @@ def rebuild_step_input(
     def rebuild_from_snapshot(
         job_name: str,
         execution_plan_snapshot: "ExecutionPlanSnapshot",
+        step_keys_to_execute: Optional[Sequence[str]] = None,
+        known_state: Optional[KnownExecutionState] = None,
     ) -> "ExecutionPlan":
+        """Reconstructs an ExecutionPlan from its snapshot, without the job definition or run
+        config that the plan was originally built from.
+
+        Args:
+            job_name (str): The name of the job that the plan belongs to.
+            execution_plan_snapshot (ExecutionPlanSnapshot): The snapshot to rebuild from.
+            step_keys_to_execute (Optional[Sequence[str]]): If set, the returned plan only
+                executes these steps, like a plan returned by ``build_subset_plan``.
+            known_state (Optional[KnownExecutionState]): Replaces the initial known state of the
+                snapshot, e.g. with the state of an in-progress run, so that steps resolved from
+                dynamic outputs since the snapshot was taken can be selected.
+        """
         if not execution_plan_snapshot.can_reconstruct_plan:
             raise DagsterInvariantViolationError(
                 "Tried to reconstruct an old ExecutionPlanSnapshot that was created before"
@@ -1117,30 +1122,92 @@ def rebuild_from_snapshot(
             step_dict[step.handle] = step
             step_dict_by_key[step.key] = step
 
-        step_handles_to_execute = [
+        step_handles_to_execute: Sequence[StepHandleUnion] = [
             StepHandle.parse_from_key(key) for key in execution_plan_snapshot.step_keys_to_execute
         ]
+        if known_state is None:
+            known_state = execution_plan_snapshot.initial_known_state
 
         executable_map, resolvable_map = _compute_step_maps(
             step_dict,
             step_dict_by_key,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
         )
 
+        if step_keys_to_execute is not None:
+            # resolving against the full selection above added any steps resolved from dynamic
+            # outputs to step_dict, so they can be selected here
+            step_handles_to_execute = _get_step_handles_to_execute(step_dict, step_keys_to_execute)
+            executable_map, resolvable_map = _compute_step_maps(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                known_state,
+            )
+
         return ExecutionPlan(
             step_dict,
             executable_map,
             resolvable_map,
             step_handles_to_execute,
             # default to empty known execution state if initial was not persisted
-            execution_plan_snapshot.initial_known_state or KnownExecutionState(),
+            known_state or KnownExecutionState(),
             execution_plan_snapshot.artifacts_persisted,
             executor_name=execution_plan_snapshot.executor_name,
             repository_load_data=execution_plan_snapshot.repository_load_data,
         )
 
 
+def _get_step_handles_to_execute(
+    step_dict: Mapping[StepHandleUnion, IExecutionStep],
+    step_keys_to_execute: Sequence[str],
+) -> Sequence[StepHandleUnion]:
+    step_handles_to_validate_set: Set[StepHandleUnion] = {
+        StepHandle.parse_from_key(key) for key in step_keys_to_execute
+    }
+    step_handles_to_execute: List[StepHandleUnion] = []
+    bad_keys = []
+
+    for handle in step_handles_to_validate_set:
+        if handle not in step_dict:
+            # Ok if the entire dynamic step is selected to execute.
+            # https://github.com/dagster-io/dagster/issues/8000
+            # Note: the assumption here is when the entire dynamic step is selected,
+            # the step_keys_to_execute will include both unresolved step (i.e. [?])
+            # and all the resolved steps (i.e. [0], ... [n]). Given that at this point
+            # we no longer track the parent known state (we don't know what "n" was),
+            # solely from the resolved handles, we can't tell if an entire dynamic
+            # node is being selected, so the best bet here is to check both unresolved
+            # and resolved handles exist. Examples:
+            # * `generate_subtasks, subtask[?], subtask[0], subtask[1], subtask[2]` will pass
+            # * `generate_subtasks, subtask[0], subtask[1], subtask[2]` will result in 3 bad
+            #   keys `subtask[0], subtask[1], subtask[2]`
+            if isinstance(handle, ResolvedFromDynamicStepHandle):
+                unresolved_handle = handle.unresolved_form
+                if (
+                    unresolved_handle in step_dict
+                    and unresolved_handle in step_handles_to_validate_set
+                ):
+                    continue
+
+            bad_keys.append(handle.to_key())
+
+        # Add the handle to the ready-to-execute list once it's validated
+        step_handles_to_execute.append(handle)
+
+    if bad_keys:
+        raise DagsterExecutionStepNotFoundError(
+            (
+                f"Can not build subset plan from unknown step{'s' if len(bad_keys)> 1 else ''}:"
+                f" {', '.join(bad_keys)}"
+            ),
+            step_keys=bad_keys,
+        )
+
+    return step_handles_to_execute
+
+
 def _update_from_resolved_dynamic_outputs(
     step_dict: Dict[StepHandleUnion, IExecutionStep],
     step_dict_by_key: Dict[str, IExecutionStep],
@@ -1151,6 +1218,7 @@ def _update_from_resolved_dynamic_outputs(
 ) -> None:
     resolved_steps: List[ExecutionStep] = []
     key_sets_to_clear: List[FrozenSet[str]] = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1161,7 +1229,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1343,7 +1411,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -5,14 +5,17 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Type, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -43,6 +46,12 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerRetiringEvent(
+    NamedTuple("ChildProcessWorkerRetiringEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a worker process before the end of its last task, after which it exits."""
+
+
 class ChildProcessCommand(ABC):
     """Inherit from this class in order to use this library.
 
@@ -57,6 +66,28 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         """
 
 
+class ChildProcessWorkerCommand(ABC):
+    """Inherit from this class to execute a sequence of tasks in long-lived worker processes, using
+    ChildProcessWorkerPool.
+
+    The object must be picklable, as must the tasks that are sent to the workers.
+    """
+
+    @contextmanager
+    def worker_context(self) -> Iterator[None]:
+        """Invoked once in each worker process, around the execution of all of its tasks. Override
+        to set up state that is shared between tasks.
+        """
+        yield
+
+    @abstractmethod
+    def execute_task(self, task: Any) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the worker process for each task sent to it.
+
+        Yields a sequence of events to be handled by the ChildProcessWorkerPool.
+        """
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -92,6 +123,78 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
             )
 
 
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in kilobytes on Linux and in bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _execute_worker_in_child_process(
+    task_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    command: ChildProcessWorkerCommand,
+    max_tasks: Optional[int],
+    max_memory_bytes: Optional[int],
+):
+    """Executes the tasks sent to a worker process until it is sent None, or until it retires after
+    executing max_tasks tasks or its memory usage exceeds max_memory_bytes.
+
+    Each task's events are followed by a ChildProcessDoneEvent, or by a
+    ChildProcessSystemErrorEvent, after which the worker exits.
+    """
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        start_termination_thread(term_event)
+        num_tasks = 0
+        try:
+            with command.worker_context():
+                while True:
+                    task = task_queue.get()
+                    if task is None:
+                        return
+
+                    event_queue.put(ChildProcessStartEvent(pid=pid))
+                    for event in command.execute_task(task):
+                        event_queue.put(event)
+                    num_tasks += 1
+
+                    max_rss_bytes = _get_max_rss_bytes()
+                    should_retire = (
+                        term_event.is_set()
+                        or (max_tasks is not None and num_tasks >= max_tasks)
+                        or (
+                            max_memory_bytes is not None
+                            and max_rss_bytes is not None
+                            and max_rss_bytes >= max_memory_bytes
+                        )
+                    )
+                    if should_retire:
+                        event_queue.put(ChildProcessWorkerRetiringEvent(pid=pid))
+                    event_queue.put(ChildProcessDoneEvent(pid=pid))
+                    if should_retire:
+                        return
+
+        except (
+            Exception,
+            KeyboardInterrupt,
+            DagsterExecutionInterruptedError,
+        ):
+            event_queue.put(
+                ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -176,3 +279,159 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+class ChildProcessWorker:
+    """A long-lived worker process, owned by a ChildProcessWorkerPool."""
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        command: ChildProcessWorkerCommand,
+        max_tasks: Optional[int],
+        max_memory_bytes: Optional[int],
+    ):
+        self.task_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_worker_in_child_process,
+            args=(
+                self.task_queue,
+                self.event_queue,
+                self.term_event,
+                command,
+                max_tasks,
+                max_memory_bytes,
+            ),
+        )
+        self.process.start()
+        self.is_busy = False
+        self.is_retiring = False
+
+    @property
+    def is_available(self) -> bool:
+        return not self.is_busy and not self.is_retiring and self.process.is_alive()
+
+    def execute_task(self, task: Any) -> Iterator[Optional["DagsterEvent"]]:
+        check.invariant(self.is_available, "Worker process is not available to execute a task")
+        self.is_busy = True
+        self.task_queue.put(task)
+        return self._iterate_task_events()
+
+    def _iterate_task_events(self) -> Iterator[Optional["DagsterEvent"]]:
+        completed_properly = False
+        try:
+            while not completed_properly:
+                event = _poll_for_event(self.process, self.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                if isinstance(event, ChildProcessWorkerRetiringEvent):
+                    self.is_retiring = True
+                    yield None
+                    continue
+
+                yield event
+
+                if isinstance(event, ChildProcessDoneEvent):
+                    completed_properly = True
+                elif isinstance(event, ChildProcessSystemErrorEvent):
+                    # the worker exits after a system error
+                    self.is_retiring = True
+                    completed_properly = True
+        finally:
+            self.is_busy = False
+
+        if not completed_properly:
+            self.is_retiring = True
+            raise ChildProcessCrashException(exit_code=self.process.exitcode)
+
+    def shutdown(self) -> None:
+        if self.is_busy:
+            # interrupt the task in progress, after which the worker exits
+            self.term_event.set()
+        elif self.process.is_alive() and not self.is_retiring:
+            self.task_queue.put(None)
+
+        # drain any remaining events while waiting, since a process can't exit until the events
+        # that it has put on the queue are consumed
+        while self.process.is_alive():
+            try:
+                self.event_queue.get(block=True, timeout=TICK)
+            except queue.Empty:
+                pass
+        self.process.join()
+        self.task_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """Executes tasks in a pool of long-lived worker processes that are started as needed, so that
+    each worker can share state, like loaded code, between the tasks that it executes.
+
+    Workers are retired and replaced after executing max_tasks_per_worker tasks, or once their
+    memory usage exceeds max_memory_bytes_per_worker.
+
+    Warning: if a worker process is in an infinite loop, execute_task's iterator will also
+    infinitely loop.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        command: ChildProcessWorkerCommand,
+        max_tasks_per_worker: Optional[int] = None,
+        max_memory_bytes_per_worker: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._command = check.inst_param(command, "command", ChildProcessWorkerCommand)
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._max_memory_bytes_per_worker = check.opt_int_param(
+            max_memory_bytes_per_worker, "max_memory_bytes_per_worker"
+        )
+        self._workers: List[ChildProcessWorker] = []
+
+    def get_available_worker(self) -> ChildProcessWorker:
+        """Returns an idle worker process, starting a new one if none are available. The returned
+        worker must be sent a task before the next call.
+        """
+        workers = []
+        for worker in self._workers:
+            if not worker.is_busy and not worker.is_available:
+                worker.shutdown()
+            else:
+                workers.append(worker)
+        self._workers = workers
+
+        for worker in self._workers:
+            if worker.is_available:
+                return worker
+
+        worker = ChildProcessWorker(
+            self._multiprocessing_ctx,
+            self._command,
+            self._max_tasks_per_worker,
+            self._max_memory_bytes_per_worker,
+        )
+        self._workers.append(worker)
+        return worker
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Type[BaseException],
+        exception_value: Exception,
+        traceback: TracebackType,
+    ) -> None:
+        self.shutdown()
@@ -1,8 +1,19 @@
 import multiprocessing
 import os
 import sys
+from contextlib import ExitStack, contextmanager
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
 from dagster import (
     _check as check,
@@ -16,7 +27,7 @@
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import create_step_execution_plan, execute_plan_iterator
 from dagster._core.execution.context.system import IStepContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.plan.active import ActiveExecution
@@ -27,6 +38,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import format_duration, time_execution_scope
@@ -36,6 +48,9 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -46,6 +61,14 @@
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
 
+def _get_execution_plan_snapshot(
+    instance: DagsterInstance, dagster_run: "DagsterRun"
+) -> Optional[ExecutionPlanSnapshot]:
+    if not dagster_run.execution_plan_snapshot_id:
+        return None
+    return instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id)
+
+
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
         self,
@@ -73,11 +96,13 @@ def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                job=recon_job,
-                run_config=self.run_config,
+            execution_plan = create_step_execution_plan(
+                recon_job,
+                self.dagster_run,
                 step_keys_to_execute=[self.step_key],
                 known_state=self.known_state,
+                execution_plan_snapshot=_get_execution_plan_snapshot(instance, self.dagster_run),
+                run_config=self.run_config,
                 repository_load_data=self.repository_load_data,
             )
 
@@ -103,6 +128,97 @@ def execute(self) -> Iterator[DagsterEvent]:
             )
 
 
+class MultiprocessWorkerTask(NamedTuple):
+    step_key: str
+    known_state: KnownExecutionState
+
+
+class MultiprocessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    """Executes steps in a long-lived worker process, which loads the job, opens the instance and
+    builds the run's execution plan once for all of the steps that it executes.
+    """
+
+    def __init__(
+        self,
+        run_config: Mapping[str, object],
+        dagster_run: "DagsterRun",
+        instance_ref: "InstanceRef",
+        recon_pipeline: ReconstructableJob,
+        retry_mode: RetryMode,
+        repository_load_data: Optional[RepositoryLoadData],
+    ):
+        self.run_config = run_config
+        self.dagster_run = dagster_run
+        self.instance_ref = instance_ref
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+        self.repository_load_data = repository_load_data
+        self._instance: Optional[DagsterInstance] = None
+        # built once per worker process, and again only once more dynamic outputs are resolved
+        self._execution_plan: Optional[ExecutionPlan] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {**self.__dict__, "_instance": None, "_execution_plan": None}
+
+    @contextmanager
+    def worker_context(self) -> Iterator[None]:
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            self._instance = instance
+            try:
+                yield
+            finally:
+                self._instance = None
+                self._execution_plan = None
+
+    def _get_step_execution_plan(
+        self, instance: DagsterInstance, task: MultiprocessWorkerTask
+    ) -> ExecutionPlan:
+        # the steps of the plan only change when dynamic outputs are resolved, so the plan of each
+        # step is selected from the run's plan rather than building it again for every step
+        if (
+            self._execution_plan is None
+            or self._execution_plan.known_state.dynamic_mappings
+            != task.known_state.dynamic_mappings
+        ):
+            self._execution_plan = create_step_execution_plan(
+                self.recon_pipeline,
+                self.dagster_run,
+                step_keys_to_execute=None,
+                known_state=task.known_state,
+                execution_plan_snapshot=_get_execution_plan_snapshot(instance, self.dagster_run),
+                run_config=self.run_config,
+                repository_load_data=self.repository_load_data,
+            )
+
+        return self._execution_plan.build_step_plan([task.step_key], task.known_state)
+
+    def execute_task(self, task: MultiprocessWorkerTask) -> Iterator[DagsterEvent]:
+        instance = check.not_none(self._instance)
+        recon_job = self.recon_pipeline
+        execution_plan = self._get_step_execution_plan(instance, task)
+
+        log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+        yield DagsterEvent.step_worker_started(
+            log_manager,
+            self.dagster_run.job_name,
+            message=f'Executing step "{task.step_key}" in worker process.',
+            metadata={
+                "pid": MetadataValue.text(str(os.getpid())),
+            },
+            step_key=task.step_key,
+        )
+
+        yield from execute_plan_iterator(
+            execution_plan,
+            recon_job,
+            self.dagster_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+        )
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -111,6 +227,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -138,6 +257,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -186,7 +312,30 @@ def execute(
             ),
         )
 
-        with time_execution_scope() as timer_result:
+        with time_execution_scope() as timer_result, ExitStack() as stack:
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        MultiprocessExecutorWorkerCommand(
+                            run_config=plan_context.run_config,
+                            dagster_run=plan_context.dagster_run,
+                            instance_ref=plan_context.instance.get_ref(),
+                            recon_pipeline=job,
+                            retry_mode=self.retries,
+                            repository_load_data=execution_plan.repository_load_data,
+                        ),
+                        max_tasks_per_worker=self._max_steps_per_worker,
+                        max_memory_bytes_per_worker=(
+                            self._max_worker_memory_mb * 1024 * 1024
+                            if self._max_worker_memory_mb
+                            else None
+                        ),
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -223,6 +372,17 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool:
+                                active_iters[step.key] = execute_step_in_worker_pool(
+                                    worker_pool,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    active_execution.get_known_state(),
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -257,7 +417,11 @@ def execute(
                             yield DagsterEvent.engine_event(
                                 step_context,
                                 get_run_crash_explanation(
-                                    prefix=f"Multiprocess executor: child process for step {key}",
+                                    prefix=(
+                                        f"Multiprocess executor: worker process for step {key}"
+                                        if worker_pool
+                                        else f"Multiprocess executor: child process for step {key}"
+                                    ),
                                     exit_code=crash.exit_code,
                                 ),
                                 EngineEventData.engine_error(serializable_error),
@@ -365,3 +529,44 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker_pool(
+    worker_pool: ChildProcessWorkerPool,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    term_events: Dict[str, Any],
+    known_state: KnownExecutionState,
+) -> Iterator[Optional[DagsterEvent]]:
+    # not a generator, so that the step is assigned to a worker and its termination event is
+    # registered as soon as the step is dispatched, rather than when its events are first read
+    worker = worker_pool.get_available_worker()
+    term_events[step.key] = worker.term_event
+    worker_events = worker.execute_task(
+        MultiprocessWorkerTask(step_key=step.key, known_state=known_state)
+    )
+    return _iterate_worker_step_events(step_context, step, worker, worker_events, errors)
+
+
+def _iterate_worker_step_events(
+    step_context: IStepContext,
+    step: ExecutionStep,
+    worker: ChildProcessWorker,
+    worker_events: Iterator[Optional[DagsterEvent]],
+    errors: Dict[int, SerializableErrorInfo],
+) -> Iterator[Optional[DagsterEvent]]:
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending "{step.key}" to worker process (pid: {worker.process.pid}).',
+        metadata={},
+    )
+
+    for ret in worker_events:
+        if ret is None or isinstance(ret, DagsterEvent):
+            yield ret
+        elif isinstance(ret, ChildProcessEvent):
+            if isinstance(ret, ChildProcessSystemErrorEvent):
+                errors[ret.pid] = ret.error_info
+        else:
+            check.failed(f"Unexpected return value from worker process {type(ret)}")
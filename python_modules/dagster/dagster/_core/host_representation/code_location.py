@@ -1,4 +1,5 @@
 import datetime
+import functools
 import sys
 import threading
 from abc import abstractmethod
@@ -10,7 +11,11 @@
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.notebook_data import sync_get_streaming_external_notebook_data_grpc
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_data_grpc,
+    sync_get_external_job_datas_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
@@ -42,9 +47,11 @@
 from dagster._core.host_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.host_representation.origin import (
     CodeLocationOrigin,
+    ExternalRepositoryOrigin,
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
 )
+from dagster._core.host_representation.snapshot_cache import SnapshotCache, get_snapshot_cache
 from dagster._core.instance import DagsterInstance
 from dagster._core.libraries import DagsterLibraryRegistry
 from dagster._core.origin import RepositoryPythonOrigin
@@ -544,6 +551,8 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
+        defer_snapshots: bool = False,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -570,6 +579,14 @@ def __init__(
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
 
+        # fall back to a snapshot cache configured with an environment variable
+        self._snapshot_cache = (
+            check.inst_param(snapshot_cache, "snapshot_cache", SnapshotCache)
+            if snapshot_cache
+            else get_snapshot_cache()
+        )
+        self._defer_snapshots = check.bool_param(defer_snapshots, "defer_snapshots")
+
         self.server_id = None
         self._external_repositories_data = None
 
@@ -621,9 +638,17 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
+            # With deferred snapshots, a job's snapshot is only fetched from the server when the job
+            # is first accessed, so that processes that never look at a job don't pay to load it
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                defer_snapshots=self._defer_snapshots,
+                snapshot_cache=self._snapshot_cache,
+                server_id=self.server_id,
+                fixed_snapshot_repository_names=(
+                    list_repositories_response.fixed_snapshot_repository_names
+                ),
             )
 
             self.external_repositories = {
@@ -633,6 +658,18 @@ def __init__(
                         repository_name=repo_name,
                         code_location=self,
                     ),
+                    ref_to_data_fn=functools.partial(
+                        sync_get_external_job_data_grpc,
+                        self.client,
+                        ExternalRepositoryOrigin(self.origin, repo_name),
+                        snapshot_cache=self._snapshot_cache,
+                    ),
+                    refs_to_data_fn=functools.partial(
+                        sync_get_external_job_datas_grpc,
+                        self.client,
+                        ExternalRepositoryOrigin(self.origin, repo_name),
+                        snapshot_cache=self._snapshot_cache,
+                    ),
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
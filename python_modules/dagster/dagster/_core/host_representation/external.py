@@ -13,6 +13,7 @@
     Mapping,
     Optional,
     Sequence,
+    Set,
     Union,
 )
 
@@ -88,6 +89,9 @@ def __init__(
         external_repository_data: ExternalRepositoryData,
         repository_handle: RepositoryHandle,
         ref_to_data_fn: Optional[Callable[[ExternalJobRef], ExternalJobData]] = None,
+        refs_to_data_fn: Optional[
+            Callable[[Sequence[ExternalJobRef]], Mapping[str, ExternalJobData]]
+        ] = None,
     ):
         self.external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
@@ -99,6 +103,7 @@ def __init__(
             }
             self._deferred_snapshots: bool = False
             self._ref_to_data_fn = None
+            self._refs_to_data_fn = None
         elif external_repository_data.external_job_refs is not None:
             self._job_map = {r.name: r for r in external_repository_data.external_job_refs}
             self._deferred_snapshots = True
@@ -109,6 +114,7 @@ def __init__(
                 )
 
             self._ref_to_data_fn = ref_to_data_fn
+            self._refs_to_data_fn = refs_to_data_fn
         else:
             check.failed("invalid state - expected job data or refs")
 
@@ -126,6 +132,10 @@ def __init__(
         self._memo_lock: RLock = RLock()
         self._cached_jobs: Dict[str, ExternalJob] = {}
 
+        # jobs that were listed together, whose data is fetched at once when any of them needs it
+        self._batched_job_names: Set[str] = set()
+        self._batched_job_datas: Dict[str, ExternalJobData] = {}
+
     @property
     def name(self) -> str:
         return self.external_repository_data.name
@@ -235,14 +245,47 @@ def get_full_external_job(self, job_name: str) -> ExternalJob:
                     external_job_data=external_data,
                     repository_handle=self.handle,
                     external_job_ref=external_ref,
-                    ref_to_data_fn=self._ref_to_data_fn,
+                    ref_to_data_fn=(
+                        self._get_job_data_from_ref
+                        if self._refs_to_data_fn is not None
+                        else self._ref_to_data_fn
+                    ),
                 )
 
             return self._cached_jobs[job_name]
 
     def get_all_external_jobs(self) -> Sequence[ExternalJob]:
+        if self._deferred_snapshots and self._refs_to_data_fn is not None:
+            with self._memo_lock:
+                # views that list every job typically go on to read each job's snapshot, so the
+                # data of the listed jobs is fetched at once when the first of them is read
+                self._batched_job_names.update(
+                    job_name
+                    for job_name in self._job_map
+                    if job_name not in self._cached_jobs
+                    or not self._cached_jobs[job_name].is_loaded
+                )
+
         return [self.get_full_external_job(pn) for pn in self._job_map]
 
+    def _get_job_data_from_ref(self, job_ref: ExternalJobRef) -> ExternalJobData:
+        with self._memo_lock:
+            if job_ref.name in self._batched_job_names and self._refs_to_data_fn is not None:
+                job_refs = [
+                    job_item
+                    for job_name, job_item in self._job_map.items()
+                    if job_name in self._batched_job_names and isinstance(job_item, ExternalJobRef)
+                ]
+                self._batched_job_names.clear()
+                self._batched_job_datas.update(self._refs_to_data_fn(job_refs))
+
+            # each job holds on to its data once it has it
+            job_data = self._batched_job_datas.pop(job_ref.name, None)
+
+        if job_data is not None:
+            return job_data
+        return check.not_none(self._ref_to_data_fn)(job_ref)
+
     @property
     def handle(self) -> RepositoryHandle:
         return self._handle
@@ -349,6 +392,11 @@ def description(self):
     def node_names_in_topological_order(self):
         return self._job_index.job_snapshot.node_names_in_topological_order
 
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the job's data has been loaded, for jobs loaded with deferred snapshots."""
+        return self._data is not None
+
     @property
     def external_job_data(self):
         with self._memo_lock:
@@ -11,6 +11,7 @@
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -1224,11 +1225,84 @@ def external_repository_data_from_def(
         )
         job_refs = None
 
-    resource_datas = repository_def.get_top_level_resources()
     asset_graph = external_asset_graph_from_defs(
         jobs,
         source_assets_by_key=repository_def.source_assets_by_key,
     )
+    return _external_repository_data_from_def(
+        repository_def, jobs, asset_graph, job_datas, job_refs
+    )
+
+
+def external_repository_data_components_from_def(
+    repository_def: RepositoryDefinition,
+    defer_snapshots: bool = False,
+) -> Iterator[Union["ExternalJobData", "ExternalAssetNode", ExternalRepositoryData]]:
+    """Builds the ExternalRepositoryData of a repository in parts, so that it can be serialized and
+    sent without holding all of it at once.
+
+    Yields the ExternalJobData of each job (unless snapshots are deferred) as it is built, then each
+    ExternalAssetNode, and finally the ExternalRepositoryData with its job datas and asset nodes
+    left out. ``external_repository_data_from_components`` puts the parts back together.
+    """
+    check.inst_param(repository_def, "repository_def", RepositoryDefinition)
+
+    jobs = repository_def.get_all_jobs()
+    if defer_snapshots:
+        job_datas = None
+        job_refs = sorted(
+            list(map(external_job_ref_from_def, jobs)),
+            key=lambda pd: pd.name,
+        )
+    else:
+        for job_def in sorted(jobs, key=lambda job_def: job_def.name):
+            yield external_job_data_from_def(job_def)
+        job_datas = []
+        job_refs = None
+
+    asset_graph = external_asset_graph_from_defs(
+        jobs,
+        source_assets_by_key=repository_def.source_assets_by_key,
+    )
+    yield from asset_graph
+
+    repository_data = _external_repository_data_from_def(
+        repository_def, jobs, asset_graph, job_datas, job_refs
+    )
+    yield repository_data._replace(external_asset_graph_data=[])
+
+
+def external_repository_data_from_components(
+    components: Sequence[Union["ExternalJobData", "ExternalAssetNode", ExternalRepositoryData]]
+) -> ExternalRepositoryData:
+    """Reassembles the ExternalRepositoryData built by
+    ``external_repository_data_components_from_def``.
+    """
+    repository_datas = [
+        component for component in components if isinstance(component, ExternalRepositoryData)
+    ]
+    check.invariant(
+        len(repository_datas) == 1, "Expected exactly one ExternalRepositoryData component"
+    )
+    repository_data = repository_datas[0]
+
+    job_datas = [component for component in components if isinstance(component, ExternalJobData)]
+    return repository_data._replace(
+        external_job_datas=job_datas if repository_data.has_job_data() else None,
+        external_asset_graph_data=[
+            component for component in components if isinstance(component, ExternalAssetNode)
+        ],
+    )
+
+
+def _external_repository_data_from_def(
+    repository_def: RepositoryDefinition,
+    jobs: Sequence[JobDefinition],
+    asset_graph: Sequence["ExternalAssetNode"],
+    job_datas: Optional[Sequence["ExternalJobData"]],
+    job_refs: Optional[Sequence["ExternalJobRef"]],
+) -> ExternalRepositoryData:
+    resource_datas = repository_def.get_top_level_resources()
 
     nested_resource_map = _get_nested_resources_map(
         resource_datas, repository_def.get_resource_key_mapping()
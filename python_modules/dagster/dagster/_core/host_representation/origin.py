@@ -106,7 +106,7 @@ def location_name(self) -> str:
         pass
 
     @abstractmethod
-    def create_location(self) -> "CodeLocation":
+    def create_location(self, instance: Optional["DagsterInstance"] = None) -> "CodeLocation":
         pass
 
 
@@ -127,7 +127,7 @@ def __new__(cls, location_name: str):
     def get_display_metadata(self) -> Mapping[str, Any]:
         return {}
 
-    def create_location(self) -> NoReturn:
+    def create_location(self, instance: Optional["DagsterInstance"] = None) -> NoReturn:
         raise DagsterInvariantViolationError(
             "A RegisteredCodeLocationOrigin does not have enough information to load its "
             "repository location on its own."
@@ -186,7 +186,9 @@ def is_reload_supported(self) -> bool:
     def get_display_metadata(self) -> Mapping[str, Any]:
         return {}
 
-    def create_location(self) -> "InProcessCodeLocation":
+    def create_location(
+        self, instance: Optional["DagsterInstance"] = None
+    ) -> "InProcessCodeLocation":
         from dagster._core.host_representation.code_location import (
             InProcessCodeLocation,
         )
@@ -231,7 +233,7 @@ def get_display_metadata(self) -> Mapping[str, str]:
         }
         return {key: value for key, value in metadata.items() if value is not None}
 
-    def create_location(self) -> NoReturn:
+    def create_location(self, instance: Optional["DagsterInstance"] = None) -> NoReturn:
         raise DagsterInvariantViolationError(
             "A ManagedGrpcPythonEnvCodeLocationOrigin needs a DynamicWorkspace"
             " in order to create a handle."
@@ -246,6 +248,7 @@ def create_single_location(
 
         from .code_location import GrpcServerCodeLocation
         from .grpc_server_registry import GrpcServerRegistry
+        from .snapshot_cache import get_snapshot_cache
 
         with GrpcServerRegistry(
             instance=instance,
@@ -265,6 +268,8 @@ def create_single_location(
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=grpc_server_registry,
+                snapshot_cache=get_snapshot_cache(instance),
+                defer_snapshots=instance.code_server_defer_job_snapshots if instance else False,
             ) as location:
                 yield location
 
@@ -317,12 +322,19 @@ def get_display_metadata(self) -> Mapping[str, str]:
         }
         return {key: value for key, value in metadata.items() if value is not None}
 
-    def create_location(self) -> "GrpcServerCodeLocation":
+    def create_location(
+        self, instance: Optional["DagsterInstance"] = None
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.host_representation.code_location import (
             GrpcServerCodeLocation,
         )
+        from dagster._core.host_representation.snapshot_cache import get_snapshot_cache
 
-        return GrpcServerCodeLocation(self)
+        return GrpcServerCodeLocation(
+            self,
+            snapshot_cache=get_snapshot_cache(instance),
+            defer_snapshots=instance.code_server_defer_job_snapshots if instance else False,
+        )
 
     def create_client(self) -> "DagsterGrpcClient":
         from dagster._grpc.client import DagsterGrpcClient
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, List, Mapping, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._utils import mkdir_p
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+
+SNAPSHOT_CACHE_DIR_ENV_VAR = "DAGSTER_SNAPSHOT_CACHE_DIR"
+
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_SNAPSHOT_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+# Files used more recently than this are never evicted, so that a process loading a snapshot
+# doesn't lose the parts it was just told are on disk
+MIN_EVICTION_AGE_SECONDS = 10 * 60
+
+# Processes writing to the cache check whether files should be evicted at most this often
+EVICTION_INTERVAL_SECONDS = 10 * 60
+
+
+def get_snapshot_cache(instance: Optional["DagsterInstance"] = None) -> Optional["SnapshotCache"]:
+    """Returns the on-disk snapshot cache that this process should use, if one is configured in the
+    snapshot_cache settings of the instance or with the DAGSTER_SNAPSHOT_CACHE_DIR environment
+    variable.
+    """
+    settings = instance.snapshot_cache_settings if instance else {}
+    base_dir = settings.get("base_dir") or os.getenv(SNAPSHOT_CACHE_DIR_ENV_VAR)
+    if not base_dir:
+        return None
+
+    return SnapshotCache(
+        base_dir,
+        max_bytes=settings.get("max_bytes", DEFAULT_SNAPSHOT_CACHE_MAX_BYTES),
+        max_age_seconds=settings.get("max_age_seconds", DEFAULT_SNAPSHOT_CACHE_MAX_AGE_SECONDS),
+    )
+
+
+class SnapshotCache:
+    """Content-addressed store on local disk for the serialized parts of repository snapshots that
+    are loaded from code servers.
+
+    Every process on a host that loads code locations (dagit, the daemon, run workers) can point at
+    the same directory. Each part is stored once under the hash of its content, and the hashes of
+    the parts of the last snapshot loaded for each repository are recorded under the repository's
+    origin id, so that a process loading a code location for the first time only fetches the parts
+    that aren't on disk yet. The id of the code server that served the snapshot is recorded with
+    the hashes: a code server serves the same snapshot of a repository whose definitions are fixed
+    for as long as it runs, so a process loading such a repository from the same server builds the
+    snapshot from disk without calling the server at all. Code servers that serve a location of
+    the same name, like those of different deployments sharing a host, record their snapshots
+    separately. The data of jobs whose snapshots are fetched on their own is stored under the job's
+    snapshot id.
+
+    Files are written to a temporary file that is then renamed into place, so concurrent readers
+    never see a partially written file.
+
+    Files are marked as used when they are read. Files that haven't been used in
+    `max_age_seconds` are evicted, and then the least recently used files until the cache takes up
+    at most `max_bytes`. Writers check whether files should be evicted every few minutes.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        max_bytes: int = DEFAULT_SNAPSHOT_CACHE_MAX_BYTES,
+        max_age_seconds: int = DEFAULT_SNAPSHOT_CACHE_MAX_AGE_SECONDS,
+    ):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._max_age_seconds = check.int_param(max_age_seconds, "max_age_seconds")
+
+    @property
+    def base_dir(self) -> str:
+        return self._base_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def max_age_seconds(self) -> int:
+        return self._max_age_seconds
+
+    def _component_path(self, component_hash: str) -> str:
+        return os.path.join(self._base_dir, "components", component_hash[:2], component_hash)
+
+    def _manifest_path(self, repository_origin_id: str) -> str:
+        key = hashlib.sha256(repository_origin_id.encode("utf-8"))
+        return os.path.join(self._base_dir, "repositories", key.hexdigest())
+
+    def _job_data_path(self, repository_origin_id: str, job_name: str, snapshot_id: str) -> str:
+        key = hashlib.sha256(
+            json.dumps([repository_origin_id, job_name, snapshot_id]).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self._base_dir, "jobs", key[:2], key)
+
+    def _eviction_marker_path(self) -> str:
+        return os.path.join(self._base_dir, ".last_eviction")
+
+    def _read(self, path: str) -> Optional[str]:
+        try:
+            with open(path, encoding="utf8") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        self._touch(path)
+        return data
+
+    def _touch(self, path: str) -> bool:
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _write(self, path: str, data: bytes) -> None:
+        mkdir_p(os.path.dirname(path))
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        self._maybe_evict()
+
+    def has_serialized_component(self, component_hash: str) -> bool:
+        return os.path.exists(self._component_path(component_hash))
+
+    def get_serialized_component(self, component_hash: str) -> Optional[str]:
+        return self._read(self._component_path(component_hash))
+
+    def set_serialized_component(self, component_hash: str, serialized_component: str) -> None:
+        path = self._component_path(component_hash)
+        if not os.path.exists(path):
+            self._write(path, serialized_component.encode("utf-8"))
+
+    def _read_manifest(self, repository_origin_id: str) -> Mapping[str, Any]:
+        try:
+            with open(self._manifest_path(repository_origin_id), encoding="utf8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+        # manifests written before the server id was recorded hold only the hashes
+        if isinstance(manifest, list):
+            return {"component_hashes": manifest}
+        return manifest
+
+    def get_component_hashes(self, repository_origin_id: str) -> Sequence[str]:
+        """Returns the hashes of the parts of the snapshot last loaded for the repository that are
+        still on disk. They are marked as used, so that they aren't evicted before they are read.
+        """
+        return [
+            component_hash
+            for component_hash in self._read_manifest(repository_origin_id).get(
+                "component_hashes", []
+            )
+            if self._touch(self._component_path(component_hash))
+        ]
+
+    def get_served_component_hashes(
+        self, repository_origin_id: str, server_id: str, defer_snapshots: bool
+    ) -> Optional[Sequence[str]]:
+        """Returns the hashes of the parts of the snapshot last loaded for the repository if it was
+        served by the code server with the given id, with the same deferred snapshots setting, and
+        all of its parts are still on disk. Returns None otherwise.
+        """
+        check.str_param(server_id, "server_id")
+        check.bool_param(defer_snapshots, "defer_snapshots")
+
+        manifest = self._read_manifest(repository_origin_id)
+        if (
+            manifest.get("server_id") != server_id
+            or manifest.get("defer_snapshots") != defer_snapshots
+        ):
+            return None
+
+        component_hashes = manifest.get("component_hashes", [])
+        if not all(
+            [
+                self._touch(self._component_path(component_hash))
+                for component_hash in component_hashes
+            ]
+        ):
+            return None
+        return component_hashes
+
+    def set_component_hashes(
+        self,
+        repository_origin_id: str,
+        component_hashes: Sequence[str],
+        server_id: Optional[str] = None,
+        defer_snapshots: bool = False,
+    ) -> None:
+        self._write(
+            self._manifest_path(repository_origin_id),
+            json.dumps(
+                {
+                    "server_id": server_id,
+                    "defer_snapshots": defer_snapshots,
+                    "component_hashes": list(component_hashes),
+                }
+            ).encode("utf-8"),
+        )
+
+    def get_serialized_job_data(
+        self, repository_origin_id: str, job_name: str, snapshot_id: str
+    ) -> Optional[str]:
+        return self._read(self._job_data_path(repository_origin_id, job_name, snapshot_id))
+
+    def set_serialized_job_data(
+        self, repository_origin_id: str, job_name: str, snapshot_id: str, serialized_job_data: str
+    ) -> None:
+        path = self._job_data_path(repository_origin_id, job_name, snapshot_id)
+        if not os.path.exists(path):
+            self._write(path, serialized_job_data.encode("utf-8"))
+
+    def _maybe_evict(self) -> None:
+        marker_path = self._eviction_marker_path()
+        try:
+            if time.time() - os.path.getmtime(marker_path) < EVICTION_INTERVAL_SECONDS:
+                return
+        except FileNotFoundError:
+            pass
+
+        with open(marker_path, "a", encoding="utf8"):
+            pass
+        os.utime(marker_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Deletes the files that haven't been used in max_age_seconds, and then the least recently
+        used files until the cache takes up at most max_bytes. Files used in the last few minutes
+        are kept either way.
+        """
+        now = time.time()
+        files: List[Tuple[float, int, str]] = []
+        for dirpath, _dirnames, filenames in os.walk(self._base_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if path == self._eviction_marker_path():
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in files)
+        for last_used, size, path in sorted(files):
+            age = now - last_used
+            if age < MIN_EVICTION_AGE_SECONDS:
+                break
+            if age <= self._max_age_seconds and total_bytes <= self._max_bytes:
+                break
+
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
@@ -4,6 +4,7 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import weakref
 from collections import defaultdict
@@ -53,6 +54,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunTagsRecord,
     TagBucket,
 )
 from dagster._core.storage.tags import (
@@ -95,7 +97,7 @@
         RepositoryLoadData,
     )
     from dagster._core.definitions.run_request import InstigatorType
-    from dagster._core.event_api import EventHandlerFn
+    from dagster._core.event_api import EventHandlerFn, EventRecordsProjection
     from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -127,10 +129,15 @@
     from dagster._core.storage.event_log import EventLogStorage
     from dagster._core.storage.event_log.base import (
         AssetRecord,
+        AssetStatusCacheDelta,
         EventLogConnection,
         EventLogRecord,
         EventRecordsFilter,
     )
+    from dagster._core.storage.event_log.write_behind import (
+        WriteBehindEventWriter,
+        WriteBehindMetrics,
+    )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
@@ -176,6 +183,25 @@ def _format_field_diff(field_diff: Mapping[str, Tuple[Any, Any]]) -> str:
     )
 
 
+def _flush_event_buffer_periodically(
+    instance_ref: "weakref.ReferenceType[DagsterInstance]",
+    shutdown: threading.Event,
+    interval_seconds: float,
+) -> None:
+    # holds a weak reference so that the thread doesn't keep an undisposed instance alive
+    delay = interval_seconds
+    while not shutdown.wait(delay):
+        instance = instance_ref()
+        if instance is None:
+            return
+        try:
+            delay = instance._flush_event_buffer_if_due()  # noqa: SLF001
+        except Exception:
+            logging.exception("Exception while flushing buffered events to the event log.")
+            delay = interval_seconds
+        del instance
+
+
 class _EventListenerLogHandler(logging.Handler):
     def __init__(self, instance: "DagsterInstance"):
         self._instance = instance
@@ -407,6 +433,13 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_buffer: List[EventLogEntry] = []
+        self._event_buffer_lock = threading.RLock()
+        self._event_buffer_first_event_time: Optional[float] = None
+        self._event_buffer_flush_thread: Optional[threading.Thread] = None
+        self._event_buffer_flush_shutdown = threading.Event()
+        self._event_log_writer: Optional[WriteBehindEventWriter] = None
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
         if self.run_monitoring_enabled and self.run_monitoring_max_resume_run_attempts:
@@ -768,6 +801,10 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_defer_job_snapshots(self) -> bool:
+        return self.code_server_settings.get("defer_job_snapshots", False)
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -805,6 +842,47 @@ def auto_materialize_minimum_interval_seconds(self) -> int:
     def auto_materialize_run_tags(self) -> Dict[str, str]:
         return self.get_settings("auto_materialize").get("run_tags", {})
 
+    # event log batching
+
+    @property
+    def event_log_batching_settings(self) -> Any:
+        return self.get_settings("event_log_batching")
+
+    @property
+    def event_log_batching_enabled(self) -> bool:
+        return self.event_log_batching_settings.get("enabled", False)
+
+    @property
+    def event_log_batching_flush_size(self) -> int:
+        return self.event_log_batching_settings.get("flush_size", 100)
+
+    @property
+    def event_log_batching_flush_interval_seconds(self) -> float:
+        return self.event_log_batching_settings.get("flush_interval_seconds", 1.0)
+
+    @property
+    def event_log_write_behind_enabled(self) -> bool:
+        return self.event_log_batching_enabled and self.event_log_batching_settings.get(
+            "write_behind", False
+        )
+
+    @property
+    def event_log_write_behind_max_queue_size(self) -> int:
+        return self.event_log_batching_settings.get("max_queue_size", 10000)
+
+    @property
+    def event_log_writer_metrics(self) -> Optional[WriteBehindMetrics]:
+        """Queue depth and flush latency metrics for the write-behind event log writer, if one
+        has been started.
+        """
+        return self._event_log_writer.get_metrics() if self._event_log_writer else None
+
+    # snapshot cache
+
+    @property
+    def snapshot_cache_settings(self) -> Any:
+        return self.get_settings("snapshot_cache")
+
     # python logs
 
     @property
@@ -858,6 +936,16 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self._event_buffer_flush_shutdown.set()
+        try:
+            self.flush_event_buffer()
+            if self._event_log_writer:
+                self._event_log_writer.close()
+        finally:
+            # a failure to write buffered events is raised once the storages are disposed
+            self._dispose_storages()
+
+    def _dispose_storages(self) -> None:
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
@@ -1538,10 +1626,18 @@ def add_snapshot(
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._run_storage.handle_run_event(run_id, event)
 
+    @traced
+    def handle_run_events(self, run_events: Sequence[Tuple[str, "DagsterEvent"]]) -> None:
+        return self._run_storage.handle_run_events(run_events)
+
     @traced
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         return self._run_storage.add_run_tags(run_id, new_tags)
 
+    @traced
+    def add_run_tags_bulk(self, tags_by_run_id: Mapping[str, Mapping[str, str]]) -> None:
+        return self._run_storage.add_run_tags_bulk(tags_by_run_id)
+
     @traced
     def has_run(self, run_id: str) -> bool:
         return self._run_storage.has_run(run_id)
@@ -1596,6 +1692,12 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_run_tags_records(
+        self, filters: Optional[RunsFilter] = None, ascending: bool = False
+    ) -> Sequence[RunTagsRecord]:
+        return self._run_storage.get_run_tags_records(filters, ascending)
+
     @property
     def supports_bucket_queries(self) -> bool:
         return self._run_storage.supports_bucket_queries
@@ -1646,8 +1748,13 @@ def get_records_for_run(
         cursor: Optional[str] = None,
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
+        projection: Optional["EventRecordsProjection"] = None,
     ) -> "EventLogConnection":
-        return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
+        if projection is None:
+            return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
+        return self._event_storage.get_records_for_run(
+            run_id, cursor, of_type, limit, projection=projection
+        )
 
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
@@ -1667,6 +1774,27 @@ def update_asset_cached_status_data(
     ) -> None:
         self._event_storage.update_asset_cached_status_data(asset_key, cache_values)
 
+    @traced
+    def get_asset_status_cache_deltas(
+        self, asset_key: AssetKey
+    ) -> Optional[Sequence["AssetStatusCacheDelta"]]:
+        return self._event_storage.get_asset_status_cache_deltas(asset_key)
+
+    @traced
+    def delete_asset_status_cache_deltas(
+        self, asset_key: AssetKey, deltas: Sequence["AssetStatusCacheDelta"]
+    ) -> None:
+        self._event_storage.delete_asset_status_cache_deltas(asset_key, deltas)
+
+    @traced
+    def apply_asset_status_cache_deltas(
+        self,
+        asset_key: AssetKey,
+        cache_values: "AssetStatusCacheValue",
+        deltas: Sequence["AssetStatusCacheDelta"],
+    ) -> None:
+        self._event_storage.apply_asset_status_cache_deltas(asset_key, cache_values, deltas)
+
     @traced
     def wipe_asset_cached_status(self, asset_keys: Sequence[AssetKey]) -> None:
         check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
@@ -1710,6 +1838,7 @@ def get_event_records(
         event_records_filter: "EventRecordsFilter",
         limit: Optional[int] = None,
         ascending: bool = False,
+        projection: Optional["EventRecordsProjection"] = None,
     ) -> Sequence["EventLogRecord"]:
         """Return a list of event records stored in the event log storage.
 
@@ -1719,11 +1848,20 @@ def get_event_records(
             limit (Optional[int]): Number of results to get. Defaults to infinite.
             ascending (Optional[bool]): Sort the result in ascending order if True, descending
                 otherwise. Defaults to descending.
+            projection (Optional[EventRecordsProjection]): Which columns of the event log to load
+                for each record. With the LAZY projection, the event payload of each record is only
+                deserialized when it is first accessed. With the INDEXED_COLUMNS projection, only
+                the storage id, run id, timestamp, event type, asset key and partition key of each
+                record are loaded. Defaults to loading and deserializing the full event payload.
 
         Returns:
             List[EventLogRecord]: List of event log records stored in the event log storage.
         """
-        return self._event_storage.get_event_records(event_records_filter, limit, ascending)
+        if projection is None:
+            return self._event_storage.get_event_records(event_records_filter, limit, ascending)
+        return self._event_storage.get_event_records(
+            event_records_filter, limit, ascending, projection=projection
+        )
 
     @public
     @traced
@@ -1858,15 +1996,151 @@ def store_event(self, event: EventLogEntry) -> None:
         self._event_storage.store_event(event)
 
     def handle_new_event(self, event: EventLogEntry) -> None:
-        run_id = event.run_id
+        if not self.event_log_batching_enabled:
+            self._handle_new_events([event])
+            return
 
-        self._event_storage.store_event(event)
+        if self.event_log_write_behind_enabled:
+            # Events are written by a background thread. Everything emitted before a run status
+            # change or step boundary is forced to storage before that event is recorded.
+            if self._is_event_log_flush_boundary(event):
+                self._get_event_log_writer().flush()
+                self._handle_new_events([event])
+            else:
+                self._get_event_log_writer().enqueue(event)
+            return
+
+        # Events are buffered and written to the event log storage in batches. The buffer lock is
+        # held while writing so that concurrently emitted events are stored in emission order.
+        with self._event_buffer_lock:
+            if not self._event_buffer:
+                self._event_buffer_first_event_time = time.time()
+                self._ensure_event_buffer_flush_thread()
+            self._event_buffer.append(event)
+
+            if self._should_flush_event_buffer(event):
+                self.flush_event_buffer()
+
+    def flush_event_buffer(self) -> None:
+        """Writes any events that have been buffered or queued by ``handle_new_event`` when event
+        log batching is enabled.
+        """
+        if self._event_log_writer:
+            self._event_log_writer.flush()
+
+        with self._event_buffer_lock:
+            events = self._event_buffer
+            self._event_buffer = []
+            self._event_buffer_first_event_time = None
+            if events:
+                self._handle_new_events(events)
+
+    def _ensure_event_buffer_flush_thread(self) -> None:
+        # buffered events are also flushed from a background thread once they've waited for the
+        # flush interval, so that they don't wait for the next event when a step goes quiet
+        if (
+            self._event_buffer_flush_thread is None
+            or not self._event_buffer_flush_thread.is_alive()
+        ):
+            self._event_buffer_flush_thread = threading.Thread(
+                target=_flush_event_buffer_periodically,
+                args=(
+                    weakref.ref(self),
+                    self._event_buffer_flush_shutdown,
+                    self.event_log_batching_flush_interval_seconds,
+                ),
+                name="event-log-buffer-flush",
+                daemon=True,
+            )
+            self._event_buffer_flush_thread.start()
+
+    def _flush_event_buffer_if_due(self) -> float:
+        """Flushes the event buffer if its oldest event has waited for the flush interval, and
+        returns the number of seconds until the buffer should next be checked.
+        """
+        interval = self.event_log_batching_flush_interval_seconds
+        with self._event_buffer_lock:
+            if self._event_buffer_first_event_time is None:
+                return interval
+
+            waited = time.time() - self._event_buffer_first_event_time
+            if waited < interval:
+                return interval - waited
+
+            self.flush_event_buffer()
+            return interval
+
+    def _get_event_log_writer(self) -> WriteBehindEventWriter:
+        from dagster._core.storage.event_log.write_behind import WriteBehindEventWriter
+
+        with self._event_buffer_lock:
+            if self._event_log_writer is None:
+                self._event_log_writer = WriteBehindEventWriter(
+                    store_fn=self._store_new_events,
+                    dispatch_fn=self._dispatch_stored_events,
+                    max_queue_size=self.event_log_write_behind_max_queue_size,
+                    flush_size=self.event_log_batching_flush_size,
+                    flush_interval_seconds=self.event_log_batching_flush_interval_seconds,
+                )
+            return self._event_log_writer
 
-        if event.is_dagster_event and event.get_dagster_event().is_job_event:
-            self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+    def _should_flush_event_buffer(self, event: EventLogEntry) -> bool:
+        if len(self._event_buffer) >= self.event_log_batching_flush_size:
+            return True
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+        if (
+            self._event_buffer_first_event_time is not None
+            and time.time() - self._event_buffer_first_event_time
+            >= self.event_log_batching_flush_interval_seconds
+        ):
+            return True
+
+        return self._is_event_log_flush_boundary(event)
+
+    def _is_event_log_flush_boundary(self, event: EventLogEntry) -> bool:
+        from dagster._core.events import DagsterEventType
+
+        # run status changes and step boundaries must be visible to other processes immediately,
+        # e.g. to the run monitoring daemon and to executors polling for step completion
+        if event.is_dagster_event and (
+            event.get_dagster_event().is_job_event
+            or event.get_dagster_event().event_type
+            in {
+                DagsterEventType.STEP_SUCCESS,
+                DagsterEventType.STEP_FAILURE,
+                DagsterEventType.STEP_SKIPPED,
+                DagsterEventType.STEP_UP_FOR_RETRY,
+                DagsterEventType.STEP_RESTARTED,
+            }
+        ):
+            return True
+
+        return False
+
+    def _handle_new_events(self, events: Sequence[EventLogEntry]) -> None:
+        self._store_new_events(events)
+        self._dispatch_stored_events(events)
+
+    def _store_new_events(self, events: Sequence[EventLogEntry]) -> None:
+        if len(events) == 1:
+            self._event_storage.store_event(events[0])
+        else:
+            self._event_storage.store_events(events)
+
+    def _dispatch_stored_events(self, events: Sequence[EventLogEntry]) -> None:
+        run_events = [
+            (event.run_id, event.get_dagster_event())
+            for event in events
+            if event.is_dagster_event and event.get_dagster_event().is_job_event
+        ]
+        if len(run_events) == 1:
+            self._run_storage.handle_run_event(*run_events[0])
+        elif run_events:
+            self._run_storage.handle_run_events(run_events)
+
+        for event in events:
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
 
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
@@ -1944,6 +2218,39 @@ def report_dagster_event(
         )
         self.handle_new_event(event_record)
 
+    def report_dagster_events(
+        self,
+        run_events: Sequence[Tuple[str, "DagsterEvent"]],
+        log_level: Union[str, int] = logging.INFO,
+    ) -> None:
+        """Takes a batch of DagsterEvents, each paired with the id of the DagsterRun it belongs to,
+        and stores them in persistent storage, updating the status of all the affected runs in a
+        single batch.
+        """
+        from dagster._core.events.log import EventLogEntry
+
+        now = time.time()
+        event_records = [
+            EventLogEntry(
+                user_message="",
+                level=log_level,
+                job_name=dagster_event.job_name,
+                run_id=run_id,
+                error_info=None,
+                timestamp=now,
+                step_key=dagster_event.step_key,
+                dagster_event=dagster_event,
+            )
+            for run_id, dagster_event in run_events
+        ]
+        if not event_records:
+            return
+
+        # anything buffered by handle_new_event must be stored before this batch
+        if self.event_log_batching_enabled:
+            self.flush_event_buffer()
+        self._handle_new_events(event_records)
+
     def report_run_canceling(self, run: DagsterRun, message: Optional[str] = None):
         from dagster._core.events import DagsterEvent, DagsterEventType
 
@@ -2004,6 +2311,38 @@ def report_run_failed(
         self.report_dagster_event(dagster_event, run_id=dagster_run.run_id, log_level=logging.ERROR)
         return dagster_event
 
+    def report_runs_failed(
+        self, runs_and_messages: Sequence[Tuple[DagsterRun, Optional[str]]]
+    ) -> Sequence[DagsterEvent]:
+        """Marks many runs as failed from outside the execution context, storing their failure
+        events and status updates in a single batch.
+        """
+        from dagster._core.events import DagsterEvent, DagsterEventType
+
+        check.sequence_param(runs_and_messages, "runs_and_messages", of_type=tuple)
+
+        run_events = []
+        for dagster_run, message in runs_and_messages:
+            check.inst(dagster_run, DagsterRun)
+            failure_message = check.opt_str_param(
+                message,
+                "message",
+                "This run has been marked as failed from outside the execution context.",
+            )
+            run_events.append(
+                (
+                    dagster_run.run_id,
+                    DagsterEvent(
+                        event_type_value=DagsterEventType.PIPELINE_FAILURE.value,
+                        job_name=dagster_run.job_name,
+                        message=failure_message,
+                    ),
+                )
+            )
+
+        self.report_dagster_events(run_events, log_level=logging.ERROR)
+        return [dagster_event for _, dagster_event in run_events]
+
     # directories
 
     def file_manager_directory(self, run_id: str) -> str:
@@ -251,6 +251,23 @@ def sensors_daemon_config() -> Field:
         {
             "use_threads": Field(Bool, is_required=False, default_value=False),
             "num_workers": Field(int, is_required=False),
+            "max_concurrent_ticks": Field(
+                int,
+                is_required=False,
+                description=(
+                    "If use_threads is true, limit the number of sensor ticks that are evaluated"
+                    " concurrently. Sensors that are due for a tick are evaluated in order of how"
+                    " overdue they are."
+                ),
+            ),
+            "max_concurrent_ticks_per_code_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "If use_threads is true, limit the number of sensor ticks that are evaluated"
+                    " concurrently for each code location."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -318,6 +335,7 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
             {
                 "local_startup_timeout": Field(int, is_required=False),
                 "wait_for_local_processes_on_shutdown": Field(bool, is_required=False),
+                "defer_job_snapshots": Field(bool, is_required=False),
             },
             is_required=False,
         ),
@@ -332,4 +350,22 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "run_tags": Field(dict, is_required=False),
             }
         ),
+        "event_log_batching": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "flush_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+                "write_behind": Field(Bool, is_required=False),
+                "max_queue_size": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "snapshot_cache": Field(
+            {
+                "base_dir": Field(StringSource, is_required=False),
+                "max_bytes": Field(int, is_required=False),
+                "max_age_seconds": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
     }
@@ -454,6 +454,8 @@ def from_dir(
             "schedules",
             "nux",
             "auto_materialize",
+            "event_log_batching",
+            "snapshot_cache",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -0,0 +1,25 @@
+"""add run covering indexes
+
+Revision ID: 5f8a1c3e9b27
+Revises: d9092588866f
+Create Date: 2023-03-20 10:12:45.381204
+
+"""
+from dagster._core.storage.migration.utils import (
+    add_run_covering_indexes,
+    drop_run_covering_indexes,
+)
+
+# revision identifiers, used by Alembic.
+revision = "5f8a1c3e9b27"
+down_revision = "d9092588866f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_covering_indexes()
+
+
+def downgrade():
+    drop_run_covering_indexes()
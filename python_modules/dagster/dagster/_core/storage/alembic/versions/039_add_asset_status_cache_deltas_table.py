@@ -0,0 +1,55 @@
+"""add asset status cache deltas table
+
+Revision ID: 2b6d4e9a7c13
+Revises: 5f8a1c3e9b27
+Create Date: 2023-03-24 14:05:31.902114
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "2b6d4e9a7c13"
+down_revision = "5f8a1c3e9b27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("asset_keys"):
+        # the table is only used by event log storages
+        return
+
+    if not has_table("asset_status_cache_deltas"):
+        op.create_table(
+            "asset_status_cache_deltas",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("materialized", db.Boolean, nullable=False),
+            db.Column("planned_run_id", db.String(255)),
+            db.Column("first_storage_id", db.BigInteger, nullable=False),
+            db.Column("latest_storage_id", db.BigInteger, nullable=False),
+        )
+        op.create_index(
+            "idx_asset_status_cache_deltas",
+            "asset_status_cache_deltas",
+            ["asset_key", "partition"],
+            mysql_length={"asset_key": 64, "partition": 64},
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_index("asset_status_cache_deltas", "idx_asset_status_cache_deltas"):
+        op.drop_index("idx_asset_status_cache_deltas", "asset_status_cache_deltas")
+
+    if has_table("asset_status_cache_deltas"):
+        op.drop_table("asset_status_cache_deltas")
@@ -0,0 +1,25 @@
+"""add run tags run id index
+
+Revision ID: 7a3c2f8e4d51
+Revises: 2b6d4e9a7c13
+Create Date: 2023-03-28 11:20:14.529817
+
+"""
+from dagster._core.storage.migration.utils import (
+    add_run_tags_run_id_index,
+    drop_run_tags_run_id_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "7a3c2f8e4d51"
+down_revision = "2b6d4e9a7c13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_tags_run_id_index()
+
+
+def downgrade():
+    drop_run_tags_run_id_index()
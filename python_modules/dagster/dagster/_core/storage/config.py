@@ -2,8 +2,9 @@
 
 from typing_extensions import TypedDict
 
-from dagster._config import Field, IntSource, Permissive, Selector, StringSource
+from dagster._config import Enum, Field, IntSource, Permissive, Selector, StringSource
 from dagster._config.config_schema import UserConfigSchema
+from dagster._serdes import SerdesFormat
 
 
 class MySqlStorageConfig(TypedDict):
@@ -66,3 +67,29 @@ def pg_config() -> UserConfigSchema:
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
     }
+
+
+def serdes_format_config() -> Field:
+    return Field(
+        Enum.from_python_enum(SerdesFormat),
+        is_required=False,
+        default_value=SerdesFormat.JSON.value,
+        description=(
+            "The format used to serialize the objects written by this storage. COMPACT produces"
+            " smaller values that are faster to deserialize. Values written in either format can"
+            " always be read."
+        ),
+    )
+
+
+def incremental_asset_status_cache_config() -> Field:
+    return Field(
+        bool,
+        is_required=False,
+        default_value=False,
+        description=(
+            "Whether to update the cached partition status of an asset as its materialization and"
+            " materialization planned events are stored, instead of scanning the new events when"
+            " the cached status is next read."
+        ),
+    )
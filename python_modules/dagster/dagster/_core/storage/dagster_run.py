@@ -28,6 +28,7 @@
 
 from .tags import (
     BACKFILL_ID_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
     SCHEDULE_NAME_TAG,
@@ -568,6 +569,83 @@ def __new__(
         )
 
 
+class RunTagsRecord(
+    NamedTuple(
+        "_RunTagsRecord",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("status", DagsterRunStatus),
+            ("tags", Mapping[str, str]),
+            ("location_name", Optional[str]),
+            ("update_timestamp", datetime),
+        ],
+    )
+):
+    """Internal projection of a run record onto the fields needed to schedule runs: its status,
+    its tags and the name of the code location it was launched from. It can be read from a
+    :py:class:`~dagster._core.storage.runs.RunStorage` without deserializing the run body.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        status: DagsterRunStatus,
+        tags: Mapping[str, str],
+        location_name: Optional[str],
+        update_timestamp: datetime,
+    ):
+        return super(RunTagsRecord, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            tags=check.mapping_param(tags, "tags"),
+            location_name=check.opt_str_param(location_name, "location_name"),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+        )
+
+    @staticmethod
+    def from_storage_tags(
+        storage_id: int,
+        run_id: str,
+        status: DagsterRunStatus,
+        storage_tags: Mapping[str, str],
+        update_timestamp: datetime,
+    ) -> "RunTagsRecord":
+        """Builds the record from the tags written to storage by ``DagsterRun.tags_for_storage``,
+        which include the label of the repository the run was launched from.
+        """
+        tags = dict(storage_tags)
+        repository_label = tags.pop(REPOSITORY_LABEL_TAG, None)
+        location_name = repository_label.split("@", 1)[1] if repository_label else None
+        return RunTagsRecord(storage_id, run_id, status, tags, location_name, update_timestamp)
+
+    @staticmethod
+    def from_run_record(run_record: RunRecord) -> "RunTagsRecord":
+        run = run_record.dagster_run
+        return RunTagsRecord(
+            storage_id=run_record.storage_id,
+            run_id=run.run_id,
+            status=run.status,
+            tags=run.tags,
+            location_name=(
+                run.external_job_origin.location_name if run.external_job_origin else None
+            ),
+            update_timestamp=run_record.update_timestamp,
+        )
+
+    @property
+    def priority(self) -> int:
+        try:
+            return int(self.tags.get(PRIORITY_TAG, "0"))
+        except ValueError:
+            return 0
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
@@ -7,6 +7,7 @@
 from .polling_event_watcher import SqlPollingEventWatcher as SqlPollingEventWatcher
 from .schema import (
     AssetKeyTable as AssetKeyTable,
+    AssetStatusCacheDeltasTable as AssetStatusCacheDeltasTable,
     DynamicPartitionsTable as DynamicPartitionsTable,
     SqlEventLogStorageMetadata as SqlEventLogStorageMetadata,
     SqlEventLogStorageTable as SqlEventLogStorageTable,
@@ -15,7 +15,13 @@
 import dagster._check as check
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.events import AssetKey
-from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+from dagster._core.event_api import (
+    EventHandlerFn,
+    EventLogRecord,
+    EventRecordsFilter,
+    EventRecordsProjection,
+)
 from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.stats import (
@@ -137,6 +143,24 @@ class AssetRecord(NamedTuple):
     asset_entry: AssetEntry
 
 
+class AssetStatusCacheDelta(NamedTuple):
+    """Internal representation of the change to the status of an asset partition since its cached
+    status was last updated, recorded as the materialization and materialization planned events of
+    the partition are stored.
+
+    Users should not invoke this class directly.
+    """
+
+    partition: str
+    # whether the partition was materialized
+    materialized: bool
+    # the run id of the latest materialization planned event that was not followed by a
+    # materialization
+    planned_run_id: Optional[str]
+    first_storage_id: int
+    latest_storage_id: int
+
+
 class EventLogStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance]):
     """Abstract base class for storing structured event logs from pipeline runs.
 
@@ -177,6 +201,7 @@ def get_records_for_run(
         cursor: Optional[str] = None,
         of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
         limit: Optional[int] = None,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> EventLogConnection:
         """Get all of the event log records corresponding to a run.
 
@@ -185,6 +210,8 @@ def get_records_for_run(
             cursor (Optional[str]): Cursor value to track paginated queries.
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): Max number of records to return.
+            projection (EventRecordsProjection): Which columns to load for each record. Storages
+                that cannot load a subset of the columns may return fully loaded records instead.
         """
 
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
@@ -213,6 +240,28 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order. Storages that can write many events in a single
+        round-trip should override this method.
+
+        If storing the batch fails after some of its leading events were stored, raises a
+        DagsterEventBatchPartiallyStoredError with the number of events that were stored, so that
+        callers that retry the batch don't store them twice.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for num_stored, event in enumerate(events):
+            try:
+                self.store_event(event)
+            except Exception as e:
+                if not num_stored:
+                    raise
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Only {num_stored} of {len(events)} events were stored.",
+                    num_stored=num_stored,
+                ) from e
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -261,8 +310,17 @@ def get_event_records(
         event_records_filter: EventRecordsFilter,
         limit: Optional[int] = None,
         ascending: bool = False,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> Sequence[EventLogRecord]:
-        pass
+        """Get the event log records matching the given filter.
+
+        Args:
+            event_records_filter (EventRecordsFilter): Filter for the records to return.
+            limit (Optional[int]): Max number of records to return.
+            ascending (bool): Sort the records by ascending storage id.
+            projection (EventRecordsProjection): Which columns to load for each record. Storages
+                that cannot load a subset of the columns may return fully loaded records instead.
+        """
 
     def supports_event_consumer_queries(self) -> bool:
         return False
@@ -289,6 +347,35 @@ def can_cache_asset_status_data(self) -> bool:
     def wipe_asset_cached_status(self, asset_key: AssetKey) -> None:
         pass
 
+    def get_asset_status_cache_deltas(
+        self, asset_key: AssetKey
+    ) -> Optional[Sequence[AssetStatusCacheDelta]]:
+        """Returns the changes to the partition status of the asset that were recorded as its
+        events were stored, and have not yet been applied to its cached status. None if the storage
+        does not record them.
+        """
+        return None
+
+    def delete_asset_status_cache_deltas(
+        self, asset_key: AssetKey, deltas: Sequence[AssetStatusCacheDelta]
+    ) -> None:
+        """Deletes the given changes to the partition status of the asset, once they have been
+        applied to its cached status. Changes recorded after they were fetched are kept.
+        """
+
+    def apply_asset_status_cache_deltas(
+        self,
+        asset_key: AssetKey,
+        cache_values: "AssetStatusCacheValue",
+        deltas: Sequence[AssetStatusCacheDelta],
+    ) -> None:
+        """Stores the cached status of the asset that the given changes were folded into, and
+        deletes the changes. Storages that record the changes do both in one transaction, so that
+        the changes can't be lost, or applied again to a cached status that already reflects them.
+        """
+        self.update_asset_cached_status_data(asset_key, cache_values)
+        self.delete_asset_status_cache_deltas(asset_key, deltas)
+
     @abstractmethod
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
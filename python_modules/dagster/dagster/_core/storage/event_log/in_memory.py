@@ -80,6 +80,14 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_handlers(event)
+
+    def store_events(self, events):
+        super(InMemoryEventLogStorage, self).store_events(events)
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
@@ -80,6 +80,21 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Changes to the partition status of assets, recorded as their materialization and materialization
+# planned events are stored, that have not yet been applied to their cached status. Only written
+# when the event log storage maintains the asset status cache incrementally.
+AssetStatusCacheDeltasTable = db.Table(
+    "asset_status_cache_deltas",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("materialized", db.Boolean, nullable=False),
+    db.Column("planned_run_id", db.String(255)),
+    db.Column("first_storage_id", db.Integer, nullable=False),
+    db.Column("latest_storage_id", db.Integer, nullable=False),
+)
+
 
 db.Index(
     "idx_step_key",
@@ -138,3 +153,10 @@
     mysql_length={"partitions_def_name": 64, "partition": 64},
     unique=True,
 )
+db.Index(
+    "idx_asset_status_cache_deltas",
+    AssetStatusCacheDeltasTable.c.asset_key,
+    AssetStatusCacheDeltasTable.c.partition,
+    mysql_length={"asset_key": 64, "partition": 64},
+    unique=True,
+)
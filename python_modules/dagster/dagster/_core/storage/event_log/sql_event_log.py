@@ -1,13 +1,16 @@
 import logging
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Any,
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -34,11 +37,16 @@
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
-from dagster._core.event_api import RunShardedEventsCursor
+from dagster._core.event_api import (
+    EventRecordsProjection,
+    LazyEventLogRecord,
+    RunShardedEventsCursor,
+)
 from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
 from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._serdes import (
+    SerdesFormat,
     deserialize_value,
     serialize_value,
 )
@@ -54,6 +62,7 @@
 from .base import (
     AssetEntry,
     AssetRecord,
+    AssetStatusCacheDelta,
     EventLogConnection,
     EventLogCursor,
     EventLogEntry,
@@ -65,6 +74,7 @@
 from .schema import (
     AssetEventTagsTable,
     AssetKeyTable,
+    AssetStatusCacheDeltasTable,
     DynamicPartitionsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
@@ -75,6 +85,12 @@
 
 MIN_ASSET_ROWS = 25
 
+# the asset events that change the cached partition status of an asset
+ASSET_STATUS_CACHE_EVENTS = {
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+}
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -88,6 +104,9 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    # set once the asset status cache deltas table is known to exist
+    _has_asset_status_cache_deltas_table: bool = False
+
     @abstractmethod
     def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -111,6 +130,20 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        """The format used to serialize the events written by this storage. Events written in any
+        format can be read back regardless of this setting.
+        """
+        return SerdesFormat.JSON
+
+    @property
+    def incremental_asset_status_cache(self) -> bool:
+        """Whether the cached status of an asset is updated as its materialization and
+        materialization planned events are stored, rather than when the cached status is read.
+        """
+        return False
+
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -118,23 +151,35 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self._get_insert_event_values(event))
+
+    def prepare_insert_event_batch(self, events: Sequence[EventLogEntry]):
+        """Helper method for preparing a multi-row event log SQL insertion statement, with one row
+        per event, in order.  Used by `insert_event_batch`.
+        """
+        return SqlEventLogStorageTable.insert().values(
+            [self._get_insert_event_values(event) for event in events]
+        )
+
+    def _get_insert_event_values(self, event: EventLogEntry) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
         step_key = event.step_key
         if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-            step_key = event.dagster_event.step_key
-            if event.dagster_event.asset_key:
-                check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-                asset_key_str = event.dagster_event.asset_key.to_string()
-            if event.dagster_event.partition:
-                partition = event.dagster_event.partition
-
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+            dagster_event = event.get_dagster_event()
+            dagster_event_type = dagster_event.event_type_value
+            step_key = dagster_event.step_key
+            if dagster_event.asset_key:
+                check.inst_param(dagster_event.asset_key, "asset_key", AssetKey)
+                asset_key_str = dagster_event.asset_key.to_string()
+            if dagster_event.partition:
+                partition = dagster_event.partition
+
+        return dict(
             run_id=event.run_id,
-            event=serialize_value(event),
+            event=serialize_value(event, serdes_format=self.serdes_format),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -144,6 +189,41 @@ def prepare_insert_event(self, event):
             partition=partition,
         )
 
+    def insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the event log rows for a batch of events using the given connection, within a
+        transaction opened by the caller, returning the storage id assigned to each asset event
+        (in the same order as the given events) and None for other events, which aren't indexed by
+        storage id.
+
+        Consecutive events that aren't asset events are inserted with a single multi-row
+        statement. Asset events are inserted one at a time, since not every database reports the
+        ids assigned by a multi-row insert in the order of its rows. SQL backends that can assign
+        the ids of many rows in one round-trip should override this method.
+        """
+        event_ids: List[Optional[int]] = []
+        for is_asset_event, chunk_iter in groupby(events, key=_is_asset_event):
+            chunk = list(chunk_iter)
+            if is_asset_event:
+                event_ids.extend(
+                    conn.execute(self.prepare_insert_event(event)).inserted_primary_key[0]
+                    for event in chunk
+                )
+            else:
+                conn.execute(self.prepare_insert_event_batch(chunk))
+                event_ids.extend(None for _ in chunk)
+        return event_ids
+
+    @contextmanager
+    def transaction(self, conn: Connection) -> Iterator[Connection]:
+        """Context manager opening a transaction on the given connection, yielding the connection
+        to execute the statements of the transaction with. Backends whose engines autocommit
+        override this to open a real database transaction.
+        """
+        with conn.begin():
+            yield conn
+
     def has_asset_key_col(self, column_name: str) -> bool:
         with self.index_connection() as conn:
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
@@ -182,12 +262,270 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             )
         )
 
+        if self.records_asset_status_cache_deltas():
+            # the asset key row and the asset status cache deltas are written in one transaction
+            self.store_asset_event_batch([(event, event_id)])
+            return
+
         with self.index_connection() as conn:
             try:
                 conn.execute(insert_statement)
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+    def store_asset_event_batch(self, events_with_ids: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        """Updates the asset key index for a batch of asset events, issuing at most one write per
+        distinct asset key, all within a single transaction.
+        """
+        has_asset_key_index_cols = self.writes_asset_key_index_cols()
+        records_asset_status_cache_deltas = self.records_asset_status_cache_deltas()
+
+        def _write():
+            with self.index_connection() as conn:
+                with self.transaction(conn) as transaction_conn:
+                    self.write_asset_event_batch(
+                        transaction_conn,
+                        events_with_ids,
+                        has_asset_key_index_cols,
+                        records_asset_status_cache_deltas,
+                    )
+
+        try:
+            _write()
+        except db_exc.IntegrityError:
+            if records_asset_status_cache_deltas:
+                # another writer inserted one of the rows between our read and our write, and the
+                # rows it inserted are now visible to a retry
+                _write()
+            else:
+                # another writer inserted one of the asset keys between our read and our write,
+                # fall back to writing each event individually
+                for event, event_id in events_with_ids:
+                    self.store_asset_event(event, event_id)
+
+    def writes_asset_key_index_cols(self) -> bool:
+        """Whether the asset key rows written for asset events fill in the columns that index the
+        latest events of each asset.
+        """
+        return self.has_asset_key_index_cols()
+
+    def write_asset_event_batch(
+        self,
+        conn: Connection,
+        events_with_ids: Sequence[Tuple[EventLogEntry, int]],
+        has_asset_key_index_cols: bool,
+        records_asset_status_cache_deltas: bool,
+    ) -> None:
+        """Writes the asset key rows, and any asset status cache deltas, of a batch of asset events
+        using the given index connection, within a transaction opened by the caller. The schema
+        checks are passed in, so that they don't need a second connection during the transaction.
+
+        Raises an IntegrityError if another writer inserts the row of one of the asset keys between
+        our read and our write.
+        """
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events_with_ids, has_asset_key_index_cols
+        )
+        if not values_by_asset_key:
+            return
+
+        existing_asset_keys = {
+            row[0]
+            for row in conn.execute(
+                db.select([AssetKeyTable.c.asset_key]).where(
+                    AssetKeyTable.c.asset_key.in_(list(values_by_asset_key.keys()))
+                )
+            ).fetchall()
+        }
+        for asset_key_str, values in values_by_asset_key.items():
+            if asset_key_str in existing_asset_keys:
+                if values:
+                    conn.execute(
+                        AssetKeyTable.update()
+                        .values(**values)
+                        .where(AssetKeyTable.c.asset_key == asset_key_str)
+                    )
+            else:
+                conn.execute(AssetKeyTable.insert().values(asset_key=asset_key_str, **values))
+
+        if records_asset_status_cache_deltas:
+            self.store_asset_status_cache_deltas(conn, events_with_ids)
+
+    def records_asset_status_cache_deltas(self) -> bool:
+        """Whether the changes to the partition status of assets are recorded as their events are
+        stored, to be applied to their cached status when it is next read.
+        """
+        if not self.incremental_asset_status_cache:
+            return False
+        # tables are only ever added by migrations, so only a missing table needs to be rechecked
+        if not self._has_asset_status_cache_deltas_table:
+            self._has_asset_status_cache_deltas_table = self.has_table(
+                AssetStatusCacheDeltasTable.name
+            )
+        return self._has_asset_status_cache_deltas_table
+
+    def store_asset_status_cache_deltas(
+        self, conn: Connection, events_with_ids: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        """Records the partitions of the given stored materialization and materialization planned
+        events as changes to the status of their assets, using the given index connection. Must be
+        called within the transaction that writes the asset key rows of the events, so that the
+        recorded changes can't drift from them.
+
+        Each event updates the single row of its asset partition, so that recording an event takes
+        constant time regardless of how many changes are waiting to be applied to the cached status.
+        """
+        for event, event_id in sorted(events_with_ids, key=lambda e: e[1]):
+            dagster_event = event.dagster_event
+            if (
+                not dagster_event
+                or dagster_event.event_type not in ASSET_STATUS_CACHE_EVENTS
+                or not dagster_event.partition
+            ):
+                continue
+
+            asset_key_str = check.not_none(dagster_event.asset_key).to_string()
+            materialized = dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION
+            planned_run_id = None if materialized else event.run_id
+            partition_filter = db.and_(
+                AssetStatusCacheDeltasTable.c.asset_key == asset_key_str,
+                AssetStatusCacheDeltasTable.c.partition == dagster_event.partition,
+            )
+            row = conn.execute(
+                db.select(
+                    [
+                        AssetStatusCacheDeltasTable.c.materialized,
+                        AssetStatusCacheDeltasTable.c.latest_storage_id,
+                    ]
+                )
+                .where(partition_filter)
+                .with_for_update()
+            ).fetchone()
+            if row is None:
+                conn.execute(
+                    AssetStatusCacheDeltasTable.insert().values(
+                        asset_key=asset_key_str,
+                        partition=dagster_event.partition,
+                        materialized=materialized,
+                        planned_run_id=planned_run_id,
+                        first_storage_id=event_id,
+                        latest_storage_id=event_id,
+                    )
+                )
+                continue
+
+            values: Dict[str, Any] = dict(materialized=bool(row[0]) or materialized)
+            if event_id > row[1]:
+                values.update(planned_run_id=planned_run_id, latest_storage_id=event_id)
+            conn.execute(
+                AssetStatusCacheDeltasTable.update().where(partition_filter).values(**values)
+            )
+
+    def get_asset_status_cache_deltas(
+        self, asset_key: AssetKey
+    ) -> Optional[Sequence[AssetStatusCacheDelta]]:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        if not self.records_asset_status_cache_deltas():
+            return None
+
+        with self.index_connection() as conn:
+            rows = conn.execute(
+                db.select(
+                    [
+                        AssetStatusCacheDeltasTable.c.partition,
+                        AssetStatusCacheDeltasTable.c.materialized,
+                        AssetStatusCacheDeltasTable.c.planned_run_id,
+                        AssetStatusCacheDeltasTable.c.first_storage_id,
+                        AssetStatusCacheDeltasTable.c.latest_storage_id,
+                    ]
+                )
+                .where(AssetStatusCacheDeltasTable.c.asset_key == asset_key.to_string())
+                .order_by(AssetStatusCacheDeltasTable.c.latest_storage_id)
+            ).fetchall()
+
+        return [
+            AssetStatusCacheDelta(
+                partition=row[0],
+                materialized=bool(row[1]),
+                planned_run_id=row[2],
+                first_storage_id=row[3],
+                latest_storage_id=row[4],
+            )
+            for row in rows
+        ]
+
+    def delete_asset_status_cache_deltas(
+        self, asset_key: AssetKey, deltas: Sequence[AssetStatusCacheDelta]
+    ) -> None:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        if not deltas:
+            return
+
+        with self.index_connection() as conn:
+            self._delete_asset_status_cache_deltas(conn, asset_key, deltas)
+
+    def apply_asset_status_cache_deltas(
+        self,
+        asset_key: AssetKey,
+        cache_values: "AssetStatusCacheValue",
+        deltas: Sequence[AssetStatusCacheDelta],
+    ) -> None:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        if not deltas or not self.records_asset_status_cache_deltas():
+            self.update_asset_cached_status_data(asset_key, cache_values)
+            return
+
+        with self.index_connection() as conn:
+            with self.transaction(conn) as transaction_conn:
+                transaction_conn.execute(
+                    AssetKeyTable.update()
+                    .where(AssetKeyTable.c.asset_key == asset_key.to_string())
+                    .values(cached_status_data=serialize_value(cache_values))
+                )
+                self._delete_asset_status_cache_deltas(transaction_conn, asset_key, deltas)
+
+    def _delete_asset_status_cache_deltas(
+        self, conn: Connection, asset_key: AssetKey, deltas: Sequence[AssetStatusCacheDelta]
+    ) -> None:
+        # every event updates the latest storage id of its partition, so a row is only deleted if
+        # no event was recorded in it since it was fetched
+        conn.execute(
+            AssetStatusCacheDeltasTable.delete().where(
+                db.and_(
+                    AssetStatusCacheDeltasTable.c.asset_key == asset_key.to_string(),
+                    AssetStatusCacheDeltasTable.c.latest_storage_id.in_(
+                        [delta.latest_storage_id for delta in deltas]
+                    ),
+                )
+            )
+        )
+
+    def _delete_asset_status_cache_deltas_for_asset(self, conn, asset_key: AssetKey) -> None:
+        if self.has_table(AssetStatusCacheDeltasTable.name):
+            conn.execute(
+                AssetStatusCacheDeltasTable.delete().where(
+                    AssetStatusCacheDeltasTable.c.asset_key == asset_key.to_string()
+                )
+            )
+
+    def _get_asset_entry_values_by_asset_key(
+        self,
+        events_with_ids: Sequence[Tuple[EventLogEntry, int]],
+        has_asset_key_index_cols: bool,
+    ) -> Mapping[str, Dict[str, Any]]:
+        # Applying the entry values for each event in storage order yields the same row that
+        # storing the events one at a time would have produced, since each event only overwrites
+        # the columns that it sets.
+        values_by_asset_key: Dict[str, Dict[str, Any]] = OrderedDict()
+        for event, event_id in events_with_ids:
+            if not (event.dagster_event and event.dagster_event.asset_key):
+                continue
+            asset_key_str = event.dagster_event.asset_key.to_string()
+            values_by_asset_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+        return values_by_asset_key
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> Dict[str, Any]:
@@ -212,7 +550,8 @@ def _get_asset_entry_values(
                         EventLogRecord(
                             storage_id=event_id,
                             event_log_entry=event,
-                        )
+                        ),
+                        serdes_format=self.serdes_format,
                     ),
                     "last_run_id": event.run_id,
                 }
@@ -322,8 +661,39 @@ def add_asset_event_tags(
     def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
+        self.store_asset_event_tags_batch([(event, event_id)])
 
-        if (
+    def store_asset_event_tags_batch(
+        self, events_with_ids: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        """Stores the asset event tags for a batch of asset events in a single insert."""
+        if not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
+
+        with self.index_connection() as conn:
+            self.write_asset_event_tags_batch(conn, events_with_ids)
+
+    def write_asset_event_tags_batch(
+        self, conn: Connection, events_with_ids: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        """Inserts the asset event tag rows of a batch of asset events using the given index
+        connection. The caller checks that the asset event tags table exists.
+        """
+        tag_rows = [
+            tag_row
+            for event, event_id in events_with_ids
+            for tag_row in self._get_asset_event_tag_rows(event, event_id)
+        ]
+        if tag_rows:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (
             event.dagster_event
             and event.dagster_event.asset_key
             and event.dagster_event.is_step_materialization
@@ -332,32 +702,24 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
             )
             and event.dagster_event.step_materialization_data.materialization.tags
         ):
-            if not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
-
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
-
-            tags = event.dagster_event.step_materialization_data.materialization.tags
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+
+        tags = event.dagster_event.step_materialization_data.materialization.tags
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -389,12 +751,63 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events. The event log rows of the batch, and the asset key and asset
+        event tag rows of its asset events, are written in a single transaction, so that either the
+        whole batch is stored or none of it is.
+
+        Storages that keep the event logs of different runs in different databases must override
+        this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in the order they were emitted.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        try:
+            self._store_events_in_transaction(events)
+        except db_exc.IntegrityError:
+            # another writer inserted the row of one of the asset keys of the batch between our read
+            # and our write. The transaction was rolled back, and a retry sees the inserted row.
+            self._store_events_in_transaction(events)
+
+    def _store_events_in_transaction(self, events: Sequence[EventLogEntry]) -> None:
+        has_asset_key_index_cols = self.writes_asset_key_index_cols()
+        records_asset_status_cache_deltas = self.records_asset_status_cache_deltas()
+        has_asset_event_tags_table = self.has_table(AssetEventTagsTable.name)
+
+        # the event logs of every run live in the same database as the cross-run index tables, so
+        # the index connection writes all of them
+        with self.index_connection() as conn:
+            with self.transaction(conn) as transaction_conn:
+                event_ids = self.insert_event_batch(transaction_conn, events)
+
+                asset_events_with_ids: List[Tuple[EventLogEntry, int]] = []
+                for event, event_id in zip(events, event_ids):
+                    if _is_asset_event(event):
+                        if event_id is None:
+                            raise DagsterInvariantViolationError(
+                                "Cannot store asset event tags for null event id."
+                            )
+                        asset_events_with_ids.append((event, event_id))
+
+                if asset_events_with_ids:
+                    self.write_asset_event_batch(
+                        transaction_conn,
+                        asset_events_with_ids,
+                        has_asset_key_index_cols,
+                        records_asset_status_cache_deltas,
+                    )
+                    if has_asset_event_tags_table:
+                        self.write_asset_event_tags_batch(transaction_conn, asset_events_with_ids)
+
     def get_records_for_run(
         self,
         run_id,
         cursor: Optional[str] = None,
         of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
         limit: Optional[int] = None,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> EventLogConnection:
         """Get all of the logs corresponding to a run.
 
@@ -404,9 +817,11 @@ def get_records_for_run(
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): the maximum number of events to fetch
+            projection (EventRecordsProjection): which columns to load for each record
         """
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
+        check.inst_param(projection, "projection", EventRecordsProjection)
 
         check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
@@ -417,7 +832,7 @@ def get_records_for_run(
         )
 
         query = (
-            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db.select(_get_event_record_columns(projection))
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
@@ -445,17 +860,22 @@ def get_records_for_run(
         last_record_id = None
         try:
             records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+            if projection == EventRecordsProjection.FULL:
+                for (
+                    record_id,
+                    json_str,
+                ) in results:
+                    records.append(
+                        EventLogRecord(
+                            storage_id=record_id,
+                            event_log_entry=deserialize_value(json_str, EventLogEntry),
+                        )
                     )
-                )
-                last_record_id = record_id
+                    last_record_id = record_id
+            else:
+                records = [_lazy_event_log_record_from_row(row) for row in results]
+                if records:
+                    last_record_id = records[-1].storage_id
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
@@ -624,6 +1044,9 @@ def wipe(self) -> None:
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_table("asset_status_cache_deltas"):
+                conn.execute(AssetStatusCacheDeltasTable.delete())
+
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())
             conn.execute(AssetKeyTable.delete())
@@ -634,6 +1057,9 @@ def wipe(self) -> None:
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_table("asset_status_cache_deltas"):
+                conn.execute(AssetStatusCacheDeltasTable.delete())
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -698,7 +1124,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=serialize_value(event, serdes_format=self.serdes_format),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -870,11 +1296,17 @@ def get_event_records(
         event_records_filter: EventRecordsFilter,
         limit: Optional[int] = None,
         ascending: bool = False,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> Sequence[EventLogRecord]:
         """Returns a list of (record_id, record)."""
         check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
         check.opt_int_param(limit, "limit")
         check.bool_param(ascending, "ascending")
+        check.inst_param(projection, "projection", EventRecordsProjection)
+
+        if event_records_filter.tags and not self.has_table(AssetEventTagsTable.name):
+            # tags have to be filtered on the deserialized events
+            projection = EventRecordsProjection.FULL
 
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
@@ -892,9 +1324,7 @@ def get_event_records(
         else:
             table = SqlEventLogStorageTable
 
-        query = db.select(
-            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
-        ).select_from(table)
+        query = db.select(_get_event_record_columns(projection)).select_from(table)
 
         query = self._apply_filter_to_query(
             query=query,
@@ -912,6 +1342,9 @@ def get_event_records(
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
+        if projection != EventRecordsProjection.FULL:
+            return [_lazy_event_log_record_from_row(row) for row in results]
+
         event_records = []
         for row_id, json_str in results:
             try:
@@ -1110,6 +1543,7 @@ def wipe_asset_cached_status(self, asset_key: AssetKey) -> None:
                         AssetKeyTable.c.asset_key == asset_key.to_string(),
                     )
                 )
+                self._delete_asset_status_cache_deltas_for_asset(conn, asset_key)
 
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
@@ -1628,6 +2062,7 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
                     AssetKeyTable.c.asset_key == asset_key.to_string(),
                 )
             )
+            self._delete_asset_status_cache_deltas_for_asset(conn, asset_key)
 
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int] = None
@@ -1853,6 +2288,14 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
             )
 
 
+def _is_asset_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.dagster_event.asset_key  # type: ignore
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -1860,3 +2303,34 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if not row.has_key(column):
         return None
     return row[column]
+
+
+def _get_event_record_columns(projection: EventRecordsProjection) -> Sequence[db.Column]:
+    """The event log columns to select for each record when querying with the given projection."""
+    if projection == EventRecordsProjection.FULL:
+        return [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+
+    columns = [
+        SqlEventLogStorageTable.c.id,
+        SqlEventLogStorageTable.c.run_id,
+        SqlEventLogStorageTable.c.timestamp,
+        SqlEventLogStorageTable.c.dagster_event_type,
+        SqlEventLogStorageTable.c.asset_key,
+        SqlEventLogStorageTable.c.partition,
+    ]
+    if projection == EventRecordsProjection.LAZY:
+        columns.append(SqlEventLogStorageTable.c.event)
+    return columns
+
+
+def _lazy_event_log_record_from_row(row: SqlAlchemyRow) -> LazyEventLogRecord:
+    storage_id, run_id, timestamp, event_type_value, asset_key, partition, *event_json = row
+    return LazyEventLogRecord(
+        storage_id=storage_id,
+        event_json=event_json[0] if event_json else None,
+        run_id=run_id,
+        timestamp=datetime_as_float(timestamp),
+        event_type_value=event_type_value,
+        asset_key=AssetKey.from_db_string(asset_key),
+        partition_key=partition,
+    )
@@ -7,7 +7,17 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
+from itertools import groupby
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    cast,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -22,10 +32,17 @@
 from dagster._config import StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
-from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
+    DagsterInvariantViolationError,
+)
+from dagster._core.event_api import EventHandlerFn, EventRecordsProjection
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.config import (
+    incremental_asset_status_cache_config,
+    serdes_format_config,
+)
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
 from dagster._core.storage.sql import (
@@ -40,13 +57,19 @@
 from dagster._serdes import (
     ConfigurableClass,
     ConfigurableClassData,
+    SerdesFormat,
 )
 from dagster._serdes.errors import DeserializationError
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..schema import AssetEventTagsTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..sql_event_log import (
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    _get_event_record_columns,
+    _lazy_event_log_record_from_row,
+)
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
@@ -78,12 +101,22 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     run.
     """
 
-    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        serdes_format: SerdesFormat = SerdesFormat.JSON,
+        incremental_asset_status_cache: bool = False,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database.
         """
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
+        self._serdes_format = check.inst_param(serdes_format, "serdes_format", SerdesFormat)
+        self._incremental_asset_status_cache = check.bool_param(
+            incremental_asset_status_cache, "incremental_asset_status_cache"
+        )
 
         self._obs = None
 
@@ -125,9 +158,21 @@ def upgrade(self) -> None:
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        return self._serdes_format
+
+    @property
+    def incremental_asset_status_cache(self) -> bool:
+        return self._incremental_asset_status_cache
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "serdes_format": serdes_format_config(),
+            "incremental_asset_status_cache": incremental_asset_status_cache_config(),
+        }
 
     @classmethod
     def from_config_value(
@@ -265,11 +310,116 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Overridden method to insert the whole batch with a single multi-row statement.
+
+        SQLite serializes writers, and numbers the rows of an insert one after the other from the
+        largest existing rowid, so the storage ids of the batch are the consecutive ids ending at
+        the last inserted rowid.
+        """
+        if not events:
+            return []
+
+        result = conn.execute(self.prepare_insert_event_batch(events))
+        last_event_id = result.lastrowid
+        return list(range(last_event_id - len(events) + 1, last_event_id + 1))
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in a single transaction, and
+        to mirror the run's asset events in the central assets.db sqlite shard, along with their
+        asset key and asset event tag rows, in a single transaction.
+
+        The shards are separate databases, so the batch is not stored atomically. The events of
+        each run are stored one run at a time, and if storing a run's events fails after the events
+        of earlier runs were stored, a DagsterEventBatchPartiallyStoredError reports them.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        num_stored = 0
+        for run_id, run_events_iter in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events_iter)
+            try:
+                with self.run_connection(run_id) as conn:
+                    with self.transaction(conn) as transaction_conn:
+                        self.insert_event_batch(transaction_conn, run_events)
+            except Exception as e:
+                if not num_stored:
+                    raise
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Only {num_stored} of {len(events)} events were stored.",
+                    num_stored=num_stored,
+                ) from e
+
+            asset_events = []
+            for event in run_events:
+                if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
+                    check.invariant(
+                        event.dagster_event_type in ASSET_EVENTS,
+                        (
+                            "Can only store asset materializations, materialization_planned, and"
+                            " observations in index database"
+                        ),
+                    )
+                    asset_events.append(event)
+
+            num_stored += len(run_events)
+            if not asset_events:
+                continue
+
+            try:
+                try:
+                    self._mirror_asset_events(asset_events)
+                except db_exc.IntegrityError:
+                    # another writer inserted the row of one of the asset keys between our read and
+                    # our write. The transaction was rolled back, and a retry sees the inserted row.
+                    self._mirror_asset_events(asset_events)
+            except Exception as e:
+                # the events of the run were committed to its shard, so they must not be stored
+                # again, but they are missing from the cross-run index
+                raise DagsterEventBatchPartiallyStoredError(
+                    (
+                        f"The {len(asset_events)} asset events of run {run_id} were stored, but"
+                        " could not be added to the cross-run index."
+                    ),
+                    num_stored=num_stored,
+                ) from e
+
+    def _mirror_asset_events(self, asset_events: Sequence[EventLogEntry]) -> None:
+        # the schema is checked before connecting, since each connection holds the db lock
+        has_asset_key_index_cols = self.writes_asset_key_index_cols()
+        records_asset_status_cache_deltas = self.records_asset_status_cache_deltas()
+        has_asset_event_tags_table = self.has_table(AssetEventTagsTable.name)
+
+        # mirror the events in the cross-run index database
+        with self.index_connection() as conn:
+            with self.transaction(conn) as transaction_conn:
+                event_ids = self.insert_event_batch(transaction_conn, asset_events)
+                if any(event_id is None for event_id in event_ids):
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+
+                events_with_ids = list(zip(asset_events, cast(Sequence[int], event_ids)))
+                self.write_asset_event_batch(
+                    transaction_conn,
+                    events_with_ids,
+                    has_asset_key_index_cols,
+                    records_asset_status_cache_deltas,
+                )
+                if has_asset_event_tags_table:
+                    self.write_asset_event_tags_batch(transaction_conn, events_with_ids)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
         limit: Optional[int] = None,
         ascending: bool = False,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> Iterable[EventLogRecord]:
         """Overridden method to enable cross-run event queries in sqlite.
 
@@ -279,16 +429,20 @@ def get_event_records(
         check.opt_inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
         check.opt_int_param(limit, "limit")
         check.bool_param(ascending, "ascending")
+        check.inst_param(projection, "projection", EventRecordsProjection)
 
         is_asset_query = event_records_filter and event_records_filter.event_type in ASSET_EVENTS
         if is_asset_query:
             # asset materializations, observations and materialization planned events
             # get mirrored into the index shard, so no custom run shard-aware cursor logic needed
             return super(SqliteEventLogStorage, self).get_event_records(
-                event_records_filter=event_records_filter, limit=limit, ascending=ascending
+                event_records_filter=event_records_filter,
+                limit=limit,
+                ascending=ascending,
+                projection=projection,
             )
 
-        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+        query = db.select(_get_event_record_columns(projection))
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
         else:
@@ -338,6 +492,14 @@ def get_event_records(
             with self.run_connection(run_id) as conn:
                 results = conn.execute(query).fetchall()
 
+            if projection != EventRecordsProjection.FULL:
+                if limit:
+                    results = results[: limit - len(event_records)]
+                event_records.extend(_lazy_event_log_record_from_row(row) for row in results)
+                if limit and len(event_records) >= limit:
+                    break
+                continue
+
             for row_id, json_str in results:
                 try:
                     event_record = deserialize_value(json_str, EventLogEntry)
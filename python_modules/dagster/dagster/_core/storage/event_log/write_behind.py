@@ -0,0 +1,329 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError, DagsterEventLogWriteError
+from dagster._core.events.log import EventLogEntry
+
+# Markers placed on the queue alongside events to control the writer thread
+_FLUSH = object()
+_SHUTDOWN = object()
+
+
+class WriteBehindMetrics(NamedTuple):
+    """Point-in-time metrics for a WriteBehindEventWriter.
+
+    queue_depth (int): Number of events currently waiting to be written.
+    max_queue_depth (int): High-water mark of the queue depth.
+    events_written (int): Total number of events written.
+    flush_count (int): Total number of batches written.
+    last_flush_latency_seconds (Optional[float]): Time spent writing the most recent batch.
+    max_flush_latency_seconds (Optional[float]): Longest time spent writing a single batch.
+    total_flush_latency_seconds (float): Total time spent writing batches.
+    failed_flush_count (int): Total number of batches that could not be written after retrying,
+        whose events were retained to be written ahead of the next batch.
+    """
+
+    queue_depth: int
+    max_queue_depth: int
+    events_written: int
+    flush_count: int
+    last_flush_latency_seconds: Optional[float]
+    max_flush_latency_seconds: Optional[float]
+    total_flush_latency_seconds: float
+    failed_flush_count: int
+
+
+class WriteBehindEventWriter:
+    """Writes events to the event log off of the emitting thread.
+
+    Events are placed on a bounded in-process queue and drained by a background thread, which hands
+    them to `store_fn` in batches of up to `flush_size` events, waiting at most
+    `flush_interval_seconds` for a batch to fill. Once events are stored, they are handed to
+    `dispatch_fn`, e.g. to notify subscribers. When the queue is full, `enqueue` blocks until the
+    writer catches up. `flush` blocks until every previously enqueued event has been written, and
+    any writers still open at interpreter shutdown are drained.
+
+    A batch that raises is retried up to `max_write_attempts` times, backing off from
+    `retry_interval_seconds`. Only the events that weren't stored are retried: `store_fn` must
+    either store none of a batch when it raises, or raise a DagsterEventBatchPartiallyStoredError
+    reporting the stored events. Dispatching is never retried, since it may have partly run. If a
+    batch still can't be stored, its events are retained and written ahead of the next batch, and
+    `enqueue` and `flush` raise a DagsterEventLogWriteError until a write succeeds.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects the enqueued / written counters, the retained events and write
+        error, and the metrics
+    """
+
+    def __init__(
+        self,
+        store_fn: Callable[[Sequence[EventLogEntry]], None],
+        dispatch_fn: Callable[[Sequence[EventLogEntry]], None],
+        max_queue_size: int,
+        flush_size: int,
+        flush_interval_seconds: float,
+        max_write_attempts: int = 3,
+        retry_interval_seconds: float = 0.5,
+    ):
+        self._store_fn = check.callable_param(store_fn, "store_fn")
+        self._dispatch_fn = check.callable_param(dispatch_fn, "dispatch_fn")
+        self._max_queue_size = check.int_param(max_queue_size, "max_queue_size")
+        self._flush_size = check.int_param(flush_size, "flush_size")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        self._max_write_attempts = check.int_param(max_write_attempts, "max_write_attempts")
+        check.invariant(self._max_write_attempts > 0, "max_write_attempts must be positive")
+        self._retry_interval_seconds = check.numeric_param(
+            retry_interval_seconds, "retry_interval_seconds"
+        )
+        self._closed = False
+        self._reset()
+        _LIVE_WRITERS.add(self)
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=self._max_queue_size)
+        self._lock = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        self._num_enqueued = 0
+        self._num_written = 0
+
+        # events of batches that could not be written, and the error raised by the last attempt
+        self._unwritten: List[EventLogEntry] = []
+        self._write_error: Optional[Exception] = None
+
+        self._max_queue_depth = 0
+        self._flush_count = 0
+        self._failed_flush_count = 0
+        self._last_flush_latency: Optional[float] = None
+        self._max_flush_latency: Optional[float] = None
+        self._total_flush_latency = 0.0
+
+    def _ensure_started(self) -> None:
+        if self._pid != os.getpid():
+            # the queue and writer thread belong to the parent of a forked process
+            self._reset()
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="event-log-write-behind", daemon=True
+                )
+                self._thread.start()
+
+    def _is_writer_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _raise_write_error(self) -> None:
+        # must be called with _lock held
+        if self._write_error is not None:
+            raise DagsterEventLogWriteError(
+                f"{len(self._unwritten)} events could not be written to the event log. They are"
+                " retained and will be retried with the next batch."
+            ) from self._write_error
+
+    def enqueue(self, event: EventLogEntry) -> None:
+        # events emitted while writing (e.g. by event listeners) are written synchronously, so that
+        # the writer thread never blocks on its own queue
+        if self._closed or self._is_writer_thread():
+            self._store_fn([event])
+            self._dispatch_fn([event])
+            return
+
+        self._ensure_started()
+        with self._lock:
+            # like a synchronous write, the event is not stored if the event log can't be written
+            self._raise_write_error()
+            self._num_enqueued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize() + 1)
+
+        # blocks when the queue is full, applying backpressure to the emitting thread
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        """Blocks until every event enqueued before this call has been written. Raises a
+        DagsterEventLogWriteError if some of them could not be written.
+        """
+        if self._thread is None or self._pid != os.getpid() or self._is_writer_thread():
+            return
+
+        with self._lock:
+            target = self._num_enqueued
+            if self._num_written >= target:
+                return
+            failed_flush_count = self._failed_flush_count
+
+        try:
+            self._queue.put_nowait(_FLUSH)
+        except queue.Full:
+            # the writer is still draining the queue, and the flush marker only cuts short the wait
+            # for a batch to fill
+            pass
+
+        with self._lock:
+            while True:
+                self._lock.wait_for(
+                    lambda: self._num_written >= target
+                    or self._failed_flush_count > failed_flush_count
+                )
+                if self._num_written >= target:
+                    return
+                self._raise_write_error()
+                failed_flush_count = self._failed_flush_count
+
+    def close(self) -> None:
+        """Drains the queue and stops the writer thread. Events enqueued after the writer is closed
+        are written synchronously.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _LIVE_WRITERS.discard(self)
+
+        if self._thread is None or self._pid != os.getpid():
+            return
+
+        self._queue.put(_SHUTDOWN)
+        self._thread.join()
+
+        with self._lock:
+            self._raise_write_error()
+
+    def get_metrics(self) -> WriteBehindMetrics:
+        with self._lock:
+            return WriteBehindMetrics(
+                queue_depth=self._num_enqueued - self._num_written,
+                max_queue_depth=self._max_queue_depth,
+                events_written=self._num_written,
+                flush_count=self._flush_count,
+                last_flush_latency_seconds=self._last_flush_latency,
+                max_flush_latency_seconds=self._max_flush_latency,
+                total_flush_latency_seconds=self._total_flush_latency,
+                failed_flush_count=self._failed_flush_count,
+            )
+
+    def _run(self) -> None:
+        shutdown = False
+        while not shutdown:
+            try:
+                # retained events are retried after an interval even if no more events arrive
+                item = self._queue.get(
+                    timeout=self._retry_interval_seconds if self._unwritten else None
+                )
+            except queue.Empty:
+                item = _FLUSH
+
+            batch: List[EventLogEntry] = []
+            deadline = time.time() + self._flush_interval_seconds
+            while True:
+                if item is _SHUTDOWN:
+                    shutdown = True
+                    break
+                if item is _FLUSH:
+                    break
+
+                batch.append(item)  # type: ignore  # (only events and markers are enqueued)
+                remaining = deadline - time.time()
+                if len(batch) >= self._flush_size or remaining <= 0:
+                    break
+
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch or self._unwritten:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: Sequence[EventLogEntry]) -> None:
+        # retained events were enqueued first, so they're written first
+        batch = [*self._unwritten, *batch]
+        error: Optional[Exception] = None
+        for attempt in range(self._max_write_attempts):
+            if attempt:
+                time.sleep(self._retry_interval_seconds * 2 ** (attempt - 1))
+
+            start = time.perf_counter()
+            try:
+                self._store_fn(batch)
+            except DagsterEventBatchPartiallyStoredError as e:
+                error = e
+                logging.exception(
+                    "Only %d of %d events were written to the event log (attempt %d of %d).",
+                    e.num_stored,
+                    len(batch),
+                    attempt + 1,
+                    self._max_write_attempts,
+                )
+                # the stored events are not retried, so that none of them is stored twice
+                stored, batch = batch[: e.num_stored], batch[e.num_stored :]
+                self._dispatch(stored)
+                with self._lock:
+                    self._num_written += len(stored)
+                    self._lock.notify_all()
+                if not batch:
+                    break
+                continue
+            except Exception as e:
+                error = e
+                logging.exception(
+                    "Exception while writing %d events to the event log (attempt %d of %d).",
+                    len(batch),
+                    attempt + 1,
+                    self._max_write_attempts,
+                )
+                continue
+
+            latency = time.perf_counter() - start
+            self._dispatch(batch)
+            with self._lock:
+                self._unwritten = []
+                self._write_error = None
+                self._num_written += len(batch)
+                self._flush_count += 1
+                self._last_flush_latency = latency
+                self._max_flush_latency = max(self._max_flush_latency or 0.0, latency)
+                self._total_flush_latency += latency
+                self._lock.notify_all()
+            return
+
+        with self._lock:
+            self._unwritten = batch
+            if batch:
+                self._write_error = error
+                self._failed_flush_count += 1
+            else:
+                self._write_error = None
+            self._lock.notify_all()
+
+    def _dispatch(self, events: Sequence[EventLogEntry]) -> None:
+        if not events:
+            return
+        try:
+            self._dispatch_fn(events)
+        except Exception:
+            # the events are stored, so dispatching them again could repeat callbacks that ran
+            logging.exception(
+                "Exception while dispatching %d events written to the event log.", len(events)
+            )
+
+
+_LIVE_WRITERS: "weakref.WeakSet[WriteBehindEventWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _drain_live_writers() -> None:
+    for writer in list(_LIVE_WRITERS):
+        try:
+            writer.close()
+        except DagsterEventLogWriteError:
+            logging.exception("Events were lost when draining the event log writer at exit.")
@@ -11,7 +11,7 @@
 
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.event_api import EventHandlerFn, EventRecordsProjection
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import PrintFn
 
@@ -51,6 +51,7 @@
         RunPartitionData,
         RunRecord,
         RunsFilter,
+        RunTagsRecord,
         TagBucket,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -187,6 +188,9 @@ def add_run(self, dagster_run: "DagsterRun") -> "DagsterRun":
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
+    def handle_run_events(self, run_events: Sequence[Tuple[str, "DagsterEvent"]]) -> None:
+        return self._storage.run_storage.handle_run_events(run_events)
+
     def get_runs(
         self,
         filters: Optional["RunsFilter"] = None,
@@ -223,6 +227,13 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_tags_records(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        ascending: bool = False,
+    ) -> Sequence["RunTagsRecord"]:
+        return self._storage.run_storage.get_run_tags_records(filters, ascending)
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -237,6 +248,9 @@ def get_run_tag_keys(self) -> Sequence[str]:
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         return self._storage.run_storage.add_run_tags(run_id, new_tags)
 
+    def add_run_tags_bulk(self, tags_by_run_id: Mapping[str, Mapping[str, str]]) -> None:
+        return self._storage.run_storage.add_run_tags_bulk(tags_by_run_id)
+
     def has_run(self, run_id: str) -> bool:
         return self._storage.run_storage.has_run(run_id)
 
@@ -432,11 +446,12 @@ def get_event_records(
         event_records_filter: Optional[EventRecordsFilter] = None,
         limit: Optional[int] = None,
         ascending: bool = False,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> Iterable[EventLogRecord]:
         # type ignored because `get_event_records` does not accept None. Unclear which type
         # annotation is wrong.
         return self._storage.event_log_storage.get_event_records(
-            event_records_filter, limit, ascending  # type: ignore
+            event_records_filter, limit, ascending, projection  # type: ignore
         )
 
     def get_asset_records(
@@ -532,8 +547,11 @@ def get_records_for_run(
         cursor: Optional[str] = None,
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
+        projection: EventRecordsProjection = EventRecordsProjection.FULL,
     ) -> EventLogConnection:
-        return self._storage.event_log_storage.get_records_for_run(run_id, cursor, of_type, limit)
+        return self._storage.event_log_storage.get_records_for_run(
+            run_id, cursor, of_type, limit, projection
+        )
 
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
@@ -452,3 +452,67 @@ def drop_run_job_index() -> None:
             "runs",
             postgresql_concurrently=True,
         )
+
+
+def add_run_covering_indexes() -> None:
+    if has_table("runs") and not has_index("runs", "idx_runs_by_status_job"):
+        op.create_index(
+            "idx_runs_by_status_job",
+            "runs",
+            ["status", "pipeline_name", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            mysql_length={
+                "status": 32,
+                "pipeline_name": 255,
+            },
+        )
+
+    if has_table("run_tags") and not has_index("run_tags", "idx_run_tags_key_value_run_id"):
+        op.create_index(
+            "idx_run_tags_key_value_run_id",
+            "run_tags",
+            ["key", "value", "run_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            mysql_length={
+                "key": 64,
+                "value": 64,
+            },
+        )
+
+
+def drop_run_covering_indexes() -> None:
+    if has_index("runs", "idx_runs_by_status_job"):
+        op.drop_index(
+            "idx_runs_by_status_job",
+            "runs",
+            postgresql_concurrently=True,
+        )
+
+    if has_index("run_tags", "idx_run_tags_key_value_run_id"):
+        op.drop_index(
+            "idx_run_tags_key_value_run_id",
+            "run_tags",
+            postgresql_concurrently=True,
+        )
+
+
+def add_run_tags_run_id_index() -> None:
+    if has_table("run_tags") and not has_index("run_tags", "idx_run_tags_run_id"):
+        op.create_index(
+            "idx_run_tags_run_id",
+            "run_tags",
+            ["run_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def drop_run_tags_run_id_index() -> None:
+    if has_index("run_tags", "idx_run_tags_run_id"):
+        op.drop_index(
+            "idx_run_tags_run_id",
+            "run_tags",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,290 @@
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from typing import Any, List, Optional, Sequence
+
+from pydantic import Field
+from upath import UPath
+
+import dagster._check as check
+from dagster._annotations import experimental
+from dagster._config.pythonic_config import ConfigurableIOManagerFactory
+from dagster._core.definitions.decorators.sensor_decorator import sensor
+from dagster._core.definitions.sensor_definition import (
+    DefaultSensorStatus,
+    SensorDefinition,
+    SensorEvaluationContext,
+    SkipReason,
+)
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.context.init import InitResourceContext
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.storage.dagster_run import FINISHED_STATUSES, DagsterRunStatus, RunsFilter
+from dagster._core.storage.upath_io_manager import UPathIOManager
+from dagster._utils import PICKLE_PROTOCOL, utc_datetime_from_naive
+
+# Out-of-band pickle buffers were added in protocol 5 (Python 3.8). On older versions, objects are
+# pickled in-band with the default protocol, and loading them copies the data as usual.
+_OUT_OF_BAND_PICKLE_PROTOCOL = 5
+_SUPPORTS_OUT_OF_BAND_BUFFERS = sys.version_info >= (3, 8)
+
+# File layout: magic, the length of the pickle stream and the number of out-of-band buffers,
+# followed by (offset, length) for each buffer, the pickle stream, and the buffers themselves.
+_MAGIC = b"DAGMMAP1"
+_HEADER = struct.Struct("<8sQQ")
+_BUFFER_ENTRY = struct.Struct("<QQ")
+
+# Buffers are aligned so that loaded arrays satisfy the alignment requirements of any dtype.
+_BUFFER_ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _BUFFER_ALIGNMENT - 1) // _BUFFER_ALIGNMENT * _BUFFER_ALIGNMENT
+
+
+@experimental
+class MemoryMappedIOManager(ConfigurableIOManagerFactory["PickledObjectMemoryMappedIOManager"]):
+    """IO manager for executors that run all steps on a single host, which stores values in
+    memory-mapped files and loads them without copying their data.
+
+    Values are pickled with protocol 5, and large buffers that support out-of-band pickling, such
+    as those of NumPy arrays and Arrow tables, are written to the file unchanged. Downstream steps
+    map the file into memory and rebuild the value on top of the mapped buffers, so loading a large
+    array neither reads it through a pickle stream nor holds a second copy of it in memory. Pages
+    are mapped copy-on-write: modifying a loaded value does not modify the stored file.
+
+    Outputs are stored at the same paths as with :py:class:`FilesystemIOManager`. Op outputs are
+    stored under "<base_dir>/<run_id>/", and assets at "<base_dir>/<asset_key>". Steps may run in
+    separate processes, so op outputs are not removed by the IO manager when a run completes: add
+    the sensor created by :py:func:`make_memory_mapped_io_manager_cleanup_sensor` to remove them
+    once each run has succeeded. Re-executing a run whose outputs were removed fails, since the
+    re-execution loads the outputs of the steps it doesn't run from the parent run.
+
+    To store values in POSIX shared memory rather than on disk, set ``base_dir`` to a directory on
+    a memory-backed filesystem, such as "/dev/shm" on Linux. Files there hold RAM until they are
+    removed.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import (
+            Definitions,
+            MemoryMappedIOManager,
+            job,
+            make_memory_mapped_io_manager_cleanup_sensor,
+            multiprocess_executor,
+            op,
+        )
+
+        @op
+        def make_array():
+            return np.zeros((10_000, 10_000))
+
+        @op
+        def total(array):
+            return array.sum()
+
+        @job(
+            executor_def=multiprocess_executor,
+            resource_defs={"io_manager": MemoryMappedIOManager(base_dir="/dev/shm/dagster")},
+        )
+        def my_job():
+            total(make_array())
+
+        defs = Definitions(
+            jobs=[my_job],
+            sensors=[make_memory_mapped_io_manager_cleanup_sensor(base_dir="/dev/shm/dagster")],
+        )
+
+    """
+
+    base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+
+    def create_io_manager(
+        self, context: InitResourceContext
+    ) -> "PickledObjectMemoryMappedIOManager":
+        base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
+        return PickledObjectMemoryMappedIOManager(base_dir=base_dir)
+
+
+class PickledObjectMemoryMappedIOManager(UPathIOManager):
+    """IO manager that pickles values into local files with out-of-band buffers, and loads them
+    from memory-mapped views of those files.
+
+    Args:
+        base_dir (Optional[str]): base directory where all the step outputs which use this object
+            manager will be stored in. Must be on a local filesystem.
+    """
+
+    extension: str = ""
+
+    def __init__(self, base_dir: Optional[str] = None):
+        self.base_dir = check.opt_str_param(base_dir, "base_dir")
+
+        super().__init__(base_path=UPath(base_dir))
+
+    def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            if _SUPPORTS_OUT_OF_BAND_BUFFERS:
+                data = pickle.dumps(
+                    obj, protocol=_OUT_OF_BAND_PICKLE_PROTOCOL, buffer_callback=buffers.append
+                )
+            else:
+                data = pickle.dumps(obj, protocol=PICKLE_PROTOCOL)
+        except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
+            if isinstance(e, RecursionError):
+                obj_repr = f"{obj.__class__} exceeds recursion limit and"
+            else:
+                obj_repr = obj.__str__()
+
+            raise DagsterInvariantViolationError(
+                f"Object {obj_repr} is not picklable. You will need to use a different io manager"
+                " to continue using this output."
+            ) from e
+
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        header_size = _HEADER.size + _BUFFER_ENTRY.size * len(raw_buffers)
+        offset = header_size + len(data)
+        buffer_entries = []
+        for raw_buffer in raw_buffers:
+            offset = _aligned(offset)
+            buffer_entries.append((offset, raw_buffer.nbytes))
+            offset += raw_buffer.nbytes
+
+        # Write to a temporary file that replaces the stored file once complete, so that steps
+        # that have the previous file mapped keep seeing its contents.
+        fd, temp_path = tempfile.mkstemp(dir=os.fspath(path.parent), prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, len(data), len(raw_buffers)))
+                for entry in buffer_entries:
+                    file.write(_BUFFER_ENTRY.pack(*entry))
+                file.write(data)
+                for (buffer_offset, _), raw_buffer in zip(buffer_entries, raw_buffers):
+                    file.seek(buffer_offset)
+                    file.write(raw_buffer)
+            os.replace(temp_path, os.fspath(path))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def load_from_path(self, context: InputContext, path: UPath) -> Any:
+        with open(os.fspath(path), "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, data_length, num_buffers = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            mapped.close()
+            raise DagsterInvariantViolationError(
+                f"File at {path} was not written by the {self.__class__.__name__}."
+            )
+
+        data_offset = _HEADER.size + _BUFFER_ENTRY.size * num_buffers
+        data = mapped[data_offset : data_offset + data_length]
+        if not num_buffers:
+            mapped.close()
+            return pickle.loads(data)
+
+        # The loaded value holds views into the mapping, which keep it open until they are
+        # garbage collected.
+        view = memoryview(mapped)
+        buffers = []
+        for i in range(num_buffers):
+            buffer_offset, buffer_length = _BUFFER_ENTRY.unpack_from(
+                mapped, _HEADER.size + _BUFFER_ENTRY.size * i
+            )
+            buffers.append(view[buffer_offset : buffer_offset + buffer_length])
+        return pickle.loads(data, buffers=buffers)
+
+    def cleanup_run(self, run_id: str) -> None:
+        """Removes the outputs of the ops of the given run. Asset outputs are not removed."""
+        check.str_param(run_id, "run_id")
+        shutil.rmtree(os.fspath(self._base_path / run_id), ignore_errors=True)
+
+
+@experimental
+def make_memory_mapped_io_manager_cleanup_sensor(
+    base_dir: Optional[str] = None,
+    name: str = "memory_mapped_io_manager_cleanup_sensor",
+    statuses: Sequence[DagsterRunStatus] = (DagsterRunStatus.SUCCESS,),
+    retention_seconds: int = 0,
+    minimum_interval_seconds: Optional[int] = None,
+    default_status: DefaultSensorStatus = DefaultSensorStatus.STOPPED,
+) -> SensorDefinition:
+    """Creates a sensor that removes the op outputs that a :py:class:`MemoryMappedIOManager` stored
+    for each run, once the run has finished.
+
+    On each tick, the sensor removes the run directories under ``base_dir`` whose runs finished
+    with one of ``statuses`` more than ``retention_seconds`` ago, so the outputs of each run are
+    removed once. The sensor must be evaluated on the host that the runs execute on, e.g. by a
+    daemon running next to them.
+
+    Re-executing a run, whether from failure or for a subset of its steps, loads the outputs of the
+    steps it doesn't run from the parent run, and fails once the outputs of the parent run have
+    been removed. By default, only the outputs of successful runs are removed. To also remove the
+    outputs of failed and canceled runs, include their statuses and set ``retention_seconds`` to
+    how long they may still be re-executed.
+
+    Args:
+        base_dir (Optional[str]): The base directory of the IO manager. Defaults to the storage
+            directory of the instance, like the IO manager.
+        name (str): The name of the sensor.
+        statuses (Sequence[DagsterRunStatus]): The statuses of the finished runs whose outputs are
+            removed. Defaults to successful runs only.
+        retention_seconds (int): How long after a run finished its outputs are kept. Defaults to
+            removing them on the first tick after the run finished.
+        minimum_interval_seconds (Optional[int]): The minimum number of seconds between
+            evaluations of the sensor.
+        default_status (DefaultSensorStatus): Whether the sensor starts as running or not.
+    """
+    statuses = check.sequence_param(statuses, "statuses", of_type=DagsterRunStatus)
+    check.invariant(
+        all(status in FINISHED_STATUSES for status in statuses),
+        "The outputs of runs that haven't finished can't be removed.",
+    )
+    retention_seconds = check.int_param(retention_seconds, "retention_seconds")
+
+    @sensor(
+        name=name,
+        minimum_interval_seconds=minimum_interval_seconds,
+        default_status=default_status,
+        description="Removes the op outputs of finished runs stored by a MemoryMappedIOManager.",
+    )
+    def _cleanup_sensor(context: SensorEvaluationContext):
+        io_manager = PickledObjectMemoryMappedIOManager(
+            base_dir=base_dir or context.instance.storage_directory()
+        )
+        base_path = os.fspath(io_manager._base_path)  # noqa: SLF001
+        # asset outputs are stored next to the run directories, and are never removed
+        directory_names = os.listdir(base_path) if os.path.isdir(base_path) else []
+        if not directory_names:
+            return SkipReason("No outputs are stored.")
+
+        finished_before = time.time() - retention_seconds
+        num_removed = 0
+        for record in context.instance.get_run_records(
+            filters=RunsFilter(run_ids=directory_names, statuses=list(statuses))
+        ):
+            end_time = (
+                record.end_time
+                if record.end_time is not None
+                # run storages that don't record end times store naive UTC update timestamps
+                else utc_datetime_from_naive(record.update_timestamp).timestamp()
+            )
+            if end_time > finished_before:
+                continue
+            io_manager.cleanup_run(record.dagster_run.run_id)
+            num_removed += 1
+
+        return SkipReason(f"Removed the outputs of {num_removed} finished runs.")
+
+    return _cleanup_sensor
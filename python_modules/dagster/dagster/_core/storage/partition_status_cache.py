@@ -1,4 +1,4 @@
-from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
 from dagster import (
     AssetKey,
@@ -22,6 +22,7 @@
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
+from dagster._core.storage.event_log.base import AssetStatusCacheDelta
 from dagster._core.storage.tags import (
     MULTIDIMENSIONAL_PARTITION_PREFIX,
     get_dimension_from_partition_tag,
@@ -65,6 +66,7 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("pending_planned_partition_run_ids", Optional[Mapping[str, str]]),
         ],
     )
 ):
@@ -86,6 +88,11 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        pending_planned_partition_run_ids (Optional(Mapping[str, str])): The run id of the latest
+            materialization planned event of each partition that has not been followed by a
+            materialization, for runs that had not finished when the cache was last read. Only set
+            for partitions whose status was read from the asset status cache deltas recorded by the
+            event log storage, which don't include the storage ids of the planned events.
     """
 
     def __new__(
@@ -96,6 +103,7 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        pending_planned_partition_run_ids: Optional[Mapping[str, str]] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -116,8 +124,18 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            check.opt_nullable_mapping_param(
+                pending_planned_partition_run_ids,
+                "pending_planned_partition_run_ids",
+                key_type=str,
+                value_type=str,
+            ),
         )
 
+    @property
+    def has_pending_partition_events(self) -> bool:
+        return bool(self.pending_planned_partition_run_ids)
+
     @staticmethod
     def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
         if not db_string:
@@ -312,6 +330,12 @@ def build_failed_and_in_progress_partition_subset(
     )
 
 
+class _IncompleteMaterialization(NamedTuple):
+    run_id: str
+    # None for materialization planned events that were recorded as pending on the cache value
+    storage_id: Optional[int]
+
+
 def _get_updated_failed_and_in_progress_partition_subset(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -319,49 +343,86 @@ def _get_updated_failed_and_in_progress_partition_subset(
     current_cached_subset: PartitionsSubset,
     unevaluated_event_records: Sequence[EventLogRecord],
     dynamic_partitions_store: DynamicPartitionsStore,
-) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
+    current_status_cache_value: Optional[AssetStatusCacheValue] = None,
+    status_cache_deltas: Sequence[AssetStatusCacheDelta] = (),
+) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int], Mapping[str, str]]:
     current_failed_partitions = set(current_cached_subset.get_partition_keys())
 
     cursor = None
-    incomplete_materialization_records: Dict[str, EventLogRecord] = {}
-    for record in sorted(unevaluated_event_records, key=lambda r: r.storage_id):
-        event = check.not_none(record.event_log_entry.dagster_event)
-        if event.is_asset_materialization_planned:
-            if event.partition:
-                # If we have a planned materilization for a partition, keep track of it to see if we
-                # also find a materialization. If not, we'll check if the run failed and add it to
-                # the failed partitions.
-                incomplete_materialization_records[event.partition] = record
-        if event.is_step_materialization:
-            if event.partition:
-                incomplete_materialization_records.pop(event.partition, None)
-                # if we have a new materialization for a partition, that negates the old failure
-                current_failed_partitions.discard(event.partition)
+    incomplete_materializations: Dict[str, _IncompleteMaterialization] = {}
+
+    def _apply_record(record: EventLogRecord) -> None:
+        if not record.partition_key:
+            return
+        if record.event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED:
+            # If we have a planned materilization for a partition, keep track of it to see if we
+            # also find a materialization. If not, we'll check if the run failed and add it to
+            # the failed partitions.
+            incomplete_materializations[record.partition_key] = _IncompleteMaterialization(
+                record.run_id, record.storage_id
+            )
+        elif record.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            incomplete_materializations.pop(record.partition_key, None)
+            # if we have a new materialization for a partition, that negates the old failure
+            current_failed_partitions.discard(record.partition_key)
+
+    sorted_records = sorted(unevaluated_event_records, key=lambda r: r.storage_id)
+    if current_status_cache_value and current_status_cache_value.has_pending_partition_events:
+        # The pending partitions reflect the state of each partition they mention as of the
+        # latest storage id, so apply them after any records up to that id, and before any newer
+        # records.
+        latest_storage_id = current_status_cache_value.latest_storage_id
+        for record in sorted_records:
+            if record.storage_id <= latest_storage_id:
+                _apply_record(record)
+        for partition, run_id in (
+            current_status_cache_value.pending_planned_partition_run_ids or {}
+        ).items():
+            incomplete_materializations[partition] = _IncompleteMaterialization(run_id, None)
+        sorted_records = [r for r in sorted_records if r.storage_id > latest_storage_id]
+
+    for record in sorted_records:
+        _apply_record(record)
+
+    for delta in status_cache_deltas:
+        # a delta reflects every event of its partition, so a planned run id is only set if the
+        # run was planned after the latest materialization
+        if delta.materialized:
+            incomplete_materializations.pop(delta.partition, None)
+            current_failed_partitions.discard(delta.partition)
+        if delta.planned_run_id:
+            incomplete_materializations[delta.partition] = _IncompleteMaterialization(
+                delta.planned_run_id, None
+            )
 
     new_failed_partitions = set()
     in_progress_partitions = set()
-    if incomplete_materialization_records:
+    in_progress_pending_partition_run_ids = {}
+    if incomplete_materializations:
         finished_runs = {
             r.run_id: r.status
             for r in instance.get_runs(
                 filters=RunsFilter(
-                    run_ids=[
-                        record.run_id for record in incomplete_materialization_records.values()
-                    ],
+                    run_ids=list(
+                        {incomplete.run_id for incomplete in incomplete_materializations.values()}
+                    ),
                     statuses=FINISHED_STATUSES,
                 )
             )
         }
 
-        for partition, record in incomplete_materialization_records.items():
-            if record.run_id in finished_runs:
-                if finished_runs[record.run_id] == DagsterRunStatus.FAILURE:
+        for partition, incomplete in incomplete_materializations.items():
+            if incomplete.run_id in finished_runs:
+                if finished_runs[incomplete.run_id] == DagsterRunStatus.FAILURE:
                     new_failed_partitions.add(partition)
             else:
                 in_progress_partitions.add(partition)
-                if cursor is None or record.storage_id <= cursor:
+                if incomplete.storage_id is None:
+                    # keep the pending partition around, to check on the run next time
+                    in_progress_pending_partition_run_ids[partition] = incomplete.run_id
+                elif cursor is None or incomplete.storage_id <= cursor:
                     # If the run is not finished, keep track of the event id so we can check on it next time
-                    cursor = record.storage_id
+                    cursor = incomplete.storage_id
 
     return (
         partitions_def.empty_subset().with_partition_keys(
@@ -373,49 +434,116 @@ def _get_updated_failed_and_in_progress_partition_subset(
             get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
         ),
         cursor,
+        in_progress_pending_partition_run_ids,
     )
 
 
+def _status_cache_deltas_cover_unevaluated_events(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    current_status_cache_value: AssetStatusCacheValue,
+    status_cache_deltas: Sequence[AssetStatusCacheDelta],
+) -> bool:
+    """Whether the asset status cache deltas reflect every materialization and materialization
+    planned event stored after the latest storage id of the cache value. Events stored before the
+    event log storage started recording deltas, e.g. before the incremental asset status cache was
+    enabled, have smaller storage ids than any recorded delta.
+    """
+    if current_status_cache_value.earliest_in_progress_materialization_event_id:
+        # the planned events of in progress runs are re-fetched from the event log
+        return False
+
+    first_storage_id = min((delta.first_storage_id for delta in status_cache_deltas), default=None)
+    if (
+        first_storage_id is not None
+        and first_storage_id <= current_status_cache_value.latest_storage_id + 1
+    ):
+        return True
+
+    for event_type in [
+        DagsterEventType.ASSET_MATERIALIZATION,
+        DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+    ]:
+        if instance.get_event_records(
+            event_records_filter=EventRecordsFilter(
+                event_type=event_type,
+                asset_key=asset_key,
+                after_cursor=current_status_cache_value.latest_storage_id,
+                before_cursor=first_storage_id,
+            ),
+            limit=1,
+        ):
+            return False
+    return True
+
+
 def _get_updated_status_cache(
     instance: DagsterInstance,
     asset_key: AssetKey,
     current_status_cache_value: AssetStatusCacheValue,
     partitions_def: Optional[PartitionsDefinition],
     dynamic_partitions_store: DynamicPartitionsStore,
+    status_cache_deltas: Optional[Sequence[AssetStatusCacheDelta]] = None,
 ) -> AssetStatusCacheValue:
     """This method accepts the current asset status cache value, and fetches unevaluated
     records from the event log. It then updates the cache value with the new materializations.
+
+    If the event log storage records asset status cache deltas as events are stored, and the deltas
+    reflect every unevaluated event, the deltas are applied instead, without reading the event log.
     """
-    # if earliest_in_progress_materialization_event_id is set, we fetch all events including the
-    # materialization planned event at that id (hence the - 1). We'll use this to determine if the
-    # materialization is still in progress.
-    cursor = (
-        current_status_cache_value.earliest_in_progress_materialization_event_id - 1
-        if current_status_cache_value.earliest_in_progress_materialization_event_id
-        else current_status_cache_value.latest_storage_id
-    )
-    unevaluated_planned_event_records = instance.get_event_records(
-        event_records_filter=EventRecordsFilter(
-            event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-            asset_key=asset_key,
-            after_cursor=cursor,
+    from dagster._core.event_api import EventRecordsProjection
+
+    if status_cache_deltas is not None and _status_cache_deltas_cover_unevaluated_events(
+        instance, asset_key, current_status_cache_value, status_cache_deltas
+    ):
+        unevaluated_event_records: List[EventLogRecord] = []
+        if not (status_cache_deltas or current_status_cache_value.has_pending_partition_events):
+            return current_status_cache_value
+    else:
+        # the deltas were recorded before their events were fetched, so the events reflect them
+        status_cache_deltas = []
+
+        # if earliest_in_progress_materialization_event_id is set, we fetch all events including
+        # the materialization planned event at that id (hence the - 1). We'll use this to determine
+        # if the materialization is still in progress.
+        cursor = (
+            current_status_cache_value.earliest_in_progress_materialization_event_id - 1
+            if current_status_cache_value.earliest_in_progress_materialization_event_id
+            else current_status_cache_value.latest_storage_id
         )
-    )
-    unevaluated_materialization_event_records = instance.get_event_records(
-        event_records_filter=EventRecordsFilter(
-            event_type=DagsterEventType.ASSET_MATERIALIZATION,
-            asset_key=asset_key,
-            after_cursor=cursor,
+        # only the indexed columns (partition, run id, event type) of the records are needed
+        unevaluated_planned_event_records = instance.get_event_records(
+            event_records_filter=EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                asset_key=asset_key,
+                after_cursor=cursor,
+            ),
+            projection=EventRecordsProjection.INDEXED_COLUMNS,
+        )
+        unevaluated_materialization_event_records = instance.get_event_records(
+            event_records_filter=EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                after_cursor=cursor,
+            ),
+            projection=EventRecordsProjection.INDEXED_COLUMNS,
         )
-    )
 
-    if not (unevaluated_materialization_event_records or unevaluated_planned_event_records):
-        return current_status_cache_value
+        if not (
+            unevaluated_materialization_event_records
+            or unevaluated_planned_event_records
+            or current_status_cache_value.has_pending_partition_events
+        ):
+            return current_status_cache_value
 
-    unevaluated_event_records = list(unevaluated_planned_event_records)
-    unevaluated_event_records.extend(list(unevaluated_materialization_event_records))
+        unevaluated_event_records = list(unevaluated_planned_event_records)
+        unevaluated_event_records.extend(list(unevaluated_materialization_event_records))
 
-    latest_storage_id = max([record.storage_id for record in unevaluated_event_records])
+    latest_storage_id = max(
+        [record.storage_id for record in unevaluated_event_records]
+        + [delta.latest_storage_id for delta in status_cache_deltas]
+        + [current_status_cache_value.latest_storage_id]
+    )
     if not partitions_def or not is_cacheable_partition_type(partitions_def):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
@@ -433,16 +561,15 @@ def _get_updated_status_cache(
         and current_status_cache_value.serialized_materialized_partition_subset
         else partitions_def.empty_subset()
     )
-    newly_materialized_partitions = set()
+    newly_materialized_partitions = {
+        delta.partition for delta in status_cache_deltas if delta.materialized
+    }
 
     for record in unevaluated_event_records:
-        if not record.event_log_entry.dagster_event:
-            check.failed("Expected dagster event")
-
-        if record.event_log_entry.dagster_event.is_step_materialization:
-            if record.event_log_entry.dagster_event.partition:
-                newly_materialized_partitions.add(record.event_log_entry.dagster_event.partition)
-        elif not record.event_log_entry.dagster_event.is_asset_materialization_planned:
+        if record.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            if record.partition_key:
+                newly_materialized_partitions.add(record.partition_key)
+        elif record.event_type != DagsterEventType.ASSET_MATERIALIZATION_PLANNED:
             check.failed("Expected materialization or materialization planned event")
 
     materialized_subset = materialized_subset.with_partition_keys(
@@ -464,6 +591,7 @@ def _get_updated_status_cache(
         failed_subset,
         in_progress_subset,
         new_cursor,
+        in_progress_pending_partition_run_ids,
     ) = _get_updated_failed_and_in_progress_partition_subset(
         instance,
         asset_key,
@@ -471,6 +599,8 @@ def _get_updated_status_cache(
         failed_subset,
         unevaluated_event_records,
         dynamic_partitions_store=dynamic_partitions_store,
+        current_status_cache_value=current_status_cache_value,
+        status_cache_deltas=status_cache_deltas,
     )
 
     return AssetStatusCacheValue(
@@ -480,6 +610,7 @@ def _get_updated_status_cache(
         serialized_failed_partition_subset=failed_subset.serialize(),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=new_cursor,
+        pending_planned_partition_run_ids=in_progress_pending_partition_run_ids or None,
     )
 
 
@@ -502,6 +633,7 @@ def _get_fresh_asset_status_cache_value(
     asset_key: AssetKey,
     dynamic_partitions_store: DynamicPartitionsStore,
     partitions_def: Optional[PartitionsDefinition] = None,
+    status_cache_deltas: Optional[Sequence[AssetStatusCacheDelta]] = None,
 ) -> Optional[AssetStatusCacheValue]:
     cached_status_data = _fetch_stored_asset_status_cache_value(instance, asset_key)
 
@@ -549,6 +681,7 @@ def _get_fresh_asset_status_cache_value(
             partitions_def=partitions_def,
             current_status_cache_value=cached_status_data,
             dynamic_partitions_store=dynamic_partitions_store,
+            status_cache_deltas=status_cache_deltas,
         )
 
     return updated_cache_value
@@ -560,6 +693,9 @@ def get_and_update_asset_status_cache_value(
     partitions_def: Optional[PartitionsDefinition] = None,
     dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
 ) -> Optional[AssetStatusCacheValue]:
+    # The deltas are fetched before the cache value is brought up to date, so that every delta is
+    # reflected in the updated cache value, whether or not the event log is read.
+    status_cache_deltas = instance.get_asset_status_cache_deltas(asset_key)
     updated_cache_value = _get_fresh_asset_status_cache_value(
         instance=instance,
         asset_key=asset_key,
@@ -567,8 +703,31 @@ def get_and_update_asset_status_cache_value(
         dynamic_partitions_store=dynamic_partitions_loader
         if dynamic_partitions_loader
         else instance,
+        status_cache_deltas=status_cache_deltas,
     )
     if updated_cache_value:
-        instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+        # the deltas are folded into the stored cache value and deleted in one transaction, so that
+        # they don't pile up between reads of the cached status
+        instance.apply_asset_status_cache_deltas(
+            asset_key, updated_cache_value, status_cache_deltas or []
+        )
 
     return updated_cache_value
+
+
+def rebuild_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: Optional[PartitionsDefinition] = None,
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+) -> Optional[AssetStatusCacheValue]:
+    """Discards the cached status of the asset and recomputes it from the event log. This repairs
+    cached values that have drifted from the event log, e.g. after events were deleted.
+    """
+    instance.wipe_asset_cached_status([asset_key])
+    return get_and_update_asset_status_cache_value(
+        instance=instance,
+        asset_key=asset_key,
+        partitions_def=partitions_def,
+        dynamic_partitions_loader=dynamic_partitions_loader,
+    )
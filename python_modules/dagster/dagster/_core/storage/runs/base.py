@@ -13,6 +13,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunTagsRecord,
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
@@ -62,6 +63,17 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
             event (DagsterEvent)
         """
 
+    def handle_run_events(self, run_events: Sequence[Tuple[str, DagsterEvent]]) -> None:
+        """Update run storage in accordance to a batch of pipeline run related DagsterEvents,
+        applied in order. Storages that can update many runs in a single transaction should
+        override this method.
+
+        Args:
+            run_events (Sequence[Tuple[str, DagsterEvent]]): Pairs of run id and event.
+        """
+        for run_id, event in run_events:
+            self.handle_run_event(run_id, event)
+
     @abstractmethod
     def get_runs(
         self,
@@ -174,6 +186,28 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_tags_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        ascending: bool = False,
+    ) -> Sequence[RunTagsRecord]:
+        """Return the status, tags and code location of the runs that match the given filters,
+        sorted by the order in which they were added to storage. Storages that can read these
+        without deserializing the full run should override this method.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            List[RunTagsRecord]: List of run tags records stored in the run storage.
+        """
+        return [
+            RunTagsRecord.from_run_record(run_record)
+            for run_record in self.get_run_records(filters=filters, ascending=ascending)
+        ]
+
     @abstractmethod
     def get_run_tags(
         self,
@@ -207,6 +241,16 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
             new_tags (Dict[string, string])
         """
 
+    def add_run_tags_bulk(self, tags_by_run_id: Mapping[str, Mapping[str, str]]) -> None:
+        """Add additional tags for many pipeline runs. Storages that can tag many runs in a single
+        transaction should override this method.
+
+        Args:
+            tags_by_run_id (Dict[str, Dict[str, str]]): The new tags for each run id.
+        """
+        for run_id, new_tags in tags_by_run_id.items():
+            self.add_run_tags(run_id, new_tags)
+
     @abstractmethod
     def has_run(self, run_id: str) -> bool:
         """Check if the storage contains a run.
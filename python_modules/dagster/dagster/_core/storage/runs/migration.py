@@ -104,13 +104,20 @@ def migrate_run_partition(storage: RunStorage, print_fn: Optional[PrintFn] = Non
     if print_fn:
         print_fn("Querying run storage.")
 
+    tags_by_run_id = {}
     for run in chunked_run_iterator(storage, print_fn):
         if PARTITION_NAME_TAG not in run.tags:
             continue
         if PARTITION_SET_TAG not in run.tags:
             continue
 
-        storage.add_run_tags(run.run_id, run.tags)
+        tags_by_run_id[run.run_id] = run.tags
+        if len(tags_by_run_id) >= CHUNK_SIZE:
+            storage.add_run_tags_bulk(tags_by_run_id)
+            tags_by_run_id = {}
+
+    if tags_by_run_id:
+        storage.add_run_tags_bulk(tags_by_run_id)
 
 
 def migrate_run_start_end(storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
@@ -132,6 +132,27 @@
         "pipeline_name": 255,
     },
 )
+db.Index(
+    "idx_runs_by_status_job",
+    RunsTable.c.status,
+    RunsTable.c.pipeline_name,
+    RunsTable.c.id,
+    mysql_length={
+        "status": 32,
+        "pipeline_name": 255,
+    },
+)
+db.Index(
+    "idx_run_tags_key_value_run_id",
+    RunTagsTable.c.key,
+    RunTagsTable.c.value,
+    RunTagsTable.c.run_id,
+    mysql_length={
+        "key": 64,
+        "value": 64,
+    },
+)
+db.Index("idx_run_tags_run_id", RunTagsTable.c.run_id)
 db.Index("idx_bulk_actions", BulkActionsTable.c.key, mysql_length=32)
 db.Index("idx_bulk_actions_status", BulkActionsTable.c.status, mysql_length=32)
 db.Index("idx_bulk_actions_action_type", BulkActionsTable.c.action_type, mysql_length=32)
@@ -52,6 +52,7 @@
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
+    SerdesFormat,
     deserialize_value,
     serialize_value,
 )
@@ -66,6 +67,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunTagsRecord,
     TagBucket,
 )
 from .base import RunGroupInfo, RunStorage
@@ -86,6 +88,11 @@
     SnapshotsTable,
 )
 
+# Limited job buckets are fetched with one select per job in a UNION ALL. Past this many jobs, the
+# runs are ranked with a window function instead, to stay under the limits that some databases
+# place on the number of selects in a compound select.
+MAX_UNIONED_JOB_BUCKETS = 100
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -105,6 +112,13 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        """The format used to serialize the job and execution plan snapshots written by this
+        storage. Snapshots written in any format can be read back regardless of this setting.
+        """
+        return SerdesFormat.JSON
+
     def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -206,6 +220,62 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                 )
             )
 
+    def handle_run_events(self, run_events: Sequence[Tuple[str, DagsterEvent]]) -> None:
+        """Overridden method to fetch the affected runs in a single query and apply their updates
+        in a single transaction. The events for a run are collapsed into a single update that
+        leaves the run in the status of its last event.
+        """
+        check.sequence_param(run_events, "run_events", of_type=tuple)
+
+        status_events = [
+            (run_id, event)
+            for run_id, event in run_events
+            if check.inst(event, DagsterEvent).event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+        ]
+        if not status_events:
+            return
+
+        runs_by_id = self._get_runs_by_ids({run_id for run_id, _ in status_events})
+        run_stats_cols_in_index = self.has_run_stats_index_cols()
+        now = pendulum.now("UTC")
+
+        values_by_run_id: Dict[str, Dict[str, Any]] = {}
+        for run_id, event in status_events:
+            run = runs_by_id.get(run_id)
+            if not run:
+                continue
+
+            new_job_status = EVENT_TYPE_TO_PIPELINE_RUN_STATUS[event.event_type]
+            values = values_by_run_id.setdefault(run_id, {"update_timestamp": now})
+            values["run_body"] = serialize_value(run.with_status(new_job_status))
+            values["status"] = new_job_status.value
+
+            if run_stats_cols_in_index and event.event_type == DagsterEventType.PIPELINE_START:
+                values["start_time"] = now.timestamp()
+
+            if run_stats_cols_in_index and event.event_type in {
+                DagsterEventType.PIPELINE_CANCELED,
+                DagsterEventType.PIPELINE_FAILURE,
+                DagsterEventType.PIPELINE_SUCCESS,
+            }:
+                values["end_time"] = now.timestamp()
+
+        # updates that set the same columns are issued as a single executemany statement
+        values_by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for run_id, values in values_by_run_id.items():
+            values_by_columns[tuple(sorted(values.keys()))].append(
+                {"b_run_id": run_id, **{f"b_{column}": value for column, value in values.items()}}
+            )
+
+        with self.connect() as conn:
+            for columns, params in values_by_columns.items():
+                conn.execute(
+                    RunsTable.update()
+                    .where(RunsTable.c.run_id == db.bindparam("b_run_id"))
+                    .values(**{column: db.bindparam(f"b_{column}") for column in columns}),
+                    params,
+                )
+
     def _row_to_run(self, row: SqlAlchemyRow) -> DagsterRun:
         run = deserialize_value(row["run_body"], DagsterRun)
         status = DagsterRunStatus(row["status"])
@@ -225,17 +295,41 @@ def _add_cursor_limit_to_query(
         order_by: Optional[str],
         ascending: Optional[bool],
     ) -> SqlAlchemyQuery:
-        """Helper function to deal with cursor/limit pagination args."""
+        """Helper function to deal with cursor/limit pagination args.
+
+        Pages are keyed on (sort column, id) of the cursor run rather than on an offset, so that
+        fetching a page only scans the rows of that page along an index on the sort column.
+        """
+        sorting_column = getattr(RunsTable.c, order_by) if order_by else RunsTable.c.id
+        direction = db.asc if ascending else db.desc
+
         if cursor:
-            cursor_query = db.select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor)
-            query = query.where(RunsTable.c.id < cursor_query)
+            cursor_id = db.select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor)
+            if sorting_column is RunsTable.c.id:
+                query = query.where(
+                    RunsTable.c.id > cursor_id if ascending else RunsTable.c.id < cursor_id
+                )
+            else:
+                cursor_value = db.select([sorting_column]).where(RunsTable.c.run_id == cursor)
+                query = query.where(
+                    db.or_(
+                        sorting_column > cursor_value
+                        if ascending
+                        else sorting_column < cursor_value,
+                        db.and_(
+                            sorting_column == cursor_value,
+                            RunsTable.c.id > cursor_id if ascending else RunsTable.c.id < cursor_id,
+                        ),
+                    )
+                )
 
         if limit:
             query = query.limit(limit)
 
-        sorting_column = getattr(RunsTable.c, order_by) if order_by else RunsTable.c.id
-        direction = db.asc if ascending else db.desc
         query = query.order_by(direction(sorting_column))
+        if sorting_column is not RunsTable.c.id:
+            # break ties on the id, so that pages never skip or repeat runs
+            query = query.order_by(direction(RunsTable.c.id))
 
         return query
 
@@ -352,6 +446,14 @@ def _bucketed_runs_query(
         order_by: Optional[str] = None,
         ascending: bool = False,
     ) -> SqlAlchemyQuery:
+        if (
+            isinstance(bucket_by, JobBucket)
+            and bucket_by.bucket_limit
+            and not filters.tags
+            and 0 < len(bucket_by.job_names) <= MAX_UNIONED_JOB_BUCKETS
+        ):
+            return self._limited_job_buckets_query(bucket_by, filters, columns, order_by, ascending)
+
         bucket_rank = self._bucket_rank_column(bucket_by, order_by, ascending)
         query_columns = [getattr(RunsTable.c, column) for column in columns] + [bucket_rank]
 
@@ -424,6 +526,65 @@ def _bucketed_runs_query(
 
         return query
 
+    def _limited_job_buckets_query(
+        self,
+        bucket_by: JobBucket,
+        filters: RunsFilter,
+        columns: Sequence[str],
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+    ) -> SqlAlchemyQuery:
+        """Fetches the first bucket_limit runs of each job with a limited query per job, combined
+        with UNION ALL.
+
+        Each of these queries reads at most bucket_limit rows along the (pipeline_name, id)
+        index, where ranking the runs of each job with a window function reads every run of the
+        jobs in the bucket. With tag filters, the runs matching the tags would be looked up once
+        per job, so those queries rank the runs instead.
+
+        The runs are ranked within each job after the limit is applied, so that the combined runs
+        are ordered like those of the ranked query: by rank, and then by the sort column.
+        """
+        sorting_column_name = order_by if order_by else "id"
+        direction = db.asc if ascending else db.desc
+        ordering_column_names = (
+            [sorting_column_name] if sorting_column_name == "id" else [sorting_column_name, "id"]
+        )
+        query_column_names = [
+            *columns,
+            *(column for column in ordering_column_names if column not in columns),
+        ]
+
+        job_queries = []
+        for job_name in bucket_by.job_names:
+            job_query = db.select([getattr(RunsTable.c, column) for column in query_column_names])
+            job_query = job_query.where(RunsTable.c.pipeline_name == job_name)
+            job_query = self._add_filters_to_query(job_query, filters)
+            job_query = self._add_cursor_limit_to_query(
+                job_query, None, bucket_by.bucket_limit, order_by, ascending
+            )
+            # wrapped in a subquery, since not all databases allow a LIMIT on each selectable of a
+            # compound select
+            job_subquery = job_query.alias(f"job_{len(job_queries)}")
+            job_rank = (
+                db.func.rank()
+                .over(order_by=direction(getattr(job_subquery.c, sorting_column_name)))
+                .label("rank")
+            )
+            job_queries.append(
+                db.select(
+                    [getattr(job_subquery.c, column) for column in query_column_names] + [job_rank]
+                )
+            )
+
+        buckets = db.union_all(*job_queries).alias("job_buckets")
+
+        # select all the columns, but skip the rank and any ordering columns that were not asked for
+        return db.select([getattr(buckets.c, column) for column in columns]).order_by(
+            buckets.c.rank.asc(),
+            *(direction(getattr(buckets.c, column)) for column in ordering_column_names),
+        )
+
     def _apply_tags_table_joins(
         self,
         table: db.Table,
@@ -458,7 +619,8 @@ def get_runs(
         return self._rows_to_runs(rows)
 
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
-        subquery = self._runs_query(filters=filters).alias("subquery")
+        # only select the id, so that counting runs can be answered from the indexes
+        subquery = self._runs_query(filters=filters, columns=["id"]).alias("subquery")
 
         # We use an alias here because Postgres requires subqueries to be
         # aliased.
@@ -478,6 +640,16 @@ def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         rows = self.fetchall(query)
         return self._row_to_run(rows[0]) if rows else None
 
+    def _get_runs_by_ids(self, run_ids: Iterable[str]) -> Mapping[str, DagsterRun]:
+        run_ids = list(run_ids)
+        if not run_ids:
+            return {}
+
+        query = db.select([RunsTable.c.run_id, RunsTable.c.run_body, RunsTable.c.status]).where(
+            RunsTable.c.run_id.in_(run_ids)
+        )
+        return {row["run_id"]: self._row_to_run(row) for row in self.fetchall(query)}
+
     def get_run_records(
         self,
         filters: Optional[RunsFilter] = None,
@@ -520,6 +692,46 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_tags_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        ascending: bool = False,
+    ) -> Sequence[RunTagsRecord]:
+        """Overridden method to read the records from the indexed status and tag columns, without
+        deserializing run bodies.
+        """
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+
+        runs_query = self._runs_query(
+            filters=filters,
+            columns=["id", "run_id", "status", "update_timestamp"],
+            ascending=ascending,
+        )
+        run_rows = self.fetchall(runs_query)
+        if not run_rows:
+            return []
+
+        # the tags of all the matching runs are read with one lookup of the run id index rather than
+        # one query per run
+        run_ids_query = self._runs_query(filters=filters, columns=["run_id"]).order_by(None)
+        tags_query = db.select(
+            [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+        ).where(RunTagsTable.c.run_id.in_(run_ids_query))
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for row in self.fetchall(tags_query):
+            tags_by_run_id[row["run_id"]][row["key"]] = row["value"]
+
+        return [
+            RunTagsRecord.from_storage_tags(
+                storage_id=row["id"],
+                run_id=row["run_id"],
+                status=DagsterRunStatus(row["status"]),
+                storage_tags=tags_by_run_id[row["run_id"]],
+                update_timestamp=check.inst(row["update_timestamp"], datetime),
+            )
+            for row in run_rows
+        ]
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -598,6 +810,77 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                     [dict(run_id=run_id, key=tag, value=new_tags[tag]) for tag in added_tags],
                 )
 
+    def add_run_tags_bulk(self, tags_by_run_id: Mapping[str, Mapping[str, str]]) -> None:
+        """Overridden method to fetch the runs in a single query and write the tags of every run in
+        a single transaction, with one statement each for the run bodies, the changed tag rows, and
+        the new tag rows.
+        """
+        check.mapping_param(tags_by_run_id, "tags_by_run_id", key_type=str)
+        for new_tags in tags_by_run_id.values():
+            check.mapping_param(new_tags, "new_tags", key_type=str, value_type=str)
+
+        if not tags_by_run_id:
+            return
+
+        runs_by_id = self._get_runs_by_ids(tags_by_run_id.keys())
+        for run_id in tags_by_run_id:
+            if run_id not in runs_by_id:
+                raise DagsterRunNotFoundError(
+                    f"Run {run_id} was not found in instance.", invalid_run_id=run_id
+                )
+
+        now = pendulum.now("UTC")
+        run_params = []
+        tag_update_params = []
+        tag_insert_params = []
+        for run_id, new_tags in tags_by_run_id.items():
+            run = runs_by_id[run_id]
+            current_tags = run.tags if run.tags else {}
+            all_tags = merge_dicts(current_tags, new_tags)
+            run_params.append(
+                {
+                    "b_run_id": run_id,
+                    "b_run_body": serialize_value(run.with_tags(all_tags)),
+                    "b_partition": all_tags.get(PARTITION_NAME_TAG),
+                    "b_partition_set": all_tags.get(PARTITION_SET_TAG),
+                    "b_update_timestamp": now,
+                }
+            )
+            for key, value in new_tags.items():
+                if key in current_tags:
+                    tag_update_params.append({"b_run_id": run_id, "b_key": key, "b_value": value})
+                else:
+                    tag_insert_params.append(dict(run_id=run_id, key=key, value=value))
+
+        with self.connect() as conn:
+            conn.execute(
+                RunsTable.update()
+                .where(RunsTable.c.run_id == db.bindparam("b_run_id"))
+                .values(
+                    run_body=db.bindparam("b_run_body"),
+                    partition=db.bindparam("b_partition"),
+                    partition_set=db.bindparam("b_partition_set"),
+                    update_timestamp=db.bindparam("b_update_timestamp"),
+                ),
+                run_params,
+            )
+
+            if tag_update_params:
+                conn.execute(
+                    RunTagsTable.update()
+                    .where(
+                        db.and_(
+                            RunTagsTable.c.run_id == db.bindparam("b_run_id"),
+                            RunTagsTable.c.key == db.bindparam("b_key"),
+                        )
+                    )
+                    .values(value=db.bindparam("b_value")),
+                    tag_update_params,
+                )
+
+            if tag_insert_params:
+                conn.execute(RunTagsTable.insert(), tag_insert_params)
+
     def get_run_group(self, run_id: str) -> Tuple[str, Sequence[DagsterRun]]:
         check.str_param(run_id, "run_id")
         dagster_run = self._get_run_by_id(run_id)
@@ -853,7 +1136,9 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=zlib.compress(
+                    serialize_value(snapshot_obj, serdes_format=self.serdes_format).encode("utf-8")
+                ),
                 snapshot_type=snapshot_type.value,
             )
             conn.execute(snapshot_insert)
@@ -13,6 +13,7 @@
     _check as check,
 )
 from dagster._config.config_schema import UserConfigSchema
+from dagster._core.storage.config import serdes_format_config
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -23,7 +24,7 @@
     stamp_alembic_rev,
 )
 from dagster._core.storage.sqlite import create_db_conn_string, get_sqlite_version
-from dagster._serdes import ConfigurableClass, ConfigurableClassData
+from dagster._serdes import ConfigurableClass, ConfigurableClassData, SerdesFormat
 from dagster._utils import mkdir_p
 
 from ..schema import InstanceInfo, RunsTable, RunStorageSqlMetadata, RunTagsTable
@@ -57,19 +58,29 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
     The ``base_dir`` param tells the run storage where on disk to store the database.
     """
 
-    def __init__(self, conn_string: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        conn_string: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        serdes_format: SerdesFormat = SerdesFormat.JSON,
+    ):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._serdes_format = check.inst_param(serdes_format, "serdes_format", SerdesFormat)
         super().__init__()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        return self._serdes_format
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {"base_dir": StringSource, "serdes_format": serdes_format_config()}
 
     @classmethod
     def from_config_value(
@@ -78,7 +89,12 @@ def from_config_value(
         return SqliteRunStorage.from_local(inst_data=inst_data, **config_value)
 
     @classmethod
-    def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] = None) -> Self:
+    def from_local(
+        cls,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        serdes_format: SerdesFormat = SerdesFormat.JSON,
+    ) -> Self:
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
         conn_string = create_db_conn_string(base_dir, "runs")
@@ -98,7 +114,7 @@ def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] =
             if "instance_info" not in table_names:
                 InstanceInfo.create(engine)
 
-        run_storage = cls(conn_string, inst_data)
+        run_storage = cls(conn_string, inst_data, serdes_format)
 
         if should_mark_indexes:
             run_storage.migrate()
@@ -34,6 +34,7 @@
     LocationStateSubscriber,
 )
 from dagster._core.host_representation.origin import GrpcServerCodeLocationOrigin
+from dagster._core.host_representation.snapshot_cache import get_snapshot_cache
 from dagster._core.instance import DagsterInstance
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -503,7 +504,7 @@ def rm_state_subscriber(self, token: int) -> None:
 
     def _create_location_from_origin(self, origin: CodeLocationOrigin) -> Optional[CodeLocation]:
         if not self._grpc_server_registry.supports_origin(origin):
-            return origin.create_location()
+            return origin.create_location(self._instance)
         else:
             endpoint = (
                 self._grpc_server_registry.reload_grpc_endpoint(origin)
@@ -520,6 +521,8 @@ def _create_location_from_origin(self, origin: CodeLocationOrigin) -> Optional[C
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                snapshot_cache=get_snapshot_cache(self._instance),
+                defer_snapshots=self._instance.code_server_defer_job_snapshots,
             )
 
     @property
@@ -1,6 +1,7 @@
 import dagster._check as check
 from dagster._core.definitions.asset_reconciliation_sensor import (
     AssetReconciliationCursor,
+    AssetReconciliationProfile,
     reconcile,
 )
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
@@ -70,13 +71,16 @@ def run_iteration(
             else AssetReconciliationCursor.empty()
         )
 
+        profile = AssetReconciliationProfile()
         run_requests, new_cursor = reconcile(
             asset_graph=asset_graph,
             target_asset_keys=target_asset_keys,
             instance=instance,
             cursor=cursor,
             run_tags=None,
+            profile=profile,
         )
+        self._logger.info(profile.report())
 
         for run_request in run_requests:
             yield
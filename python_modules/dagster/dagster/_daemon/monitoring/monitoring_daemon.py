@@ -1,7 +1,7 @@
 import logging
 import sys
 import time
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Tuple
 
 import pendulum
 
@@ -13,6 +13,7 @@
 from dagster._core.launcher import WorkerStatus
 from dagster._core.storage.dagster_run import (
     IN_PROGRESS_RUN_STATUSES,
+    DagsterRun,
     DagsterRunStatus,
     RunRecord,
     RunsFilter,
@@ -25,8 +26,24 @@
 RESUME_RUN_LOG_MESSAGE = "Launching a new run worker to resume run"
 
 
+def _report_run_failed(
+    instance: DagsterInstance,
+    run: DagsterRun,
+    message: str,
+    runs_to_fail: Optional[List[Tuple[DagsterRun, Optional[str]]]],
+) -> None:
+    # when monitoring many runs, failures are collected and reported together at the end
+    if runs_to_fail is None:
+        instance.report_run_failed(run, message)
+    else:
+        runs_to_fail.append((run, message))
+
+
 def monitor_starting_run(
-    instance: DagsterInstance, run_record: RunRecord, logger: logging.Logger
+    instance: DagsterInstance,
+    run_record: RunRecord,
+    logger: logging.Logger,
+    runs_to_fail: Optional[List[Tuple[DagsterRun, Optional[str]]]] = None,
 ) -> None:
     run = run_record.dagster_run
     check.invariant(run.status == DagsterRunStatus.STARTING)
@@ -52,7 +69,7 @@ def monitor_starting_run(
 
         logger.info(msg)
 
-        instance.report_run_failed(run, msg)
+        _report_run_failed(instance, run, msg, runs_to_fail)
 
 
 def count_resume_run_attempts(instance: DagsterInstance, run_id: str) -> int:
@@ -65,6 +82,7 @@ def monitor_started_run(
     workspace: IWorkspace,
     run_record: RunRecord,
     logger: logging.Logger,
+    runs_to_fail: Optional[List[Tuple[DagsterRun, Optional[str]]]] = None,
 ) -> None:
     run = run_record.dagster_run
     check.invariant(run.status == DagsterRunStatus.STARTED)
@@ -110,7 +128,7 @@ def monitor_started_run(
                         f" {run.run_id} as failed."
                     )
                 logger.info(msg)
-                instance.report_run_failed(run, msg)
+                _report_run_failed(instance, run, msg, runs_to_fail)
                 # Return rather than immediately checking for a timeout, since we just failed
                 return
     check_run_timeout(instance, run_record, logger)
@@ -133,14 +151,15 @@ def execute_monitoring_iteration(
 
     logger.info(f"Collected {len(run_records)} runs for monitoring")
     workspace = workspace_process_context.create_request_context()
+    runs_to_fail: List[Tuple[DagsterRun, Optional[str]]] = []
     for run_record in run_records:
         try:
             logger.info(f"Checking run {run_record.dagster_run.run_id}")
 
             if run_record.dagster_run.status == DagsterRunStatus.STARTING:
-                monitor_starting_run(instance, run_record, logger)
+                monitor_starting_run(instance, run_record, logger, runs_to_fail)
             elif run_record.dagster_run.status == DagsterRunStatus.STARTED:
-                monitor_started_run(instance, workspace, run_record, logger)
+                monitor_started_run(instance, workspace, run_record, logger, runs_to_fail)
             elif run_record.dagster_run.status == DagsterRunStatus.CANCELING:
                 # TODO: implement canceling timeouts
                 pass
@@ -155,6 +174,16 @@ def execute_monitoring_iteration(
         else:
             yield
 
+    if runs_to_fail:
+        try:
+            instance.report_runs_failed(runs_to_fail)
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.error(
+                f"Hit error while marking {len(runs_to_fail)} runs as failed: {error_info}"
+            )
+            yield error_info
+
 
 def check_run_timeout(
     instance: DagsterInstance, run_record: RunRecord, logger: logging.Logger
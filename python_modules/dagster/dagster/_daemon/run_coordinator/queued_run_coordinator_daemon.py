@@ -3,6 +3,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 from dagster import (
@@ -20,17 +21,123 @@
 )
 from dagster._core.storage.dagster_run import (
     IN_PROGRESS_RUN_STATUSES,
-    DagsterRun,
     DagsterRunStatus,
     RunsFilter,
+    RunTagsRecord,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+# Each refresh of the in-progress runs index re-reads the runs updated this long before the latest
+# update it has seen, to catch updates that were committed late with an earlier timestamp
+IN_PROGRESS_RUNS_LOOKBACK_SECONDS = 10
+
+# The in-progress runs index is periodically rebuilt from scratch, e.g. to drop deleted runs
+IN_PROGRESS_RUNS_FULL_REFRESH_INTERVAL_SECONDS = 300
+
+NOT_IN_PROGRESS_RUN_STATUSES = [
+    status for status in DagsterRunStatus if status not in IN_PROGRESS_RUN_STATUSES
+]
+
+
+def _to_naive_utc(timestamp: datetime) -> datetime:
+    # run storages return update timestamps as naive UTC datetimes
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _max_timestamp(high_water_mark: Optional[datetime], timestamp: datetime) -> datetime:
+    timestamp = _to_naive_utc(timestamp)
+    return timestamp if high_water_mark is None else max(high_water_mark, timestamp)
+
+
+class InProgressRunsIndex:
+    """In-memory index of the runs that are in progress. After it is first built, each refresh only
+    reads the runs that were updated since the previous one, instead of all in-progress runs.
+
+    The runs to read are found by their update timestamps, relative to the latest update timestamp
+    the index has read from the run storage rather than to the daemon's clock. An update that is
+    committed after the index has read a later one is still read, as long as it is stamped no more
+    than `lookback_seconds` before the latest one.
+
+    Update timestamps are stamped by the clock of the host that wrote them, so the update that
+    finished a run on a host whose clock is behind may be stamped before that window. Each refresh
+    also looks up the runs the index holds by id, which doesn't depend on any clock, and drops the
+    ones that are no longer in progress.
+    """
+
+    def __init__(
+        self,
+        lookback_seconds: float = IN_PROGRESS_RUNS_LOOKBACK_SECONDS,
+        full_refresh_interval_seconds: float = IN_PROGRESS_RUNS_FULL_REFRESH_INTERVAL_SECONDS,
+    ):
+        self._lookback = timedelta(seconds=lookback_seconds)
+        self._full_refresh_interval_seconds = full_refresh_interval_seconds
+        self._runs: Dict[str, RunTagsRecord] = {}
+        # the latest update timestamp read from the run storage
+        self._high_water_mark: Optional[datetime] = None
+        self._last_full_refresh_time = 0.0
+
+    def refresh(self, instance: DagsterInstance) -> Sequence[RunTagsRecord]:
+        if (
+            self._high_water_mark is None
+            or time.time() - self._last_full_refresh_time >= self._full_refresh_interval_seconds
+        ):
+            self._full_refresh(instance)
+        else:
+            self._incremental_refresh(instance, self._high_water_mark)
+
+        return list(self._runs.values())
+
+    def _full_refresh(self, instance: DagsterInstance) -> None:
+        self._last_full_refresh_time = time.time()
+
+        # read before the in-progress runs, so that runs updated in between are read by the next
+        # incremental refresh
+        latest_updated_records = instance.get_run_records(limit=1, order_by="update_timestamp")
+        high_water_mark = (
+            _to_naive_utc(latest_updated_records[0].update_timestamp)
+            if latest_updated_records
+            else None
+        )
+
+        self._runs = {}
+        for record in instance.get_run_tags_records(
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        ):
+            self._runs[record.run_id] = record
+            high_water_mark = _max_timestamp(high_water_mark, record.update_timestamp)
+
+        self._high_water_mark = high_water_mark
+
+    def _incremental_refresh(self, instance: DagsterInstance, high_water_mark: datetime) -> None:
+        # filtering on every status lets the storage range-scan its (status, update_timestamp) index
+        updated_records = instance.get_run_tags_records(
+            filters=RunsFilter(
+                statuses=list(DagsterRunStatus), updated_after=high_water_mark - self._lookback
+            )
+        )
+        for record in updated_records:
+            if record.status in IN_PROGRESS_RUN_STATUSES:
+                self._runs[record.run_id] = record
+            else:
+                self._runs.pop(record.run_id, None)
+            high_water_mark = _max_timestamp(high_water_mark, record.update_timestamp)
+
+        self._high_water_mark = high_water_mark
+
+        # only the runs that finished are returned, so this is usually an empty lookup of the run id
+        # index
+        if self._runs:
+            for record in instance.get_run_tags_records(
+                filters=RunsFilter(run_ids=list(self._runs), statuses=NOT_IN_PROGRESS_RUN_STATUSES)
+            ):
+                self._runs.pop(record.run_id, None)
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -42,6 +149,7 @@ def __init__(self, interval_seconds) -> None:
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        self._in_progress_runs_index = InProgressRunsIndex()
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -91,7 +199,7 @@ def _dequeue_runs_iter(
         self,
         workspace_process_context: IWorkspaceProcessContext,
         run_coordinator: QueuedRunCoordinator,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunTagsRecord],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> Iterator[None]:
@@ -114,7 +222,7 @@ def _dequeue_runs_iter(
     def _dequeue_run_thread(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        run: DagsterRun,
+        run: RunTagsRecord,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
@@ -129,7 +237,7 @@ def _dequeue_run_thread(
     def _dequeue_runs_iter_threaded(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunTagsRecord],
         max_workers: Optional[int],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
@@ -157,7 +265,7 @@ def _dequeue_runs_iter_threaded(
     def _dequeue_runs_iter_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunTagsRecord],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> Iterator[None]:
@@ -183,7 +291,7 @@ def _get_runs_to_dequeue(
         instance: DagsterInstance,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
-    ) -> List[DagsterRun]:
+    ) -> List[RunTagsRecord]:
         if not isinstance(instance.run_coordinator, QueuedRunCoordinator):
             check.failed(f"Expected QueuedRunCoordinator, got {instance.run_coordinator}")
 
@@ -236,7 +344,7 @@ def _get_runs_to_dequeue(
             tag_concurrency_limits, in_progress_runs
         )
 
-        batch: List[DagsterRun] = []
+        batch: List[RunTagsRecord] = []
         for run in sorted_runs:
             if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
                 break
@@ -244,10 +352,7 @@ def _get_runs_to_dequeue(
             if tag_concurrency_limits_counter.is_blocked(run):
                 continue
 
-            location_name = (
-                run.external_job_origin.location_name if run.external_job_origin else None
-            )
-            if location_name and location_name in paused_location_names:
+            if run.location_name and run.location_name in paused_location_names:
                 continue
 
             tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -255,26 +360,18 @@ def _get_runs_to_dequeue(
 
         return batch
 
-    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
+    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[RunTagsRecord]:
         queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
 
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        # Ascending for fifo ordering
+        return instance.get_run_tags_records(filters=queued_runs_filter, ascending=True)
 
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
-
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[RunTagsRecord]:
+        return self._in_progress_runs_index.refresh(instance)
 
+    def _priority_sort(self, runs: Iterable[RunTagsRecord]) -> Sequence[RunTagsRecord]:
         # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return sorted(runs, key=lambda run: run.priority, reverse=True)
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -287,12 +384,12 @@ def _dequeue_run(
         self,
         instance: DagsterInstance,
         workspace: IWorkspace,
-        run: DagsterRun,
+        queued_run: RunTagsRecord,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run = check.not_none(instance.get_run_by_id(queued_run.run_id))
 
         now = fixed_iteration_time or time.time()
 
@@ -1,3 +1,4 @@
+import heapq
 import logging
 import os
 import sys
@@ -16,6 +17,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -394,9 +396,10 @@ def execute_sensor_iteration(
         yield
         return
 
+    now = pendulum.now("UTC").timestamp()
+    # sensors that are due for a tick, ordered so that the most overdue sensors are evaluated first
+    sensor_queue: List[Tuple[float, int, ExternalSensor, InstigatorState]] = []
     for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
         if not sensor_state:
             assert external_sensor.default_status == DefaultSensorStatus.RUNNING
@@ -410,6 +413,28 @@ def execute_sensor_iteration(
         elif _is_under_min_interval(sensor_state, external_sensor):
             continue
 
+        heapq.heappush(
+            sensor_queue,
+            (
+                -_get_sensor_lag_seconds(sensor_state, external_sensor, now),
+                len(sensor_queue),
+                external_sensor,
+                sensor_state,
+            ),
+        )
+
+    if log_verbose_checks:
+        _log_sensor_lag(logger, sensor_queue)
+
+    in_flight_limits = _SensorTickInFlightLimits.from_settings(
+        instance.get_settings("sensors"), sensors, sensor_tick_futures
+    )
+    num_deferred_ticks = 0
+    while sensor_queue:
+        _, _, external_sensor, sensor_state = heapq.heappop(sensor_queue)
+        sensor_name = external_sensor.name
+        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
+
         if threadpool_executor:
             if sensor_tick_futures is None:
                 check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
@@ -421,6 +446,13 @@ def execute_sensor_iteration(
             ):
                 continue
 
+            location_name = external_sensor.handle.location_name
+            if not in_flight_limits.can_submit(location_name):
+                # leave the tick for a later iteration, when it will be prioritized by its lag
+                num_deferred_ticks += 1
+                continue
+
+            in_flight_limits.add(location_name)
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
@@ -447,6 +479,127 @@ def execute_sensor_iteration(
                 tick_retention_settings,
             )
 
+    if num_deferred_ticks and log_verbose_checks:
+        logger.info(
+            f"Deferred {num_deferred_ticks} sensor ticks to the next iteration since the maximum"
+            " number of concurrent sensor ticks are in flight."
+        )
+
+
+def _get_sensor_lag_seconds(
+    state: InstigatorState, external_sensor: ExternalSensor, now: float
+) -> float:
+    """Returns how long a sensor has been due for a tick. Sensors that have never ticked are
+    treated as the most overdue.
+    """
+    instigator_data = _sensor_instigator_data(state)
+    last_tick_timestamp = (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        if instigator_data
+        else 0
+    )
+    if not last_tick_timestamp:
+        return float("inf")
+
+    return max(0.0, now - (last_tick_timestamp + (external_sensor.min_interval_seconds or 0)))
+
+
+class SensorLagSummary(NamedTuple):
+    """Summarizes how far behind their minimum intervals the sensors that are due for a tick are."""
+
+    num_due_sensors: int
+    num_new_sensors: int
+    median_lag_seconds: float
+    max_lag_seconds: float
+    max_lag_sensor_name: Optional[str]
+
+    @staticmethod
+    def from_lags(lags: Mapping[str, float]) -> "SensorLagSummary":
+        ticked_lags = sorted(
+            (lag, sensor_name) for sensor_name, lag in lags.items() if lag != float("inf")
+        )
+        return SensorLagSummary(
+            num_due_sensors=len(lags),
+            num_new_sensors=len(lags) - len(ticked_lags),
+            median_lag_seconds=ticked_lags[len(ticked_lags) // 2][0] if ticked_lags else 0.0,
+            max_lag_seconds=ticked_lags[-1][0] if ticked_lags else 0.0,
+            max_lag_sensor_name=ticked_lags[-1][1] if ticked_lags else None,
+        )
+
+
+def _log_sensor_lag(
+    logger: logging.Logger,
+    sensor_queue: Sequence[Tuple[float, int, ExternalSensor, InstigatorState]],
+) -> None:
+    if not sensor_queue:
+        return
+
+    summary = SensorLagSummary.from_lags(
+        {external_sensor.name: -neg_lag for neg_lag, _, external_sensor, _ in sensor_queue}
+    )
+    message = f"{summary.num_due_sensors} sensors are due for a tick"
+    if summary.max_lag_sensor_name:
+        message += (
+            f", with a median lag of {summary.median_lag_seconds:.1f} seconds and a maximum lag"
+            f" of {summary.max_lag_seconds:.1f} seconds ({summary.max_lag_sensor_name})"
+        )
+    if summary.num_new_sensors:
+        message += f". {summary.num_new_sensors} of them have never ticked"
+    logger.info(message + ".")
+
+
+class _SensorTickInFlightLimits:
+    """Tracks the sensor ticks that are in flight in the threadpool, to limit how many are in flight
+    in total and for each code location.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_ticks: Optional[int],
+        max_concurrent_ticks_per_code_location: Optional[int],
+        in_flight_location_names: Sequence[Optional[str]],
+    ):
+        self._max_concurrent_ticks = max_concurrent_ticks
+        self._max_concurrent_ticks_per_code_location = max_concurrent_ticks_per_code_location
+        self._num_in_flight = len(in_flight_location_names)
+        self._num_in_flight_by_location: Dict[Optional[str], int] = defaultdict(int)
+        for location_name in in_flight_location_names:
+            self._num_in_flight_by_location[location_name] += 1
+
+    @staticmethod
+    def from_settings(
+        settings: Mapping[str, object],
+        sensors: Mapping[str, ExternalSensor],
+        sensor_tick_futures: Optional[Mapping[str, Future]],
+    ) -> "_SensorTickInFlightLimits":
+        return _SensorTickInFlightLimits(
+            max_concurrent_ticks=cast(Optional[int], settings.get("max_concurrent_ticks")),
+            max_concurrent_ticks_per_code_location=cast(
+                Optional[int], settings.get("max_concurrent_ticks_per_code_location")
+            ),
+            in_flight_location_names=[
+                sensors[selector_id].handle.location_name if selector_id in sensors else None
+                for selector_id, future in (sensor_tick_futures or {}).items()
+                if not future.done()
+            ],
+        )
+
+    def can_submit(self, location_name: str) -> bool:
+        if self._max_concurrent_ticks and self._num_in_flight >= self._max_concurrent_ticks:
+            return False
+        return not (
+            self._max_concurrent_ticks_per_code_location
+            and self._num_in_flight_by_location[location_name]
+            >= self._max_concurrent_ticks_per_code_location
+        )
+
+    def add(self, location_name: str) -> None:
+        self._num_in_flight += 1
+        self._num_in_flight_by_location[location_name] += 1
+
 
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
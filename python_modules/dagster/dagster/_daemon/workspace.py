@@ -11,6 +11,7 @@
 )
 from dagster._core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster._core.host_representation.origin import CodeLocationOrigin
+from dagster._core.host_representation.snapshot_cache import get_snapshot_cache
 from dagster._core.workspace.load_target import WorkspaceLoadTarget
 from dagster._core.workspace.workspace import (
     CodeLocationEntry,
@@ -157,8 +158,9 @@ def _load_location(self, origin) -> CodeLocationEntry:
     def _create_location_from_origin(self, origin) -> CodeLocation:
         check.inst_param(origin, "origin", CodeLocationOrigin)
 
+        instance = self._grpc_server_registry.instance
         if not self._grpc_server_registry.supports_origin(origin):
-            return origin.create_location()
+            return origin.create_location(instance)
         else:
             endpoint = self._grpc_server_registry.get_grpc_endpoint(origin)
             return GrpcServerCodeLocation(
@@ -170,4 +172,6 @@ def _create_location_from_origin(self, origin) -> CodeLocation:
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                snapshot_cache=get_snapshot_cache(instance),
+                defer_snapshots=instance.code_server_defer_job_snapshots,
             )
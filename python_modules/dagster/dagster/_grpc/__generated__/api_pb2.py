@@ -46,7 +46,14 @@
     b" \x01(\t\x12\x17\n\x0f\x64\x65\x66\x65r_snapshots\x18\x02"
     b' \x01(\x08"F\n\x17\x45xternalRepositoryReply\x12+\n#serialized_external_repository_data\x18\x01'
     b' \x01(\t"i\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01'
-    b' \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02 \x01(\t"W\n'
+    b" \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02"
+    b' \x01(\t"\x8b\x01\n#ExternalRepositoryComponentsRequest\x12+\n#serialized_repository_python_origin\x18\x01'
+    b" \x01(\t\x12\x17\n\x0f\x64\x65\x66\x65r_snapshots\x18\x02"
+    b" \x01(\x08\x12\x1e\n\x16known_component_hashes\x18\x03"
+    b' \x03(\t"\x97\x01\n)StreamingExternalRepositoryComponentEvent\x12\x17\n\x0fsequence_number\x18\x01'
+    b" \x01(\x05\x12\x16\n\x0e\x63omponent_hash\x18\x02"
+    b' \x01(\t\x12"\n\x1aserialized_component_chunk\x18\x03'
+    b' \x01(\t\x12\x15\n\ris_last_chunk\x18\x04 \x01(\x08"W\n'
     b" ExternalScheduleExecutionRequest\x12\x33\n+serialized_external_schedule_execution_args\x18\x01"
     b' \x01(\t"S\n\x1e\x45xternalSensorExecutionRequest\x12\x31\n)serialized_external_sensor_execution_args\x18\x01'
     b' \x01(\t"H\n\x13StreamingChunkEvent\x12\x17\n\x0fsequence_number\x18\x01'
@@ -64,9 +71,14 @@
     b" \x01(\t\x12\x10\n\x08job_name\x18\x02"
     b' \x01(\t"I\n\x10\x45xternalJobReply\x12\x1b\n\x13serialized_job_data\x18\x01'
     b" \x01(\t\x12\x18\n\x10serialized_error\x18\x02"
-    b' \x01(\t2\xd3\x0e\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
+    b' \x01(\t"N\n\x13\x45xternalJobsRequest\x12$\n\x1cserialized_repository_origin\x18\x01'
+    b" \x01(\t\x12\x11\n\tjob_names\x18\x02"
+    b' \x03(\t"\x9a\x01\n\x19StreamingExternalJobEvent\x12\x17\n\x0fsequence_number\x18\x01'
+    b" \x01(\x05\x12\x10\n\x08job_name\x18\x02 \x01(\t\x12!\n\x19serialized_job_data_chunk\x18\x03"
+    b" \x01(\t\x12\x15\n\ris_last_chunk\x18\x04 \x01(\x08\x12\x18\n\x10serialized_error\x18\x05"
+    b' \x01(\t2\xb2\x10\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
     b' .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12'
-    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x62\x06proto3'
+    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12U\n\x15StreamingExternalJobs\x12\x18.api.ExternalJobsRequest\x1a\x1e.api.StreamingExternalJobEvent"\x00\x30\x01\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12\x85\x01\n%StreamingExternalRepositoryComponents\x12(.api.ExternalRepositoryComponentsRequest\x1a..api.StreamingExternalRepositoryComponentEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x62\x06proto3'
 )
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
@@ -121,34 +133,42 @@
     _EXTERNALREPOSITORYREPLY._serialized_end = 1613
     _STREAMINGEXTERNALREPOSITORYEVENT._serialized_start = 1615
     _STREAMINGEXTERNALREPOSITORYEVENT._serialized_end = 1720
-    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_start = 1722
-    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 1809
-    _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 1811
-    _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 1894
-    _STREAMINGCHUNKEVENT._serialized_start = 1896
-    _STREAMINGCHUNKEVENT._serialized_end = 1968
-    _SHUTDOWNSERVERREPLY._serialized_start = 1970
-    _SHUTDOWNSERVERREPLY._serialized_end = 2034
-    _CANCELEXECUTIONREQUEST._serialized_start = 2036
-    _CANCELEXECUTIONREQUEST._serialized_end = 2105
-    _CANCELEXECUTIONREPLY._serialized_start = 2107
-    _CANCELEXECUTIONREPLY._serialized_end = 2173
-    _CANCANCELEXECUTIONREQUEST._serialized_start = 2175
-    _CANCANCELEXECUTIONREQUEST._serialized_end = 2251
-    _CANCANCELEXECUTIONREPLY._serialized_start = 2253
-    _CANCANCELEXECUTIONREPLY._serialized_end = 2326
-    _STARTRUNREQUEST._serialized_start = 2328
-    _STARTRUNREQUEST._serialized_end = 2382
-    _STARTRUNREPLY._serialized_start = 2384
-    _STARTRUNREPLY._serialized_end = 2436
-    _GETCURRENTIMAGEREPLY._serialized_start = 2438
-    _GETCURRENTIMAGEREPLY._serialized_end = 2494
-    _GETCURRENTRUNSREPLY._serialized_start = 2496
-    _GETCURRENTRUNSREPLY._serialized_end = 2550
-    _EXTERNALJOBREQUEST._serialized_start = 2552
-    _EXTERNALJOBREQUEST._serialized_end = 2628
-    _EXTERNALJOBREPLY._serialized_start = 2630
-    _EXTERNALJOBREPLY._serialized_end = 2703
-    _DAGSTERAPI._serialized_start = 2706
-    _DAGSTERAPI._serialized_end = 4581
+    _EXTERNALREPOSITORYCOMPONENTSREQUEST._serialized_start = 1723
+    _EXTERNALREPOSITORYCOMPONENTSREQUEST._serialized_end = 1862
+    _STREAMINGEXTERNALREPOSITORYCOMPONENTEVENT._serialized_start = 1865
+    _STREAMINGEXTERNALREPOSITORYCOMPONENTEVENT._serialized_end = 2016
+    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_start = 2018
+    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 2105
+    _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 2107
+    _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 2190
+    _STREAMINGCHUNKEVENT._serialized_start = 2192
+    _STREAMINGCHUNKEVENT._serialized_end = 2264
+    _SHUTDOWNSERVERREPLY._serialized_start = 2266
+    _SHUTDOWNSERVERREPLY._serialized_end = 2330
+    _CANCELEXECUTIONREQUEST._serialized_start = 2332
+    _CANCELEXECUTIONREQUEST._serialized_end = 2401
+    _CANCELEXECUTIONREPLY._serialized_start = 2403
+    _CANCELEXECUTIONREPLY._serialized_end = 2469
+    _CANCANCELEXECUTIONREQUEST._serialized_start = 2471
+    _CANCANCELEXECUTIONREQUEST._serialized_end = 2547
+    _CANCANCELEXECUTIONREPLY._serialized_start = 2549
+    _CANCANCELEXECUTIONREPLY._serialized_end = 2622
+    _STARTRUNREQUEST._serialized_start = 2624
+    _STARTRUNREQUEST._serialized_end = 2678
+    _STARTRUNREPLY._serialized_start = 2680
+    _STARTRUNREPLY._serialized_end = 2732
+    _GETCURRENTIMAGEREPLY._serialized_start = 2734
+    _GETCURRENTIMAGEREPLY._serialized_end = 2790
+    _GETCURRENTRUNSREPLY._serialized_start = 2792
+    _GETCURRENTRUNSREPLY._serialized_end = 2846
+    _EXTERNALJOBREQUEST._serialized_start = 2848
+    _EXTERNALJOBREQUEST._serialized_end = 2924
+    _EXTERNALJOBREPLY._serialized_start = 2926
+    _EXTERNALJOBREPLY._serialized_end = 2999
+    _EXTERNALJOBSREQUEST._serialized_start = 3001
+    _EXTERNALJOBSREQUEST._serialized_end = 3079
+    _STREAMINGEXTERNALJOBEVENT._serialized_start = 3082
+    _STREAMINGEXTERNALJOBEVENT._serialized_end = 3236
+    _DAGSTERAPI._serialized_start = 3239
+    _DAGSTERAPI._serialized_end = 5337
 # @@protoc_insertion_point(module_scope)
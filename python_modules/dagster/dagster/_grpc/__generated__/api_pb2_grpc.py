@@ -91,11 +91,21 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalJobRequest.SerializeToString,
             response_deserializer=api__pb2.ExternalJobReply.FromString,
         )
+        self.StreamingExternalJobs = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalJobs",
+            request_serializer=api__pb2.ExternalJobsRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingExternalJobEvent.FromString,
+        )
         self.StreamingExternalRepository = channel.unary_stream(
             "/api.DagsterApi/StreamingExternalRepository",
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.StreamingExternalRepositoryComponents = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositoryComponents",
+            request_serializer=api__pb2.ExternalRepositoryComponentsRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingExternalRepositoryComponentEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -225,12 +235,24 @@ def ExternalJob(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalJobs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def StreamingExternalRepository(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepositoryComponents(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -352,11 +374,21 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalJobRequest.FromString,
             response_serializer=api__pb2.ExternalJobReply.SerializeToString,
         ),
+        "StreamingExternalJobs": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalJobs,
+            request_deserializer=api__pb2.ExternalJobsRequest.FromString,
+            response_serializer=api__pb2.StreamingExternalJobEvent.SerializeToString,
+        ),
         "StreamingExternalRepository": grpc.unary_stream_rpc_method_handler(
             servicer.StreamingExternalRepository,
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "StreamingExternalRepositoryComponents": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositoryComponents,
+            request_deserializer=api__pb2.ExternalRepositoryComponentsRequest.FromString,
+            response_serializer=api__pb2.StreamingExternalRepositoryComponentEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -812,6 +844,35 @@ def ExternalJob(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalJobs(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalJobs",
+            api__pb2.ExternalJobsRequest.SerializeToString,
+            api__pb2.StreamingExternalJobEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def StreamingExternalRepository(
         request,
@@ -841,6 +902,35 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepositoryComponents(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositoryComponents",
+            api__pb2.ExternalRepositoryComponentsRequest.SerializeToString,
+            api__pb2.StreamingExternalRepositoryComponentEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
@@ -335,6 +335,32 @@ def external_job(
             job_name=job_name,
         )
 
+    def streaming_external_jobs(
+        self,
+        external_repository_origin: ExternalRepositoryOrigin,
+        job_names: Sequence[str],
+    ):
+        check.inst_param(
+            external_repository_origin,
+            "external_repository_origin",
+            ExternalRepositoryOrigin,
+        )
+        check.sequence_param(job_names, "job_names", of_type=str)
+
+        for res in self._streaming_query(
+            "StreamingExternalJobs",
+            api_pb2.ExternalJobsRequest,  # type: ignore
+            serialized_repository_origin=serialize_value(external_repository_origin),
+            job_names=list(job_names),
+        ):
+            yield {
+                "sequence_number": res.sequence_number,
+                "job_name": res.job_name,
+                "serialized_job_data_chunk": res.serialized_job_data_chunk,
+                "is_last_chunk": res.is_last_chunk,
+                "serialized_error": res.serialized_error,
+            }
+
     def streaming_external_repository(
         self,
         external_repository_origin: ExternalRepositoryOrigin,
@@ -352,6 +378,26 @@ def streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_components(
+        self,
+        external_repository_origin: ExternalRepositoryOrigin,
+        known_component_hashes: Sequence[str] = (),
+        defer_snapshots: bool = False,
+    ):
+        for res in self._streaming_query(
+            "StreamingExternalRepositoryComponents",
+            api_pb2.ExternalRepositoryComponentsRequest,  # type: ignore
+            serialized_repository_python_origin=serialize_value(external_repository_origin),
+            defer_snapshots=defer_snapshots,
+            known_component_hashes=list(known_component_hashes),
+        ):
+            yield {
+                "sequence_number": res.sequence_number,
+                "component_hash": res.component_hash,
+                "serialized_component_chunk": res.serialized_component_chunk,
+                "is_last_chunk": res.is_last_chunk,
+            }
+
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
             external_schedule_execution_args,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import math
 import multiprocessing
 import os
@@ -22,6 +23,7 @@
 import dagster._check as check
 import dagster._seven as seven
 from dagster._core.code_pointer import CodePointer
+from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.reconstruct import ReconstructableRepository
 from dagster._core.definitions.repository_definition import RepositoryDefinition
 from dagster._core.errors import DagsterUserCodeUnreachableError
@@ -32,6 +34,7 @@
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
     external_job_data_from_def,
+    external_repository_data_components_from_def,
     external_repository_data_from_def,
 )
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
@@ -159,6 +162,17 @@ def code_pointers_by_repo_name(self) -> Mapping[str, CodePointer]:
     def definitions_by_name(self) -> Mapping[str, RepositoryDefinition]:
         return self._repo_defs_by_name
 
+    @property
+    def fixed_snapshot_repository_names(self) -> Sequence[str]:
+        """The names of the repositories whose snapshots don't change for as long as the server
+        runs, since their definitions are fixed once loaded.
+        """
+        return [
+            repo_name
+            for repo_name, repo_def in self._repo_defs_by_name.items()
+            if repo_def.has_fixed_definitions
+        ]
+
     @property
     def reconstructables_by_name(self) -> Mapping[str, ReconstructableRepository]:
         return self._recon_repos_by_name
@@ -190,6 +204,17 @@ def _get_code_pointer(
         check.failed("Invalid loadable target origin")
 
 
+def _get_job_def_by_name(repository_def: RepositoryDefinition, job_name: str) -> JobDefinition:
+    # the job refs sent with deferred snapshots are named after the job, which a dict of jobs
+    # passed to @repository may list under a different key
+    if repository_def.has_job(job_name):
+        return repository_def.get_job(job_name)
+    for job_def in repository_def.get_all_jobs():
+        if job_def.name == job_name:
+            return job_def
+    return repository_def.get_job(job_name)
+
+
 class DagsterApiServer(DagsterApiServicer):
     # The loadable_target_origin is currently Noneable to support instaniating a server.
     # This helps us test the ping methods, and incrementally migrate each method to
@@ -419,6 +444,7 @@ def ListRepositories(self, request, _context) -> api_pb2.ListRepositoriesReply:
                     container_image=self._container_image,
                     container_context=self._container_context,
                     dagster_library_versions=DagsterLibraryRegistry.get(),
+                    fixed_snapshot_repository_names=loaded_repositories.fixed_snapshot_repository_names,
                 )
             )
         except Exception:
@@ -572,9 +598,10 @@ def _get_serialized_external_repository_data(self, request):
                 ExternalRepositoryOrigin,
             )
 
+            repository_def = self._get_repo_for_origin(repository_origin)
             return serialize_value(
                 external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
+                    repository_def,
                     defer_snapshots=request.defer_snapshots,
                 )
             )
@@ -596,7 +623,9 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:  # type: i
                 ExternalRepositoryOrigin,
             )
 
-            job_def = self._get_repo_for_origin(repository_origin).get_job(request.job_name)
+            job_def = _get_job_def_by_name(
+                self._get_repo_for_origin(repository_origin), request.job_name
+            )
             ser_job_data = serialize_value(external_job_data_from_def(job_def))
             return api_pb2.ExternalJobReply(serialized_job_data=ser_job_data)  # type: ignore
         except Exception:
@@ -606,6 +635,43 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:  # type: i
                 )
             )
 
+    def StreamingExternalJobs(self, request, _context):
+        """Streams the serialized ExternalJobData of each of the requested jobs, so that a client
+        can fetch the snapshots of many jobs loaded with deferred snapshots in one call. If building
+        a job's data fails, the last event carries the serialized error.
+        """
+        sequence_number = 0
+        try:
+            repository_origin = deserialize_value(
+                request.serialized_repository_origin,
+                ExternalRepositoryOrigin,
+            )
+
+            repository_def = self._get_repo_for_origin(repository_origin)
+            for job_name in request.job_names:
+                job_def = _get_job_def_by_name(repository_def, job_name)
+                ser_job_data = serialize_value(external_job_data_from_def(job_def))
+                chunks = [
+                    ser_job_data[i : i + STREAMING_CHUNK_SIZE]
+                    for i in range(0, len(ser_job_data), STREAMING_CHUNK_SIZE)
+                ]
+                for i, chunk in enumerate(chunks):
+                    yield api_pb2.StreamingExternalJobEvent(
+                        sequence_number=sequence_number,
+                        job_name=job_name,
+                        serialized_job_data_chunk=chunk,
+                        is_last_chunk=i == len(chunks) - 1,
+                    )
+                    sequence_number += 1
+        except Exception:
+            yield api_pb2.StreamingExternalJobEvent(
+                sequence_number=sequence_number,
+                serialized_error=serialize_value(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+                is_last_chunk=True,
+            )
+
     def StreamingExternalRepository(self, request, _context):
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
 
@@ -627,6 +693,55 @@ def StreamingExternalRepository(self, request, _context):
                 ],
             )
 
+    def _get_serialized_external_repository_components(self, request) -> Iterator[str]:
+        try:
+            repository_origin = deserialize_value(
+                request.serialized_repository_python_origin,
+                ExternalRepositoryOrigin,
+            )
+
+            repository_def = self._get_repo_for_origin(repository_origin)
+            for component in external_repository_data_components_from_def(
+                repository_def,
+                defer_snapshots=request.defer_snapshots,
+            ):
+                yield serialize_value(component)
+        except Exception:
+            yield serialize_value(
+                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            )
+
+    def StreamingExternalRepositoryComponents(self, request, _context):
+        """Streams the serialized parts of the repository's ExternalRepositoryData as they are
+        built: the data of each job and each asset node, then the rest of the repository data
+        (or an ExternalRepositoryErrorData if building it failed).
+
+        Each part is identified by a hash of its serialized content, and the content of parts
+        whose hash is in the request's known_component_hashes is left out, since the client
+        already has them from a previous snapshot.
+        """
+        known_component_hashes = set(request.known_component_hashes)
+        sequence_number = 0
+
+        for serialized_component in self._get_serialized_external_repository_components(request):
+            component_hash = hashlib.sha256(serialized_component.encode("utf-8")).hexdigest()
+            if component_hash in known_component_hashes:
+                chunks = [""]
+            else:
+                chunks = [
+                    serialized_component[i : i + STREAMING_CHUNK_SIZE]
+                    for i in range(0, len(serialized_component), STREAMING_CHUNK_SIZE)
+                ]
+
+            for i, chunk in enumerate(chunks):
+                yield api_pb2.StreamingExternalRepositoryComponentEvent(
+                    sequence_number=sequence_number,
+                    component_hash=component_hash,
+                    serialized_component_chunk=chunk,
+                    is_last_chunk=i == len(chunks) - 1,
+                )
+                sequence_number += 1
+
     def _split_serialized_data_into_chunk_events(self, serialized_data):
         num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
         for i in range(num_chunks):
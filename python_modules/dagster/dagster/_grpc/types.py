@@ -313,6 +313,7 @@ class ListRepositoriesResponse(
             ("container_image", Optional[str]),
             ("container_context", Optional[Mapping[str, Any]]),
             ("dagster_library_versions", Optional[Mapping[str, str]]),
+            ("fixed_snapshot_repository_names", Optional[Sequence[str]]),
         ],
     )
 ):
@@ -325,6 +326,7 @@ def __new__(
         container_image: Optional[str] = None,
         container_context: Optional[Mapping] = None,
         dagster_library_versions: Optional[Mapping[str, str]] = None,
+        fixed_snapshot_repository_names: Optional[Sequence[str]] = None,
     ):
         return super(ListRepositoriesResponse, cls).__new__(
             cls,
@@ -352,6 +354,9 @@ def __new__(
             dagster_library_versions=check.opt_nullable_mapping_param(
                 dagster_library_versions, "dagster_library_versions"
             ),
+            fixed_snapshot_repository_names=check.opt_nullable_sequence_param(
+                fixed_snapshot_repository_names, "fixed_snapshot_repository_names", of_type=str
+            ),
         )
 
 
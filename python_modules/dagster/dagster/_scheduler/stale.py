@@ -26,7 +26,7 @@ def resolve_stale_or_missing_assets(
         if run_request.asset_selection is not None
         else asset_graph.get_materialization_asset_keys_for_job(check.not_none(instigator.job_name))
     )
-    resolver = CachingStaleStatusResolver(context.instance, asset_graph)
+    resolver = CachingStaleStatusResolver(context.instance, asset_graph, asset_keys=asset_selection)
     stale_or_unknown_keys: List[AssetKey] = []
     for asset_key in asset_selection:
         if resolver.get_status(asset_key) in [StaleStatus.STALE, StaleStatus.MISSING]:
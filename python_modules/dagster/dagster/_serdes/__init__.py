@@ -6,9 +6,11 @@
 from .serdes import (
     EnumSerializer as EnumSerializer,
     NamedTupleSerializer as NamedTupleSerializer,
+    SerdesFormat as SerdesFormat,
     WhitelistMap as WhitelistMap,
     deserialize_value as deserialize_value,
     pack_value as pack_value,
+    serialize_as_base_class as serialize_as_base_class,
     serialize_value as serialize_value,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
@@ -132,6 +132,7 @@ def register_tuple(
             if field_serializers
             else None,
         )
+        serializer.compile()
         self.tuple_serializers[name] = serializer
         deserializer_name = storage_name or name
         self.tuple_deserializers[deserializer_name] = serializer
@@ -139,6 +140,12 @@ def register_tuple(
             for old_storage_name in old_storage_names:
                 self.tuple_deserializers[old_storage_name] = serializer
 
+    def register_tuple_subclass(self, name: str, base_name: str) -> None:
+        """Register a subclass of a whitelisted namedtuple, which is serialized with the serializer
+        of its base class (through its `_asdict`), and so is deserialized as the base class.
+        """
+        self.tuple_serializers[name] = self.tuple_serializers[base_name]
+
     def has_tuple_serializer(self, name: str) -> bool:
         return name in self.tuple_serializers
 
@@ -335,6 +342,18 @@ def __whitelist_for_serdes(klass: T_Type) -> T_Type:
     return __whitelist_for_serdes
 
 
+def serialize_as_base_class(__cls: T_Type) -> T_Type:
+    """Decorator for a subclass of a whitelisted NamedTuple, e.g. one that computes some of its
+    fields lazily, whose instances should be serialized as, and deserialized to, its base class.
+    """
+    check.class_param(__cls, "__cls")
+    base = __cls.__bases__[0]
+    if not _WHITELIST_MAP.has_tuple_serializer(base.__name__):
+        raise SerdesUsageError(f"Can not serialize {__cls} as {base}, which is not whitelisted")
+    _WHITELIST_MAP.register_tuple_subclass(__cls.__name__, base.__name__)
+    return __cls
+
+
 ###################################################################################################
 # Serializers
 ###################################################################################################
@@ -418,8 +437,21 @@ def get_storage_name(self) -> str:
 
 EMPTY_VALUES_TO_SKIP: Tuple[None, List[Any], Dict[Any, Any], Set[Any]] = (None, [], {}, set())
 
+# Returned by a compiled unpack function when the value must be unpacked by the generic path
+_USE_GENERIC_UNPACK: Final = object()
+
+CompiledPackFn: TypeAlias = Callable[[Any, WhitelistMap, str], Dict[str, JsonSerializableValue]]
+CompiledUnpackFn: TypeAlias = Callable[
+    [Dict[str, UnpackedValue], WhitelistMap, "UnpackContext"], Any
+]
+
 
 class NamedTupleSerializer(Serializer, Generic[T_NamedTuple]):
+    # Specialized pack / unpack functions for `klass`, generated by `compile` when the serializer is
+    # registered in a `WhitelistMap`.
+    _compiled_pack: Optional[CompiledPackFn] = None
+    _compiled_unpack: Optional[CompiledUnpackFn] = None
+
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
     def __init__(
         self,
@@ -447,6 +479,11 @@ def unpack(
     ) -> T_NamedTuple:
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
+            if self._compiled_unpack is not None and not context.observed_unknown_serdes_values:
+                compiled_unpacked = self._compiled_unpack(unpacked_dict, whitelist_map, context)
+                if compiled_unpacked is not _USE_GENERIC_UNPACK:
+                    return compiled_unpacked
+
             unpacked: Dict[str, PackableValue] = {}
             for key, value in unpacked_dict.items():
                 loaded_name = self.loaded_field_names.get(key, key)
@@ -507,6 +544,9 @@ def pack(
         whitelist_map: WhitelistMap,
         descent_path: str,
     ) -> Dict[str, JsonSerializableValue]:
+        if self._compiled_pack is not None and type(value) is self.klass:
+            return self._compiled_pack(value, whitelist_map, descent_path)
+
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
         for key, inner_value in value._asdict().items():
@@ -541,6 +581,93 @@ def after_pack(self, **packed_dict: JsonSerializableValue) -> Dict[str, JsonSeri
     def constructor_param_names(self) -> Sequence[str]:
         return list(signature(self.klass.__new__).parameters.keys())
 
+    def compile(self) -> None:
+        """Generate the specialized pack / unpack functions for `klass`. Called once, when the
+        serializer is registered.
+        """
+        self._compiled_pack = self._compile_pack()
+        self._compiled_unpack = self._compile_unpack()
+
+    def _compile_pack(self) -> CompiledPackFn:
+        # The generated function resolves the storage name, storage field names, field serializers
+        # and skipped fields once up front, rather than once per field of every packed value.
+        storage_name = self.get_storage_name()
+        fields = tuple(
+            (
+                self.storage_field_names.get(key, key),
+                self.field_serializers.get(key),
+                key in self.skip_when_empty_fields,
+                f".{key}",
+            )
+            for key in self.klass._fields
+        )
+        old_fields = tuple(self.old_fields.items())
+        after_pack = (
+            self.after_pack
+            if type(self).after_pack is not NamedTupleSerializer.after_pack
+            else None
+        )
+
+        def _compiled_pack(
+            value: Any, whitelist_map: WhitelistMap, descent_path: str
+        ) -> Dict[str, JsonSerializableValue]:
+            packed: Dict[str, JsonSerializableValue] = {"__class__": storage_name}
+            for (storage_key, custom, skip_when_empty, path), inner_value in zip(fields, value):
+                if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                if custom:
+                    packed[storage_key] = custom.pack(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=descent_path + path,
+                    )
+                else:
+                    packed[storage_key] = _pack_value(
+                        inner_value, whitelist_map, descent_path + path
+                    )
+            for key, default in old_fields:
+                packed[key] = default
+            return after_pack(**packed) if after_pack else packed
+
+        return _compiled_pack
+
+    def _compile_unpack(self) -> CompiledUnpackFn:
+        klass = self.klass
+        param_names = frozenset(self.constructor_param_names)
+        loaded_field_names = self.loaded_field_names
+        # fields that are only written for the benefit of older versions of the class
+        old_field_names = frozenset(self.old_fields.keys()) - param_names
+        field_serializers = tuple(self.field_serializers.items())
+
+        def _compiled_unpack(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> Any:
+            if loaded_field_names or old_field_names:
+                unpacked_dict = {
+                    loaded_field_names.get(key, key): value
+                    for key, value in unpacked_dict.items()
+                    if key not in old_field_names
+                }
+            elif field_serializers:
+                unpacked_dict = dict(unpacked_dict)
+
+            # Values with fields that are unknown to the loaded version of the class (e.g. removed
+            # fields, or values written by a newer version) take the generic path, which filters
+            # them out.
+            if not unpacked_dict.keys() <= param_names:
+                return _USE_GENERIC_UNPACK
+
+            for key, custom in field_serializers:
+                if key in unpacked_dict:
+                    unpacked_dict[key] = custom.unpack(
+                        unpacked_dict[key], whitelist_map=whitelist_map, context=context
+                    )
+            return klass(**unpacked_dict)
+
+        return _compiled_unpack
+
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
@@ -581,16 +708,46 @@ def pack(
 ###################################################################################################
 
 
+class SerdesFormat(Enum):
+    """The string formats that `serialize_value` can produce. `deserialize_value` accepts all of
+    them.
+
+    JSON: Plain JSON, in which every serialized NamedTuple carries its class name and field names.
+        This is the default, and the format used to compute snapshot ids.
+    COMPACT: A versioned header followed by JSON in which the class name and field names of each
+        distinct NamedTuple shape are written once to a table, with each serialized NamedTuple
+        referencing its shape by index and holding only its field values.
+    """
+
+    JSON = "JSON"
+    COMPACT = "COMPACT"
+
+
 def serialize_value(
     val: PackableValue,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    serdes_format: SerdesFormat = SerdesFormat.JSON,
     **json_kwargs: object,
 ) -> str:
     """Serialize an object to a JSON string.
 
-    Objects are first converted to a JSON-serializable form with `pack_value`.
+    Objects are first converted to a JSON-serializable form with `pack_value`. If `serdes_format`
+    is `SerdesFormat.COMPACT`, the packed value is then re-encoded with `_compact_encode`, and the
+    table of shapes it collects is written ahead of it.
     """
     packed_value = pack_value(val, whitelist_map=whitelist_map)
+    if serdes_format == SerdesFormat.COMPACT:
+        shapes: Dict[Tuple[str, ...], int] = {}
+        encoded_value = _compact_encode(packed_value, shapes)
+        json_kwargs.setdefault("separators", (",", ":"))
+        return "".join(
+            [
+                COMPACT_FORMAT_HEADER,
+                seven.json.dumps([list(shape) for shape in shapes], **json_kwargs),
+                "\n",
+                seven.json.dumps(encoded_value, **json_kwargs),
+            ]
+        )
     return seven.json.dumps(packed_value, **json_kwargs)
 
 
@@ -662,15 +819,14 @@ def _pack_value(
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(val.__class__.__name__)
+        if serializer is None:
             raise SerializationError(
                 (
                     "Can only serialize whitelisted namedtuples, received"
                     f" {val}.\nDescent path: {descent_path}"
                 ),
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -764,7 +920,8 @@ def deserialize_value(
 
     Three steps:
 
-    - Parse the input string as JSON.
+    - Parse the input string as JSON. Strings produced with `SerdesFormat.COMPACT` are detected by
+      their header and expanded back into the plain JSON form as part of this step.
     - Unpack the complex of lists, dicts, and scalars resulting from JSON parsing into a complex of richer
       Python objects (e.g. dagster-specific `NamedTuple` objects).
     - Optionally, check that the resulting object is of the expected type.
@@ -775,9 +932,13 @@ def deserialize_value(
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", DeprecationWarning)
         context = UnpackContext()
-        unpacked_value = seven.json.loads(
-            val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
-        )
+        if val.startswith(_COMPACT_FORMAT_HEADER_PREFIX):
+            unpacked_value = _deserialize_compact(val, whitelist_map, context)
+        else:
+            unpacked_value = seven.json.loads(
+                val,
+                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
+            )
         unpacked_value = context.finalize_unpack(unpacked_value)
         if as_type and not (
             is_named_tuple_instance(unpacked_value)
@@ -916,6 +1077,111 @@ def _unpack_value(
     return val
 
 
+###################################################################################################
+# Compact format
+###################################################################################################
+
+# The compact format is `@c<version>:`, followed by a JSON list of shapes, a newline, and the JSON
+# body. Each shape is a `[<class storage name>, <field name>, ...]` list, and the body is the packed
+# value in which every `{"__class__": ..., <field>: <value>, ...}` dict has been replaced by
+# `{"#<shape index>": [<value>, ...]}`. Keys of plain dicts that start with "#" are escaped with an
+# additional "#". Plain JSON never starts with "@", which is how the two formats are told apart when
+# reading. Since the shapes are read before the body, the body can be decoded in a single pass by
+# `json.loads`, like the plain JSON format.
+
+_COMPACT_FORMAT_HEADER_PREFIX: Final = "@c"
+COMPACT_FORMAT_VERSION: Final = 1
+COMPACT_FORMAT_HEADER: Final = f"{_COMPACT_FORMAT_HEADER_PREFIX}{COMPACT_FORMAT_VERSION}:"
+
+
+def _compact_encode(
+    val: JsonSerializableValue, shapes: Dict[Tuple[str, ...], int]
+) -> JsonSerializableValue:
+    if isinstance(val, list):
+        return [_compact_encode(item, shapes) for item in val]
+
+    if isinstance(val, dict):
+        if "__class__" in val:
+            shape = (cast(str, val["__class__"]), *(key for key in val if key != "__class__"))
+            shape_idx = shapes.setdefault(shape, len(shapes))
+            return {
+                f"#{shape_idx}": [
+                    _compact_encode(value, shapes)
+                    for key, value in val.items()
+                    if key != "__class__"
+                ]
+            }
+
+        return {
+            (f"#{key}" if isinstance(key, str) and key.startswith("#") else key): _compact_encode(
+                value, shapes
+            )
+            for key, value in val.items()
+        }
+
+    return val
+
+
+def _deserialize_compact(
+    val: str, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    header, _, rest = val.partition(":")
+    if header != COMPACT_FORMAT_HEADER[:-1]:
+        raise DeserializationError(
+            f"Unsupported serdes format header {header}. Only version {COMPACT_FORMAT_VERSION} of"
+            " the compact format is supported, so this value may have been written by a newer"
+            " version of dagster."
+        )
+
+    shapes_str, _, body = rest.partition("\n")
+    # keyed by the `#<shape index>` key that refers to each shape, so that each object in the body
+    # only costs a single lookup
+    shapes_by_key = {
+        f"#{idx}": (
+            shape[0],
+            shape[1:],
+            whitelist_map.get_tuple_deserializer(shape[0])
+            if whitelist_map.has_tuple_deserializer(shape[0])
+            else None,
+        )
+        for idx, shape in enumerate(seven.json.loads(shapes_str))
+    }
+    return seven.json.loads(
+        body,
+        object_hook=partial(
+            _unpack_compact_object,
+            shapes_by_key=shapes_by_key,
+            whitelist_map=whitelist_map,
+            context=context,
+        ),
+    )
+
+
+def _unpack_compact_object(
+    val: dict,
+    shapes_by_key: Mapping[str, Tuple[str, Sequence[str], Optional[NamedTupleSerializer]]],
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+):
+    if len(val) == 1:
+        ((key, inner),) = val.items()
+        shape = shapes_by_key.get(key)
+        if shape:
+            klass_name, field_names, deserializer = shape
+            unpacked = dict(zip(field_names, inner))
+            if deserializer is None:
+                unpacked["__class__"] = klass_name
+                return _unpack_object(unpacked, whitelist_map, context)
+            return deserializer.unpack(unpacked, whitelist_map, context)
+
+    for key in val:
+        if key[:1] == "#":
+            val = {(key[1:] if key[:1] == "#" else key): value for key, value in val.items()}
+            break
+
+    return _unpack_object(val, whitelist_map, context)
+
+
 ###################################################################################################
 # Validation
 ###################################################################################################
@@ -81,7 +81,19 @@ def prefetch_asset_partition_counts(
             )
 
     def prefetch_asset_records(self, asset_keys: Sequence[AssetKey]):
-        """For performance, batches together queries for selected assets."""
+        """For performance, batches together queries for selected assets. Assets whose records were
+        already prefetched are skipped, so the records can be shared by everything that uses this
+        queryer.
+        """
+        asset_keys = [
+            asset_key
+            for asset_key in asset_keys
+            if asset_key not in self._asset_record_cache
+            or AssetKeyPartitionKey(asset_key) not in self._latest_materialization_record_cache
+        ]
+        if not asset_keys:
+            return
+
         # get all asset records for the selected assets
         asset_records = self.instance.get_asset_records(asset_keys)
         for asset_record in asset_records:
@@ -126,7 +138,7 @@ def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
     def _get_latest_materialization_record(
         self, *, asset_partition: AssetKeyPartitionKey, before_cursor: Optional[int] = None
     ) -> Optional["EventLogRecord"]:
-        from dagster._core.event_api import EventRecordsFilter
+        from dagster._core.event_api import EventRecordsFilter, EventRecordsProjection
 
         records = self.instance.get_event_records(
             EventRecordsFilter(
@@ -139,6 +151,8 @@ def _get_latest_materialization_record(
             ),
             ascending=False,
             limit=1,
+            # most callers only need the storage id, run id or partition of the record
+            projection=EventRecordsProjection.LAZY,
         )
         return next(iter(records), None)
 
@@ -270,7 +284,7 @@ def get_materialization_records(
         after_cursor: Optional[int] = None,
         tags: Optional[Mapping[str, str]] = None,
     ) -> Iterable["EventLogRecord"]:
-        from dagster._core.event_api import EventRecordsFilter
+        from dagster._core.event_api import EventRecordsFilter, EventRecordsProjection
 
         return self.instance.get_event_records(
             EventRecordsFilter(
@@ -278,7 +292,8 @@ def get_materialization_records(
                 asset_key=asset_key,
                 after_cursor=after_cursor,
                 tags=tags,
-            )
+            ),
+            projection=EventRecordsProjection.LAZY,
         )
 
     ####################
@@ -292,7 +307,7 @@ def get_observation_record(
         asset_key: AssetKey,
         before_cursor: Optional[int],
     ) -> Optional["EventLogRecord"]:
-        from dagster._core.event_api import EventRecordsFilter
+        from dagster._core.event_api import EventRecordsFilter, EventRecordsProjection
 
         return next(
             iter(
@@ -303,11 +318,37 @@ def get_observation_record(
                         before_cursor=before_cursor,
                     ),
                     ascending=False,
+                    limit=1,
+                    projection=EventRecordsProjection.LAZY,
                 )
             ),
             None,
         )
 
+    @cached_method
+    def get_observed_asset_keys(self, *, after_cursor: Optional[int]) -> AbstractSet[AssetKey]:
+        """Returns the keys of all assets that have been observed after the given cursor, with a
+        single query that only deserializes the observation events stored without an indexed asset
+        key.
+
+        Args:
+            after_cursor (Optional[int]): Filter parameter such that only records with a storage_id
+                greater than this value will be considered.
+        """
+        from dagster._core.event_api import EventRecordsFilter, EventRecordsProjection
+
+        return {
+            cast(AssetKey, record.asset_key)
+            for record in self.instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_OBSERVATION,
+                    after_cursor=after_cursor,
+                ),
+                projection=EventRecordsProjection.LAZY,
+            )
+            if record.asset_key is not None
+        }
+
     @cached_method
     def next_version_record(
         self,
@@ -5,7 +5,9 @@
 
 if TYPE_CHECKING:
     from dagster._core.execution.plan.step import ExecutionStep
-    from dagster._core.storage.dagster_run import DagsterRun
+    from dagster._core.storage.dagster_run import DagsterRun, RunTagsRecord
+
+    TaggedItem = Union[DagsterRun, RunTagsRecord, ExecutionStep]
 
 
 class TagConcurrencyLimitsCounter:
@@ -21,7 +23,7 @@ class TagConcurrencyLimitsCounter:
     def __init__(
         self,
         tag_concurrency_limits: Sequence[Mapping[str, Any]],
-        in_progress_tagged_items: Sequence[Union["DagsterRun", "ExecutionStep"]],
+        in_progress_tagged_items: Sequence["TaggedItem"],
     ):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
         check.list_param(in_progress_tagged_items, "in_progress_tagged_items")
@@ -50,7 +52,7 @@ def __init__(
         for item in in_progress_tagged_items:
             self.update_counters_with_launched_item(item)
 
-    def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
+    def is_blocked(self, item: "TaggedItem") -> bool:
         """True if there are in progress item which are blocking this item based on tag limits."""
         for key, value in item.tags.items():
             if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
@@ -71,9 +73,7 @@ def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
 
         return False
 
-    def update_counters_with_launched_item(
-        self, item: Union["DagsterRun", "ExecutionStep"]
-    ) -> None:
+    def update_counters_with_launched_item(self, item: "TaggedItem") -> None:
         """Add a new in progress item to the counters."""
         for key, value in item.tags.items():
             if key in self._key_limits:
@@ -0,0 +1,59 @@
+"""Helpers for perf tests and benchmarks.
+
+Perf tests check an optimized code path on inputs small enough to run as part of the test suite,
+without printing anything. Benchmarks, marked with `benchmark`, time the same code path at the
+scale it was optimized for, and print their timings. Each benchmark picks its own input sizes. They
+are skipped unless the DAGSTER_PERF_BENCHMARKS environment variable is set:
+
+    DAGSTER_PERF_BENCHMARKS=1 pytest -s <test file>
+"""
+import gc
+import os
+import time
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import pytest
+
+
+def perf_benchmarks_enabled() -> bool:
+    return bool(os.getenv("DAGSTER_PERF_BENCHMARKS"))
+
+
+benchmark = pytest.mark.skipif(
+    not perf_benchmarks_enabled(), reason="Set DAGSTER_PERF_BENCHMARKS to run benchmarks"
+)
+
+
+class Timing(NamedTuple):
+    """The time taken by an operation, and optionally the number of things that it handled, like
+    the runs returned by a query or the bytes of a serialized value.
+    """
+
+    name: str
+    seconds: float
+    count: Optional[int] = None
+
+
+def best_time(fn: Callable[[], object], iterations: int = 1) -> float:
+    """Calls fn iterations times and returns the fastest call's time, in seconds."""
+    # like timeit, disable GC while timing so that collections of unrelated objects don't add noise
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+def print_timings(label: str, timings: Sequence[Timing]) -> None:
+    """Prints a table of the timings of a benchmark."""
+    name_width = max([len("name"), *(len(timing.name) for timing in timings)]) + 2
+    lines = [label, f"{'name':<{name_width}}{'count':>10}{'ms':>12}"]
+    for timing in timings:
+        count = "" if timing.count is None else str(timing.count)
+        lines.append(f"{timing.name:<{name_width}}{count:>10}{timing.seconds * 1000:>12.2f}")
+    print("\n".join(lines))  # noqa: T201
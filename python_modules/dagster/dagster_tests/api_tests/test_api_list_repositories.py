@@ -39,6 +39,9 @@ def test_sync_list_python_file_grpc():
     assert repository_code_pointer_dict["bar_repo"].python_file.endswith("api_tests_repo.py")
     assert repository_code_pointer_dict["bar_repo"].fn_name == "bar_repo"
 
+    # the definitions of a repository built with @repository are fixed once loaded
+    assert response.fixed_snapshot_repository_names == ["bar_repo"]
+
 
 def test_sync_list_python_file_multi_repo_grpc():
     python_file = file_relative_path(__file__, "multiple_repos.py")
@@ -1,10 +1,23 @@
 import sys
+from typing import cast
 
 import pytest
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api import snapshot_job
+from dagster._api.snapshot_job import (
+    ExternalJobDataCache,
+    sync_get_external_job_data_grpc,
+    sync_get_external_job_datas_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.host_representation.external_data import ExternalJobSubsetResult
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalJobRef,
+    ExternalJobSubsetResult,
+)
 from dagster._core.host_representation.handle import JobHandle
+from dagster._core.host_representation.snapshot_cache import SnapshotCache
+from dagster._core.test_utils import instance_for_test
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -12,6 +25,12 @@
 from .utils import get_bar_repo_code_location
 
 
+@pytest.fixture
+def deferred_instance():
+    with instance_for_test(overrides={"code_servers": {"defer_job_snapshots": True}}) as instance:
+        yield instance
+
+
 def _test_job_subset_grpc(job_handle, api_client, solid_selection=None):
     return sync_get_external_job_subset_grpc(
         api_client, job_handle.get_external_origin(), solid_selection=solid_selection
@@ -84,3 +103,205 @@ def test_job_with_invalid_definition_snapshot_api_grpc(instance):
                 "Input 'some_input' of op 'fail_subset' has no way of being resolved"
                 in error_info.cause.message
             )
+
+
+def test_job_snapshots_not_deferred_by_default(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+        assert repo.external_repository_data.external_job_datas is not None
+        assert repo.get_full_external_job("foo").is_loaded
+
+
+def test_job_snapshots_fetched_on_access(deferred_instance, monkeypatch):
+    monkeypatch.setattr(snapshot_job, "_job_data_cache", ExternalJobDataCache(10 * 1024 * 1024))
+
+    with get_bar_repo_code_location(deferred_instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+        assert repo.external_repository_data.external_job_datas is None
+
+        calls = []
+        original_external_job = code_location.client.external_job
+
+        def _external_job(*args, **kwargs):
+            calls.append(args)
+            return original_external_job(*args, **kwargs)
+
+        monkeypatch.setattr(code_location.client, "external_job", _external_job)
+
+        # reading a job's ref doesn't fetch its snapshot
+        job = repo.get_full_external_job("foo")
+        _ = job.computed_job_snapshot_id
+        _ = job.active_presets
+        assert len(calls) == 0
+
+        assert job.job_snapshot.name == "foo"
+        assert len(calls) == 1
+        assert len(snapshot_job._job_data_cache) == 1  # noqa: SLF001
+
+        # a reloaded location reuses the fetched data of unchanged jobs
+        with get_bar_repo_code_location(deferred_instance) as reloaded_location:
+            monkeypatch.setattr(reloaded_location.client, "external_job", _external_job)
+            reloaded_job = reloaded_location.get_repository("bar_repo").get_full_external_job("foo")
+            assert reloaded_job.job_snapshot.name == "foo"
+            assert len(calls) == 1
+
+
+def test_job_snapshots_stored_on_disk(deferred_instance, monkeypatch, tmp_path):
+    monkeypatch.setattr(snapshot_job, "_job_data_cache", ExternalJobDataCache(10 * 1024 * 1024))
+    snapshot_cache = SnapshotCache(str(tmp_path))
+
+    with get_bar_repo_code_location(deferred_instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+        repository_origin = repo.get_external_origin()
+        job_ref = next(
+            ref
+            for ref in repo.external_repository_data.external_job_refs or []
+            if ref.name == "foo"
+        )
+
+        calls = []
+        original_external_job = code_location.client.external_job
+
+        def _external_job(*args, **kwargs):
+            calls.append(args)
+            return original_external_job(*args, **kwargs)
+
+        monkeypatch.setattr(code_location.client, "external_job", _external_job)
+
+        job_data = sync_get_external_job_data_grpc(
+            code_location.client, repository_origin, job_ref, snapshot_cache=snapshot_cache
+        )
+        assert len(calls) == 1
+        assert list((tmp_path / "jobs").iterdir())
+
+        # a process that has nothing in memory loads the job's data from disk
+        monkeypatch.setattr(snapshot_job, "_job_data_cache", ExternalJobDataCache(10 * 1024 * 1024))
+        assert (
+            sync_get_external_job_datas_grpc(
+                code_location.client, repository_origin, [job_ref], snapshot_cache=snapshot_cache
+            )["foo"].job_snapshot.name
+            == job_data.job_snapshot.name
+        )
+        assert len(calls) == 1
+        assert len(snapshot_job._job_data_cache) == 1  # noqa: SLF001
+
+
+def test_job_snapshots_cached_by_fetched_snapshot_id(deferred_instance, monkeypatch, tmp_path):
+    monkeypatch.setattr(snapshot_job, "_job_data_cache", ExternalJobDataCache(10 * 1024 * 1024))
+    snapshot_cache = SnapshotCache(str(tmp_path))
+
+    with get_bar_repo_code_location(deferred_instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+        repository_origin = repo.get_external_origin()
+        job_ref = next(
+            ref
+            for ref in repo.external_repository_data.external_job_refs or []
+            if ref.name == "foo"
+        )
+        # a ref loaded before the job's code changed
+        stale_job_ref = job_ref._replace(snapshot_id="stale")
+
+        calls = []
+        original_external_job = code_location.client.external_job
+
+        def _external_job(*args, **kwargs):
+            calls.append(args)
+            return original_external_job(*args, **kwargs)
+
+        monkeypatch.setattr(code_location.client, "external_job", _external_job)
+
+        sync_get_external_job_data_grpc(
+            code_location.client, repository_origin, stale_job_ref, snapshot_cache=snapshot_cache
+        )
+        assert len(calls) == 1
+
+        # the live data isn't cached under the stale ref's snapshot id, in memory or on disk...
+        sync_get_external_job_data_grpc(
+            code_location.client, repository_origin, stale_job_ref, snapshot_cache=snapshot_cache
+        )
+        assert len(calls) == 2
+
+        # ...but under the id of the snapshot it holds
+        sync_get_external_job_data_grpc(
+            code_location.client, repository_origin, job_ref, snapshot_cache=snapshot_cache
+        )
+        assert len(calls) == 2
+
+
+def test_job_data_cache_bounded_by_bytes():
+    cache = ExternalJobDataCache(max_bytes=100)
+    job_datas = {name: cast(ExternalJobData, object()) for name in ["a", "b", "c", "d"]}
+
+    cache.set(("repo", "a", "1"), job_datas["a"], 40)
+    cache.set(("repo", "b", "1"), job_datas["b"], 40)
+    assert cache.total_bytes == 80
+
+    # reading "a" makes "b" the least recently used
+    assert cache.get(("repo", "a", "1")) is job_datas["a"]
+    cache.set(("repo", "c", "1"), job_datas["c"], 40)
+    assert cache.get(("repo", "b", "1")) is None
+    assert cache.get(("repo", "a", "1")) is job_datas["a"]
+    assert cache.get(("repo", "c", "1")) is job_datas["c"]
+    assert cache.total_bytes == 80
+
+    # data larger than the cache isn't kept
+    cache.set(("repo", "d", "1"), job_datas["d"], 200)
+    assert cache.get(("repo", "d", "1")) is None
+    assert len(cache) == 2
+
+
+def test_listed_job_snapshots_fetched_in_one_call(deferred_instance, monkeypatch):
+    monkeypatch.setattr(snapshot_job, "_job_data_cache", ExternalJobDataCache(10 * 1024 * 1024))
+
+    with get_bar_repo_code_location(deferred_instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+
+        external_job_calls = []
+        streaming_external_jobs_calls = []
+        original_external_job = code_location.client.external_job
+        original_streaming_external_jobs = code_location.client.streaming_external_jobs
+
+        def _external_job(*args, **kwargs):
+            external_job_calls.append(args)
+            return original_external_job(*args, **kwargs)
+
+        def _streaming_external_jobs(repository_origin, job_names):
+            streaming_external_jobs_calls.append(job_names)
+            return original_streaming_external_jobs(repository_origin, job_names)
+
+        monkeypatch.setattr(code_location.client, "external_job", _external_job)
+        monkeypatch.setattr(
+            code_location.client, "streaming_external_jobs", _streaming_external_jobs
+        )
+
+        # listing jobs doesn't fetch snapshots
+        jobs = repo.get_all_external_jobs()
+        _ = [job.computed_job_snapshot_id for job in jobs]
+        assert len(streaming_external_jobs_calls) == 0
+
+        # reading the snapshot of one listed job fetches those of all the listed jobs at once
+        assert {job.job_snapshot.name for job in jobs} == {job.name for job in jobs}
+        assert len(streaming_external_jobs_calls) == 1
+        assert set(streaming_external_jobs_calls[0]) == {job.name for job in jobs}
+        assert len(external_job_calls) == 0
+        assert len(snapshot_job._job_data_cache) == len(jobs)  # noqa: SLF001
+
+        # listing the jobs again doesn't fetch the snapshots that were already read
+        assert {job.job_snapshot.name for job in repo.get_all_external_jobs()} == {
+            job.name for job in jobs
+        }
+        assert len(streaming_external_jobs_calls) == 1
+
+
+def test_job_snapshots_fetch_error(instance, monkeypatch):
+    monkeypatch.setattr(snapshot_job, "_job_data_cache", ExternalJobDataCache(10 * 1024 * 1024))
+
+    with get_bar_repo_code_location(instance) as code_location:
+        repository_origin = code_location.get_repository("bar_repo").get_external_origin()
+        job_refs = [
+            ExternalJobRef(name=name, snapshot_id=name, active_presets=[], parent_snapshot_id=None)
+            for name in ["foo", "not_a_job"]
+        ]
+
+        with pytest.raises(DagsterUserCodeProcessError, match="not_a_job"):
+            sync_get_external_job_datas_grpc(code_location.client, repository_origin, job_refs)
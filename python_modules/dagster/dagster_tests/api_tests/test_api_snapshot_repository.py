@@ -1,24 +1,34 @@
+import os
 import sys
+import time
 from contextlib import contextmanager
 
 import pytest
 from dagster import job, op, repository
+from dagster._api import snapshot_repository
 from dagster._api.snapshot_repository import (
+    ExternalRepositoryComponentCache,
     sync_get_streaming_external_repositories_data_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation import (
     ExternalRepositoryData,
+    GrpcServerCodeLocationOrigin,
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.host_representation.external import ExternalRepository
 from dagster._core.host_representation.external_data import ExternalJobData
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
+from dagster._core.host_representation.snapshot_cache import (
+    SNAPSHOT_CACHE_DIR_ENV_VAR,
+    SnapshotCache,
+    get_snapshot_cache,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 from .utils import get_bar_repo_code_location
 
@@ -49,6 +59,273 @@ def test_streaming_external_repositories_error(instance):
             sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
 
 
+def test_streaming_external_repository_components(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        external_repository_data = deserialize_value(
+            code_location.client.external_repository(repo_origin), ExternalRepositoryData
+        )
+
+        external_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+        assert serialize_value(external_repo_datas["bar_repo"]) == serialize_value(
+            external_repository_data
+        )
+
+        events = list(code_location.client.streaming_external_repository_components(repo_origin))
+        # one component per job and asset node, plus the rest of the repository data
+        component_hashes = [event["component_hash"] for event in events if event["is_last_chunk"]]
+        assert len(component_hashes) == (
+            len(external_repository_data.external_job_datas)
+            + len(external_repository_data.external_asset_graph_data)
+            + 1
+        )
+
+        # components the client already has are sent without their content
+        unchanged_events = list(
+            code_location.client.streaming_external_repository_components(
+                repo_origin, known_component_hashes=component_hashes[1:]
+            )
+        )
+        assert [event["component_hash"] for event in unchanged_events] == component_hashes
+        assert unchanged_events[0]["serialized_component_chunk"]
+        assert not any(event["serialized_component_chunk"] for event in unchanged_events[1:])
+
+        # loading the repository again reuses the components from the previous load
+        assert serialize_value(
+            sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)[
+                "bar_repo"
+            ]
+        ) == serialize_value(external_repository_data)
+
+
+def test_snapshot_cache(tmp_path, monkeypatch):
+    with instance_for_test(
+        overrides={"snapshot_cache": {"base_dir": str(tmp_path)}}
+    ) as instance, get_bar_repo_code_location(instance) as code_location:
+        snapshot_cache = get_snapshot_cache(instance)
+        assert snapshot_cache and snapshot_cache.base_dir == str(tmp_path)
+
+        monkeypatch.setattr(
+            snapshot_repository, "_component_cache", ExternalRepositoryComponentCache()
+        )
+        external_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location, snapshot_cache=snapshot_cache
+        )["bar_repo"]
+        assert list((tmp_path / "components").iterdir())
+
+        # a process that has nothing in memory loads the unchanged parts from disk
+        monkeypatch.setattr(
+            snapshot_repository, "_component_cache", ExternalRepositoryComponentCache()
+        )
+        events = []
+        streaming_external_repository_components = (
+            code_location.client.streaming_external_repository_components
+        )
+
+        def _record_events(*args, **kwargs):
+            for event in streaming_external_repository_components(*args, **kwargs):
+                events.append(event)
+                yield event
+
+        monkeypatch.setattr(
+            code_location.client, "streaming_external_repository_components", _record_events
+        )
+        assert serialize_value(
+            sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, snapshot_cache=snapshot_cache
+            )["bar_repo"]
+        ) == serialize_value(external_repository_data)
+        assert events
+        assert not any(event["serialized_component_chunk"] for event in events)
+
+
+def test_snapshot_cache_skips_fetch_from_same_server(tmp_path, monkeypatch):
+    with instance_for_test(
+        overrides={"snapshot_cache": {"base_dir": str(tmp_path)}}
+    ) as instance, get_bar_repo_code_location(instance) as code_location:
+        snapshot_cache = get_snapshot_cache(instance)
+        server_id = code_location.server_id
+        assert snapshot_cache and server_id
+
+        monkeypatch.setattr(
+            snapshot_repository, "_component_cache", ExternalRepositoryComponentCache()
+        )
+        external_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client,
+            code_location,
+            snapshot_cache=snapshot_cache,
+            server_id=server_id,
+            fixed_snapshot_repository_names=["bar_repo"],
+        )["bar_repo"]
+
+        calls = []
+        streaming_external_repository_components = (
+            code_location.client.streaming_external_repository_components
+        )
+
+        def _record_calls(*args, **kwargs):
+            calls.append(kwargs)
+            return streaming_external_repository_components(*args, **kwargs)
+
+        monkeypatch.setattr(
+            code_location.client, "streaming_external_repository_components", _record_calls
+        )
+
+        # the same process loading the repository from the same server doesn't call it
+        assert serialize_value(
+            sync_get_streaming_external_repositories_data_grpc(
+                code_location.client,
+                code_location,
+                snapshot_cache=snapshot_cache,
+                server_id=server_id,
+                fixed_snapshot_repository_names=["bar_repo"],
+            )["bar_repo"]
+        ) == serialize_value(external_repository_data)
+        assert not calls
+
+        # neither does a process that has nothing in memory, which loads the parts from disk
+        monkeypatch.setattr(
+            snapshot_repository, "_component_cache", ExternalRepositoryComponentCache()
+        )
+        assert serialize_value(
+            sync_get_streaming_external_repositories_data_grpc(
+                code_location.client,
+                code_location,
+                snapshot_cache=snapshot_cache,
+                server_id=server_id,
+                fixed_snapshot_repository_names=["bar_repo"],
+            )["bar_repo"]
+        ) == serialize_value(external_repository_data)
+        assert not calls
+
+        # another server, another deferred snapshots setting, or a repository whose definitions
+        # aren't fixed may serve another snapshot
+        monkeypatch.setattr(
+            snapshot_repository, "_component_cache", ExternalRepositoryComponentCache()
+        )
+        sync_get_streaming_external_repositories_data_grpc(
+            code_location.client,
+            code_location,
+            snapshot_cache=snapshot_cache,
+            server_id="another_server_id",
+            fixed_snapshot_repository_names=["bar_repo"],
+        )
+        assert len(calls) == 1
+        sync_get_streaming_external_repositories_data_grpc(
+            code_location.client,
+            code_location,
+            defer_snapshots=True,
+            snapshot_cache=snapshot_cache,
+            server_id="another_server_id",
+            fixed_snapshot_repository_names=["bar_repo"],
+        )
+        assert len(calls) == 2
+        sync_get_streaming_external_repositories_data_grpc(
+            code_location.client,
+            code_location,
+            defer_snapshots=True,
+            snapshot_cache=snapshot_cache,
+            server_id="another_server_id",
+        )
+        assert len(calls) == 3
+
+
+def test_snapshot_cache_served_component_hashes(tmp_path):
+    snapshot_cache = SnapshotCache(str(tmp_path))
+    snapshot_cache.set_serialized_component("aaaa", "a")
+    snapshot_cache.set_serialized_component("bbbb", "b")
+
+    snapshot_cache.set_component_hashes("origin", ["aaaa", "bbbb"], "server", False)
+    assert snapshot_cache.get_served_component_hashes("origin", "server", False) == [
+        "aaaa",
+        "bbbb",
+    ]
+    assert snapshot_cache.get_served_component_hashes("origin", "server", True) is None
+    assert snapshot_cache.get_served_component_hashes("origin", "other_server", False) is None
+
+    # the snapshot can't be built from disk once one of its parts is evicted
+    os.unlink(tmp_path / "components" / "aa" / "aaaa")
+    assert snapshot_cache.get_served_component_hashes("origin", "server", False) is None
+    assert snapshot_cache.get_component_hashes("origin") == ["bbbb"]
+
+
+def test_snapshot_cache_component_hashes_by_origin(tmp_path):
+    snapshot_cache = SnapshotCache(str(tmp_path))
+    snapshot_cache.set_serialized_component("aaaa", "a")
+    snapshot_cache.set_serialized_component("bbbb", "b")
+
+    # code servers serving a location of the same name have different origin ids
+    location_origin = GrpcServerCodeLocationOrigin(
+        host="host_a", port=4000, location_name="location"
+    )
+    other_location_origin = GrpcServerCodeLocationOrigin(
+        host="host_b", port=4000, location_name="location"
+    )
+    repository_origin_id = ExternalRepositoryOrigin(location_origin, "repo").get_id()
+    other_repository_origin_id = ExternalRepositoryOrigin(other_location_origin, "repo").get_id()
+
+    snapshot_cache.set_component_hashes(repository_origin_id, ["aaaa"])
+    snapshot_cache.set_component_hashes(other_repository_origin_id, ["bbbb"])
+    assert snapshot_cache.get_component_hashes(repository_origin_id) == ["aaaa"]
+    assert snapshot_cache.get_component_hashes(other_repository_origin_id) == ["bbbb"]
+
+
+def test_snapshot_cache_settings(monkeypatch, tmp_path):
+    monkeypatch.delenv(SNAPSHOT_CACHE_DIR_ENV_VAR, raising=False)
+    with instance_for_test() as instance:
+        assert get_snapshot_cache(instance) is None
+
+    monkeypatch.setenv(SNAPSHOT_CACHE_DIR_ENV_VAR, str(tmp_path / "from_env"))
+    with instance_for_test(
+        overrides={"snapshot_cache": {"max_bytes": 1024, "max_age_seconds": 3600}}
+    ) as instance:
+        snapshot_cache = get_snapshot_cache(instance)
+        assert snapshot_cache
+        assert snapshot_cache.base_dir == str(tmp_path / "from_env")
+        assert snapshot_cache.max_bytes == 1024
+        assert snapshot_cache.max_age_seconds == 3600
+
+    with instance_for_test(overrides={"snapshot_cache": {"base_dir": str(tmp_path)}}) as instance:
+        snapshot_cache = get_snapshot_cache(instance)
+        assert snapshot_cache and snapshot_cache.base_dir == str(tmp_path)
+
+
+def test_snapshot_cache_eviction(tmp_path):
+    snapshot_cache = SnapshotCache(str(tmp_path), max_bytes=300, max_age_seconds=24 * 60 * 60)
+
+    def _set_last_used(component_hash, seconds_ago):
+        last_used = time.time() - seconds_ago
+        path = os.path.join(str(tmp_path), "components", component_hash[:2], component_hash)
+        os.utime(path, (last_used, last_used))
+
+    for component_hash in ["aaaa", "bbbb", "cccc", "dddd"]:
+        snapshot_cache.set_serialized_component(component_hash, component_hash * 25)
+
+    # unused for longer than max_age_seconds
+    _set_last_used("aaaa", 2 * 24 * 60 * 60)
+    # the least recently used while the cache is over max_bytes
+    _set_last_used("bbbb", 2 * 60 * 60)
+    _set_last_used("cccc", 60 * 60)
+    # used too recently to be evicted, even though the cache would still be over max_bytes
+    _set_last_used("dddd", 0)
+    snapshot_cache.set_serialized_component("eeee", "eeee" * 25)
+
+    snapshot_cache.evict()
+    assert not snapshot_cache.has_serialized_component("aaaa")
+    assert not snapshot_cache.has_serialized_component("bbbb")
+    assert snapshot_cache.has_serialized_component("cccc")
+    assert snapshot_cache.has_serialized_component("dddd")
+    assert snapshot_cache.has_serialized_component("eeee")
+
+    # reading a file marks it as used
+    _set_last_used("cccc", 2 * 24 * 60 * 60)
+    assert snapshot_cache.get_serialized_component("cccc") == "cccc" * 25
+    snapshot_cache.evict()
+    assert snapshot_cache.has_serialized_component("cccc")
+
+
 @op
 def do_something():
     return 1
@@ -221,3 +221,65 @@ def test_daily_to_daily_lag_different_start_date():
     assert mapping.get_downstream_partitions_for_partitions(
         subset_with_key(upstream_partitions_def, "2021-05-05"), downstream_partitions_def
     ).get_partition_keys() == ["2021-05-06"]
+
+
+def test_daily_to_daily_different_start_and_end_offsets():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05")
+    mapping = TimeWindowPartitionMapping(start_offset=-2, end_offset=0)
+
+    assert mapping.get_upstream_partitions_for_partitions(
+        subset_with_key(partitions_def, "2021-05-10"), partitions_def
+    ).get_partition_keys() == ["2021-05-08", "2021-05-09", "2021-05-10"]
+
+    assert mapping.get_downstream_partitions_for_partitions(
+        subset_with_key(partitions_def, "2021-05-10"), partitions_def
+    ).get_partition_keys() == ["2021-05-10", "2021-05-11", "2021-05-12"]
+
+    # the windows mapped from nearby partitions overlap, and are counted once
+    result = mapping.get_upstream_partitions_for_partitions(
+        partitions_def.empty_subset().with_partition_keys(
+            ["2021-05-06", "2021-05-08", "2021-05-20"]
+        ),
+        partitions_def,
+    )
+    assert result.get_partition_keys() == [
+        "2021-05-05",
+        "2021-05-06",
+        "2021-05-07",
+        "2021-05-08",
+        "2021-05-18",
+        "2021-05-19",
+        "2021-05-20",
+    ]
+    assert len(result) == 7
+
+
+def test_hourly_to_hourly_offsets_half_hour_dst_transition(monkeypatch):
+    # DST shifts the clocks of Lord Howe Island by 30 minutes, so offsets can't be applied to the
+    # indices of fixed-period windows
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2023-01-01-00:00", timezone="Australia/Lord_Howe"
+    )
+    mapping = TimeWindowPartitionMapping(start_offset=-1, end_offset=0)
+    subset = partitions_def.empty_subset().with_partition_keys(
+        ["2023-03-10-23:00", "2023-06-11-00:00"]
+    )
+
+    upstream_keys = mapping.get_upstream_partitions_for_partitions(
+        subset, partitions_def
+    ).get_partition_keys()
+    assert upstream_keys == [
+        "2023-03-10-22:00",
+        "2023-03-10-23:00",
+        "2023-06-10-23:00",
+        "2023-06-11-00:00",
+    ]
+
+    with monkeypatch.context() as m:
+        m.setattr(TimeWindowPartitionsDefinition, "_get_fixed_period_time_windows", lambda _: None)
+        assert (
+            mapping.get_upstream_partitions_for_partitions(
+                subset, partitions_def
+            ).get_partition_keys()
+            == upstream_keys
+        )
@@ -27,6 +27,7 @@
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.source_asset import SourceAsset
+from dagster._core.errors import DagsterInvalidInvocationError
 from dagster._core.host_representation.external_data import external_asset_graph_from_defs
 from dagster._core.test_utils import instance_for_test
 from dagster._seven.compat.pendulum import create_pendulum_time
@@ -258,6 +259,63 @@ def child(parent):
         }
 
 
+def test_get_child_and_parent_partitions_subsets():
+    partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=partitions_def)
+    def parent():
+        ...
+
+    @asset(partitions_def=partitions_def)
+    def same_partitions_child(parent):
+        ...
+
+    @asset(
+        partitions_def=partitions_def,
+        ins={"parent": AssetIn(partition_mapping=TimeWindowPartitionMapping(start_offset=-1))},
+    )
+    def lagged_child(parent):
+        ...
+
+    @asset
+    def unpartitioned_child(parent):
+        ...
+
+    asset_graph = AssetGraph.from_assets(
+        [parent, same_partitions_child, lagged_child, unpartitioned_child]
+    )
+    parent_subset = partitions_def.subset_with_partition_keys(["2022-01-02", "2022-01-05"])
+
+    assert set(
+        asset_graph.get_child_partitions_subset(
+            MagicMock(), parent.key, parent_subset, same_partitions_child.key
+        ).get_partition_keys()
+    ) == {"2022-01-02", "2022-01-05"}
+    assert set(
+        asset_graph.get_child_partitions_subset(
+            MagicMock(), parent.key, parent_subset, lagged_child.key
+        ).get_partition_keys()
+    ) == {"2022-01-02", "2022-01-03", "2022-01-05", "2022-01-06"}
+    assert set(
+        asset_graph.get_parent_partitions_subset(
+            MagicMock(), lagged_child.key, parent_subset, parent.key
+        ).get_partition_keys()
+    ) == {"2022-01-01", "2022-01-02", "2022-01-04", "2022-01-05"}
+
+    # the per-key methods return the same partitions as the subsets
+    assert asset_graph.get_child_partition_keys_of_parent(
+        MagicMock(), "2022-01-02", parent.key, lagged_child.key
+    ) == ["2022-01-02", "2022-01-03"]
+    assert asset_graph.get_parent_partition_keys_for_child(
+        "2022-01-02", parent.key, lagged_child.key, MagicMock()
+    ) == ["2022-01-01", "2022-01-02"]
+
+    with pytest.raises(DagsterInvalidInvocationError):
+        asset_graph.get_child_partitions_subset(
+            MagicMock(), parent.key, parent_subset, unpartitioned_child.key
+        )
+
+
 def test_required_multi_asset_sets_non_subsettable_multi_asset():
     @multi_asset(outs={"a": AssetOut(dagster_type=None), "b": AssetOut(dagster_type=None)})
     def non_subsettable_multi_asset():
@@ -507,3 +565,120 @@ def include_all(asset_key, partitions_subset):
         )
         == expected_asset_graph_subset
     )
+
+
+def test_bfs_filter_asset_subsets_paths_of_different_lengths():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset0():
+        ...
+
+    @asset(
+        partitions_def=daily_partitions_def,
+        ins={
+            "asset0": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def asset1(asset0):
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset2(asset1):
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset3(asset0, asset2):
+        ...
+
+    asset_graph = AssetGraph.from_assets([asset0, asset1, asset2, asset3])
+
+    initial_subset = daily_partitions_def.subset_with_partition_keys(["2022-01-01"])
+    shifted_subset = daily_partitions_def.subset_with_partition_keys(["2022-01-02"])
+
+    # asset3 is reached directly from asset0 before it's reached through asset1 and asset2, but it
+    # must include the partitions from both paths
+    assert asset_graph.bfs_filter_subsets(
+        dynamic_partitions_store=MagicMock(),
+        initial_subset=AssetGraphSubset(
+            asset_graph, partitions_subsets_by_asset_key={asset0.key: initial_subset}
+        ),
+        condition_fn=lambda asset_key, partitions_subset: True,
+    ) == AssetGraphSubset(
+        asset_graph,
+        partitions_subsets_by_asset_key={
+            asset0.key: initial_subset,
+            asset1.key: shifted_subset,
+            asset2.key: shifted_subset,
+            asset3.key: initial_subset | shifted_subset,
+        },
+    )
+
+
+def test_index():
+    @asset
+    def a():
+        ...
+
+    @asset
+    def b(a):
+        ...
+
+    @asset
+    def c(a):
+        ...
+
+    @asset(non_argument_deps={"source"})
+    def d(b, c):
+        ...
+
+    @asset
+    def e(d):
+        ...
+
+    @asset
+    def f(b):
+        ...
+
+    @asset
+    def unconnected():
+        ...
+
+    source = SourceAsset("source")
+    assets = [a, b, c, d, e, f, unconnected, source]
+
+    def keys(*names):
+        return {AssetKey(name) for name in names}
+
+    for asset_graph in [AssetGraph.from_assets(assets), to_external_asset_graph(assets)]:
+        index = asset_graph.index
+        assert asset_graph.index is index
+
+        assert index.get_ancestors(keys("d")) == keys("a", "b", "c", "source")
+        assert index.get_ancestors(keys("d"), depth=1) == keys("b", "c", "source")
+        assert index.get_ancestors(keys("e", "f")) == keys("a", "b", "c", "d", "source")
+        assert index.get_ancestors(keys("a", "unconnected")) == set()
+        assert index.get_descendants(keys("a")) == keys("b", "c", "d", "e", "f")
+        assert index.get_descendants(keys("a"), depth=2) == keys("b", "c", "d", "f")
+        assert index.get_descendants(keys("c", "f"), depth=0) == set()
+        assert index.get_descendants(keys("source")) == keys("d", "e")
+
+        assert index.get_roots(keys("b", "c", "d", "e", "f")) == keys("b", "c")
+        assert index.get_sinks(keys("a", "b", "c", "d")) == keys("d")
+        assert index.get_sinks(keys("a", "c", "f")) == keys("c", "f")
+
+        for level, asset_keys in enumerate(asset_graph.toposort_asset_keys()):
+            for asset_key in asset_keys:
+                assert index.get_level(asset_key) == level
+
+        for asset_key in asset_graph.all_asset_keys:
+            for parent_key in asset_graph.get_parents(asset_key):
+                assert index.get_position(parent_key) < index.get_position(asset_key)
+
+        assert asset_graph.root_asset_keys == keys("a", "unconnected")
+        assert asset_graph.get_non_source_roots(AssetKey("e")) == keys("a")
+        assert set(asset_graph.upstream_key_iterator(AssetKey("e"))) == keys(
+            "a", "b", "c", "d", "source"
+        )
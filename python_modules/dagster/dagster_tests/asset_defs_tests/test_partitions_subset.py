@@ -1,11 +1,23 @@
+import json
+
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
-from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionKey,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import BitmapPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsSubset,
 )
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+)
+from dagster._core.test_utils import instance_for_test
 
 
 def test_default_subset_cannot_deserialize_invalid_version():
@@ -75,6 +87,230 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(composite.empty_subset()) is MultiPartitionsSubset
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(composite.empty_subset()) is BitmapPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+def test_empty_subsets_without_partition_key_index():
+    duplicate_key_partitions = StaticPartitionsDefinition(["a", "b", "a"])
+    assert type(duplicate_key_partitions.empty_subset()) is DefaultPartitionsSubset
+
+    static_composite = MultiPartitionsDefinition(
+        {"abc": static_partitions, "xy": StaticPartitionsDefinition(["x", "y"])}
+    )
+    assert type(static_composite.empty_subset()) is BitmapPartitionsSubset
+
+
+def test_bitmap_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(1000)])
+    evens = partitions_def.empty_subset().with_partition_keys(str(i) for i in range(0, 1000, 2))
+    first_half = partitions_def.empty_subset().with_partition_key_range(
+        PartitionKeyRange("0", "499")
+    )
+
+    assert len(evens) == 500
+    assert len(first_half) == 500
+    assert "2" in evens and "3" not in evens and "1000" not in evens
+
+    assert (evens | first_half).get_partition_keys() == {str(i) for i in range(1000)} - {
+        str(i) for i in range(501, 1000, 2)
+    }
+    assert (evens & first_half).get_partition_keys() == {str(i) for i in range(0, 500, 2)}
+    assert (evens - first_half).get_partition_keys() == {str(i) for i in range(500, 1000, 2)}
+    assert set(evens.get_partition_keys_not_in_subset()) == {str(i) for i in range(1, 1000, 2)}
+    assert first_half.get_partition_key_ranges() == [PartitionKeyRange("0", "499")]
+
+    # set operations with subsets of other representations
+    default_subset = DefaultPartitionsSubset(partitions_def, {"1", "2"})
+    assert (evens | default_subset).get_partition_keys() == evens.get_partition_keys() | {"1"}
+    assert (evens & default_subset).get_partition_keys() == {"2"}
+    assert (evens - default_subset).get_partition_keys() == evens.get_partition_keys() - {"2"}
+    assert partitions_def.empty_subset().with_partition_keys(["1", "2"]) == default_subset
+    assert default_subset == partitions_def.empty_subset().with_partition_keys(["1", "2"])
+
+
+def test_bitmap_subset_unindexed_keys():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+    subset = partitions_def.empty_subset().with_partition_keys(["a", "removed"])
+    assert subset.get_partition_keys() == {"a", "removed"}
+    assert "removed" in subset
+    assert len(subset) == 2
+    assert set(subset.get_partition_keys_not_in_subset()) == {"b", "c"}
+    assert subset.get_partition_key_ranges() == [PartitionKeyRange("a", "a")]
+
+    deserialized = partitions_def.deserialize_subset(subset.serialize())
+    assert deserialized == subset
+    assert (deserialized - subset).get_partition_keys() == set()
+
+
+def test_bitmap_subset_serialization():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(100)])
+    subset = partitions_def.empty_subset().with_partition_keys(
+        ["99", "50", "removed"] + [str(i) for i in range(10, 20)]
+    )
+    serialized = subset.serialize()
+    data = json.loads(serialized)
+    assert data["version"] == BitmapPartitionsSubset.SERIALIZATION_VERSION
+    assert data["num_partitions"] == 100
+    assert data["ranges"] == [[10, 19], [50, 50], [99, 99]]
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.can_deserialize_subset(serialized, None, "StaticPartitionsDefinition")
+    assert not partitions_def.can_deserialize_subset(serialized, None, "DailyPartitionsDefinition")
+    assert partitions_def.deserialize_subset(serialized) == subset
+
+    class NewSerializationVersionSubset(BitmapPartitionsSubset):
+        SERIALIZATION_VERSION = -1
+
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="version 2"):
+        NewSerializationVersionSubset.from_serialized(partitions_def, serialized)
+
+
+def test_bitmap_subset_serialization_is_compact():
+    partitions_def = StaticPartitionsDefinition([f"key_{i}" for i in range(100_000)])
+    subset = partitions_def.empty_subset().with_partition_key_range(
+        PartitionKeyRange("key_0", "key_49999")
+    )
+    assert len(subset.serialize()) < 200
+
+    legacy_serialized = DefaultPartitionsSubset(
+        partitions_def, set(subset.get_partition_keys())
+    ).serialize()
+    assert len(legacy_serialized) > 500_000
+    assert partitions_def.deserialize_subset(legacy_serialized) == subset
+
+
+def test_bitmap_subset_serialization_changed_keys():
+    serialized = (
+        StaticPartitionsDefinition(["a", "b", "c"])
+        .subset_with_partition_keys(["a", "c"])
+        .serialize()
+    )
+
+    # positions can be read back after keys are appended to the definition
+    appended_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    assert appended_partitions_def.can_deserialize_subset(
+        serialized, None, "StaticPartitionsDefinition"
+    )
+    assert appended_partitions_def.deserialize_subset(serialized).get_partition_keys() == {
+        "a",
+        "c",
+    }
+
+    # but not after keys are removed, renamed or reordered
+    for partition_keys in [["x", "a", "c"], ["c", "b", "a"], ["a", "b"]]:
+        other_partitions_def = StaticPartitionsDefinition(partition_keys)
+        assert not other_partitions_def.can_deserialize_subset(
+            serialized, None, "StaticPartitionsDefinition"
+        )
+        with pytest.raises(DagsterDefinitionChangedDeserializationError):
+            other_partitions_def.deserialize_subset(serialized)
+
+    # subsets serialized as lists of keys can be deserialized against any keys
+    for legacy_serialized in [json.dumps(["a"]), json.dumps({"version": 1, "subset": ["a"]})]:
+        other_partitions_def = StaticPartitionsDefinition(["x", "a", "c"])
+        assert other_partitions_def.can_deserialize_subset(
+            legacy_serialized, None, "StaticPartitionsDefinition"
+        )
+        assert other_partitions_def.deserialize_subset(legacy_serialized).get_partition_keys() == {
+            "a"
+        }
+
+
+def test_multi_partitions_bitmap_subset():
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "abc": StaticPartitionsDefinition(["a", "b", "c"]),
+            "num": StaticPartitionsDefinition([str(i) for i in range(1000)]),
+        }
+    )
+    subset = partitions_def.empty_subset().with_partition_keys(
+        [MultiPartitionKey({"abc": "b", "num": str(i)}) for i in range(1000)] + ["c|5", "a", "d|1"]
+    )
+    # keys that aren't multi-partition keys are dropped, like in MultiPartitionsSubset
+    assert len(subset) == 1002
+    assert "b|999" in subset and "c|5" in subset and "d|1" in subset and "a|5" not in subset
+    assert all(isinstance(key, MultiPartitionKey) for key in subset.get_partition_keys())
+    assert subset.get_partition_key_ranges() == [
+        PartitionKeyRange("b|0", "b|999"),
+        PartitionKeyRange("c|5", "c|5"),
+    ]
+    assert set(subset.get_partition_keys_not_in_subset()) == set(
+        partitions_def.get_partition_keys()
+    ) - subset.get_partition_keys() - {"d|1"}
+
+    deserialized = partitions_def.deserialize_subset(subset.serialize())
+    assert deserialized == subset
+    assert deserialized.get_partition_keys() == subset.get_partition_keys()
+
+    # subsets serialized as MultiPartitionsSubsets can still be deserialized
+    legacy_serialized = json.dumps({"version": 1, "subset": ["a|1", "c|2"]})
+    assert partitions_def.deserialize_subset(legacy_serialized).get_partition_keys() == {
+        "a|1",
+        "c|2",
+    }
+
+
+def test_dynamic_partitions_bitmap_subset():
+    partitions_def = DynamicPartitionsDefinition(name="customers")
+    assert type(partitions_def.empty_subset()) is BitmapPartitionsSubset
+
+    with instance_for_test() as instance:
+        instance.add_dynamic_partitions("customers", [str(i) for i in range(1000)])
+
+        evens = partitions_def.empty_subset().with_partition_keys(str(i) for i in range(0, 1000, 2))
+        # subsets of definitions loaded separately share the positions of their keys
+        first_half = (
+            DynamicPartitionsDefinition(name="customers")
+            .empty_subset()
+            .with_partition_key_range(
+                PartitionKeyRange("0", "499"), dynamic_partitions_store=instance
+            )
+        )
+        assert len(first_half) == 500
+        assert "2" in evens and "3" not in evens
+
+        assert (evens & first_half).get_partition_keys() == {str(i) for i in range(0, 500, 2)}
+        assert (evens - first_half).get_partition_keys() == {str(i) for i in range(500, 1000, 2)}
+        assert len(evens | first_half) == 750
+        assert set(evens.get_partition_keys_not_in_subset(dynamic_partitions_store=instance)) == {
+            str(i) for i in range(1, 1000, 2)
+        }
+        assert first_half.get_partition_key_ranges(dynamic_partitions_store=instance) == [
+            PartitionKeyRange("0", "499")
+        ]
+
+        serialized = evens.serialize()
+        assert "ranges" not in json.loads(serialized)
+        assert partitions_def.can_deserialize_subset(
+            serialized, None, "DynamicPartitionsDefinition"
+        )
+        assert partitions_def.deserialize_subset(serialized) == evens
+
+        # subsets serialized as lists of keys can still be deserialized
+        legacy_serialized = DefaultPartitionsSubset(partitions_def, {"1", "2"}).serialize()
+        assert partitions_def.deserialize_subset(legacy_serialized).get_partition_keys() == {
+            "1",
+            "2",
+        }
+
+
+def test_multi_partitions_with_time_dimension_bitmap_subset():
+    subset = composite.empty_subset().with_partition_keys(
+        [MultiPartitionKey({"abc": "a", "date": "2021-05-05"}), "b|2021-05-06", "c"]
+    )
+    # keys that aren't multi-partition keys are dropped, like in MultiPartitionsSubset
+    assert subset.get_partition_keys() == {"a|2021-05-05", "b|2021-05-06"}
+    assert all(isinstance(key, MultiPartitionKey) for key in subset.get_partition_keys())
+
+    other = composite.empty_subset().with_partition_keys(["b|2021-05-06", "c|2021-05-07"])
+    assert (subset | other).get_partition_keys() == {
+        "a|2021-05-05",
+        "b|2021-05-06",
+        "c|2021-05-07",
+    }
+    assert (subset - other).get_partition_keys() == {"a|2021-05-05"}
+
+    deserialized = composite.deserialize_subset(subset.serialize())
+    assert deserialized == subset
+    assert all(isinstance(key, MultiPartitionKey) for key in deserialized.get_partition_keys())
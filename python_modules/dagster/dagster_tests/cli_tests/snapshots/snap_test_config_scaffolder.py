@@ -36,7 +36,11 @@
                     }
                 },
                 'tag_concurrency_limits': [
-                ]
+                ],
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0
+                }
             }
         }
     },
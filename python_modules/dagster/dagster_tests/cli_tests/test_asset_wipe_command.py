@@ -2,8 +2,20 @@
 
 import pytest
 from click.testing import CliRunner
-from dagster import AssetKey, AssetMaterialization, Output, job, op
-from dagster._cli.asset import asset_wipe_cache_command, asset_wipe_command
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    Output,
+    StaticPartitionsDefinition,
+    file_relative_path,
+    job,
+    op,
+)
+from dagster._cli.asset import (
+    asset_rebuild_cache_command,
+    asset_wipe_cache_command,
+    asset_wipe_command,
+)
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.test_utils import instance_for_test
 from dagster._seven import json
@@ -39,6 +51,17 @@ def op_normalization(_):
     yield Output(1)
 
 
+@op
+def op_partition_one(_):
+    yield AssetMaterialization(asset_key=AssetKey("partitioned_asset"), partition="one")
+    yield Output(1)
+
+
+@job
+def job_partition_one():
+    op_partition_one()
+
+
 @job
 def job_one():
     op_one()
@@ -218,3 +241,29 @@ def test_asset_wipe_all_cache_status_values(instance_runner):
     records = list(instance.get_asset_records())
     for record in records:
         assert record.asset_entry.cached_status is None
+
+
+def test_asset_rebuild_cache(instance_runner):
+    instance, runner = instance_runner
+    partitioned_asset_key = AssetKey("partitioned_asset")
+    job_partition_one.execute_in_process(instance=instance)
+    dummy_cache_value = AssetStatusCacheValue(1, "foo", "bar")
+    instance.update_asset_cached_status_data(partitioned_asset_key, dummy_cache_value)
+
+    result = runner.invoke(
+        asset_rebuild_cache_command,
+        [
+            "-f",
+            file_relative_path(__file__, "command_tests/assets.py"),
+            "--select",
+            "partitioned_asset",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Rebuilt the partitions status cache for 1 assets" in result.output
+
+    cached_status = _get_cached_status_for_asset(instance, partitioned_asset_key)
+    assert cached_status != dummy_cache_value
+    assert cached_status.deserialize_materialized_partition_subsets(
+        StaticPartitionsDefinition(["one", "two", "three"])
+    ).get_partition_keys() == {"one"}
@@ -1,4 +1,5 @@
 import re
+import time
 from typing import Any, Mapping, Optional
 
 import pytest
@@ -20,6 +21,7 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -31,6 +33,7 @@
     create_job_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
     _runs_directory,
@@ -504,6 +507,107 @@ def test_cancellation_thread():
         assert instance.cancellation_thread_poll_interval_seconds == 10
 
 
+def test_event_log_batching():
+    @op
+    def log_op(context):
+        for i in range(10):
+            context.log.info(f"message {i}")
+
+    @job
+    def log_job():
+        log_op()
+
+    with instance_for_test() as unbatched_instance:
+        unbatched_result = log_job.execute_in_process(instance=unbatched_instance)
+        num_events = len(unbatched_instance.get_records_for_run(unbatched_result.run_id).records)
+
+    with instance_for_test(
+        overrides={
+            "event_log_batching": {"enabled": True, "flush_size": 5, "flush_interval_seconds": 60}
+        }
+    ) as instance:
+        assert instance.event_log_batching_enabled
+        assert instance.event_log_batching_flush_size == 5
+
+        result = log_job.execute_in_process(instance=instance)
+        assert result.success
+        assert instance.get_run_by_id(result.run_id).status == DagsterRunStatus.SUCCESS
+
+        records = instance.get_records_for_run(result.run_id).records
+        assert len(records) == num_events
+        assert [record.storage_id for record in records] == sorted(
+            record.storage_id for record in records
+        )
+
+        # events are buffered until the flush size is reached or the buffer is flushed
+        run = create_run_for_test(instance)
+        instance.report_engine_event("buffered", run)
+        assert len(instance.get_records_for_run(run.run_id).records) == 0
+        instance.flush_event_buffer()
+        assert len(instance.get_records_for_run(run.run_id).records) == 1
+
+
+def test_event_log_batching_flushes_quiet_buffer():
+    with instance_for_test(
+        overrides={
+            "event_log_batching": {
+                "enabled": True,
+                "flush_size": 100,
+                "flush_interval_seconds": 0.1,
+            }
+        }
+    ) as instance:
+        run = create_run_for_test(instance)
+        instance.report_engine_event("buffered", run)
+
+        # no further events are emitted, so the buffer is flushed once its interval elapses
+        start = time.time()
+        while not instance.get_records_for_run(run.run_id).records:
+            assert time.time() - start < 10, "buffered event was never flushed"
+            time.sleep(0.05)
+
+
+def test_event_log_write_behind():
+    @op
+    def log_op(context):
+        for i in range(10):
+            context.log.info(f"message {i}")
+
+    @job
+    def log_job():
+        log_op()
+
+    with instance_for_test(
+        overrides={
+            "event_log_batching": {
+                "enabled": True,
+                "write_behind": True,
+                "flush_size": 5,
+                "max_queue_size": 20,
+            }
+        }
+    ) as instance:
+        assert instance.event_log_write_behind_enabled
+        assert instance.event_log_writer_metrics is None
+
+        result = log_job.execute_in_process(instance=instance)
+        assert result.success
+        assert instance.get_run_by_id(result.run_id).status == DagsterRunStatus.SUCCESS
+
+        # everything emitted before the run success event was flushed before it was recorded
+        records = instance.get_records_for_run(result.run_id).records
+        assert records[-1].event_log_entry.dagster_event_type == DagsterEventType.RUN_SUCCESS
+        assert (
+            len([record for record in records if not record.event_log_entry.is_dagster_event]) == 10
+        )
+
+        metrics = instance.event_log_writer_metrics
+        assert metrics
+        assert metrics.queue_depth == 0
+        assert metrics.events_written > 0
+        assert metrics.max_queue_depth <= 20
+
+
 def test_dagster_home_not_set():
     with environ({"DAGSTER_HOME": ""}):
         with pytest.raises(
@@ -186,7 +186,7 @@
             "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
           ]
         },
-        "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+        "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -194,31 +194,31 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-              "description": "Execute all steps in a single process.",
+              "default_value_as_json_str": "{}",
+              "description": null,
               "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+              "name": "disabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": "Execute each step in an individual process.",
+              "default_value_as_json_str": "{}",
+              "description": null,
               "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+              "name": "enabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             }
           ],
           "given_name": null,
-          "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+          "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+        "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -226,24 +226,24 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
+              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "description": "Execute all steps in a single process.",
               "is_required": false,
-              "name": "disabled",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "in_process",
+              "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": "Execute each step in an individual process.",
               "is_required": false,
-              "name": "enabled",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "multiprocess",
+              "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
             }
           ],
           "given_name": null,
-          "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+          "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -707,7 +707,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+        "Shape.506e409f76a04cd7d983516c3405abccea94d63b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -715,42 +715,42 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "0",
-              "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+              "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+              "description": "Configure how steps are executed within a run.",
               "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
+              "name": "execution",
+              "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
-              "description": "Whether retries are enabled or not. By default, retries are enabled.",
+              "default_value_as_json_str": "{}",
+              "description": "Configure how loggers emit messages within a run.",
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "loggers",
+              "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"foo_op\\": {}}",
+              "description": "Configure runtime parameters for ops or assets.",
               "is_required": false,
-              "name": "start_method",
-              "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+              "name": "ops",
+              "type_key": "Shape.60df2c49e5b0539ee28b520840462e1318fb3af1"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
+              "description": "Configure how shared resources are implemented within a run.",
               "is_required": false,
-              "name": "tag_concurrency_limits",
-              "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+              "name": "resources",
+              "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
             }
           ],
           "given_name": null,
-          "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+          "key": "Shape.506e409f76a04cd7d983516c3405abccea94d63b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -780,6 +780,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -803,7 +826,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.c316d36ab5bb3060e272fa4bc6858cd6aad80613": {
+        "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -811,42 +834,51 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-              "description": "Configure how steps are executed within a run.",
+              "default_value_as_json_str": "0",
+              "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
               "is_required": false,
-              "name": "execution",
-              "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+              "name": "max_concurrent",
+              "type_key": "Int"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": "Configure how loggers emit messages within a run.",
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": "Whether retries are enabled or not. By default, retries are enabled.",
               "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"foo_op\\": {}}",
-              "description": "Configure runtime parameters for ops or assets.",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
               "is_required": false,
-              "name": "ops",
-              "type_key": "Shape.60df2c49e5b0539ee28b520840462e1318fb3af1"
+              "name": "start_method",
+              "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
-              "description": "Configure how shared resources are implemented within a run.",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
               "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+              "name": "tag_concurrency_limits",
+              "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
             }
           ],
           "given_name": null,
-          "key": "Shape.c316d36ab5bb3060e272fa4bc6858cd6aad80613",
+          "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -866,7 +898,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+        "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -875,37 +907,46 @@
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
               "default_value_as_json_str": null,
-              "description": null,
+              "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
               "is_required": false,
-              "name": "console",
-              "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+              "name": "max_steps_per_worker",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+              "is_required": false,
+              "name": "max_worker_memory_mb",
+              "type_key": "Int"
             }
           ],
           "given_name": null,
-          "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+          "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+        "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+              "name": "console",
+              "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
             }
           ],
           "given_name": null,
-          "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+          "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1071,7 +1112,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.c316d36ab5bb3060e272fa4bc6858cd6aad80613"
+        "root_config_key": "Shape.506e409f76a04cd7d983516c3405abccea94d63b"
       }
     ],
     "name": "foo_job",
@@ -1317,7 +1358,7 @@
                 "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
               ]
             },
-            "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1325,31 +1366,31 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-                  "description": "Execute all steps in a single process.",
+                  "default_value_as_json_str": "{}",
+                  "description": null,
                   "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+                  "name": "disabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": "Execute each step in an individual process.",
+                  "default_value_as_json_str": "{}",
+                  "description": null,
                   "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+                  "name": "enabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 }
               ],
               "given_name": null,
-              "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+            "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1357,24 +1398,24 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
+                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "description": "Execute all steps in a single process.",
                   "is_required": false,
-                  "name": "disabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "in_process",
+                  "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "description": "Execute each step in an individual process.",
                   "is_required": false,
-                  "name": "enabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "multiprocess",
+                  "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
                 }
               ],
               "given_name": null,
-              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+              "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -1838,7 +1879,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+            "Shape.506e409f76a04cd7d983516c3405abccea94d63b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1846,42 +1887,42 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+                  "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+                  "description": "Configure how steps are executed within a run.",
                   "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
+                  "name": "execution",
+                  "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
-                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
+                  "default_value_as_json_str": "{}",
+                  "description": "Configure how loggers emit messages within a run.",
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "loggers",
+                  "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"foo_op\\": {}}",
+                  "description": "Configure runtime parameters for ops or assets.",
                   "is_required": false,
-                  "name": "start_method",
-                  "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+                  "name": "ops",
+                  "type_key": "Shape.60df2c49e5b0539ee28b520840462e1318fb3af1"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
+                  "description": "Configure how shared resources are implemented within a run.",
                   "is_required": false,
-                  "name": "tag_concurrency_limits",
-                  "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+                  "name": "resources",
+                  "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
                 }
               ],
               "given_name": null,
-              "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+              "key": "Shape.506e409f76a04cd7d983516c3405abccea94d63b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1911,6 +1952,29 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1934,7 +1998,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.c316d36ab5bb3060e272fa4bc6858cd6aad80613": {
+            "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1942,42 +2006,51 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-                  "description": "Configure how steps are executed within a run.",
+                  "default_value_as_json_str": "0",
+                  "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
                   "is_required": false,
-                  "name": "execution",
-                  "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+                  "name": "max_concurrent",
+                  "type_key": "Int"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": "Configure how loggers emit messages within a run.",
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
                   "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"foo_op\\": {}}",
-                  "description": "Configure runtime parameters for ops or assets.",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
                   "is_required": false,
-                  "name": "ops",
-                  "type_key": "Shape.60df2c49e5b0539ee28b520840462e1318fb3af1"
+                  "name": "start_method",
+                  "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
-                  "description": "Configure how shared resources are implemented within a run.",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
                   "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+                  "name": "tag_concurrency_limits",
+                  "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
                 }
               ],
               "given_name": null,
-              "key": "Shape.c316d36ab5bb3060e272fa4bc6858cd6aad80613",
+              "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1997,7 +2070,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+            "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2006,37 +2079,46 @@
                   "__class__": "ConfigFieldSnap",
                   "default_provided": false,
                   "default_value_as_json_str": null,
-                  "description": null,
+                  "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
                   "is_required": false,
-                  "name": "console",
-                  "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+                  "name": "max_steps_per_worker",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+                  "is_required": false,
+                  "name": "max_worker_memory_mb",
+                  "type_key": "Int"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+              "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+            "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+                  "name": "console",
+                  "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
                 }
               ],
               "given_name": null,
-              "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+              "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2202,7 +2284,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.c316d36ab5bb3060e272fa4bc6858cd6aad80613"
+            "root_config_key": "Shape.506e409f76a04cd7d983516c3405abccea94d63b"
           }
         ],
         "name": "foo_job",
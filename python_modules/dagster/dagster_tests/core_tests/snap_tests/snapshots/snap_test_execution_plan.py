@@ -21,7 +21,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "ee8de04ca32fa0656a0c040f0e503a5851dc8b8c",
+  "pipeline_snapshot_id": "a6b5ccda0d57f84ca364ca8354591e4a50441079",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "op_one",
@@ -157,7 +157,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "0b967d368d23e3e2d71555cf3afa343548a291fd",
+  "pipeline_snapshot_id": "270b3b9795cc0a1ce779d4d211b5ad0910e16896",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -221,7 +221,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "25ab027dd42414ee540dfba3020f90ff4c0c6196",
+  "pipeline_snapshot_id": "6b694dc078cc9ac89dfaae5bc387f82513fd033c",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -299,7 +299,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "10446802a7b75c5c4da33361665a159f9a70215b",
+  "pipeline_snapshot_id": "6044cc26aeaebea297d546deeb9649ca90fab2f5",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
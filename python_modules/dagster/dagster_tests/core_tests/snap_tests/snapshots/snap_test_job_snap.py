@@ -180,7 +180,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -188,31 +188,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -220,24 +220,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -701,7 +701,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Any"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -741,40 +787,26 @@
             "is_required": false,
             "name": "tag_concurrency_limits",
             "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "worker_pool",
+            "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.8e365c9c613acebd35b89385172f1d8b2c3dafa8": {
+      "Shape.94f3fac02390dadc673a649556bea860c80c02db": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -786,7 +818,7 @@
             "description": "Configure how steps are executed within a run.",
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+            "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -817,7 +849,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.8e365c9c613acebd35b89385172f1d8b2c3dafa8",
+        "key": "Shape.94f3fac02390dadc673a649556bea860c80c02db",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -878,7 +910,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -887,37 +919,46 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+            "is_required": false,
+            "name": "max_worker_memory_mb",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1125,7 +1166,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.8e365c9c613acebd35b89385172f1d8b2c3dafa8"
+      "root_config_key": "Shape.94f3fac02390dadc673a649556bea860c80c02db"
     }
   ],
   "name": "single_dep_job",
@@ -1199,7 +1240,7 @@
   "tags": {}
 }'''
 
-snapshots['test_basic_dep_fan_out 2'] = 'e62cb2139a840cbbab80c98e59fab64e3c383cbf'
+snapshots['test_basic_dep_fan_out 2'] = '55352255e254244bdf2bc108927cbca23e88f0e6'
 
 snapshots['test_basic_fan_in 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -1374,7 +1415,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1382,31 +1423,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1414,24 +1455,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -1895,7 +1936,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1903,42 +1944,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "config",
+            "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2009,7 +2023,66 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d3e8f70cd06d35bfe63e246f97b25cc8231dfe5a": {
+      "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.d2d8e9911ff7103e6746d98388956e2544d210e7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2021,7 +2094,7 @@
             "description": "Configure how steps are executed within a run.",
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+            "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -2052,7 +2125,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.d3e8f70cd06d35bfe63e246f97b25cc8231dfe5a",
+        "key": "Shape.d2d8e9911ff7103e6746d98388956e2544d210e7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2072,7 +2145,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2081,37 +2154,46 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+            "is_required": false,
+            "name": "max_worker_memory_mb",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2311,7 +2393,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.d3e8f70cd06d35bfe63e246f97b25cc8231dfe5a"
+      "root_config_key": "Shape.d2d8e9911ff7103e6746d98388956e2544d210e7"
     }
   ],
   "name": "fan_in_test",
@@ -2385,7 +2467,7 @@
   "tags": {}
 }'''
 
-snapshots['test_basic_fan_in 2'] = '5c617079c2edfa51b72be2fe78ae9bcda99fce41'
+snapshots['test_basic_fan_in 2'] = '7ee538e6fcbe90c76812e3581ac507b04ddcf9c7'
 
 snapshots['test_deserialize_node_def_snaps_multi_type_config 1'] = '''{
   "__class__": "ConfigTypeSnap",
@@ -2593,7 +2675,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2601,31 +2683,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2633,24 +2715,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -3059,6 +3141,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_op\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -3137,7 +3269,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3145,42 +3277,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "config",
+            "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3210,7 +3315,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba51206ea43d22347f91c6a5da765403a6eee445": {
+      "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3218,42 +3323,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_op\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
             "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445",
+        "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3273,7 +3387,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3282,37 +3396,46 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+            "is_required": false,
+            "name": "max_worker_memory_mb",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3478,7 +3601,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445"
+      "root_config_key": "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4"
     }
   ],
   "name": "noop_job",
@@ -3518,7 +3641,7 @@
   "tags": {}
 }'''
 
-snapshots['test_empty_job_snap_props 2'] = '0b967d368d23e3e2d71555cf3afa343548a291fd'
+snapshots['test_empty_job_snap_props 2'] = '270b3b9795cc0a1ce779d4d211b5ad0910e16896'
 
 snapshots['test_empty_job_snap_snapshot 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -3693,7 +3816,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3701,31 +3824,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3733,24 +3856,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -4159,39 +4282,89 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+      "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_op\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "key": "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
+      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4237,7 +4410,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4245,42 +4418,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "config",
+            "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4310,7 +4456,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba51206ea43d22347f91c6a5da765403a6eee445": {
+      "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4318,42 +4464,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_op\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
             "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445",
+        "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4373,7 +4528,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4382,37 +4537,46 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+            "is_required": false,
+            "name": "max_worker_memory_mb",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4578,7 +4742,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445"
+      "root_config_key": "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4"
     }
   ],
   "name": "noop_job",
@@ -4791,7 +4955,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4799,31 +4963,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4831,24 +4995,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -5257,6 +5421,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_op\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5335,7 +5549,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5343,42 +5557,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "config",
+            "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5408,7 +5595,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba51206ea43d22347f91c6a5da765403a6eee445": {
+      "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5416,42 +5603,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_op\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
             "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445",
+        "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5471,7 +5667,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5480,37 +5676,46 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+            "is_required": false,
+            "name": "max_worker_memory_mb",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5676,7 +5881,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445"
+      "root_config_key": "Shape.31b8b071c98c83149b6d1c6531a0a4db13364cc4"
     }
   ],
   "name": "noop_job",
@@ -5718,7 +5923,7 @@
   }
 }'''
 
-snapshots['test_job_snap_all_props 2'] = '51b4a064c71fdf1a2efdba2c8fae3930c1067d55'
+snapshots['test_job_snap_all_props 2'] = 'cf9a9fbcfcb346b528faff99cae1bbfd93022b39'
 
 snapshots['test_multi_type_config_array_dict_fields[Permissive] 1'] = '''{
   "__class__": "ConfigTypeSnap",
@@ -6101,7 +6306,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6109,31 +6314,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3367425990ef17401227ed9eea48165506c00c5a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6141,24 +6346,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3367425990ef17401227ed9eea48165506c00c5a",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -6622,7 +6827,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6630,42 +6835,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "config",
+            "type_key": "Selector.3367425990ef17401227ed9eea48165506c00c5a"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6695,7 +6873,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.a5a68088e42f4b99cc993bae2b87b445310de808": {
+      "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6703,31 +6881,58 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "one",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "two",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes, which each load the job once, instead of starting a new process for each step. Resources are still initialized for each step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805"
           }
         ],
         "given_name": null,
-        "key": "Shape.a5a68088e42f4b99cc993bae2b87b445310de808",
+        "key": "Shape.8e0f4548f847c2b39d2606e85e002108970f46c7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d57a1ccc1c9dc433e9c44c202b06fdca8c0a8655": {
+      "Shape.95e022dcd1e9662c9d7b76816f9bdf4a180b58ad": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6739,7 +6944,7 @@
             "description": "Configure how steps are executed within a run.",
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
+            "type_key": "Shape.6c17300d72b8fab140ebce5f2b391f5a6695e3b2"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -6770,7 +6975,39 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.d57a1ccc1c9dc433e9c44c202b06fdca8c0a8655",
+        "key": "Shape.95e022dcd1e9662c9d7b76816f9bdf4a180b58ad",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.a5a68088e42f4b99cc993bae2b87b445310de808": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "one",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "two",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.a5a68088e42f4b99cc993bae2b87b445310de808",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6790,7 +7027,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6799,37 +7036,46 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The number of steps that a worker process executes before it is replaced with a new one. By default, workers are not replaced.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after a step once its peak memory usage exceeds this many megabytes. Not supported on Windows.",
+            "is_required": false,
+            "name": "max_worker_memory_mb",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.e33b05a4d9806d45368f5e22bc2ff64baed7b805",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -7003,7 +7249,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.d57a1ccc1c9dc433e9c44c202b06fdca8c0a8655"
+      "root_config_key": "Shape.95e022dcd1e9662c9d7b76816f9bdf4a180b58ad"
     }
   ],
   "name": "two_op_job",
@@ -7043,4 +7289,4 @@
   "tags": {}
 }'''
 
-snapshots['test_two_invocations_deps_snap 2'] = 'cdc7278950da2eb13fa513c53731694be0b4704b'
+snapshots['test_two_invocations_deps_snap 2'] = 'ab59cf61190ec9d2ad68867e67fadca40fb081f8'
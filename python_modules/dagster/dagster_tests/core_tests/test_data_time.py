@@ -167,6 +167,68 @@ def f():
                     }
 
 
+def test_get_current_data_time_by_key():
+    @asset
+    def a():
+        return 1
+
+    @asset(non_argument_deps={AssetKey("a")})
+    def b():
+        return 1
+
+    @asset(non_argument_deps={AssetKey("a")})
+    def c():
+        return 1
+
+    @asset(non_argument_deps={AssetKey("b"), AssetKey("c")})
+    def d():
+        return 1
+
+    @asset(non_argument_deps={AssetKey("d")})
+    def e():
+        return 1
+
+    all_assets = [a, b, c, d, e]
+    asset_graph = AssetGraph.from_assets(all_assets)
+    all_keys = [assets_def.key for assets_def in all_assets]
+
+    with DagsterInstance.ephemeral() as instance:
+        for to_materialize in ["abcde", "ab", "d", "a"]:
+            assert materialize_to_memory(
+                [
+                    assets_def
+                    for assets_def in all_assets
+                    if assets_def.key.path[0] in to_materialize
+                ],
+                instance=instance,
+            ).success
+
+        evaluation_time = pendulum.now("UTC")
+        expected_data_time_by_key = {
+            key: CachingDataTimeResolver(
+                instance_queryer=CachingInstanceQueryer(instance), asset_graph=asset_graph
+            ).get_current_data_time(key, current_time=evaluation_time)
+            for key in all_keys
+        }
+        assert expected_data_time_by_key[AssetKey("a")] != expected_data_time_by_key[AssetKey("d")]
+
+        data_time_resolver = CachingDataTimeResolver(
+            instance_queryer=CachingInstanceQueryer(instance), asset_graph=asset_graph
+        )
+        with mock.patch.object(
+            instance, "get_asset_records", wraps=instance.get_asset_records
+        ) as get_asset_records:
+            assert data_time_resolver.get_current_data_time_by_key(
+                [AssetKey("d"), AssetKey("e")], evaluation_time
+            ) == {key: expected_data_time_by_key[key] for key in [AssetKey("d"), AssetKey("e")]}
+            assert (
+                data_time_resolver.get_current_data_time_by_key(all_keys, evaluation_time)
+                == expected_data_time_by_key
+            )
+            # the latest materializations of all the assets are fetched together, once
+            assert get_asset_records.call_count == 1
+
+
 @asset(partitions_def=DailyPartitionsDefinition(start_date="2023-01-01"))
 def partitioned_asset():
     pass
@@ -2,7 +2,7 @@
 import string
 import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from unittest import mock
 
@@ -54,6 +54,7 @@
     DynamicPartitionsRequestResult,
     InstigatorState,
     InstigatorStatus,
+    SensorInstigatorData,
     TickStatus,
 )
 from dagster._core.storage.event_log.base import EventRecordsFilter
@@ -64,7 +65,11 @@
 )
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorLagSummary,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 from .conftest import create_workspace_load_target
@@ -2904,6 +2909,96 @@ def test_settings():
         assert thread_inst.get_settings("sensors") == settings
 
 
+class PendingFuturesExecutor:
+    """Records the sensors whose ticks are submitted, leaving their ticks in flight."""
+
+    def __init__(self):
+        self.submitted_sensor_names = []
+
+    def submit(self, _fn, _workspace_process_context, _logger, external_sensor, *_args):
+        self.submitted_sensor_names.append(external_sensor.name)
+        return Future()
+
+
+@pytest.mark.parametrize(
+    "settings,expected_sensor_names",
+    [
+        ({}, ["run_key_sensor", "always_on_sensor", "simple_sensor", "custom_interval_sensor"]),
+        ({"max_concurrent_ticks": 2}, ["run_key_sensor", "always_on_sensor"]),
+        ({"max_concurrent_ticks_per_code_location": 1}, ["run_key_sensor"]),
+    ],
+)
+def test_sensor_concurrency_limits(settings, expected_sensor_names):
+    freeze_datetime = create_pendulum_time(year=2019, month=2, day=27, tz="UTC")
+    with instance_for_test(
+        overrides={"sensors": {"use_threads": True, **settings}}
+    ) as instance, create_test_daemon_workspace_context(
+        workspace_load_target=create_workspace_load_target(), instance=instance
+    ) as workspace_context:
+        external_repo = next(
+            iter(workspace_context.create_request_context().get_workspace_snapshot().values())
+        ).code_location.get_repository("the_repo")
+
+        # the sensors are due for a tick, by increasing amounts of time
+        for sensor_name, seconds_since_last_tick in [
+            ("custom_interval_sensor", 90),
+            ("simple_sensor", 100),
+            ("always_on_sensor", 300),
+            ("run_key_sensor", None),
+        ]:
+            external_sensor = external_repo.get_external_sensor(sensor_name)
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                    SensorInstigatorData(
+                        last_tick_timestamp=freeze_datetime.timestamp() - seconds_since_last_tick,
+                        min_interval=external_sensor.min_interval_seconds,
+                    )
+                    if seconds_since_last_tick
+                    else None,
+                )
+            )
+
+        executor = PendingFuturesExecutor()
+        futures = {}
+        with pendulum.test(freeze_datetime):
+            list(
+                execute_sensor_iteration(
+                    workspace_context,
+                    get_default_daemon_logger("SensorDaemon"),
+                    threadpool_executor=executor,
+                    sensor_tick_futures=futures,
+                )
+            )
+            assert executor.submitted_sensor_names == expected_sensor_names
+
+            # no more ticks are submitted while the ticks are in flight
+            list(
+                execute_sensor_iteration(
+                    workspace_context,
+                    get_default_daemon_logger("SensorDaemon"),
+                    threadpool_executor=executor,
+                    sensor_tick_futures=futures,
+                )
+            )
+            assert executor.submitted_sensor_names == expected_sensor_names
+
+
+def test_sensor_lag_summary():
+    assert SensorLagSummary.from_lags({}) == SensorLagSummary(0, 0, 0.0, 0.0, None)
+    assert SensorLagSummary.from_lags(
+        {"a": 10.0, "b": float("inf"), "c": 30.0, "d": 0.0}
+    ) == SensorLagSummary(
+        num_due_sensors=4,
+        num_new_sensors=1,
+        median_lag_seconds=10.0,
+        max_lag_seconds=30.0,
+        max_lag_sensor_name="c",
+    )
+
+
 def test_sensor_logging(executor, instance, workspace_context, external_repo):
     external_sensor = external_repo.get_external_sensor("logging_sensor")
     instance.add_instigator_state(
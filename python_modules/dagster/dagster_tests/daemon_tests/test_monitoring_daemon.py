@@ -21,7 +21,11 @@
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.monitoring.monitoring_daemon import monitor_started_run, monitor_starting_run
+from dagster._daemon.monitoring.monitoring_daemon import (
+    execute_monitoring_iteration,
+    monitor_started_run,
+    monitor_starting_run,
+)
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -177,6 +181,37 @@ def test_monitor_starting(instance: DagsterInstance, logger: Logger):
     assert run.status == DagsterRunStatus.FAILURE
 
 
+def test_monitor_starting_runs_failed_in_bulk(
+    instance: DagsterInstance, workspace_context: WorkspaceProcessContext, logger: Logger
+):
+    timed_out_runs = [create_run_for_test(instance, job_name="foo") for _ in range(3)]
+    for run in timed_out_runs:
+        report_starting_event(instance, run, timestamp=time.time() - 1000)
+
+    recent_run = create_run_for_test(instance, job_name="foo")
+    report_starting_event(instance, recent_run, timestamp=time.time())
+
+    handle_run_events = instance._run_storage.handle_run_events  # noqa: SLF001
+    batches = []
+
+    def _record_handle_run_events(run_events):
+        batches.append([run_id for run_id, _ in run_events])
+        return handle_run_events(run_events)
+
+    instance._run_storage.handle_run_events = _record_handle_run_events  # noqa: SLF001
+
+    assert not any(
+        error for error in execute_monitoring_iteration(workspace_context, logger) if error
+    )
+
+    assert len(batches) == 1
+    assert sorted(batches[0]) == sorted(run.run_id for run in timed_out_runs)
+    for run in timed_out_runs:
+        assert instance.get_run_by_id(run.run_id).status == DagsterRunStatus.FAILURE  # type: ignore
+        assert instance.all_logs(run.run_id, of_type=DagsterEventType.PIPELINE_FAILURE)
+    assert instance.get_run_by_id(recent_run.run_id).status == DagsterRunStatus.STARTING  # type: ignore
+
+
 def test_monitor_started(
     instance: DagsterInstance, workspace_context: WorkspaceProcessContext, logger: Logger
 ):
@@ -1,13 +1,16 @@
 import time
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Iterator
 
 import pytest
+from dagster import _check as check
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.host_representation.code_location import GrpcServerCodeLocation
 from dagster._core.host_representation.handle import JobHandle
 from dagster._core.host_representation.origin import ManagedGrpcPythonEnvCodeLocationOrigin
 from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, DagsterRunStatus
+from dagster._core.storage.runs.schema import RunsTable
 from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.test_utils import (
     create_run_for_test,
@@ -15,7 +18,10 @@
     instance_for_test,
 )
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget
-from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
+    InProgressRunsIndex,
+    QueuedRunCoordinatorDaemon,
+)
 
 from dagster_tests.api_tests.utils import get_foo_job_handle
 
@@ -834,3 +840,87 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, job_h
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_in_progress_runs_index(instance, job_handle):
+    index = InProgressRunsIndex(full_refresh_interval_seconds=3600)
+
+    create_run(instance, job_handle, run_id="started-run", status=DagsterRunStatus.STARTED)
+    create_queued_run(instance, job_handle, run_id="queued-run")
+    assert [record.run_id for record in index.refresh(instance)] == ["started-run"]
+
+    filters_seen = []
+    get_run_tags_records = instance.get_run_tags_records
+
+    def _record_filters(filters=None, ascending=False):
+        filters_seen.append(filters)
+        return get_run_tags_records(filters=filters, ascending=ascending)
+
+    instance.get_run_tags_records = _record_filters
+
+    create_run(
+        instance,
+        job_handle,
+        run_id="starting-run",
+        status=DagsterRunStatus.STARTING,
+        tags={"foo": "bar"},
+    )
+    instance.report_run_failed(check.not_none(instance.get_run_by_id("started-run")))
+
+    records = index.refresh(instance)
+    assert [record.run_id for record in records] == ["starting-run"]
+    assert records[0].tags == {"foo": "bar"}
+    assert records[0].location_name == job_handle.location_name
+
+    # only the runs updated since the previous refresh are read, and the runs held as in progress
+    # are looked up by id
+    assert len(filters_seen) == 2
+    assert filters_seen[0].updated_after is not None
+    assert filters_seen[1].run_ids == ["starting-run"]
+
+
+def test_in_progress_runs_index_reads_late_updates(instance, job_handle):
+    def _set_update_timestamp(run_id, update_timestamp):
+        with instance.run_storage.connect() as conn:
+            conn.execute(
+                RunsTable.update()
+                .where(RunsTable.c.run_id == run_id)
+                .values(update_timestamp=update_timestamp)
+            )
+
+    index = InProgressRunsIndex(lookback_seconds=10, full_refresh_interval_seconds=3600)
+
+    # the run storage stamps updates with a clock that is an hour behind the daemon's
+    create_run(instance, job_handle, run_id="started-run", status=DagsterRunStatus.STARTED)
+    latest_update_timestamp = check.not_none(
+        instance.get_run_record_by_id("started-run")
+    ).update_timestamp - timedelta(hours=1)
+    _set_update_timestamp("started-run", latest_update_timestamp)
+    assert [record.run_id for record in index.refresh(instance)] == ["started-run"]
+
+    # an update that is committed late, stamped before the latest update the index has read
+    create_run(instance, job_handle, run_id="late-run", status=DagsterRunStatus.STARTING)
+    _set_update_timestamp("late-run", latest_update_timestamp - timedelta(seconds=5))
+    assert {record.run_id for record in index.refresh(instance)} == {"started-run", "late-run"}
+
+
+def test_in_progress_runs_index_drops_backdated_finished_runs(instance, job_handle):
+    index = InProgressRunsIndex(lookback_seconds=10, full_refresh_interval_seconds=3600)
+
+    create_run(instance, job_handle, run_id="started-run", status=DagsterRunStatus.STARTED)
+    create_run(instance, job_handle, run_id="other-run", status=DagsterRunStatus.STARTED)
+    assert {record.run_id for record in index.refresh(instance)} == {"started-run", "other-run"}
+
+    # the run worker that finishes the run stamps its update with a clock that is an hour behind
+    instance.report_run_failed(check.not_none(instance.get_run_by_id("started-run")))
+    update_timestamp = check.not_none(
+        instance.get_run_record_by_id("started-run")
+    ).update_timestamp - timedelta(hours=1)
+    with instance.run_storage.connect() as conn:
+        conn.execute(
+            RunsTable.update()
+            .where(RunsTable.c.run_id == "started-run")
+            .values(update_timestamp=update_timestamp)
+        )
+
+    assert [record.run_id for record in index.refresh(instance)] == ["other-run"]
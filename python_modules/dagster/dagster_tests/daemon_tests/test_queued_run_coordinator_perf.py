@@ -0,0 +1,170 @@
+"""Times the queued run coordinator daemon's selection of runs to dequeue against an instance with
+many queued and in-progress runs, alongside the finished runs of its history. The first tick builds
+the index of in-progress runs, and the following ticks only read the runs updated since the
+previous tick.
+"""
+import random
+import time
+from datetime import datetime, timedelta
+from typing import List, Sequence
+
+import pytest
+from dagster._core.host_representation.origin import (
+    ExternalJobOrigin,
+    ExternalRepositoryOrigin,
+    RegisteredCodeLocationOrigin,
+)
+from dagster._core.instance import DagsterInstance
+from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
+from dagster._core.storage.dagster_run import (
+    FINISHED_STATUSES,
+    IN_PROGRESS_RUN_STATUSES,
+    DagsterRun,
+    DagsterRunStatus,
+    RunsFilter,
+)
+from dagster._core.storage.runs.schema import RunsTable
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
+    QueuedRunCoordinatorDaemon,
+)
+from dagster._utils.test.perf import Timing, benchmark, print_timings
+
+NUM_LOCATIONS = 5
+NUM_TEAMS = 20
+
+
+def _job_origin(rng: random.Random) -> ExternalJobOrigin:
+    return ExternalJobOrigin(
+        ExternalRepositoryOrigin(
+            RegisteredCodeLocationOrigin(f"location_{rng.randrange(NUM_LOCATIONS)}"), "repo"
+        ),
+        "foo",
+    )
+
+
+def populate_instance(
+    instance: DagsterInstance,
+    num_queued_runs: int,
+    num_in_progress_runs: int,
+    num_finished_runs: int = 0,
+    seed: int = 0,
+) -> None:
+    """Adds finished, queued and in-progress runs with a mix of team and priority tags, last updated
+    an hour ago.
+    """
+    rng = random.Random(seed)
+    for i in range(num_finished_runs + num_queued_runs + num_in_progress_runs):
+        if i < num_finished_runs:
+            status = FINISHED_STATUSES[i % len(FINISHED_STATUSES)]
+        elif i < num_finished_runs + num_in_progress_runs:
+            status = IN_PROGRESS_RUN_STATUSES[i % len(IN_PROGRESS_RUN_STATUSES)]
+        else:
+            status = DagsterRunStatus.QUEUED
+
+        instance.run_storage.add_run(
+            DagsterRun(
+                job_name="foo",
+                run_id=make_new_run_id(),
+                status=status,
+                tags={
+                    "team": f"team_{rng.randrange(NUM_TEAMS)}",
+                    PRIORITY_TAG: str(rng.randrange(-2, 3)),
+                },
+                external_job_origin=_job_origin(rng),
+            )
+        )
+
+    # runs that have been waiting for a while, rather than runs that were all just updated
+    run_storage = instance.run_storage
+    assert isinstance(run_storage, SqlRunStorage)
+    with run_storage.connect() as conn:
+        conn.execute(
+            RunsTable.update().values(update_timestamp=datetime.utcnow() - timedelta(hours=1))
+        )
+
+
+def time_dequeue_ticks(instance: DagsterInstance, num_ticks: int = 3) -> Sequence[Timing]:
+    """Times reading all queued and in-progress runs in full, as the daemon used to on every tick,
+    and then the daemon's own ticks.
+    """
+    run_coordinator = instance.run_coordinator
+    assert isinstance(run_coordinator, QueuedRunCoordinator)
+    run_queue_config = run_coordinator.get_run_queue_config()
+
+    timings: List[Timing] = []
+
+    start = time.perf_counter()
+    full_runs = instance.get_runs(
+        filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED, *IN_PROGRESS_RUN_STATUSES])
+    )
+    timings.append(
+        Timing("read full queued and in progress runs", time.perf_counter() - start, len(full_runs))
+    )
+
+    daemon = QueuedRunCoordinatorDaemon(interval_seconds=1)
+    for tick in range(num_ticks):
+        start = time.perf_counter()
+        runs_to_dequeue = daemon._get_runs_to_dequeue(  # noqa: SLF001
+            instance, run_queue_config, fixed_iteration_time=None
+        )
+        timings.append(
+            Timing(
+                "first tick" if tick == 0 else f"tick {tick + 1}",
+                time.perf_counter() - start,
+                len(runs_to_dequeue),
+            )
+        )
+
+    return timings
+
+
+def _instance_for_perf(max_concurrent_runs: int):
+    return instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster._core.run_coordinator",
+                "class": "QueuedRunCoordinator",
+                "config": {
+                    "max_concurrent_runs": max_concurrent_runs,
+                    "tag_concurrency_limits": [
+                        {"key": "team", "value": {"applyLimitPerUniqueValue": True}, "limit": 200}
+                    ],
+                },
+            },
+        }
+    )
+
+
+def test_time_dequeue_ticks():
+    with _instance_for_perf(max_concurrent_runs=50) as instance:
+        populate_instance(
+            instance, num_queued_runs=60, num_in_progress_runs=20, num_finished_runs=200
+        )
+
+        timings = time_dequeue_ticks(instance)
+
+        assert timings[0].count == 80
+        # nothing is launched, so every tick selects the same runs
+        assert [timing.count for timing in timings[1:]] == [30, 30, 30]
+
+
+@benchmark
+@pytest.mark.parametrize(
+    "num_queued_runs, num_in_progress_runs, num_finished_runs", [(20_000, 2_000, 100_000)]
+)
+def test_benchmark_dequeue_ticks(
+    num_queued_runs: int, num_in_progress_runs: int, num_finished_runs: int
+):
+    with _instance_for_perf(max_concurrent_runs=num_in_progress_runs + 100) as instance:
+        populate_instance(instance, num_queued_runs, num_in_progress_runs, num_finished_runs)
+        print_timings(
+            (
+                f"sqlite, {num_queued_runs} queued runs, {num_in_progress_runs} in progress,"
+                f" {num_finished_runs} finished"
+            ),
+            time_dequeue_ticks(instance),
+        )
@@ -11,11 +11,18 @@
     repository,
 )
 from dagster._check import CheckError
+from dagster._core.definitions.asset_reconciliation_sensor import (
+    AssetReconciliationCursor,
+    AssetReconciliationProfile,
+    reconcile,
+)
+from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.time_window_partitions import (
     HourlyPartitionsDefinition,
 )
 
-from .asset_reconciliation_scenario import AssetReconciliationScenario, asset_def
+from .asset_reconciliation_scenario import AssetReconciliationScenario, asset_def, do_run
+from .freshness_policy_scenarios import diamond_freshness
 from .scenarios import ASSET_RECONCILIATION_SCENARIOS
 
 
@@ -144,3 +151,79 @@ def repo():
         match=r"build_asset_reconciliation_sensor: Asset '.*' has an AutoMaterializePolicy set",
     ):
         reconciliation_sensor(context)
+
+
+def test_reconcile_only_evaluates_updated_or_due_assets():
+    @repository
+    def repo():
+        return diamond_freshness
+
+    asset_graph = repo.asset_graph
+    all_keys = asset_graph.non_source_asset_keys
+    instance = DagsterInstance.ephemeral()
+    do_run(
+        asset_keys=list(all_keys),
+        partition_key=None,
+        all_assets=diamond_freshness,
+        instance=instance,
+    )
+
+    def tick(cursor):
+        profile = AssetReconciliationProfile()
+        run_requests, new_cursor = reconcile(
+            asset_graph=asset_graph,
+            target_asset_keys=all_keys,
+            instance=instance,
+            cursor=cursor,
+            run_tags=None,
+            profile=profile,
+        )
+        # make sure the cursor survives a round trip through serialization
+        new_cursor = AssetReconciliationCursor.from_serialized(new_cursor.serialize(), asset_graph)
+        return run_requests, new_cursor, profile
+
+    # everything is evaluated on the first tick, and is fresh
+    run_requests, cursor, profile = tick(AssetReconciliationCursor.empty())
+    assert run_requests == []
+    assert profile.asset_counts["assets to evaluate"] == 4
+    assert set(cursor.next_evaluation_timestamps_by_key.keys()) == all_keys
+    assert "freshness" in profile.seconds_by_step
+    assert "Asset reconciliation tick took" in profile.report()
+
+    # nothing has happened since, so nothing is evaluated
+    run_requests, cursor, profile = tick(cursor)
+    assert run_requests == []
+    assert profile.asset_counts["updated assets"] == 0
+    assert profile.asset_counts["assets to evaluate"] == 0
+
+    # a new materialization of the root is evaluated along with everything downstream of it
+    do_run(
+        asset_keys=[AssetKey("asset1")],
+        partition_key=None,
+        all_assets=diamond_freshness,
+        instance=instance,
+    )
+    run_requests, cursor, profile = tick(cursor)
+    assert run_requests == []
+    assert profile.asset_counts["updated assets"] == 1
+    assert profile.asset_counts["assets to evaluate"] == 4
+
+    # once the freshness policy's execution period has started, the assets are evaluated again
+    with pendulum.test(pendulum.now("UTC").add(minutes=35)):
+        run_requests, cursor, profile = tick(cursor)
+    assert profile.asset_counts["updated assets"] == 0
+    assert profile.asset_counts["assets to evaluate"] == 4
+    assert len(run_requests) == 1
+    assert set(run_requests[0].asset_selection) == all_keys
+
+
+def test_cursor_without_next_evaluation_timestamps():
+    @repository
+    def repo():
+        return diamond_freshness
+
+    # cursors serialized before next evaluation timestamps were tracked
+    cursor = AssetReconciliationCursor.from_serialized('[5, ["asset1"], {}]', repo.asset_graph)
+    assert cursor.latest_storage_id == 5
+    assert cursor.materialized_or_requested_root_asset_keys == {AssetKey("asset1")}
+    assert cursor.next_evaluation_timestamps_by_key == {}
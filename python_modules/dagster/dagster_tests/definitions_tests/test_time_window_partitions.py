@@ -17,6 +17,7 @@
     weekly_partitioned_config,
 )
 from dagster._check import CheckError
+from dagster._core.definitions import time_window_partitions
 from dagster._core.definitions.time_window_partitions import (
     ScheduleType,
     TimeWindow,
@@ -1188,3 +1189,256 @@ def test_has_partition_key():
     )
     assert partitions_def.has_partition_key("2020-01-01")
     assert partitions_def.has_partition_key("2020-03-15")
+
+
+@pytest.mark.parametrize(
+    "partitions_def,current_time",
+    [
+        (
+            HourlyPartitionsDefinition(start_date="2019-03-08-00:00", minute_offset=15),
+            "2019-03-20",
+        ),
+        (
+            HourlyPartitionsDefinition(
+                start_date="2019-03-08-00:00", minute_offset=15, timezone="America/Chicago"
+            ),
+            "2019-03-20",
+        ),
+        (
+            HourlyPartitionsDefinition(
+                start_date="2019-10-30-00:00", timezone="America/Chicago", end_offset=2
+            ),
+            "2019-11-10",
+        ),
+        (
+            DailyPartitionsDefinition(
+                start_date="2019-01-01", hour_offset=2, minute_offset=30, timezone="US/Central"
+            ),
+            "2020-01-01",
+        ),
+        (
+            DailyPartitionsDefinition(
+                start_date="2019-01-01", hour_offset=1, timezone="America/Chicago", end_offset=-1
+            ),
+            "2020-01-01",
+        ),
+        (DailyPartitionsDefinition(start_date="2019-01-01", timezone="Asia/Kolkata"), "2020-01-01"),
+        (
+            WeeklyPartitionsDefinition(
+                start_date="2018-01-01", day_offset=0, hour_offset=2, timezone="America/Chicago"
+            ),
+            "2021-01-01",
+        ),
+        (
+            MonthlyPartitionsDefinition(
+                start_date="2010-01-01", day_offset=10, hour_offset=2, timezone="Europe/Berlin"
+            ),
+            "2021-01-01",
+        ),
+        (MonthlyPartitionsDefinition(start_date="2010-01-01", end_offset=1), "2021-01-15"),
+    ],
+)
+def test_fixed_period_time_windows_match_cron_schedule(
+    partitions_def: TimeWindowPartitionsDefinition, current_time: str, monkeypatch
+):
+    fixed_period_time_windows = partitions_def._get_fixed_period_time_windows()  # noqa: SLF001
+    assert fixed_period_time_windows is not None
+
+    time_windows = []
+    for time_window in partitions_def._iterate_time_windows(partitions_def.start):  # noqa: SLF001
+        time_windows.append(time_window)
+        if len(time_windows) == 400:
+            break
+    for i, time_window in enumerate(time_windows):
+        fixed_period_time_window = fixed_period_time_windows.get_time_window(i)
+        assert fixed_period_time_window.start.isoformat() == time_window.start.isoformat()
+        assert fixed_period_time_window.end.isoformat() == time_window.end.isoformat()
+        for timestamp in [
+            time_window.start.timestamp(),
+            time_window.end.timestamp() - 1,
+            (time_window.start.timestamp() + time_window.end.timestamp()) / 2,
+        ]:
+            assert fixed_period_time_windows.get_index_of_window_containing(timestamp) == i
+
+    dt = pendulum.parse(current_time, tz=partitions_def.timezone)
+    partition_keys = partitions_def.get_partition_keys(dt)
+    keys_to_check = [
+        *partition_keys[:3],
+        *partition_keys[-3:],
+        partition_keys[len(partition_keys) // 2],
+        datetime(2099, 1, 1).strftime(partitions_def.fmt),
+    ]
+
+    def _get_results():
+        return {
+            "keys": partitions_def.get_partition_keys(dt),
+            "num_partitions": partitions_def.get_num_partitions(dt),
+            "between_indexes": partitions_def.get_partition_keys_between_indexes(5, 12, dt),
+            "first_window": partitions_def.get_first_partition_window(dt),
+            "last_window": partitions_def.get_last_partition_window(dt),
+            "time_windows": [
+                partitions_def.time_window_for_partition_key(key) for key in keys_to_check
+            ],
+            "time_windows_for_keys": partitions_def.time_windows_for_partition_keys(
+                partition_keys[:3]
+            ),
+            "start_times": [
+                partitions_def.start_time_for_partition_key(key) for key in keys_to_check
+            ],
+            "next_keys": [partitions_def.get_next_partition_key(key, dt) for key in keys_to_check],
+            "next_windows": [
+                partitions_def.get_next_partition_window(window.end, dt)
+                for window in time_windows[:50]
+            ],
+            "keys_for_timestamps": [
+                partitions_def.get_partition_key_for_timestamp(timestamp, end_closed=end_closed)
+                for window in time_windows[:50]
+                for timestamp in [window.start.timestamp(), window.start.timestamp() + 1]
+                for end_closed in [False, True]
+            ],
+            "keys_in_range": partitions_def.get_partition_keys_in_range(
+                PartitionKeyRange(partition_keys[1], partition_keys[-2])
+            ),
+            "has_keys": [partitions_def.has_partition_key(key, dt) for key in keys_to_check],
+        }
+
+    def _clear_caches():
+        TimeWindowPartitionsDefinition._time_window_for_partition_key.cache_clear()  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_first_partition_window.cache_clear()  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_last_partition_window.cache_clear()  # noqa: SLF001
+
+    _clear_caches()
+    fixed_period_results = _get_results()
+    with monkeypatch.context() as m:
+        m.setattr(TimeWindowPartitionsDefinition, "_get_fixed_period_time_windows", lambda _: None)
+        _clear_caches()
+        iteration_results = _get_results()
+    _clear_caches()
+
+    for name, result in fixed_period_results.items():
+        assert result == iteration_results[name], name
+
+    # compared to the forward iteration, since the reverse iteration can skip windows at DST
+    # transitions
+    assert [partitions_def.get_prev_partition_window(window.start) for window in time_windows] == [
+        None,
+        *time_windows[:-1],
+    ]
+
+
+def test_irregular_cron_schedules_iterate():
+    weekdays_partitions_def = TimeWindowPartitionsDefinition(
+        start="2023-03-27", fmt="%Y-%m-%d", cron_schedule="0 0 * * 1-5"
+    )
+    assert weekdays_partitions_def._get_fixed_period_time_windows() is None  # noqa: SLF001
+    # the schedule moves to the last day of months without the 31st, and stays there
+    partitions_def = MonthlyPartitionsDefinition(start_date="2023-01-31", day_offset=31)
+    assert partitions_def._get_fixed_period_time_windows() is None  # noqa: SLF001
+    assert partitions_def.get_partition_keys(datetime(2023, 6, 1)) == [
+        "2023-01-31",
+        "2023-02-28",
+        "2023-03-28",
+        "2023-04-28",
+    ]
+
+
+def test_half_hour_dst_transition_schedules_iterate():
+    # DST shifts the clocks of Lord Howe Island by 30 minutes, so the ticks of the schedule after a
+    # transition depend on where the iteration started
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2023-01-01-00:00", timezone="Australia/Lord_Howe"
+    )
+    assert partitions_def._get_fixed_period_time_windows() is None  # noqa: SLF001
+    timestamp = pendulum.datetime(2023, 6, 11, 0, 10, tz="Australia/Lord_Howe").timestamp()
+    assert partitions_def.get_partition_key_for_timestamp(timestamp) == "2023-06-11-00:00"
+    assert (
+        partitions_def.get_partition_key_for_timestamp(timestamp, end_closed=True)
+        == "2023-06-11-00:00"
+    )
+    assert partitions_def.get_next_partition_key("2023-06-10-23:00") == "2023-06-11-00:00"
+
+    daily_partitions_def = DailyPartitionsDefinition(
+        start_date="2023-01-01", hour_offset=2, timezone="Australia/Lord_Howe"
+    )
+    assert daily_partitions_def._get_fixed_period_time_windows() is None  # noqa: SLF001
+
+
+def test_dst_offsets_checked_through_next_year(monkeypatch):
+    checked_years = []
+    has_whole_hour_utc_offset_changes = (
+        time_window_partitions._has_whole_hour_utc_offset_changes  # noqa: SLF001
+    )
+
+    def _record_checked_years(timezone, start_year, end_year):
+        checked_years.append((start_year, end_year))
+        return has_whole_hour_utc_offset_changes(timezone, start_year, end_year)
+
+    monkeypatch.setattr(
+        time_window_partitions, "_has_whole_hour_utc_offset_changes", _record_checked_years
+    )
+    time_window_partitions._get_fixed_period_time_windows.cache_clear()  # noqa: SLF001
+    partitions_def = DailyPartitionsDefinition(start_date="2020-01-01", timezone="US/Central")
+
+    with pendulum.test(create_pendulum_time(2023, 6, 1, tz="UTC")):
+        assert partitions_def._get_fixed_period_time_windows() is not None  # noqa: SLF001
+    # the offsets are checked again once the year changes, instead of holding on to a result that
+    # only covers the years until the first check
+    with pendulum.test(create_pendulum_time(2025, 6, 1, tz="UTC")):
+        assert partitions_def._get_fixed_period_time_windows() is not None  # noqa: SLF001
+    assert checked_years == [(2020, 2024), (2020, 2026)]
+
+
+def test_time_window_partition_keys_sequence():
+    partitions_def = HourlyPartitionsDefinition(start_date="2000-01-01-00:00")
+    current_time = datetime(2023, 1, 1, 5, 30)
+    partition_keys = partitions_def.get_partition_keys_sequence(current_time)
+
+    num_partitions = 23 * 365 * 24 + 6 * 24 + 5
+    assert len(partition_keys) == num_partitions
+    assert partition_keys[0] == "2000-01-01-00:00"
+    assert partition_keys[-1] == "2023-01-01-04:00"
+    assert partition_keys[1000] == "2000-02-11-16:00"
+    with pytest.raises(IndexError):
+        partition_keys[num_partitions]
+
+    sliced = partition_keys[-3:]
+    assert len(sliced) == 3
+    assert sliced == ["2023-01-01-02:00", "2023-01-01-03:00", "2023-01-01-04:00"]
+    assert list(sliced[1:]) == ["2023-01-01-03:00", "2023-01-01-04:00"]
+    assert partition_keys[:4:2] == ["2000-01-01-00:00", "2000-01-01-02:00"]
+
+    assert "2010-06-01-12:00" in partition_keys
+    assert "2023-01-01-05:00" not in partition_keys
+    assert "2010-06-01-12:30" not in partition_keys
+    assert "1999-12-31-23:00" not in partition_keys
+    assert "2010-06-01" not in partition_keys
+    assert partition_keys.index("2000-02-11-16:00") == 1000
+    assert sliced.index("2023-01-01-04:00") == 2
+    with pytest.raises(ValueError):
+        sliced.index("2000-02-11-16:00")
+
+    assert (
+        partitions_def.get_partition_keys_between_indexes(
+            num_partitions - 3, num_partitions, current_time
+        )
+        == sliced
+    )
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2020-01-01"),
+        HourlyPartitionsDefinition(start_date="2020-01-01-00:00", timezone="US/Central"),
+        # windows that aren't a fixed period apart are counted by iterating over the schedule
+        MonthlyPartitionsDefinition(start_date="2020-01-31", day_offset=31),
+    ],
+)
+def test_get_num_partitions_in_time_window(partitions_def: TimeWindowPartitionsDefinition):
+    time_window = TimeWindow(
+        create_pendulum_time(2020, 3, 5, 12, tz=partitions_def.timezone),
+        create_pendulum_time(2021, 1, 1, tz=partitions_def.timezone),
+    )
+    assert partitions_def.get_num_partitions_in_time_window(time_window) == len(
+        partitions_def.get_partition_keys_in_time_window(time_window)
+    )
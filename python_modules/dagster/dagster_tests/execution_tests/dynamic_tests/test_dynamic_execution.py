@@ -14,7 +14,9 @@
 )
 from dagster._core.errors import DagsterExecutionStepNotFoundError
 from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster._core.test_utils import instance_for_test
 from dagster._utils.merger import merge_dicts
 
@@ -118,10 +120,25 @@ def _mp_cfg():
     }
 
 
+def _mp_worker_pool_cfg():
+    # a single worker executes every step, including the steps resolved from dynamic outputs
+    return {
+        "execution": {
+            "config": {
+                "multiprocess": {
+                    "max_concurrent": 1,
+                    "worker_pool": {},
+                }
+            }
+        }
+    }
+
+
 def _run_configs():
     return [
         _in_proc_cfg(),
         _mp_cfg(),
+        _mp_worker_pool_cfg(),
     ]
 
 
@@ -246,6 +263,76 @@ def test_tags():
         assert plan.get_step_by_key(f"{multiply_by_two.name}[{mapping_key}]").tags == {"third": "3"}
 
 
+def test_rebuild_step_plans_from_snapshot():
+    snapshot = snapshot_from_execution_plan(create_execution_plan(dynamic_job), "job_snapshot_id")
+    known_state = KnownExecutionState(
+        {},
+        {
+            emit.name: {"result": ["0", "1", "2"]},
+        },
+    )
+
+    for step_key in [
+        num_range.name,
+        emit.name,
+        f"{multiply_inputs.name}[1]",
+        f"{multiply_by_two.name}[2]",
+        sum_numbers.name,
+        "double_total",
+    ]:
+        built_plan = create_execution_plan(
+            dynamic_job, step_keys_to_execute=[step_key], known_state=known_state
+        )
+        rebuilt_plan = ExecutionPlan.rebuild_from_snapshot(
+            dynamic_job.name, snapshot, step_keys_to_execute=[step_key], known_state=known_state
+        )
+        assert rebuilt_plan.step_keys_to_execute == [step_key]
+        assert rebuilt_plan.known_state == known_state
+        assert snapshot_from_execution_plan(rebuilt_plan, "job_snapshot_id").steps == (
+            snapshot_from_execution_plan(built_plan, "job_snapshot_id").steps
+        )
+
+    with pytest.raises(DagsterExecutionStepNotFoundError):
+        ExecutionPlan.rebuild_from_snapshot(
+            dynamic_job.name, snapshot, step_keys_to_execute=[f"{multiply_inputs.name}[3]"]
+        )
+
+
+def test_build_step_plans():
+    known_state = KnownExecutionState(
+        {},
+        {
+            emit.name: {"result": ["0", "1", "2"]},
+        },
+    )
+    plan = create_execution_plan(dynamic_job, known_state=known_state)
+
+    for step_key in [
+        num_range.name,
+        emit.name,
+        f"{multiply_inputs.name}[1]",
+        f"{multiply_by_two.name}[2]",
+        sum_numbers.name,
+        "double_total",
+    ]:
+        step_known_state = known_state._replace(previous_retry_attempts={step_key: 1})
+        built_plan = create_execution_plan(
+            dynamic_job, step_keys_to_execute=[step_key], known_state=step_known_state
+        )
+        step_plan = plan.build_step_plan([step_key], step_known_state)
+        assert step_plan.step_keys_to_execute == [step_key]
+        assert step_plan.known_state == step_known_state
+        assert snapshot_from_execution_plan(step_plan, "job_snapshot_id") == (
+            snapshot_from_execution_plan(built_plan, "job_snapshot_id")
+        )
+
+    # steps that weren't resolved when the plan was built can't be selected
+    with pytest.raises(DagsterExecutionStepNotFoundError):
+        create_execution_plan(dynamic_job).build_step_plan(
+            [f"{multiply_inputs.name}[1]"], known_state
+        )
+
+
 def test_full_reexecute():
     with instance_for_test() as instance:
         result_1 = execute_job(
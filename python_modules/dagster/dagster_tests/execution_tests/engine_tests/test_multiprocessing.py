@@ -489,6 +489,70 @@ def test_crash_hard_multiprocessing():
             # )
 
 
+def _get_step_worker_pids(result: execution_result.ExecutionResult):
+    return {
+        event.step_key: event.event_specific_data.metadata["pid"].text
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+@pytest.mark.parametrize(
+    "worker_pool_config,num_expected_workers",
+    [({}, 1), ({"max_steps_per_worker": 2}, 2), ({"max_worker_memory_mb": 1}, 4)],
+)
+def test_worker_pool_execution(worker_pool_config, num_expected_workers):
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(define_diamond_job),
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {"max_concurrent": 1, "worker_pool": worker_pool_config}
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            step_worker_pids = _get_step_worker_pids(result)
+            assert len(step_worker_pids) == 4
+            assert len(set(step_worker_pids.values())) == num_expected_workers
+            assert os.getpid() not in step_worker_pids.values()
+
+
+def test_worker_pool_failure():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(failure),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("throw")
+            assert failure_data
+            assert failure_data.error.cls_name == "Failure"
+            assert failure_data.user_failure_data.label == "intentional-failure"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 def get_dynamic_resource_init_failure_job():
     return get_dynamic_job_resource_init_failure(multiprocess_executor)[0]
 
@@ -515,3 +579,14 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+def test_dynamic_failure_retry_worker_pool():
+    _, config_fn = get_dynamic_job_op_failure(multiprocess_executor)
+    assert_expected_failure_behavior(
+        get_dynamic_op_failure_job,
+        lambda *args: {
+            **config_fn(*args),
+            "execution": {"config": {"multiprocess": {"worker_pool": {"max_steps_per_worker": 2}}}},
+        },
+    )
@@ -0,0 +1,183 @@
+"""Times driving an ActiveExecution through plans of increasing size, the way the in-process
+executor does, without executing any ops.
+"""
+import time
+from typing import List, Sequence
+
+import pytest
+from dagster import (
+    DynamicOut,
+    DynamicOutput,
+    In,
+    Int,
+    List as DagsterList,
+    job,
+    op,
+)
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.retries import RetryMode
+from dagster._utils.test.perf import Timing, benchmark, print_timings
+
+
+def _build_chains_job(num_steps: int, num_chains: int) -> JobDefinition:
+    """Builds a job of num_chains parallel chains of ops that are fanned in by a final op."""
+
+    @op
+    def root() -> int:
+        return 1
+
+    @op(ins={"upstream": In(Int)})
+    def link(upstream: int) -> int:
+        return upstream
+
+    @op(ins={"results": In(DagsterList[Int])})
+    def fan_in(results: List[int]) -> int:
+        return sum(results)
+
+    chain_length = max((num_steps - 2) // num_chains, 1)
+
+    @job
+    def chains_job():
+        start = root()
+        results = []
+        for i in range(num_chains):
+            result = start
+            for j in range(chain_length):
+                result = link.alias(f"link_{i}_{j}")(result)
+            results.append(result)
+        fan_in(results)
+
+    return chains_job
+
+
+@op(out=DynamicOut(Int))
+def emit():
+    yield DynamicOutput(1, mapping_key="0")
+
+
+@op(ins={"upstream": In(Int)})
+def mapped(upstream: int) -> int:
+    return upstream
+
+
+@op(ins={"results": In(DagsterList[Int])})
+def collect(results: List[int]) -> int:
+    return sum(results)
+
+
+@job
+def dynamic_job():
+    collect(emit().map(mapped).map(mapped.alias("mapped_again")).collect())
+
+
+def _output_events(step: ExecutionStep, num_mapping_keys: int) -> Sequence[DagsterEvent]:
+    events = []
+    for step_output in step.step_outputs:
+        mapping_keys = (
+            [str(i) for i in range(num_mapping_keys)] if step_output.is_dynamic else [None]
+        )
+        for mapping_key in mapping_keys:
+            events.append(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    step.job_name,
+                    step_key=step.key,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle(step.key, step_output.name, mapping_key)
+                    ),
+                )
+            )
+    return events
+
+
+def execute_active_execution(plan: ExecutionPlan, num_mapping_keys: int = 0) -> Sequence[str]:
+    """Executes every step of the plan one at a time and returns their keys in execution order."""
+    executed = []
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        while not active_execution.is_complete:
+            step = active_execution.get_next_step()
+            executed.append(step.key)
+            for event in _output_events(step, num_mapping_keys):
+                active_execution.handle_event(event)
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_SUCCESS.value,
+                    step.job_name,
+                    step_key=step.key,
+                    event_specific_data=StepSuccessData(duration_ms=0.0),
+                )
+            )
+
+            # like ActiveExecution.plan_events_iterator, which needs a job context to log with
+            for step in active_execution.get_steps_to_skip():
+                active_execution.mark_skipped(step.key)
+            for step in active_execution.get_steps_to_abandon():
+                active_execution.mark_abandoned(step.key)
+    return executed
+
+
+def _assert_executed_in_dependency_order(plan: ExecutionPlan, executed: Sequence[str]) -> None:
+    position = {step_key: i for i, step_key in enumerate(executed)}
+    for step_key in executed:
+        for dep in plan.get_executable_step_by_key(step_key).get_execution_dependency_keys():
+            assert position[dep] < position[step_key]
+
+
+def time_active_execution(num_steps: int) -> Sequence[Timing]:
+    """Times building and executing a plan of parallel chains, and executing a plan whose mapped
+    steps are resolved while executing, so that there's no up-front plan cost to report.
+    """
+    timings = []
+
+    start = time.perf_counter()
+    plan = create_execution_plan(_build_chains_job(num_steps, num_chains=max(num_steps // 100, 1)))
+    plan_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    executed = execute_active_execution(plan)
+    execution_seconds = time.perf_counter() - start
+    timings.append(Timing("chains, build plan", plan_seconds, len(executed)))
+    timings.append(Timing("chains, execute", execution_seconds, len(executed)))
+
+    plan = create_execution_plan(dynamic_job)
+    start = time.perf_counter()
+    executed = execute_active_execution(plan, num_mapping_keys=num_steps // 2)
+    timings.append(Timing("dynamic, execute", time.perf_counter() - start, len(executed)))
+
+    return timings
+
+
+def test_active_execution_chains():
+    plan = create_execution_plan(_build_chains_job(num_steps=202, num_chains=4))
+    executed = execute_active_execution(plan)
+
+    assert len(executed) == 202
+    assert set(executed) == set(plan.step_keys_to_execute)
+    _assert_executed_in_dependency_order(plan, executed)
+
+
+def test_active_execution_dynamic():
+    plan = create_execution_plan(dynamic_job)
+    executed = execute_active_execution(plan, num_mapping_keys=50)
+
+    assert len(executed) == 102
+    assert executed[0] == "emit"
+    assert executed[-1] == "collect"
+    _assert_executed_in_dependency_order(plan, executed)
+
+
+def test_time_active_execution():
+    timings = time_active_execution(num_steps=1002)
+
+    assert [timing.count for timing in timings] == [1002, 1002, 1004]
+
+
+@benchmark
+@pytest.mark.parametrize("num_steps", [1_000, 10_000, 50_000])
+def test_benchmark_active_execution(num_steps: int):
+    print_timings(f"active execution, {num_steps} steps", time_active_execution(num_steps))
@@ -941,3 +941,49 @@ def test_stale_cause_comparison():
     cause_2 = StaleCause(key=AssetKey(["foo"]), category=StaleCauseCategory.DATA, reason="ok")
 
     assert cause_1 < cause_2
+
+
+def test_stale_status_long_chain_batches_queries():
+    chain: List[AssetsDefinition] = []
+    for i in range(300):
+
+        @asset(name=f"asset{i}", non_argument_deps={chain[-1].key} if chain else set())
+        def _asset():
+            ...
+
+        chain.append(_asset)
+
+    with instance_for_test() as instance:
+        # without data provenance, staleness is decided by the order of the materializations
+        for chain_asset in [*chain[1:], chain[0]]:
+            instance.store_event(
+                create_test_event_log_entry(
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    AssetMaterialization(asset_key=chain_asset.key),
+                )
+            )
+
+        status_resolver = CachingStaleStatusResolver(
+            instance=instance,
+            asset_graph=AssetGraph.from_assets(chain),
+            asset_keys=[chain[-1].key],
+        )
+        with mock.patch.object(
+            instance, "get_asset_records", wraps=instance.get_asset_records
+        ) as get_asset_records, mock.patch.object(
+            instance, "get_event_records", wraps=instance.get_event_records
+        ) as get_event_records:
+            assert status_resolver.get_status(chain[-1].key) == StaleStatus.STALE
+            assert status_resolver.get_stale_root_causes(chain[-1].key) == [
+                StaleCause(
+                    chain[0].key,
+                    StaleCauseCategory.DATA,
+                    "has a new materialization",
+                )
+            ]
+            assert status_resolver.get_status(chain[0].key) == StaleStatus.FRESH
+            assert status_resolver.get_status(chain[1].key) == StaleStatus.STALE
+
+            # the latest materializations of the whole chain are fetched together
+            assert get_asset_records.call_count == 1
+            assert get_event_records.call_count == 0
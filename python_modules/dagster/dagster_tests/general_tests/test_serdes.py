@@ -8,9 +8,11 @@
 from dagster._check import ParameterCheckError, inst_param, set_param
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
+    COMPACT_FORMAT_HEADER,
     EnumSerializer,
     FieldSerializer,
     NamedTupleSerializer,
+    SerdesFormat,
     UnpackContext,
     WhitelistMap,
     _whitelist_for_serdes,
@@ -712,3 +714,100 @@ class Foo(Enum):
     assert serialized == '{"__enum__": "Foo.BLUE"}'
     deserialized = deserialize_value(serialized, whitelist_map=test_env)
     assert deserialized == Foo.RED
+
+
+def test_compact_format() -> None:
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_map)
+    class Color(Enum):
+        RED = "red"
+
+    @_whitelist_for_serdes(
+        test_map, storage_name="Bar", storage_field_names={"color": "colour"}, old_fields={"old": 1}
+    )
+    class Foo(NamedTuple):
+        color: Color
+        children: Sequence["Foo"]
+        metadata: Mapping[str, Any]
+
+    val = Foo(
+        Color.RED,
+        [Foo(Color.RED, [], {"#0": [1]}), Foo(Color.RED, [], {"#": {"a": {1, 2}}})],
+        {"nested": Foo(Color.RED, [], {}), "frozen": frozenset(["a", "b"])},
+    )
+
+    compact = serialize_value(val, whitelist_map=test_map, serdes_format=SerdesFormat.COMPACT)
+    assert compact.startswith(COMPACT_FORMAT_HEADER)
+    # each class name and field name is only written once
+    assert compact.count('"Bar"') == 1
+    assert compact.count('"colour"') == 1
+    assert deserialize_value(compact, as_type=Foo, whitelist_map=test_map) == val
+
+    # the plain JSON format is still the default, and is still readable
+    legacy = serialize_value(val, whitelist_map=test_map)
+    assert legacy.startswith("{")
+    assert len(compact) < len(legacy)
+    assert deserialize_value(legacy, as_type=Foo, whitelist_map=test_map) == val
+
+
+def test_compact_format_forward_compat() -> None:
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Quux(NamedTuple("_Quux", [("foo", str), ("bar", str), ("baz", Optional[str])])):
+        def __new__(cls, foo, bar, baz=None):
+            return super(Quux, cls).__new__(cls, foo, bar, baz=baz)
+
+    serialized = serialize_value(
+        Quux("zip", "zow", "zap"), whitelist_map=test_map, serdes_format=SerdesFormat.COMPACT
+    )
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Quux(NamedTuple("_Quux", [("foo", str), ("bar", str)])):
+        def __new__(cls, foo, bar):
+            return super(Quux, cls).__new__(cls, foo, bar)
+
+    assert deserialize_value(serialized, as_type=Quux, whitelist_map=test_map) == Quux("zip", "zow")
+
+    with pytest.raises(DeserializationError, match="Unsupported serdes format header"):
+        deserialize_value("@c2:" + serialized[len(COMPACT_FORMAT_HEADER) :], whitelist_map=test_map)
+
+
+def test_compiled_serdes() -> None:
+    test_map = WhitelistMap.create()
+
+    class FooFieldSerializer(FieldSerializer):
+        def pack(self, value, whitelist_map, descent_path):
+            return value.upper()
+
+        def unpack(self, value, whitelist_map, context):
+            return value.lower()
+
+    @_whitelist_for_serdes(
+        test_map,
+        storage_field_names={"job_name": "pipeline_name"},
+        old_fields={"message": ""},
+        skip_when_empty_fields={"tags"},
+        field_serializers={"label": FooFieldSerializer},
+    )
+    class Foo(NamedTuple):
+        job_name: str
+        label: str
+        tags: Optional[Mapping[str, str]] = None
+
+    serializer = test_map.get_tuple_serializer("Foo")
+    assert serializer._compiled_pack is not None  # noqa: SLF001
+    assert serializer._compiled_unpack is not None  # noqa: SLF001
+
+    val = Foo("my_job", "abc", None)
+    serialized = serialize_value(val, whitelist_map=test_map)
+    assert (
+        serialized
+        == '{"__class__": "Foo", "label": "ABC", "message": "", "pipeline_name": "my_job"}'
+    )
+    assert deserialize_value(serialized, whitelist_map=test_map) == val
+
+    # fields unknown to the loaded class fall back to the generic path, which drops them
+    newer = '{"__class__": "Foo", "label": "ABC", "pipeline_name": "my_job", "new_field": 1}'
+    assert deserialize_value(newer, whitelist_map=test_map) == val
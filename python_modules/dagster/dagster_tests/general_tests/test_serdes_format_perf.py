@@ -0,0 +1,70 @@
+"""Compares the size and encode / decode time of the serdes formats on job snapshots, execution plan
+snapshots, and event log entries.
+"""
+from typing import List, Mapping, Sequence
+
+import pytest
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.snap import JobSnapshot, create_job_snapshot_id, snapshot_from_execution_plan
+from dagster._serdes import SerdesFormat, deserialize_value, serialize_value
+from dagster._utils.test.perf import Timing, benchmark, best_time, print_timings
+
+from .utils import build_events, build_wide_job
+
+
+def time_formats(name: str, value: object, iterations: int = 5) -> Sequence[Timing]:
+    """Times encoding and decoding the value in each serdes format, counting the encoded bytes."""
+    timings = []
+    for serdes_format in SerdesFormat:
+        serialized = serialize_value(value, serdes_format=serdes_format)
+        assert deserialize_value(serialized) == value
+        timings.append(
+            Timing(
+                f"{name}, {serdes_format.value}, encode",
+                best_time(lambda: serialize_value(value, serdes_format=serdes_format), iterations),
+                len(serialized),
+            )
+        )
+        timings.append(
+            Timing(
+                f"{name}, {serdes_format.value}, decode",
+                best_time(lambda: deserialize_value(serialized), iterations),
+                len(serialized),
+            )
+        )
+    return timings
+
+
+def _get_values(num_ops: int, num_events: int) -> Mapping[str, object]:
+    wide_job = build_wide_job(num_ops)
+    run_config = {
+        "ops": {f"op_{i}": {"config": {"label": f"label_{i}"}} for i in range(num_ops)},
+    }
+    execution_plan = create_execution_plan(wide_job, run_config=run_config)
+    job_snapshot = JobSnapshot.from_job_def(wide_job)
+
+    return {
+        "job snapshot": job_snapshot,
+        "execution plan snapshot": snapshot_from_execution_plan(
+            execution_plan, create_job_snapshot_id(job_snapshot)
+        ),
+        "event log entries": build_events(num_events),
+    }
+
+
+def test_compact_format_is_smaller():
+    for value in _get_values(num_ops=20, num_events=20).values():
+        json_serialized = serialize_value(value, serdes_format=SerdesFormat.JSON)
+        compact_serialized = serialize_value(value, serdes_format=SerdesFormat.COMPACT)
+        assert deserialize_value(compact_serialized) == value
+        assert len(compact_serialized) < len(json_serialized)
+
+
+@benchmark
+@pytest.mark.parametrize("num_ops, num_events", [(200, 1_000), (1_000, 10_000)])
+def test_benchmark_serdes_formats(num_ops: int, num_events: int):
+    timings: List[Timing] = []
+    for name, value in _get_values(num_ops, num_events).items():
+        timings.extend(time_formats(name, value))
+
+    print_timings(f"serdes formats, {num_ops} ops, {num_events} events", timings)
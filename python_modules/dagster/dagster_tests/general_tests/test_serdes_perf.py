@@ -0,0 +1,93 @@
+"""Compares the time spent packing and unpacking EventLogEntry, ExternalRepositoryData and
+ExecutionPlanSnapshot values with the compiled per-class serdes functions and with the generic
+NamedTupleSerializer path.
+"""
+from contextlib import contextmanager
+from typing import Iterator, List, Mapping, Sequence
+
+import pytest
+from dagster import Definitions
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._core.snap import JobSnapshot, create_job_snapshot_id, snapshot_from_execution_plan
+from dagster._serdes.serdes import (
+    _WHITELIST_MAP,
+    UnpackContext,
+    WhitelistMap,
+    pack_value,
+    unpack_value,
+)
+from dagster._utils.test.perf import Timing, benchmark, best_time, print_timings
+
+from .utils import build_events, build_wide_job
+
+
+@contextmanager
+def generic_serdes(whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Iterator[None]:
+    """Disables the compiled pack / unpack functions of every registered NamedTuple."""
+    serializers = set(whitelist_map.tuple_serializers.values())
+    for serializer in serializers:
+        serializer._compiled_pack = None  # noqa: SLF001
+        serializer._compiled_unpack = None  # noqa: SLF001
+    try:
+        yield
+    finally:
+        for serializer in serializers:
+            serializer.compile()
+
+
+def _get_values(num_ops: int, num_events: int) -> Mapping[str, object]:
+    wide_job = build_wide_job(num_ops)
+    run_config = {
+        "ops": {f"op_{i}": {"config": {"label": f"label_{i}"}} for i in range(num_ops)},
+    }
+    job_snapshot = JobSnapshot.from_job_def(wide_job)
+    repository_def = Definitions(jobs=[wide_job]).get_repository_def()
+    return {
+        "event log entries": build_events(num_events),
+        "external repository data": external_repository_data_from_def(repository_def),
+        "execution plan snapshot": snapshot_from_execution_plan(
+            create_execution_plan(wide_job, run_config=run_config),
+            create_job_snapshot_id(job_snapshot),
+        ),
+    }
+
+
+def _time_pack_and_unpack(name: str, value: object, iterations: int) -> Sequence[Timing]:
+    packed = pack_value(value)
+    return [
+        Timing(f"{name}, pack", best_time(lambda: pack_value(value), iterations)),
+        Timing(
+            f"{name}, unpack",
+            best_time(lambda: unpack_value(packed, context=UnpackContext()), iterations),
+        ),
+    ]
+
+
+def time_serdes(name: str, value: object, iterations: int = 5) -> Sequence[Timing]:
+    """Times packing and unpacking the value along the generic and the compiled paths."""
+    timings: List[Timing] = []
+    with generic_serdes():
+        timings.extend(_time_pack_and_unpack(f"{name}, generic", value, iterations))
+    timings.extend(_time_pack_and_unpack(f"{name}, compiled", value, iterations))
+    return timings
+
+
+def test_compiled_serdes_matches_generic():
+    for value in _get_values(num_ops=10, num_events=10).values():
+        packed = pack_value(value)
+        unpacked = unpack_value(packed)
+        with generic_serdes():
+            assert pack_value(value) == packed
+            assert unpack_value(packed) == unpacked
+        assert unpacked == value
+
+
+@benchmark
+@pytest.mark.parametrize("num_ops, num_events", [(200, 10_000), (200, 100_000)])
+def test_benchmark_compiled_serdes(num_ops: int, num_events: int):
+    timings: List[Timing] = []
+    for name, value in _get_values(num_ops, num_events).items():
+        timings.extend(time_serdes(name, value))
+
+    print_timings(f"serdes, {num_ops} ops, {num_events} events", timings)
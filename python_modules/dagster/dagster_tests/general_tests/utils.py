@@ -0,0 +1,64 @@
+"""Builders of large values to serialize, for the serdes perf tests and benchmarks."""
+from typing import List
+
+from dagster import Field, In, Int, Out, String, job, op
+from dagster._core.definitions.events import AssetMaterialization, MetadataValue
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+
+
+def build_wide_job(num_ops: int) -> JobDefinition:
+    ops = []
+    for i in range(num_ops):
+
+        @op(
+            name=f"op_{i}",
+            ins={"upstream": In(Int)},
+            out={"result": Out(Int), "description": Out(String, is_required=False)},
+            config_schema={"multiplier": Field(Int, default_value=i), "label": Field(String)},
+        )
+        def _op(context, upstream):
+            return upstream * context.op_config["multiplier"]
+
+        ops.append(_op)
+
+    @op
+    def root():
+        return 1
+
+    @job
+    def wide_job():
+        result = root()
+        for _op in ops:
+            result, _ = _op(result)
+
+    return wide_job
+
+
+def build_events(num_events: int) -> List[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="b0c7e3a4-5a1e-4d89-9b42-4d0e7b1c2e5f",
+            timestamp=1680000000.0 + i,
+            step_key=f"op_{i % 50}",
+            job_name="wide_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "wide_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=f"asset_{i % 50}",
+                        metadata={
+                            "rows": MetadataValue.int(i),
+                            "path": MetadataValue.path(f"/data/asset_{i}.parquet"),
+                        },
+                    )
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
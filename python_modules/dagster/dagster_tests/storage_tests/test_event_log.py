@@ -17,6 +17,7 @@
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._serdes import SerdesFormat
 
 from .utils.event_log_storage import TestEventLogStorage
 
@@ -36,12 +37,14 @@ def event_log_storage(self):
 class TestSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
 
-    @pytest.fixture(scope="function", name="storage")
-    def event_log_storage(self):
+    @pytest.fixture(
+        scope="function", name="storage", params=[SerdesFormat.JSON, SerdesFormat.COMPACT]
+    )
+    def event_log_storage(self, request):
         # make the temp dir in the cwd since default temp roots
         # have issues with FS notif based event log watching
         with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
-            storage = SqliteEventLogStorage(tmpdir_path)
+            storage = SqliteEventLogStorage(tmpdir_path, serdes_format=request.param)
             try:
                 yield storage
             finally:
@@ -0,0 +1,238 @@
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+
+from dagster import (
+    DagsterRunStatus,
+    MemoryMappedIOManager,
+    MetadataValue,
+    ReexecutionOptions,
+    asset,
+    build_sensor_context,
+    execute_job,
+    in_process_executor,
+    job,
+    make_memory_mapped_io_manager_cleanup_sensor,
+    materialize,
+    multiprocess_executor,
+    op,
+    reconstructable,
+)
+from dagster._core.storage.dagster_run import FINISHED_STATUSES
+from dagster._core.storage.mmap_io_manager import PickledObjectMemoryMappedIOManager
+from dagster._core.test_utils import instance_for_test
+
+
+class ZeroCopyBytes:
+    """Bytes that are pickled out-of-band with protocol 5."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self.data),)  # noqa: SLF001
+        return type(self)._reconstruct, (bytearray(self.data),)  # noqa: SLF001
+
+    @classmethod
+    def _reconstruct(cls, data):
+        return cls(memoryview(data))
+
+
+@op
+def make_bytes():
+    return ZeroCopyBytes(bytearray(b"x" * 1000)), [1, 2, 3]
+
+
+@op
+def check_bytes(value):
+    data, rest = value
+    assert bytes(data.data) == b"x" * 1000
+    assert rest == [1, 2, 3]
+    if sys.version_info >= (3, 8):
+        assert isinstance(data.data.obj, mmap.mmap)
+    return len(data.data)
+
+
+@job
+def bytes_job():
+    check_bytes(make_bytes())
+
+
+@job(executor_def=multiprocess_executor, resource_defs={"io_manager": MemoryMappedIOManager()})
+def multiprocess_bytes_job():
+    check_bytes(make_bytes())
+
+
+def test_mmap_io_manager():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        result = bytes_job.execute_in_process(
+            resources={"io_manager": MemoryMappedIOManager(base_dir=tmpdir_path)}
+        )
+        assert result.success
+        assert result.output_for_node("check_bytes") == 1000
+
+        filepath = os.path.join(tmpdir_path, result.run_id, "make_bytes", "result")
+        assert os.path.isfile(filepath)
+        handled_output_events = [evt for evt in result.all_events if evt.is_handled_output]
+        metadata = handled_output_events[0].event_specific_data.metadata
+        assert metadata["path"] == MetadataValue.path(filepath)
+
+        PickledObjectMemoryMappedIOManager(base_dir=tmpdir_path).cleanup_run(result.run_id)
+        assert not os.path.exists(os.path.join(tmpdir_path, result.run_id))
+
+
+def test_mmap_io_manager_multiprocess():
+    with instance_for_test() as instance:
+        with execute_job(reconstructable(multiprocess_bytes_job), instance=instance) as result:
+            assert result.success
+            assert result.output_for_node("check_bytes") == 1000
+
+
+def test_mmap_io_manager_assets():
+    @asset(key_prefix=["one", "two"])
+    def upstream():
+        return {"a": ZeroCopyBytes(bytearray(b"abc"))}
+
+    @asset
+    def downstream(upstream):
+        return bytes(upstream["a"].data)
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        result = materialize(
+            [upstream, downstream],
+            resources={"io_manager": MemoryMappedIOManager(base_dir=tmpdir_path)},
+        )
+        assert result.success
+        assert result.output_for_node("downstream") == b"abc"
+        assert os.path.isfile(os.path.join(tmpdir_path, "one", "two", "upstream"))
+
+
+def test_mmap_io_manager_unpicklable():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @op
+        def unpicklable():
+            return lambda: 1
+
+        @job(resource_defs={"io_manager": MemoryMappedIOManager(base_dir=tmpdir_path)})
+        def unpicklable_job():
+            unpicklable()
+
+        result = unpicklable_job.execute_in_process(raise_on_error=False)
+        assert not result.success
+        assert "is not picklable" in str(result.failure_data_for_node("unpicklable").error)
+
+
+def test_mmap_io_manager_cleanup_sensor():
+    with tempfile.TemporaryDirectory() as tmpdir_path, instance_for_test() as instance:
+        cleanup_sensor = make_memory_mapped_io_manager_cleanup_sensor(base_dir=tmpdir_path)
+        context = build_sensor_context(instance=instance)
+        assert "No outputs" in cleanup_sensor.evaluate_tick(context).skip_message
+
+        io_manager = MemoryMappedIOManager(base_dir=tmpdir_path)
+        result = bytes_job.execute_in_process(
+            instance=instance, resources={"io_manager": io_manager}
+        )
+        assert result.success
+        materialize(
+            [asset(name="an_asset")(lambda: 1)],
+            instance=instance,
+            resources={"io_manager": io_manager},
+        )
+
+        # a run that hasn't finished keeps its outputs
+        unfinished_run = instance.create_run_for_job(bytes_job)
+        os.makedirs(os.path.join(tmpdir_path, unfinished_run.run_id))
+
+        assert "outputs of 1 finished runs" in cleanup_sensor.evaluate_tick(context).skip_message
+        assert not os.path.exists(os.path.join(tmpdir_path, result.run_id))
+        assert os.path.exists(os.path.join(tmpdir_path, unfinished_run.run_id))
+        assert os.path.exists(os.path.join(tmpdir_path, "an_asset"))
+
+        # the outputs of each run are removed once
+        assert "outputs of 0 finished runs" in cleanup_sensor.evaluate_tick(context).skip_message
+
+
+@op
+def one():
+    return 1
+
+
+@op(config_schema={"should_fail": bool})
+def plus_two(context, i):
+    if context.op_config["should_fail"]:
+        raise Exception("failed")
+    return i + 2
+
+
+@job(executor_def=in_process_executor, resource_defs={"io_manager": MemoryMappedIOManager()})
+def can_fail_job():
+    plus_two(one())
+
+
+def _can_fail_run_config(should_fail):
+    return {"ops": {"plus_two": {"config": {"should_fail": should_fail}}}}
+
+
+def test_mmap_io_manager_cleanup_sensor_keeps_failed_runs():
+    # the IO manager and the sensors store and remove outputs in the storage directory of the
+    # instance
+    with instance_for_test() as instance:
+        storage_dir = instance.storage_directory()
+        context = build_sensor_context(instance=instance)
+        with execute_job(
+            reconstructable(can_fail_job),
+            instance,
+            run_config=_can_fail_run_config(should_fail=True),
+        ) as result:
+            assert not result.success
+        failed_run_id = result.run_id
+
+        # by default, only the outputs of successful runs are removed, so a failed run can still
+        # be re-executed from failure after the sensor ticked
+        cleanup_sensor = make_memory_mapped_io_manager_cleanup_sensor()
+        assert "outputs of 0 finished runs" in cleanup_sensor.evaluate_tick(context).skip_message
+
+        # failed runs are kept for the retention window
+        retaining_cleanup_sensor = make_memory_mapped_io_manager_cleanup_sensor(
+            name="retaining_cleanup_sensor",
+            statuses=list(FINISHED_STATUSES),
+            retention_seconds=60 * 60,
+        )
+        assert (
+            "outputs of 0 finished runs"
+            in retaining_cleanup_sensor.evaluate_tick(context).skip_message
+        )
+        assert os.path.exists(os.path.join(storage_dir, failed_run_id))
+
+        with execute_job(
+            reconstructable(can_fail_job),
+            instance,
+            run_config=_can_fail_run_config(should_fail=False),
+            reexecution_options=ReexecutionOptions.from_failure(failed_run_id, instance),
+        ) as reexecution_result:
+            assert reexecution_result.success
+            assert reexecution_result.output_for_node("plus_two") == 3
+
+        # once the outputs of the failed run are removed, it can't be re-executed from failure
+        removing_cleanup_sensor = make_memory_mapped_io_manager_cleanup_sensor(
+            name="removing_cleanup_sensor",
+            statuses=[DagsterRunStatus.FAILURE],
+        )
+        assert (
+            "outputs of 1 finished runs"
+            in removing_cleanup_sensor.evaluate_tick(context).skip_message
+        )
+        assert not os.path.exists(os.path.join(storage_dir, failed_run_id))
+
+        with execute_job(
+            reconstructable(can_fail_job),
+            instance,
+            run_config=_can_fail_run_config(should_fail=False),
+            reexecution_options=ReexecutionOptions.from_failure(failed_run_id, instance),
+            raise_on_error=False,
+        ) as reexecution_result:
+            assert not reexecution_result.success
@@ -1,5 +1,8 @@
+import tempfile
 import time
+from contextlib import contextmanager
 
+import pytest
 from dagster import (
     AssetKey,
     AssetMaterialization,
@@ -25,6 +28,7 @@
 from dagster._core.storage.partition_status_cache import (
     AssetStatusCacheValue,
     get_and_update_asset_status_cache_value,
+    rebuild_asset_status_cache_value,
 )
 from dagster._core.test_utils import create_run_for_test, instance_for_test
 from dagster._utils import Counter, traced_counter
@@ -785,3 +789,223 @@ def my_asset():
             asset_graph.get_partitions_def(asset_key)
         )
         assert failed_subset.get_partition_keys() == set()
+
+
+@contextmanager
+def incremental_status_cache_instance_for_test():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(
+            overrides={
+                "event_log_storage": {
+                    "module": "dagster._core.storage.event_log",
+                    "class": "SqliteEventLogStorage",
+                    "config": {"base_dir": temp_dir, "incremental_asset_status_cache": True},
+                },
+            }
+        ) as instance:
+            yield instance
+
+
+def _store_planned_event(instance, run_id, asset_key, partition):
+    instance.event_log_storage.store_event(
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id=run_id,
+            timestamp=time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                "nonce",
+                event_specific_data=AssetMaterializationPlannedData(
+                    asset_key=asset_key, partition=partition
+                ),
+            ),
+        )
+    )
+
+
+def test_incremental_status_cache():
+    partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1(context):
+        if context.partition_key.startswith("fail"):
+            raise Exception()
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve([asset1], [])
+
+    def _stored_cache_value(instance):
+        return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+    with incremental_status_cache_instance_for_test() as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="good1")
+        # the cache is built on the first read
+        assert _stored_cache_value(instance) is None
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1"}
+
+        # later events are recorded as deltas, without rewriting the stored cache value
+        asset_job.execute_in_process(instance=instance, partition_key="good2")
+        asset_job.execute_in_process(instance=instance, partition_key="fail1", raise_on_error=False)
+        in_progress_run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+        _store_planned_event(instance, in_progress_run.run_id, asset_key, "fail2")
+
+        latest_storage_id = next(
+            iter(
+                instance.get_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                        asset_key=asset_key,
+                    ),
+                    limit=1,
+                )
+            )
+        ).storage_id
+        assert _stored_cache_value(instance) == cached_status
+        deltas = {
+            delta.partition: delta for delta in instance.get_asset_status_cache_deltas(asset_key)
+        }
+        assert set(deltas.keys()) == {"good2", "fail1", "fail2"}
+        assert deltas["good2"].materialized
+        assert deltas["good2"].planned_run_id is None
+        assert not deltas["fail1"].materialized
+        assert deltas["fail1"].planned_run_id is not None
+        assert deltas["fail2"].planned_run_id == in_progress_run.run_id
+        assert deltas["fail2"].latest_storage_id == latest_storage_id
+
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status.latest_storage_id == latest_storage_id
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1", "good2"}
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail1"}
+        assert cached_status.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail2"}
+        assert cached_status.pending_planned_partition_run_ids == {"fail2": in_progress_run.run_id}
+        # the applied deltas are deleted
+        assert instance.get_asset_status_cache_deltas(asset_key) == []
+
+        instance.report_run_failed(in_progress_run)
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail1", "fail2"}
+        assert (
+            cached_status.deserialize_in_progress_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+            == set()
+        )
+        assert cached_status.pending_planned_partition_run_ids is None
+
+        # a rebuild from the event log agrees with the incrementally maintained value
+        rebuilt_status = rebuild_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        for deserialize in [
+            AssetStatusCacheValue.deserialize_materialized_partition_subsets,
+            AssetStatusCacheValue.deserialize_failed_partition_subsets,
+            AssetStatusCacheValue.deserialize_in_progress_partition_subsets,
+        ]:
+            assert (
+                deserialize(rebuilt_status, partitions_def).get_partition_keys()
+                == deserialize(cached_status, partitions_def).get_partition_keys()
+            )
+
+
+def test_incremental_status_cache_reads_events_without_deltas():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve([asset1], [])
+
+    with incremental_status_cache_instance_for_test() as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="a")
+        get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+
+        asset_job.execute_in_process(instance=instance, partition_key="b")
+        # drop the deltas of "b", as if it had been stored before deltas were recorded
+        instance.delete_asset_status_cache_deltas(
+            asset_key, instance.get_asset_status_cache_deltas(asset_key)
+        )
+        asset_job.execute_in_process(instance=instance, partition_key="c")
+        assert [delta.partition for delta in instance.get_asset_status_cache_deltas(asset_key)] == [
+            "c"
+        ]
+
+        # the deltas don't cover "b", so the event log is read instead
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"a", "b", "c"}
+        assert instance.get_asset_status_cache_deltas(asset_key) == []
+
+
+def test_incremental_status_cache_applies_deltas_in_one_transaction(monkeypatch):
+    partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve([asset1], [])
+
+    with incremental_status_cache_instance_for_test() as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="a")
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        asset_job.execute_in_process(instance=instance, partition_key="b")
+        deltas = instance.get_asset_status_cache_deltas(asset_key)
+        assert [delta.partition for delta in deltas] == ["b"]
+
+        def _fail_to_delete(*_args, **_kwargs):
+            raise Exception("failed to delete")
+
+        # if the deltas can't be deleted, the cache value they were folded into isn't stored either
+        with monkeypatch.context() as m:
+            m.setattr(
+                instance.event_log_storage, "_delete_asset_status_cache_deltas", _fail_to_delete
+            )
+            with pytest.raises(Exception, match="failed to delete"):
+                get_and_update_asset_status_cache_value(
+                    instance, asset_key, asset_graph.get_partitions_def(asset_key)
+                )
+        assert (
+            next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+            == cached_status
+        )
+        assert instance.get_asset_status_cache_deltas(asset_key) == deltas
+
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"a", "b"}
+        assert instance.get_asset_status_cache_deltas(asset_key) == []
@@ -7,6 +7,7 @@
 from dagster._core.storage.legacy_storage import LegacyRunStorage
 from dagster._core.storage.runs import InMemoryRunStorage, SqliteRunStorage
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._serdes import SerdesFormat
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
@@ -19,6 +20,12 @@ def create_sqlite_run_storage():
         yield SqliteRunStorage.from_local(tempdir)
 
 
+@contextmanager
+def create_compact_sqlite_run_storage():
+    with tempfile.TemporaryDirectory() as tempdir:
+        yield SqliteRunStorage.from_local(tempdir, serdes_format=SerdesFormat.COMPACT)
+
+
 @contextmanager
 def create_non_bucket_sqlite_run_storage():
     with tempfile.TemporaryDirectory() as tempdir:
@@ -62,7 +69,9 @@ def create_legacy_run_storage():
 class TestSqliteImplementation(TestRunStorage):
     __test__ = True
 
-    @pytest.fixture(name="storage", params=[create_sqlite_run_storage])
+    @pytest.fixture(
+        name="storage", params=[create_sqlite_run_storage, create_compact_sqlite_run_storage]
+    )
     def run_storage(self, request):
         with request.param() as s:
             yield s
@@ -0,0 +1,15 @@
+import tempfile
+
+import pytest
+from dagster._core.storage.runs.sqlite.sqlite_run_storage import SqliteRunStorage
+
+from .utils.run_storage_perf import TestRunStoragePerf
+
+
+class TestSqliteRunStoragePerf(TestRunStoragePerf):
+    __test__ = True
+
+    @pytest.fixture(name="storage")
+    def run_storage(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield SqliteRunStorage.from_local(tmpdir)
@@ -0,0 +1,245 @@
+import threading
+import time
+
+import pytest
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError, DagsterEventLogWriteError
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.write_behind import WriteBehindEventWriter
+
+
+def _create_event(message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message=message,
+        level="debug",
+        run_id="foo",
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "nonce",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def _noop(_events):
+    pass
+
+
+def test_write_behind_batches_and_flushes():
+    batches = []
+
+    writer = WriteBehindEventWriter(
+        store_fn=batches.append,
+        dispatch_fn=_noop,
+        max_queue_size=100,
+        flush_size=5,
+        flush_interval_seconds=10,
+    )
+    for i in range(12):
+        writer.enqueue(_create_event(str(i)))
+
+    writer.flush()
+    assert [event.user_message for batch in batches for event in batch] == [
+        str(i) for i in range(12)
+    ]
+    assert all(len(batch) <= 5 for batch in batches)
+
+    metrics = writer.get_metrics()
+    assert metrics.queue_depth == 0
+    assert metrics.events_written == 12
+    assert metrics.flush_count == len(batches)
+    assert metrics.last_flush_latency_seconds is not None
+
+    writer.close()
+    # events enqueued after close are written synchronously
+    writer.enqueue(_create_event("after close"))
+    assert batches[-1][0].user_message == "after close"
+
+
+def test_write_behind_backpressure():
+    release = threading.Event()
+    written = []
+
+    def _blocking_write(batch):
+        release.wait()
+        written.extend(batch)
+
+    writer = WriteBehindEventWriter(
+        store_fn=_blocking_write,
+        dispatch_fn=_noop,
+        max_queue_size=2,
+        flush_size=1,
+        flush_interval_seconds=0.01,
+    )
+
+    enqueued = []
+
+    def _produce():
+        for i in range(10):
+            writer.enqueue(_create_event(str(i)))
+            enqueued.append(i)
+
+    producer = threading.Thread(target=_produce)
+    producer.start()
+    time.sleep(0.5)
+
+    # the writer holds one event and the queue holds the rest, so the producer is blocked
+    assert len(enqueued) < 10
+    assert writer.get_metrics().max_queue_depth <= 3
+
+    release.set()
+    producer.join()
+    writer.close()
+    assert [event.user_message for event in written] == [str(i) for i in range(10)]
+
+
+def test_write_behind_retries_write_error():
+    written = []
+    attempts = []
+
+    def _fail_once(batch):
+        attempts.append(len(batch))
+        if len(attempts) == 1:
+            raise Exception("womp")
+        written.extend(batch)
+
+    writer = WriteBehindEventWriter(
+        store_fn=_fail_once,
+        dispatch_fn=_noop,
+        max_queue_size=10,
+        flush_size=10,
+        flush_interval_seconds=0.01,
+        retry_interval_seconds=0.01,
+    )
+    writer.enqueue(_create_event("0"))
+    writer.flush()
+    assert [event.user_message for event in written] == ["0"]
+    assert len(attempts) == 2
+
+    metrics = writer.get_metrics()
+    assert metrics.events_written == 1
+    assert metrics.failed_flush_count == 0
+    writer.close()
+
+
+def test_write_behind_write_error():
+    fail = threading.Event()
+    fail.set()
+    written = []
+
+    def _write(batch):
+        if fail.is_set():
+            raise Exception("womp")
+        written.extend(batch)
+
+    writer = WriteBehindEventWriter(
+        store_fn=_write,
+        dispatch_fn=_noop,
+        max_queue_size=10,
+        flush_size=10,
+        flush_interval_seconds=0.01,
+        max_write_attempts=2,
+        retry_interval_seconds=0.01,
+    )
+    writer.enqueue(_create_event("0"))
+
+    # events that could not be written are not counted, and the failure is raised on flush
+    with pytest.raises(DagsterEventLogWriteError):
+        writer.flush()
+    metrics = writer.get_metrics()
+    assert metrics.events_written == 0
+    assert metrics.queue_depth == 1
+    assert metrics.failed_flush_count >= 1
+
+    # new events are refused while the event log can't be written
+    with pytest.raises(DagsterEventLogWriteError):
+        writer.enqueue(_create_event("1"))
+
+    # the retained events are written once the event log recovers
+    fail.clear()
+    writer.flush()
+    assert [event.user_message for event in written] == ["0"]
+    assert writer.get_metrics().events_written == 1
+
+    writer.enqueue(_create_event("2"))
+    writer.close()
+    assert [event.user_message for event in written] == ["0", "2"]
+
+
+def test_write_behind_close_raises_unwritten_events():
+    def _fail(_batch):
+        raise Exception("womp")
+
+    writer = WriteBehindEventWriter(
+        store_fn=_fail,
+        dispatch_fn=_noop,
+        max_queue_size=10,
+        flush_size=10,
+        flush_interval_seconds=0.01,
+        max_write_attempts=1,
+        retry_interval_seconds=0.01,
+    )
+    writer.enqueue(_create_event("0"))
+    with pytest.raises(DagsterEventLogWriteError):
+        writer.close()
+
+
+def test_write_behind_retries_only_unstored_events():
+    stored = []
+    dispatched = []
+    attempts = []
+
+    def _store_partially_once(batch):
+        attempts.append([event.user_message for event in batch])
+        if len(attempts) == 1:
+            stored.extend(batch[:2])
+            raise DagsterEventBatchPartiallyStoredError("womp", num_stored=2)
+        stored.extend(batch)
+
+    writer = WriteBehindEventWriter(
+        store_fn=_store_partially_once,
+        dispatch_fn=dispatched.extend,
+        max_queue_size=10,
+        flush_size=3,
+        flush_interval_seconds=10,
+        retry_interval_seconds=0.01,
+    )
+    for i in range(3):
+        writer.enqueue(_create_event(str(i)))
+    writer.flush()
+
+    assert attempts == [["0", "1", "2"], ["2"]]
+    # every event is stored and dispatched exactly once
+    assert [event.user_message for event in stored] == ["0", "1", "2"]
+    assert [event.user_message for event in dispatched] == ["0", "1", "2"]
+    assert writer.get_metrics().events_written == 3
+    writer.close()
+
+
+def test_write_behind_does_not_retry_dispatch():
+    stored = []
+    dispatch_attempts = []
+
+    def _fail_dispatch(events):
+        dispatch_attempts.append(len(events))
+        raise Exception("womp")
+
+    writer = WriteBehindEventWriter(
+        store_fn=stored.extend,
+        dispatch_fn=_fail_dispatch,
+        max_queue_size=10,
+        flush_size=10,
+        flush_interval_seconds=0.01,
+        retry_interval_seconds=0.01,
+    )
+    writer.enqueue(_create_event("0"))
+    writer.flush()
+
+    # the events were stored, so a failure to dispatch them neither stores them again nor fails
+    # the flush
+    assert [event.user_message for event in stored] == ["0"]
+    assert dispatch_attempts == [1]
+    assert writer.get_metrics().failed_flush_count == 0
+    writer.close()
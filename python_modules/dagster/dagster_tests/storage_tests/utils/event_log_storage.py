@@ -14,6 +14,7 @@
     AssetMaterialization,
     AssetObservation,
     DagsterInstance,
+    DagsterInvariantViolationError,
     EventLogRecord,
     EventRecordsFilter,
     Field,
@@ -38,6 +39,7 @@
 from dagster._core.definitions.job_base import InMemoryJob
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
+from dagster._core.event_api import EventRecordsProjection, LazyEventLogRecord
 from dagster._core.events import (
     AssetMaterializationPlannedData,
     DagsterEvent,
@@ -63,6 +65,7 @@
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.test_utils import create_run_for_test, instance_for_test
@@ -70,7 +73,7 @@
 from dagster._core.utils import make_new_run_id
 from dagster._legacy import build_assets_job
 from dagster._loggers import colored_console_logger
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import deserialize_value, serialize_value
 from dagster._utils import datetime_as_float
 
 TEST_TIMEOUT = 5
@@ -1440,6 +1443,162 @@ def a_job():
                     ),
                 )
 
+    def test_get_event_records_projection(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "asset_one"])
+
+        @op
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key, partition="a")
+            yield AssetMaterialization(asset_key=asset_key, partition="b")
+            yield Output(1)
+
+        with instance_for_test() as instance:
+            if not storage.has_instance:
+                storage.register_instance(instance)
+
+            events, _ = _synthesize_events(
+                lambda: materialize_one(), instance=instance, run_id=test_run_id
+            )
+            for event in events:
+                storage.store_event(event)
+
+            records_filter = EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+            )
+            full_records = storage.get_event_records(records_filter)
+            lazy_records = storage.get_event_records(
+                records_filter, projection=EventRecordsProjection.LAZY
+            )
+            indexed_records = storage.get_event_records(
+                records_filter, projection=EventRecordsProjection.INDEXED_COLUMNS
+            )
+            assert len(full_records) == 2
+
+            for records in [lazy_records, indexed_records]:
+                assert all(isinstance(record, LazyEventLogRecord) for record in records)
+                assert [record.storage_id for record in records] == [
+                    record.storage_id for record in full_records
+                ]
+                assert [record.run_id for record in records] == [test_run_id, test_run_id]
+                assert [record.asset_key for record in records] == [asset_key, asset_key]
+                assert [record.partition_key for record in records] == ["b", "a"]
+                assert [record.event_type for record in records] == [
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                ]
+                for record, full_record in zip(records, full_records):
+                    assert record.timestamp == pytest.approx(full_record.timestamp, abs=1e-5)
+
+            assert lazy_records == full_records
+            assert [record.event_log_entry for record in lazy_records] == [
+                record.event_log_entry for record in full_records
+            ]
+            assert [record.asset_materialization.partition for record in lazy_records] == ["b", "a"]
+
+            with pytest.raises(DagsterInvariantViolationError, match="was not loaded"):
+                indexed_records[0].event_log_entry
+
+            # lazy records are serialized as the eager records they stand for
+            assert [
+                deserialize_value(serialize_value(record), EventLogRecord)
+                for record in storage.get_event_records(
+                    records_filter, projection=EventRecordsProjection.LAZY
+                )
+            ] == full_records
+
+            full_connection = storage.get_records_for_run(test_run_id)
+            lazy_connection = storage.get_records_for_run(
+                test_run_id, projection=EventRecordsProjection.LAZY
+            )
+            indexed_connection = storage.get_records_for_run(
+                test_run_id, projection=EventRecordsProjection.INDEXED_COLUMNS
+            )
+            assert lazy_connection.cursor == full_connection.cursor
+            assert indexed_connection.cursor == full_connection.cursor
+            assert [record.event_log_entry for record in lazy_connection.records] == [
+                record.event_log_entry for record in full_connection.records
+            ]
+            assert [record.event_type for record in indexed_connection.records] == [
+                record.event_type for record in full_connection.records
+            ]
+
+    def test_get_event_records_projection_unindexed_columns(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not index event columns")
+
+        asset_key = AssetKey(["path", "to", "asset_one"])
+
+        @op
+        def observe_one(_):
+            yield AssetObservation(asset_key=asset_key, partition="a")
+            yield Output(1)
+
+        with instance_for_test() as instance:
+            if not storage.has_instance:
+                storage.register_instance(instance)
+
+            events, _ = _synthesize_events(
+                lambda: observe_one(), instance=instance, run_id=test_run_id
+            )
+            for event in events:
+                storage.store_event(event)
+
+            # rows stored before the asset key and partition columns were indexed have them unset
+            unset_columns = (
+                SqlEventLogStorageTable.update()
+                .where(SqlEventLogStorageTable.c.run_id == test_run_id)
+                .values(asset_key=None, partition=None)
+            )
+            with storage.index_connection() as conn:
+                conn.execute(unset_columns)
+            if isinstance(storage, SqliteEventLogStorage):
+                with storage.run_connection(test_run_id) as conn:
+                    conn.execute(unset_columns)
+
+            records_filter = EventRecordsFilter(event_type=DagsterEventType.ASSET_OBSERVATION)
+            full_records = storage.get_event_records(records_filter)
+            lazy_records = storage.get_event_records(
+                records_filter, projection=EventRecordsProjection.LAZY
+            )
+            assert len(full_records) == 1
+            assert [record.asset_key for record in lazy_records] == [asset_key]
+            assert [record.partition_key for record in lazy_records] == ["a"]
+            assert [record.asset_key for record in lazy_records] == [
+                record.asset_key for record in full_records
+            ]
+
+            # without the event payload, there is nothing to fall back to
+            indexed_records = storage.get_event_records(
+                records_filter, projection=EventRecordsProjection.INDEXED_COLUMNS
+            )
+            assert [record.asset_key for record in indexed_records] == [None]
+
+    def test_get_event_records_projection_limit(self, storage):
+        @op(out={"a": Out(), "b": Out()})
+        def two_outputs():
+            yield Output(1, "a")
+            yield Output(2, "b")
+
+        run_ids = [make_new_run_id(), make_new_run_id()]
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            for run_id in run_ids:
+                create_run_for_test(created_instance, run_id=run_id)
+                events, _ = _synthesize_events(lambda: two_outputs(), run_id)
+                for event in events:
+                    storage.store_event(event)
+
+            records_filter = EventRecordsFilter(event_type=DagsterEventType.STEP_OUTPUT)
+            for projection in EventRecordsProjection:
+                assert len(storage.get_event_records(records_filter, projection=projection)) == 4
+                # the limit applies across run shards
+                assert (
+                    len(storage.get_event_records(records_filter, limit=3, projection=projection))
+                    == 3
+                )
+
     def test_watch_exc_recovery(self, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -2730,6 +2889,85 @@ def my_op():
                 {"dagster/partition/country": "US", "dagster/partition/date": "2022-10-13"}
             ]
 
+    def test_store_events_batch(self, storage, instance):
+        key = AssetKey("hello")
+
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=key, tags={"dagster/partition/country": "US"})
+            yield AssetObservation(asset_key=AssetKey("other_key"))
+            yield AssetMaterialization(asset_key=key, tags={"dagster/partition/country": "CA"})
+            yield Output(5)
+
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+            events_one, _ = _synthesize_events(lambda: my_op(), run_id_1)
+            events_two, _ = _synthesize_events(lambda: my_op(), run_id_2)
+            storage.store_events(events_one + events_two)
+
+            for run_id, events in [(run_id_1, events_one), (run_id_2, events_two)]:
+                stored = storage.get_logs_for_run(run_id)
+                assert [event.user_message for event in stored] == [
+                    event.user_message for event in events
+                ]
+                assert _event_types(stored) == _event_types(events)
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=key),
+                ascending=True,
+            )
+            assert len(materializations) == 4
+            assert [record.event_log_entry.run_id for record in materializations] == [
+                run_id_1,
+                run_id_1,
+                run_id_2,
+                run_id_2,
+            ]
+
+            asset_keys = set(storage.all_asset_keys())
+            assert key in asset_keys
+            assert AssetKey("other_key") in asset_keys
+
+            [asset_record] = storage.get_asset_records([key])
+            assert asset_record.asset_entry.last_materialization_record.storage_id == (
+                materializations[-1].storage_id
+            )
+            assert asset_record.asset_entry.last_run_id == run_id_2
+
+            # each asset event's tags are stored against the storage id of its own event log row
+            for record, country in zip(materializations, ["US", "CA", "US", "CA"]):
+                assert storage.get_event_tags_for_asset(key, filter_event_id=record.storage_id) == [
+                    {"dagster/partition/country": country}
+                ]
+
+    def test_store_events_batch_is_atomic(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage) or self.is_sqlite(storage):
+            pytest.skip("storage does not write its event logs and index tables in one database")
+
+        key = AssetKey("hello")
+
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=key, tags={"dagster/partition/country": "US"})
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            with mock.patch.object(
+                storage, "write_asset_event_tags_batch", side_effect=Exception("failed")
+            ):
+                with pytest.raises(Exception, match="failed"):
+                    storage.store_events(events)
+
+            # neither the event log rows nor the asset key row of the batch were committed
+            assert storage.get_logs_for_run(run_id) == []
+            assert key not in storage.all_asset_keys()
+
+            storage.store_events(events)
+            assert len(storage.get_logs_for_run(run_id)) == len(events)
+            assert key in storage.all_asset_keys()
+
     def test_add_asset_event_tags(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
@@ -3169,6 +3407,7 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                pending_planned_partition_run_ids={"b": run_id_2},
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
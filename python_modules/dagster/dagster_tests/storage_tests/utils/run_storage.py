@@ -12,7 +12,7 @@
     DagsterRunNotFoundError,
     DagsterSnapshotDoesNotExist,
 )
-from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.host_representation import (
     ExternalRepositoryOrigin,
@@ -39,6 +39,7 @@
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -203,6 +204,58 @@ def test_fetch_by_repo(self, storage):
         )
         assert len(two_runs) == 1
 
+    def test_fetch_run_tags_records(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                job_name="some_job",
+                tags={PRIORITY_TAG: "5", "foo": "bar"},
+                status=DagsterRunStatus.QUEUED,
+                external_job_origin=self.fake_job_origin("some_job", "fake_repo"),
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two, job_name="some_job", status=DagsterRunStatus.STARTED
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                job_name="other_job",
+                tags={"foo": "baz"},
+                status=DagsterRunStatus.QUEUED,
+                external_job_origin=self.fake_job_origin("other_job", "fake_repo"),
+            )
+        )
+
+        records = storage.get_run_tags_records(ascending=True)
+        assert [record.run_id for record in records] == [one, two, three]
+        assert [record.run_id for record in storage.get_run_tags_records()] == [three, two, one]
+
+        assert records[0].status == DagsterRunStatus.QUEUED
+        assert records[0].tags == {PRIORITY_TAG: "5", "foo": "bar"}
+        assert records[0].priority == 5
+        assert records[0].location_name == "fake:fake"
+
+        assert records[1].tags == {}
+        assert records[1].priority == 0
+        assert records[1].location_name is None
+
+        queued_records = storage.get_run_tags_records(
+            RunsFilter(statuses=[DagsterRunStatus.QUEUED]), ascending=True
+        )
+        assert [record.run_id for record in queued_records] == [one, three]
+        assert [
+            record.run_id
+            for record in storage.get_run_tags_records(RunsFilter(tags={"foo": "baz"}))
+        ] == [three]
+
     def test_fetch_by_snapshot_id(self, storage):
         assert storage
         job_def_a = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -330,6 +383,42 @@ def test_add_run_tags(self, storage):
             "tag4": "val4",
         }
 
+    def test_add_run_tags_bulk(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+
+        storage.add_run(TestRunStorage.build_run(run_id=one, job_name="foo", tags={"tag1": "a"}))
+        storage.add_run(TestRunStorage.build_run(run_id=two, job_name="bar"))
+        storage.add_run(TestRunStorage.build_run(run_id=three, job_name="baz"))
+
+        storage.add_run_tags_bulk(
+            {
+                one: {"tag1": "b", "tag2": "c"},
+                two: {PARTITION_NAME_TAG: "p1", PARTITION_SET_TAG: "ps"},
+            }
+        )
+
+        assert _get_run_by_id(storage, one).tags == {"tag1": "b", "tag2": "c"}
+        assert _get_run_by_id(storage, two).tags == {
+            PARTITION_NAME_TAG: "p1",
+            PARTITION_SET_TAG: "ps",
+        }
+        assert _get_run_by_id(storage, three).tags == {}
+
+        assert [run.run_id for run in storage.get_runs(RunsFilter(tags={"tag1": "b"}))] == [one]
+        assert not storage.get_runs(RunsFilter(tags={"tag1": "a"}))
+        assert [
+            run.run_id for run in storage.get_runs(RunsFilter(tags={PARTITION_SET_TAG: "ps"}))
+        ] == [two]
+
+        with pytest.raises(DagsterRunNotFoundError):
+            storage.add_run_tags_bulk({three: {"tag3": "d"}, make_new_run_id(): {"tag3": "d"}})
+
+        # nothing is written when any of the runs is missing
+        assert _get_run_by_id(storage, three).tags == {}
+
     def test_get_run_tags(self, storage):
         one = make_new_run_id()
         two = make_new_run_id()
@@ -1339,6 +1428,61 @@ def test_handle_run_event_job_success_test(self, storage):
 
         assert _get_run_by_id(storage, run_id).status == DagsterRunStatus.SUCCESS
 
+    def test_handle_run_events(self, storage):
+        self._skip_in_memory(storage)
+
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        for run_id in [one, two, three]:
+            storage.add_run(TestRunStorage.build_run(job_name="pipeline_name", run_id=run_id))
+
+        def _event(event_type):
+            return DagsterEvent(
+                message="a message", event_type_value=event_type.value, job_name="pipeline_name"
+            )
+
+        storage.handle_run_events(
+            [
+                (one, _event(DagsterEventType.PIPELINE_START)),
+                (two, _event(DagsterEventType.PIPELINE_START)),
+                (
+                    two,
+                    DagsterEvent(
+                        event_type_value=DagsterEventType.ENGINE_EVENT.value,
+                        job_name="pipeline_name",
+                        event_specific_data=EngineEventData(),
+                    ),
+                ),
+                (one, _event(DagsterEventType.PIPELINE_SUCCESS)),
+                (make_new_run_id(), _event(DagsterEventType.PIPELINE_FAILURE)),  # diff run
+            ]
+        )
+
+        assert _get_run_by_id(storage, one).status == DagsterRunStatus.SUCCESS
+        assert _get_run_by_id(storage, two).status == DagsterRunStatus.STARTED
+        assert _get_run_by_id(storage, three).status == DagsterRunStatus.NOT_STARTED
+
+        one_record = storage.get_run_records(RunsFilter(run_ids=[one]))[0]
+        assert one_record.start_time is not None
+        assert one_record.end_time is not None
+
+        two_record = storage.get_run_records(RunsFilter(run_ids=[two]))[0]
+        assert two_record.start_time is not None
+        assert two_record.end_time is None
+
+        storage.handle_run_events(
+            [
+                (two, _event(DagsterEventType.PIPELINE_FAILURE)),
+                (three, _event(DagsterEventType.PIPELINE_CANCELED)),
+            ]
+        )
+
+        assert _get_run_by_id(storage, two).status == DagsterRunStatus.FAILURE
+        assert _get_run_by_id(storage, three).status == DagsterRunStatus.CANCELED
+        assert storage.get_run_records(RunsFilter(run_ids=[two]))[0].end_time is not None
+        assert storage.get_run_records(RunsFilter(run_ids=[three]))[0].start_time is None
+
     def test_debug_snapshot_import(self, storage):
         from dagster._core.execution.api import create_execution_plan
         from dagster._core.snap import (
@@ -1512,6 +1656,72 @@ def _add_run(job_name, tags=None):
         assert runs_by_tag.get("2").run_id == two.run_id
         assert runs_by_tag.get("3").run_id == three.run_id
 
+    def test_by_job_bucket_limit(self, storage):
+        if not storage.supports_bucket_queries:
+            pytest.skip("storage cannot bucket")
+
+        def _add_run(job_name, tags=None):
+            return storage.add_run(
+                TestRunStorage.build_run(job_name=job_name, run_id=make_new_run_id(), tags=tags)
+            )
+
+        a_runs = [_add_run("a_pipeline", tags={"a": "A"}) for _ in range(4)]
+        b_runs = [_add_run("b_pipeline", tags={"a": "A" if i % 2 else "B"}) for i in range(4)]
+        _add_run("c_pipeline")
+
+        runs = storage.get_runs(
+            bucket_by=JobBucket(
+                job_names=["a_pipeline", "b_pipeline", "d_pipeline"], bucket_limit=2
+            )
+        )
+        assert sorted(run.run_id for run in runs) == sorted(
+            run.run_id for run in [a_runs[3], a_runs[2], b_runs[3], b_runs[2]]
+        )
+
+        # fetch with a runs filter applied
+        records = storage.get_run_records(
+            filters=RunsFilter(tags={"a": "A"}),
+            bucket_by=JobBucket(job_names=["a_pipeline", "b_pipeline"], bucket_limit=2),
+        )
+        assert sorted(record.dagster_run.run_id for record in records) == sorted(
+            run.run_id for run in [a_runs[3], a_runs[2], b_runs[3], b_runs[1]]
+        )
+
+        # the runs of each job are interleaved, latest first
+        runs = storage.get_runs(
+            bucket_by=JobBucket(job_names=["a_pipeline", "b_pipeline"], bucket_limit=3)
+        )
+        assert [run.run_id for run in runs] == [
+            run.run_id for run in [b_runs[3], a_runs[3], b_runs[2], a_runs[2], b_runs[1], a_runs[1]]
+        ]
+
+    def test_fetch_records_cursored_by_sort_column(self, storage):
+        run_ids = [make_new_run_id() for _ in range(5)]
+        for run_id in run_ids:
+            storage.add_run(TestRunStorage.build_run(run_id=run_id, job_name="some_pipeline"))
+
+        # runs created in the same instant share their timestamps, so paging through them must
+        # break ties consistently
+        for ascending in [True, False]:
+            paged_run_ids = []
+            cursor = None
+            while True:
+                records = storage.get_run_records(
+                    limit=2, order_by="create_timestamp", ascending=ascending, cursor=cursor
+                )
+                if not records:
+                    break
+                paged_run_ids.extend(record.dagster_run.run_id for record in records)
+                cursor = records[-1].dagster_run.run_id
+
+            assert paged_run_ids == (run_ids if ascending else list(reversed(run_ids)))
+
+        assert [
+            record.dagster_run.run_id
+            for record in storage.get_run_records(cursor=run_ids[1], ascending=True)
+        ] == run_ids[2:]
+        assert storage.get_runs_count(RunsFilter(job_name="some_pipeline")) == 5
+
     def test_run_record_timestamps(self, storage):
         assert storage
 
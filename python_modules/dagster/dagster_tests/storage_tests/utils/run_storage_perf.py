@@ -0,0 +1,173 @@
+"""Times the run queries behind dagit's runs views against a run storage populated with many
+runs.
+"""
+import random
+from typing import Callable, List, NamedTuple, Sequence
+
+import dagster._check as check
+import pytest
+from dagster._core.storage.dagster_run import (
+    DagsterRun,
+    DagsterRunStatus,
+    JobBucket,
+    RunsFilter,
+    TagBucket,
+)
+from dagster._core.storage.runs.base import RunStorage
+from dagster._core.utils import make_new_run_id
+from dagster._utils.test.perf import Timing, benchmark, best_time, print_timings
+
+NUM_JOBS = 50
+PAGE_SIZE = 25
+STATUSES = [
+    DagsterRunStatus.SUCCESS,
+    DagsterRunStatus.FAILURE,
+    DagsterRunStatus.CANCELED,
+    DagsterRunStatus.STARTED,
+    DagsterRunStatus.NOT_STARTED,
+]
+
+
+class RunQueryCase(NamedTuple):
+    name: str
+    query: Callable[[RunStorage], Sequence[object]]
+
+
+def _job_name(i: int) -> str:
+    return f"job_{i}"
+
+
+def populate_run_storage(storage: RunStorage, num_runs: int, seed: int = 0) -> None:
+    """Adds num_runs runs spread over NUM_JOBS jobs, with a mix of statuses and tags."""
+    rng = random.Random(seed)
+    for i in range(num_runs):
+        storage.add_run(
+            DagsterRun(
+                job_name=_job_name(rng.randrange(NUM_JOBS)),
+                run_id=make_new_run_id(),
+                status=rng.choice(STATUSES),
+                tags={
+                    "team": f"team_{rng.randrange(5)}",
+                    "env": "prod" if rng.random() < 0.8 else "dev",
+                    "batch": str(i // 1000),
+                },
+            )
+        )
+
+
+def run_query_cases() -> Sequence[RunQueryCase]:
+    job_names = [_job_name(i) for i in range(NUM_JOBS)]
+
+    def _second_page(filters: RunsFilter) -> Callable[[RunStorage], Sequence[object]]:
+        def _query(storage: RunStorage) -> Sequence[object]:
+            first_page = storage.get_runs(filters, limit=PAGE_SIZE)
+            if not first_page:
+                return []
+            return storage.get_runs(filters, cursor=first_page[-1].run_id, limit=PAGE_SIZE)
+
+        return _query
+
+    return [
+        RunQueryCase("latest page", lambda storage: storage.get_runs(limit=PAGE_SIZE)),
+        RunQueryCase("second page", _second_page(RunsFilter())),
+        RunQueryCase(
+            "by status",
+            lambda storage: storage.get_runs(
+                RunsFilter(statuses=[DagsterRunStatus.FAILURE]), limit=PAGE_SIZE
+            ),
+        ),
+        RunQueryCase(
+            "by job and status",
+            lambda storage: storage.get_runs(
+                RunsFilter(job_name=_job_name(0), statuses=[DagsterRunStatus.FAILURE]),
+                limit=PAGE_SIZE,
+            ),
+        ),
+        RunQueryCase(
+            "by tags",
+            lambda storage: storage.get_runs(
+                RunsFilter(tags={"team": "team_1", "env": "dev"}), limit=PAGE_SIZE
+            ),
+        ),
+        RunQueryCase(
+            "by job and tags, second page",
+            _second_page(RunsFilter(job_name=_job_name(1), tags={"env": "prod"})),
+        ),
+        RunQueryCase(
+            "records by update time",
+            lambda storage: storage.get_run_records(
+                limit=PAGE_SIZE, order_by="update_timestamp", ascending=False
+            ),
+        ),
+        RunQueryCase(
+            "count by status",
+            lambda storage: [
+                storage.get_runs_count(RunsFilter(statuses=[DagsterRunStatus.SUCCESS]))
+            ],
+        ),
+        RunQueryCase(
+            "latest run per job",
+            lambda storage: storage.get_runs(
+                bucket_by=JobBucket(job_names=job_names, bucket_limit=1)
+            ),
+        ),
+        RunQueryCase(
+            "latest 5 runs per job, by tag",
+            lambda storage: storage.get_runs(
+                RunsFilter(tags={"env": "prod"}),
+                bucket_by=JobBucket(job_names=job_names, bucket_limit=5),
+            ),
+        ),
+        RunQueryCase(
+            "latest run per tag",
+            lambda storage: storage.get_runs(
+                bucket_by=TagBucket(
+                    tag_key="team", tag_values=[f"team_{i}" for i in range(5)], bucket_limit=1
+                )
+            ),
+        ),
+    ]
+
+
+def time_run_queries(storage: RunStorage, repeat: int = 3) -> Sequence[Timing]:
+    """Runs each query case repeat times and reports the fastest time, counting its results."""
+    timings: List[Timing] = []
+    for case in run_query_cases():
+        num_results = len(case.query(storage))
+        timings.append(
+            Timing(case.name, best_time(lambda: case.query(storage), repeat), num_results)
+        )
+    return timings
+
+
+class TestRunStoragePerf:
+    """You can extend this class to check the run queries behind dagit's runs views against any run
+    storage, and to benchmark them when DAGSTER_PERF_BENCHMARKS is set. When extending, you simply
+    need to override the `run_storage` fixture and return a clean instance of your implementation
+    of `RunStorage`, as with TestRunStorage.
+    """
+
+    __test__ = False
+
+    @pytest.fixture(name="storage", params=[])
+    def run_storage(self, request):
+        with request.param() as s:
+            yield s
+
+    def test_run_query_cases(self, storage: RunStorage):
+        populate_run_storage(storage, 300)
+
+        timings = time_run_queries(storage, repeat=1)
+        counts = {timing.name: timing.count for timing in timings}
+
+        assert counts["latest page"] == PAGE_SIZE
+        assert counts["second page"] == PAGE_SIZE
+        assert counts["count by status"] == 1
+        assert 0 < check.not_none(counts["latest run per job"]) <= NUM_JOBS
+        assert 0 < check.not_none(counts["latest run per tag"]) <= 5
+
+    @benchmark
+    @pytest.mark.parametrize("num_runs", [20_000, 100_000])
+    def test_benchmark_run_queries(self, storage: RunStorage, num_runs: int):
+        populate_run_storage(storage, num_runs)
+        print_timings(f"{type(storage).__name__}, {num_runs} runs", time_run_queries(storage))
@@ -4,7 +4,7 @@
 )
 from dagster._core.definitions.reconstruct import ReconstructableJob
 from dagster._core.events import EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import create_step_execution_plan, execute_plan_iterator
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._serdes import serialize_value, unpack_value
 
@@ -35,11 +35,16 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
 
         step_keys_str = ", ".join(execute_step_args.step_keys_to_execute)
 
-        execution_plan = create_execution_plan(
+        execution_plan = create_step_execution_plan(
             recon_job,
-            dagster_run.run_config,
+            dagster_run,
             step_keys_to_execute=execute_step_args.step_keys_to_execute,
             known_state=execute_step_args.known_state,
+            execution_plan_snapshot=(
+                instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id)
+                if dagster_run.execution_plan_snapshot_id
+                else None
+            ),
         )
 
         engine_event = instance.report_engine_event(
@@ -1,4 +1,5 @@
-from typing import ContextManager, Optional
+from contextlib import contextmanager
+from typing import ContextManager, Iterator, Optional
 
 import dagster._check as check
 import sqlalchemy as db
@@ -184,6 +185,13 @@ def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connect
     def index_connection(self) -> ContextManager[Connection]:
         return self._connect()
 
+    @contextmanager
+    def transaction(self, conn: Connection) -> Iterator[Connection]:
+        # The engine autocommits, so explicitly open a database transaction
+        transaction_conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with transaction_conn.begin():
+            yield transaction_conn
+
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
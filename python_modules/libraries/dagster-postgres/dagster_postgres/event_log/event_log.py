@@ -1,17 +1,24 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, Tuple
 
 import dagster._check as check
+import psycopg2.extensions
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_EVENTS
+from dagster._core.events import ASSET_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import pg_config
+from dagster._core.storage.config import (
+    incremental_asset_status_cache_config,
+    pg_config,
+    serdes_format_config,
+)
 from dagster._core.storage.event_log import (
     AssetKeyTable,
+    AssetStatusCacheDeltasTable,
     DynamicPartitionsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
@@ -19,7 +26,7 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.sql_event_log import ASSET_STATUS_CACHE_EVENTS
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -27,7 +34,12 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_value
+from dagster._serdes import (
+    ConfigurableClass,
+    ConfigurableClassData,
+    SerdesFormat,
+    deserialize_value,
+)
 from sqlalchemy.engine import Connection
 
 from ..utils import (
@@ -38,6 +50,7 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .event_watcher import PostgresEventWatcher
 
 CHANNEL_NAME = "run_events"
 
@@ -76,8 +89,14 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        serdes_format: SerdesFormat = SerdesFormat.JSON,
+        incremental_asset_status_cache: bool = False,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._serdes_format = check.inst_param(serdes_format, "serdes_format", SerdesFormat)
+        self._incremental_asset_status_cache = check.bool_param(
+            incremental_asset_status_cache, "incremental_asset_status_cache"
+        )
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
@@ -90,7 +109,9 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = PostgresEventWatcher(
+            self, self._create_listen_connection, CHANNEL_NAME
+        )
 
         self._secondary_index_cache = {}
 
@@ -136,9 +157,21 @@ def upgrade(self) -> None:
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        return self._serdes_format
+
+    @property
+    def incremental_asset_status_cache(self) -> bool:
+        return self._incremental_asset_status_cache
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {
+            **pg_config(),
+            "serdes_format": serdes_format_config(),
+            "incremental_asset_status_cache": incremental_asset_status_cache_config(),
+        }
 
     @classmethod
     def from_config_value(
@@ -148,6 +181,10 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            serdes_format=config_value.get("serdes_format", SerdesFormat.JSON),
+            incremental_asset_status_cache=config_value.get(
+                "incremental_asset_status_cache", False
+            ),
         )
 
     @staticmethod
@@ -181,7 +218,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # notify PostgresEventWatcher listeners of the new event
             conn.execute(
                 f"""NOTIFY {CHANNEL_NAME}, %s; """,
                 (res[0] + "_" + str(res[1]),),  # type: ignore
@@ -202,6 +239,88 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the event log rows for a batch of events in a single multi-row statement,
+        returning the storage id of each event in the order of the given events. Must be called
+        within a transaction opened with `transaction`, so that the notifications of the events
+        are only delivered once their rows are committed.
+
+        The ids are drawn from the table's sequence before the insert and assigned explicitly, since
+        neither the order of the rows returned by INSERT ... RETURNING nor the order in which a
+        multi-row insert draws from the sequence is guaranteed.
+        """
+        if not events:
+            return []
+
+        event_ids = sorted(
+            int(row[0])
+            for row in conn.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                (SqlEventLogStorageTable.name, len(events)),
+            )
+        )
+        conn.execute(
+            SqlEventLogStorageTable.insert().values(
+                [
+                    dict(self._get_insert_event_values(event), id=event_id)
+                    for event, event_id in zip(events, event_ids)
+                ]
+            )
+        )
+
+        # notify PostgresEventWatcher listeners of the new events
+        conn.execute(
+            f"""SELECT pg_notify('{CHANNEL_NAME}', payload) FROM unnest(%s::text[]) AS payload""",
+            ([event.run_id + "_" + str(event_id) for event, event_id in zip(events, event_ids)],),
+        )
+        return event_ids
+
+    @contextmanager
+    def transaction(self, conn: Connection) -> Iterator[Connection]:
+        # The engine autocommits, so explicitly open a database transaction
+        transaction_conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with transaction_conn.begin():
+            yield transaction_conn
+
+    def writes_asset_key_index_cols(self) -> bool:
+        return self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+
+    def write_asset_event_batch(
+        self,
+        conn: Connection,
+        events_with_ids: Sequence[Tuple[EventLogEntry, int]],
+        has_asset_key_index_cols: bool,
+        records_asset_status_cache_deltas: bool,
+    ) -> None:
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events_with_ids, has_asset_key_index_cols
+        )
+        if not values_by_asset_key:
+            return
+
+        self._upsert_asset_entry_values(conn, values_by_asset_key)
+        if records_asset_status_cache_deltas:
+            self.store_asset_status_cache_deltas(conn, events_with_ids)
+
+    def _upsert_asset_entry_values(
+        self, conn, values_by_asset_key: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        for asset_key_str, values in values_by_asset_key.items():
+            query = db_dialects.postgresql.insert(AssetKeyTable).values(
+                asset_key=asset_key_str,
+                **values,
+            )
+            if values:
+                query = query.on_conflict_do_update(
+                    index_elements=[AssetKeyTable.c.asset_key],
+                    set_=dict(**values),
+                )
+            else:
+                query = query.on_conflict_do_nothing()
+            conn.execute(query)
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -237,6 +356,11 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         # run id for a set of assets in one roundtrip call to event log storage.
         # https://github.com/dagster-io/dagster/pull/7319
 
+        if self.records_asset_status_cache_deltas():
+            # the asset key row and the asset status cache deltas are written in one transaction
+            self.store_asset_event_batch([(event, event_id)])
+            return
+
         values = self._get_asset_entry_values(
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
@@ -254,6 +378,55 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+    def store_asset_status_cache_deltas(
+        self, conn, events_with_ids: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        # Overload base implementation to push upsert logic down into the db layer, so that
+        # concurrent writers to the same asset partition don't conflict.
+        for event, event_id in sorted(events_with_ids, key=lambda e: e[1]):
+            dagster_event = event.dagster_event
+            if (
+                not dagster_event
+                or dagster_event.event_type not in ASSET_STATUS_CACHE_EVENTS
+                or not dagster_event.partition
+            ):
+                continue
+
+            materialized = dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION
+            query = db_dialects.postgresql.insert(AssetStatusCacheDeltasTable).values(
+                asset_key=check.not_none(dagster_event.asset_key).to_string(),
+                partition=dagster_event.partition,
+                materialized=materialized,
+                planned_run_id=None if materialized else event.run_id,
+                first_storage_id=event_id,
+                latest_storage_id=event_id,
+            )
+            is_latest = (
+                query.excluded.latest_storage_id > AssetStatusCacheDeltasTable.c.latest_storage_id
+            )
+            conn.execute(
+                query.on_conflict_do_update(
+                    index_elements=[
+                        AssetStatusCacheDeltasTable.c.asset_key,
+                        AssetStatusCacheDeltasTable.c.partition,
+                    ],
+                    set_=dict(
+                        materialized=db.or_(
+                            AssetStatusCacheDeltasTable.c.materialized,
+                            query.excluded.materialized,
+                        ),
+                        planned_run_id=db.case(
+                            [(is_latest, query.excluded.planned_run_id)],
+                            else_=AssetStatusCacheDeltasTable.c.planned_run_id,
+                        ),
+                        latest_storage_id=db.func.greatest(
+                            AssetStatusCacheDeltasTable.c.latest_storage_id,
+                            query.excluded.latest_storage_id,
+                        ),
+                    ),
+                )
+            )
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -277,6 +450,11 @@ def add_dynamic_partitions(
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
+    def _create_listen_connection(self) -> psycopg2.extensions.connection:
+        # A raw DBAPI connection, held open by the event watcher outside of the engine's pool
+        cargs, cparams = self._engine.dialect.create_connect_args(self._engine.url)
+        return self._engine.dialect.connect(*cargs, **cparams)
+
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
         return self._connect()
 
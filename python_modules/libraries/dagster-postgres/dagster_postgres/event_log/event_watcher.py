@@ -0,0 +1,213 @@
+import logging
+import select
+import threading
+from typing import Callable, List, MutableMapping, Optional, Set
+
+import dagster._check as check
+import psycopg2
+import psycopg2.extensions
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.polling_event_watcher import POLLING_CADENCE
+
+RECONNECT_WAIT_SECONDS = 1.0
+
+
+class _WatchedCallback:
+    """A subscriber to a run, along with the storage id of the last event it has been sent."""
+
+    def __init__(self, callback: Callable[[EventLogEntry, str], None], cursor: Optional[str]):
+        self.callback = callback
+        self.storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+
+
+class PostgresEventWatcher:
+    """Event Log Watcher that multiplexes all watched runs over a single LISTEN connection.
+
+    `PostgresEventLogStorage.store_event` issues a NOTIFY on `channel` with a `<run_id>_<storage_id>`
+    payload for every event it writes. A single thread listens on that channel, and for every
+    notification concerning a watched run, fetches the new events for that run once and fans them
+    out to each of the run's subscribers (taking into account each subscriber's cursor).
+
+    While the LISTEN connection is unavailable, the thread falls back to polling every watched run
+    each time it retries the connection, and it catches every watched run up once after
+    reconnecting so that no notifications sent while disconnected are missed.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _callbacks_by_run_id and _runs_to_fetch
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        connect_fn: Callable[[], psycopg2.extensions.connection],
+        channel: str,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._connect_fn = check.callable_param(connect_fn, "connect_fn")
+        self._channel = check.str_param(channel, "channel")
+
+        self._lock = threading.Lock()
+        self._callbacks_by_run_id: MutableMapping[str, List[_WatchedCallback]] = {}
+        # runs that need to be fetched on the next iteration, regardless of notifications
+        self._runs_to_fetch: Set[str] = set()
+
+        self._thread: Optional[threading.Thread] = None
+        self._should_thread_exit = threading.Event()
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._callbacks_by_run_id
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        with self._lock:
+            self._callbacks_by_run_id.setdefault(run_id, []).append(
+                _WatchedCallback(callback, cursor)
+            )
+            # send the new subscriber any events already written after its cursor
+            self._runs_to_fetch.add(run_id)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="postgres-event-watch", daemon=True
+                )
+                self._thread.start()
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                return
+            callbacks = [
+                watched
+                for watched in self._callbacks_by_run_id[run_id]
+                if watched.callback != handler
+            ]
+            if callbacks:
+                self._callbacks_by_run_id[run_id] = callbacks
+            else:
+                del self._callbacks_by_run_id[run_id]
+                self._runs_to_fetch.discard(run_id)
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            if self._thread and self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        conn = None
+        while not self._should_thread_exit.is_set():
+            if conn is None:
+                conn = self._listen()
+                if conn is None:
+                    # fall back to polling every watched run until we can LISTEN again
+                    self._fetch_and_dispatch(self._watched_run_ids())
+                    self._should_thread_exit.wait(RECONNECT_WAIT_SECONDS)
+                    continue
+
+                # catch up on anything written while we were not listening
+                with self._lock:
+                    self._runs_to_fetch.update(self._callbacks_by_run_id.keys())
+
+            try:
+                notified_run_ids = self._wait_for_notifications(conn)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                logging.warning("Lost LISTEN connection for event watch, reconnecting.")
+                self._close_connection(conn)
+                conn = None
+                continue
+
+            with self._lock:
+                run_ids = (notified_run_ids | self._runs_to_fetch) & set(
+                    self._callbacks_by_run_id.keys()
+                )
+                self._runs_to_fetch = set()
+
+            self._fetch_and_dispatch(run_ids)
+
+        if conn is not None:
+            self._close_connection(conn)
+
+    def _listen(self) -> Optional[psycopg2.extensions.connection]:
+        try:
+            conn = self._connect_fn()
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self._channel};")
+            return conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            logging.warning("Could not open LISTEN connection for event watch, polling instead.")
+            return None
+
+    def _close_connection(self, conn: psycopg2.extensions.connection) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def _wait_for_notifications(self, conn: psycopg2.extensions.connection) -> Set[str]:
+        # wake up at least every POLLING_CADENCE to pick up new subscribers and exit requests
+        if select.select([conn], [], [], POLLING_CADENCE) == ([], [], []):
+            return set()
+
+        conn.poll()
+        run_ids = set()
+        while conn.notifies:
+            notification = conn.notifies.pop(0)
+            run_id, _, _storage_id = notification.payload.rpartition("_")
+            if run_id:
+                run_ids.add(run_id)
+        return run_ids
+
+    def _watched_run_ids(self) -> Set[str]:
+        with self._lock:
+            return set(self._callbacks_by_run_id.keys())
+
+    def _fetch_and_dispatch(self, run_ids: Set[str]) -> None:
+        for run_id in run_ids:
+            try:
+                self._fetch_and_dispatch_run(run_id)
+            except Exception:
+                logging.exception(
+                    "Exception while fetching events for event watch on run %s.", run_id
+                )
+
+    def _fetch_and_dispatch_run(self, run_id: str) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks_by_run_id.get(run_id, []))
+        if not callbacks:
+            return
+
+        storage_ids = [watched.storage_id for watched in callbacks]
+        if any(storage_id is None for storage_id in storage_ids):
+            cursor = None
+        else:
+            cursor = str(EventLogCursor.from_storage_id(min(storage_ids)))  # type: ignore
+
+        records = self._event_log_storage.get_records_for_run(run_id, cursor=cursor).records
+        for record in records:
+            record_cursor = str(EventLogCursor.from_storage_id(record.storage_id))
+            for watched in callbacks:
+                if watched.storage_id is not None and watched.storage_id >= record.storage_id:
+                    continue
+                watched.storage_id = record.storage_id
+                try:
+                    watched.callback(record.event_log_entry, record_cursor)
+                except Exception:
+                    logging.exception("Exception in callback for event watch on run %s.", run_id)
@@ -5,7 +5,11 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import (
+    PostgresStorageConfig,
+    pg_config,
+    serdes_format_config,
+)
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -21,7 +25,12 @@
     stamp_alembic_rev,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
+from dagster._serdes import (
+    ConfigurableClass,
+    ConfigurableClassData,
+    SerdesFormat,
+    serialize_value,
+)
 from dagster._utils import utc_datetime_from_timestamp
 from sqlalchemy.engine import Connection
 
@@ -68,8 +77,10 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        serdes_format: SerdesFormat = SerdesFormat.JSON,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._serdes_format = check.inst_param(serdes_format, "serdes_format", SerdesFormat)
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
@@ -124,9 +135,13 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        return self._serdes_format
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {**pg_config(), "serdes_format": serdes_format_config()}
 
     @classmethod
     def from_config_value(
@@ -136,6 +151,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            serdes_format=config_value.get("serdes_format", SerdesFormat.JSON),
         )
 
     @staticmethod
@@ -1,10 +1,15 @@
+import threading
 import time
 
+import psycopg2
 import pytest
 import yaml
+from dagster._core.storage.event_log import SqliteEventLogStorage
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import instance_for_test
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_watcher import PostgresEventWatcher
+from dagster_postgres.utils import get_conn
 from dagster_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
     create_test_event_log_record,
@@ -81,6 +86,73 @@ def watch_two(event, _cursor):
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
 
+    def test_event_watcher_multiplexes_runs(self, storage):
+        run_ids = [f"run_{i}" for i in range(20)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+        for run_id in run_ids:
+            storage.watch(run_id, None, callbacks[run_id])
+
+        for run_id in run_ids:
+            storage.store_event(create_test_event_log_record("1", run_id=run_id))
+            storage.store_event(create_test_event_log_record("2", run_id=run_id))
+
+        attempts = 10
+        while any(len(events) < 2 for events in watched.values()) and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        for run_id in run_ids:
+            assert [int(evt.message) for evt in watched[run_id]] == [1, 2]
+
+        # all runs are watched from a single thread
+        assert (
+            len(
+                [
+                    thread
+                    for thread in threading.enumerate()
+                    if thread.name == "postgres-event-watch"
+                ]
+            )
+            == 1
+        )
+
+        for run_id in run_ids:
+            storage.end_watch(run_id, callbacks[run_id])
+
+    def test_event_watcher_reconnect(self, storage, conn_string):
+        run_id = "foo"
+        watched = []
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+        storage.store_event(create_test_event_log_record("1", run_id=run_id))
+
+        attempts = 10
+        while len(watched) < 1 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+        assert len(watched) == 1
+
+        # kill the LISTEN connection, events stored in the meantime are caught up on reconnect
+        conn = get_conn(conn_string)
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE query LIKE 'LISTEN%'"
+            )
+        conn.close()
+
+        storage.store_event(create_test_event_log_record("2", run_id=run_id))
+        storage.store_event(create_test_event_log_record("3", run_id=run_id))
+
+        attempts = 10
+        while len(watched) < 3 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+        assert [int(evt.message) for evt in watched] == [1, 2, 3]
+
     def test_load_from_config(self, hostname):
         url_cfg = """
         event_log_storage:
@@ -113,3 +185,25 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage  # noqa: SLF001
 
                 assert from_url.postgres_url == from_explicit.postgres_url
+
+
+def test_event_watcher_polls_without_listen_connection(tmpdir):
+    def _connect():
+        raise psycopg2.OperationalError("no postgres")
+
+    storage = SqliteEventLogStorage(str(tmpdir))
+    watcher = PostgresEventWatcher(storage, _connect, "run_events")
+    try:
+        watched = []
+        storage.store_event(create_test_event_log_record("1", run_id="foo"))
+        watcher.watch_run("foo", None, lambda event, _cursor: watched.append(event))
+        storage.store_event(create_test_event_log_record("2", run_id="foo"))
+
+        attempts = 10
+        while len(watched) < 2 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+        assert [int(evt.message) for evt in watched] == [1, 2]
+    finally:
+        watcher.close()
+        storage.dispose()
@@ -0,0 +1,13 @@
+import pytest
+from dagster_postgres.run_storage import PostgresRunStorage
+from dagster_tests.storage_tests.utils.run_storage_perf import TestRunStoragePerf
+
+
+class TestPostgresRunStoragePerf(TestRunStoragePerf):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def run_storage(self, conn_string):
+        storage = PostgresRunStorage.create_clean_storage(conn_string)
+        assert storage
+        return storage